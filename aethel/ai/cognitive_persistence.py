@@ -26,6 +26,8 @@ from pathlib import Path
 from datetime import datetime
 import os
 
+from aethel.core.sqlite_store import get_sqlite_store
+
 
 @dataclass
 class StoredResponse:
@@ -93,7 +95,8 @@ class CognitivePersistence:
         db_dir = Path(db_path).parent
         db_dir.mkdir(parents=True, exist_ok=True)
         
-        # Inicializar banco de dados
+        # Inicializar banco de dados (conexões compartilhadas em modo WAL)
+        self._db = get_sqlite_store(db_path)
         self._init_database()
         
         print(f"[COGNITIVE] 💾 Cognitive Persistence inicializado")
@@ -101,7 +104,10 @@ class CognitivePersistence:
     
     def _init_database(self) -> None:
         """Inicializa schema do banco de dados"""
-        conn = sqlite3.connect(self.db_path)
+        self._db.ensure_schema("cognitive_persistence", self._create_tables)
+    
+    def _create_tables(self, conn: sqlite3.Connection) -> None:
+        """Cria tabelas e índices"""
         cursor = conn.cursor()
         
         # Tabela principal de respostas
@@ -141,9 +147,6 @@ class CognitivePersistence:
             CREATE INDEX IF NOT EXISTS idx_timestamp 
             ON responses(timestamp)
         """)
-        
-        conn.commit()
-        conn.close()
     
     def save_response(self, distilled_response) -> Optional[str]:
         """
@@ -188,27 +191,23 @@ class CognitivePersistence:
         )
         
         # Salvar no banco
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         try:
-            cursor.execute("""
-                INSERT INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                stored.id,
-                stored.prompt,
-                stored.response,
-                stored.source,
-                stored.category,
-                stored.response_type,
-                stored.confidence_score,
-                1 if stored.verification_passed else 0,
-                stored.verification_details,
-                stored.timestamp,
-                stored.hash
-            ))
-            
-            conn.commit()
+            with self._db.transaction() as conn:
+                conn.execute("""
+                    INSERT INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    stored.id,
+                    stored.prompt,
+                    stored.response,
+                    stored.source,
+                    stored.category,
+                    stored.response_type,
+                    stored.confidence_score,
+                    1 if stored.verification_passed else 0,
+                    stored.verification_details,
+                    stored.timestamp,
+                    stored.hash
+                ))
             
             print(f"[COGNITIVE] ✅ Resposta salva: {response_id}")
             print(f"  Categoria: {category}")
@@ -220,18 +219,15 @@ class CognitivePersistence:
         except sqlite3.IntegrityError:
             print(f"[COGNITIVE] ⏭️  Resposta duplicada (ID: {response_id})")
             return None
-        finally:
-            conn.close()
     
     def _exists(self, response_hash: str) -> bool:
         """Verifica se resposta já existe"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connection()
         cursor = conn.cursor()
         
         cursor.execute("SELECT COUNT(*) FROM responses WHERE hash = ?", (response_hash,))
         count = cursor.fetchone()[0]
         
-        conn.close()
         return count > 0
     
     def _categorize(self, response_type) -> str:
@@ -264,7 +260,7 @@ class CognitivePersistence:
         Returns:
             Lista de respostas
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connection()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -275,7 +271,6 @@ class CognitivePersistence:
         """, (category, limit))
         
         rows = cursor.fetchall()
-        conn.close()
         
         return [self._row_to_stored(row) for row in rows]
     
@@ -290,7 +285,7 @@ class CognitivePersistence:
         Returns:
             Lista de respostas verificadas
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connection()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -302,7 +297,6 @@ class CognitivePersistence:
         """, (min_confidence, limit))
         
         rows = cursor.fetchall()
-        conn.close()
         
         return [self._row_to_stored(row) for row in rows]
     
@@ -383,7 +377,7 @@ class CognitivePersistence:
         Returns:
             Estatísticas completas
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connection()
         cursor = conn.cursor()
         
         # Total de respostas
@@ -421,8 +415,6 @@ class CognitivePersistence:
         """)
         high_quality = cursor.fetchone()[0]
         
-        conn.close()
-        
         return {
             "total_responses": total,
             "verified_responses": verified,
@@ -447,7 +439,7 @@ class CognitivePersistence:
         Returns:
             Lista de respostas encontradas
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connection()
         cursor = conn.cursor()
         
         # Busca simples com LIKE
@@ -459,7 +451,6 @@ class CognitivePersistence:
         """, (f"%{query}%", f"%{query}%", limit))
         
         rows = cursor.fetchall()
-        conn.close()
         
         return [self._row_to_stored(row) for row in rows]
     
@@ -473,17 +464,15 @@ class CognitivePersistence:
         Returns:
             Número de respostas removidas
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            DELETE FROM responses 
-            WHERE confidence_score < ?
-        """, (max_confidence,))
-        
-        deleted = cursor.rowcount
-        conn.commit()
-        conn.close()
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute("""
+                DELETE FROM responses 
+                WHERE confidence_score < ?
+            """, (max_confidence,))
+            
+            deleted = cursor.rowcount
         
         print(f"[COGNITIVE] 🗑️  {deleted} respostas de baixa qualidade removidas")
         
@@ -491,9 +480,8 @@ class CognitivePersistence:
     
     def vacuum(self) -> None:
         """Otimiza banco de dados (VACUUM)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connection()
         conn.execute("VACUUM")
-        conn.close()
         
         print("[COGNITIVE] 🧹 Banco de dados otimizado")
     
@@ -504,9 +492,13 @@ class CognitivePersistence:
         Args:
             backup_path: Caminho do backup
         """
-        import shutil
-        
-        shutil.copy2(self.db_path, backup_path)
+        # Copiar o arquivo diretamente perderia o que ainda está no WAL;
+        # a API de backup do SQLite inclui as páginas do WAL
+        dest = sqlite3.connect(backup_path)
+        try:
+            self._db.connection().backup(dest)
+        finally:
+            dest.close()
         
         print(f"[COGNITIVE] 💾 Backup criado: {backup_path}")
     
@@ -16,12 +16,17 @@ Performance optimizations:
 - Message batching to reduce network overhead
 - Parallel proof verification
 - Optimized signature verification
+- Pipelining: several sequence numbers can be in flight at once inside a
+  watermark window (low_watermark, low_watermark + watermark_window].
+  Per-instance state is keyed by (view, sequence); instances that commit
+  out of order are buffered and executed strictly in sequence order.
 """
 
-from typing import Dict, List, Optional, Set, Callable, Any
+from typing import Dict, List, Optional, Set, Callable, Any, Tuple
 from dataclasses import dataclass, field
 import time
 import hashlib
+import json
 
 from aethel.consensus.data_models import (
     ProofBlock,
@@ -43,7 +48,8 @@ from aethel.consensus.ghost_consensus import (
     GhostConsensusIntegration,
     GhostConsensusConfig
 )
-from aethel.consensus.monitoring import MetricsCollector
+from aethel.consensus.monitoring import CONSENSUS_PHASES, MetricsCollector
+from aethel.consensus.quorum_tracker import QuorumTracker, ValidatorIndex
 
 
 @dataclass
@@ -61,6 +67,13 @@ class ConsensusState:
         commit_messages: COMMIT messages received
         prepared: Whether we've reached prepare quorum
         committed: Whether we've reached commit quorum
+        executed: Whether the block has been executed (in sequence order)
+        started_at: When this node first saw the round
+        verified_at: When local verification of the block finished
+        prepared_at: When PREPARE quorum was reached
+        committed_at: When COMMIT quorum was reached
+        early_prepares: PREPARE messages that arrived before PRE-PREPARE
+        early_commits: COMMIT messages that arrived before PRE-PREPARE
     """
     sequence: int
     view: int
@@ -71,6 +84,13 @@ class ConsensusState:
     commit_messages: Dict[str, CommitMessage] = field(default_factory=dict)
     prepared: bool = False
     committed: bool = False
+    executed: bool = False
+    started_at: float = field(default_factory=time.time)
+    verified_at: float = 0.0
+    prepared_at: float = 0.0
+    committed_at: float = 0.0
+    early_prepares: Dict[str, PrepareMessage] = field(default_factory=dict)
+    early_commits: Dict[str, CommitMessage] = field(default_factory=dict)
 
 
 class ConsensusEngine:
@@ -98,6 +118,7 @@ class ConsensusEngine:
         proof_mempool: Optional[ProofMempool] = None,
         ghost_config: Optional[GhostConsensusConfig] = None,
         metrics_collector: Optional[MetricsCollector] = None,
+        watermark_window: int = 8,
     ):
         """
         Initialize ConsensusEngine.
@@ -106,24 +127,29 @@ class ConsensusEngine:
             node_id: Unique identifier for this node
             validator_stake: Amount of stake this node has locked
             network: P2P network for communication
-            proof_verifier: ProofVerifier instance (creates new if None)
+            proof_verifier: ProofVerifier instance (defaults to the mempool's
+                verifier, so proofs pre-verified on entry are cache hits)
             state_store: StateStore instance (creates new if None)
             proof_mempool: ProofMempool instance (creates new if None)
             ghost_config: Ghost Identity configuration (creates default if None)
             metrics_collector: MetricsCollector instance (creates new if None)
+            watermark_window: Maximum number of sequence numbers in flight
         """
         self.node_id = node_id
         self.validator_stake = validator_stake
         self.network = network
-        self.proof_verifier = proof_verifier or ProofVerifier()
         self.state_store = state_store or StateStore()
-        self.proof_mempool = proof_mempool or ProofMempool()
+        self.proof_mempool = proof_mempool or ProofMempool(proof_verifier=proof_verifier)
+        self.proof_verifier = proof_verifier or self.proof_mempool.proof_verifier
         
         # Ghost Identity integration
         self.ghost_consensus = GhostConsensusIntegration(ghost_config)
         
         # Metrics collection
         self.metrics = metrics_collector or MetricsCollector()
+        if self.proof_mempool.metrics_collector is None:
+            # Mempool size gauges land next to the consensus metrics
+            self.proof_mempool.metrics_collector = self.metrics
         
         # Set this node's stake in the state store
         self.state_store.set_validator_stake(node_id, validator_stake)
@@ -131,13 +157,21 @@ class ConsensusEngine:
         # Consensus state tracking
         self.view = 0
         self.sequence = 0
-        self.current_state: Optional[ConsensusState] = None
+        self.current_state: Optional[ConsensusState] = None  # Most recently touched instance
+        
+        # Pipelined instances keyed by (view, sequence)
+        self.instances: Dict[Tuple[int, int], ConsensusState] = {}
+        self.watermark_window = watermark_window
+        self.low_watermark = 0  # Highest executed sequence
+        self._ready: Dict[int, ConsensusState] = {}  # Committed, waiting for earlier sequences
+        self._in_flight_proofs: Set[str] = set()  # Proofs in blocks we proposed
         
         # Message handlers
         self.pre_prepare_handler: Optional[Callable] = None
         self.prepare_handler: Optional[Callable] = None
         self.commit_handler: Optional[Callable] = None
         self.view_change_handler: Optional[Callable] = None
+        self.finalization_handler: Optional[Callable] = None  # Called with each executed ConsensusResult
         
         # Timeout tracking
         self.consensus_timeout = 10.0  # seconds
@@ -149,6 +183,16 @@ class ConsensusEngine:
         self.view_change_timeout = 5.0  # seconds
         self.last_view_change_time = time.time()
         
+        # Incremental vote counting: bitsets over sorted validator positions
+        self._validators = ValidatorIndex([node_id, *network.peers.keys()])
+        self._prepare_votes = QuorumTracker(
+            self._validators, self.quorum_size, self._on_prepare_quorum
+        )
+        self._commit_votes = QuorumTracker(self._validators, self.quorum_size)
+        self._view_change_votes = QuorumTracker(
+            self._validators, self.quorum_size, self._on_view_change_quorum
+        )
+        
         # Performance optimizations
         self._message_batch: List[ConsensusMessage] = []
         self._batch_size = 10  # Process messages in batches of 10
@@ -224,17 +268,17 @@ class ConsensusEngine:
         Returns:
             True if we have Byzantine quorum
         """
-        # Total nodes = peers + self
-        total_nodes = self.network.node_count() + 1
-        
-        # Maximum faulty nodes
-        f = self.max_faulty_nodes()
-        
-        # Byzantine quorum = 2f + 1
-        quorum_size = 2 * f + 1
-        
         # Check if we have enough messages
-        return len(messages) >= quorum_size
+        return len(messages) >= self.quorum_size()
+    
+    def quorum_size(self) -> int:
+        """
+        Byzantine quorum size, 2f + 1.
+        
+        Returns:
+            Number of matching votes needed for quorum
+        """
+        return 2 * self.max_faulty_nodes() + 1
     
     def max_faulty_nodes(self) -> int:
         """
@@ -258,17 +302,32 @@ class ConsensusEngine:
         Initiate a new consensus round for the given proof block.
         
         This method starts the consensus protocol:
-        1. Increment sequence number
+        1. Increment sequence number (if the watermark window has room)
         2. Create new consensus state
-        3. If leader: broadcast PRE-PREPARE
+        3. If leader: broadcast PRE-PREPARE, verify the block and PREPARE
         4. If not leader: wait for PRE-PREPARE
         
+        Earlier rounds do not need to finish first; up to watermark_window
+        sequence numbers can be in flight.
+        
         Args:
             proof_block: The proof block to reach consensus on
             
         Returns:
             ConsensusResult indicating whether consensus was reached
         """
+        pending = ConsensusResult(
+            consensus_reached=False,
+            finalized_state=None,
+            total_difficulty=0,
+            verifications={},
+            participating_nodes=[],
+        )
+        
+        # Pipeline full: wait for earlier sequences to execute
+        if not self.can_start_round():
+            return pending
+        
         # Increment sequence number
         self.sequence += 1
         
@@ -279,24 +338,53 @@ class ConsensusEngine:
             proof_block=proof_block,
             block_digest=proof_block.hash(),
         )
+        self.instances[(self.view, self.sequence)] = self.current_state
         
         # Reset timeout
         self.last_consensus_time = time.time()
         
         # If we're the leader, start PRE-PREPARE phase
         if self.is_leader():
+            state = self.current_state
+            self._in_flight_proofs.update(self._proof_hash(p) for p in proof_block.proofs)
             self._start_pre_prepare_phase(proof_block)
+            
+            # The leader verifies its own proposal and votes like any replica
+            state.verification_result = self._verify_block(state, proof_block)
+            if state.verification_result.valid:
+                self.current_state = state
+                self._start_prepare_phase(proof_block, state.verification_result)
+        
+        # Consensus completes asynchronously; executed rounds are reported
+        # through handle_commit() and finalization_handler
+        return pending
+    
+    @property
+    def high_watermark(self) -> int:
+        """Highest sequence number accepted while low_watermark is unchanged."""
+        return self.low_watermark + self.watermark_window
+    
+    def can_start_round(self) -> bool:
+        """
+        Check whether another sequence number fits in the watermark window.
         
-        # Wait for consensus to complete
-        # In a real implementation, this would be event-driven
-        # For now, we return a pending result
-        return ConsensusResult(
-            consensus_reached=False,
-            finalized_state=None,
-            total_difficulty=0,
-            verifications={},
-            participating_nodes=[],
-        )
+        Returns:
+            True if start_consensus_round() would start a new instance
+        """
+        return self.sequence < self.high_watermark
+    
+    def _in_window(self, sequence: int) -> bool:
+        """Check that a sequence number lies within (low, high] watermarks."""
+        return self.low_watermark < sequence <= self.high_watermark
+    
+    def _get_instance(self, view: int, sequence: int) -> ConsensusState:
+        """Get or create the consensus instance for (view, sequence)."""
+        key = (view, sequence)
+        state = self.instances.get(key)
+        if state is None:
+            state = ConsensusState(sequence=sequence, view=view)
+            self.instances[key] = state
+        return state
     
     def _start_pre_prepare_phase(self, proof_block: ProofBlock) -> None:
         """
@@ -340,8 +428,11 @@ class ConsensusEngine:
         if not self.is_leader():
             return None
         
-        # Get next block from mempool
-        proof_block = self.proof_mempool.get_next_block(block_size)
+        # Get next block from mempool, skipping proofs already in flight
+        proof_block = self.proof_mempool.get_next_block(
+            block_size,
+            exclude=self._in_flight_proofs
+        )
         
         if proof_block is None:
             return None
@@ -395,14 +486,10 @@ class ConsensusEngine:
         if message.view != self.view:
             return
         
-        # For new consensus rounds, accept any sequence >= current
-        if message.sequence < self.sequence:
+        # Sequence must lie inside the watermark window
+        if not self._in_window(message.sequence):
             return
         
-        # Update sequence if message has higher sequence
-        if message.sequence > self.sequence:
-            self.sequence = message.sequence
-        
         # Validate proof block exists
         if message.proof_block is None:
             return
@@ -411,23 +498,37 @@ class ConsensusEngine:
         if not self._validate_proof_block(message.proof_block):
             return
         
-        # Store proof block in current state
-        if self.current_state is None or self.current_state.sequence != message.sequence:
-            self.current_state = ConsensusState(
-                sequence=message.sequence,
-                view=message.view,
-            )
+        # One block per (view, sequence): ignore a conflicting PRE-PREPARE
+        state = self._get_instance(message.view, message.sequence)
+        block_digest = message.proof_block.hash()
+        if state.block_digest and state.block_digest != block_digest:
+            return
         
-        self.current_state.proof_block = message.proof_block
-        self.current_state.block_digest = message.proof_block.hash()
+        # Update sequence if message has higher sequence
+        if message.sequence > self.sequence:
+            self.sequence = message.sequence
+        
+        state.proof_block = message.proof_block
+        state.block_digest = block_digest
+        self.current_state = state
         
         # Verify proof block independently
-        verification_result = self.proof_verifier.verify_proof_block(message.proof_block)
-        self.current_state.verification_result = verification_result
+        verification_result = self._verify_block(state, message.proof_block)
+        state.verification_result = verification_result
         
         # If verification passed, start PREPARE phase
         if verification_result.valid:
             self._start_prepare_phase(message.proof_block, verification_result)
+        
+        # Votes that overtook the PRE-PREPARE can be counted now
+        early_prepares = list(state.early_prepares.values())
+        early_commits = list(state.early_commits.values())
+        state.early_prepares.clear()
+        state.early_commits.clear()
+        for prepare in early_prepares:
+            self.handle_prepare(prepare)
+        for commit in early_commits:
+            self.handle_commit(commit)
     
     def _validate_proof_block(self, proof_block: ProofBlock) -> bool:
         """
@@ -481,11 +582,14 @@ class ConsensusEngine:
             proof_block: The verified proof block
             verification_result: Result of verification
         """
+        state = self.current_state
+        sequence = state.sequence if state is not None else self.sequence
+        
         # Create PREPARE message
         prepare = PrepareMessage(
             message_type=MessageType.PREPARE,
             view=self.view,
-            sequence=self.sequence,
+            sequence=sequence,
             sender_id=self.node_id,
             block_digest=proof_block.hash(),
             verification_result=verification_result,
@@ -493,6 +597,10 @@ class ConsensusEngine:
         
         # Broadcast to all nodes
         self.network.broadcast("consensus", prepare)
+        
+        # Our own vote counts towards the quorum
+        if isinstance(state, ConsensusState):
+            self._record_prepare(state, prepare)
     
     def handle_prepare(self, message: PrepareMessage) -> None:
         """
@@ -525,57 +633,87 @@ class ConsensusEngine:
         if message.view != self.view:
             return
         
-        # Ensure we have current state
-        if self.current_state is None:
+        # Sequence must lie inside the watermark window
+        if not self._in_window(message.sequence):
             return
         
-        # Accept messages for current or future sequence
-        if message.sequence < self.current_state.sequence:
+        state = self._get_instance(message.view, message.sequence)
+        
+        # PRE-PREPARE not seen yet: hold the vote until it arrives
+        if not state.block_digest:
+            state.early_prepares[message.sender_id] = message
             return
         
         # Validate block digest matches
-        if message.block_digest != self.current_state.block_digest:
+        if message.block_digest != state.block_digest:
+            return
+        
+        self._record_prepare(state, message)
+    
+    @staticmethod
+    def _vote_key(state: ConsensusState) -> Tuple[int, int, str]:
+        """Key under which votes for an instance's block are counted."""
+        return state.view, state.sequence, state.block_digest
+    
+    def _record_prepare(self, state: ConsensusState, message: PrepareMessage) -> None:
+        """Store a matching PREPARE; _on_prepare_quorum fires on 2f+1."""
+        state.prepare_messages[message.sender_id] = message
+        self._prepare_votes.add_vote(self._vote_key(state), message.sender_id)
+    
+    def _on_prepare_quorum(self, key: Tuple[int, int, str]) -> None:
+        """Move an instance to COMMIT the first time its PREPAREs reach quorum."""
+        view, sequence, block_digest = key
+        state = self.instances.get((view, sequence))
+        if state is None or state.prepared or state.block_digest != block_digest:
             return
         
-        # Store PREPARE message
-        self.current_state.prepare_messages[message.sender_id] = message
+        state.prepared = True
+        state.prepared_at = time.time()
+        self.current_state = state
+        self._start_commit_phase()
         
-        # Check if we have Byzantine quorum
-        prepare_list = list(self.current_state.prepare_messages.values())
-        if self.verify_quorum(prepare_list) and not self.current_state.prepared:
-            self.current_state.prepared = True
-            self._start_commit_phase()
+        # Commits counted before we prepared may already form a quorum
+        self._check_committed(state)
     
     def _start_commit_phase(self) -> None:
         """Start COMMIT phase after reaching prepare quorum."""
-        if self.current_state is None:
+        state = self.current_state
+        if state is None:
             return
         
         # Create COMMIT message
         commit = CommitMessage(
             message_type=MessageType.COMMIT,
             view=self.view,
-            sequence=self.sequence,
+            sequence=state.sequence,
             sender_id=self.node_id,
-            block_digest=self.current_state.block_digest,
+            block_digest=state.block_digest,
         )
         
         # Broadcast to all nodes
         self.network.broadcast("consensus", commit)
+        
+        # Our own vote counts towards the quorum
+        if isinstance(state, ConsensusState):
+            state.commit_messages[self.node_id] = commit
+            self._commit_votes.add_vote(self._vote_key(state), self.node_id)
+            self._check_committed(state)
     
     def handle_commit(self, message: CommitMessage) -> Optional[ConsensusResult]:
         """
         Process COMMIT message from peer.
         
         This method collects COMMIT messages from other nodes. When we
-        receive 2f+1 matching COMMIT messages (Byzantine quorum), we
-        execute the state transition and finalize consensus.
+        receive 2f+1 matching COMMIT messages (Byzantine quorum) for a
+        prepared instance, the instance is committed. Committed instances
+        are executed strictly in sequence order; one that commits ahead of
+        an earlier sequence waits until that sequence executes.
         
         Args:
             message: COMMIT message from peer
             
         Returns:
-            ConsensusResult if consensus is finalized, None otherwise
+            ConsensusResult if this message's block was executed, None otherwise
         """
         # Verify Ghost Identity proof if present (Property 22)
         if message.use_ghost_identity:
@@ -597,30 +735,93 @@ class ConsensusEngine:
         if message.view != self.view:
             return None
         
-        # Ensure we have current state
-        if self.current_state is None:
+        # Sequence must lie inside the watermark window
+        if not self._in_window(message.sequence):
             return None
         
-        # Accept messages for current or future sequence
-        if message.sequence < self.current_state.sequence:
+        state = self._get_instance(message.view, message.sequence)
+        
+        # PRE-PREPARE not seen yet: hold the vote until it arrives
+        if not state.block_digest:
+            state.early_commits[message.sender_id] = message
             return None
         
         # Validate block digest matches
-        if message.block_digest != self.current_state.block_digest:
+        if message.block_digest != state.block_digest:
             return None
         
         # Store COMMIT message
-        self.current_state.commit_messages[message.sender_id] = message
+        state.commit_messages[message.sender_id] = message
+        self._commit_votes.add_vote(self._vote_key(state), message.sender_id)
+        
+        executed = self._check_committed(state)
+        return executed.get(state.sequence)
+    
+    def _check_committed(self, state: ConsensusState) -> Dict[int, ConsensusResult]:
+        """
+        Mark an instance committed on quorum and execute every ready sequence.
         
-        # Check if we have Byzantine quorum
-        commit_list = list(self.current_state.commit_messages.values())
-        if self.verify_quorum(commit_list) and not self.current_state.committed:
-            self.current_state.committed = True
-            return self._finalize_consensus()
+        Returns:
+            Results of the instances executed by this call, keyed by sequence
+        """
+        if state.committed or not state.prepared:
+            return {}
         
-        return None
+        if not self._commit_votes.has_quorum(self._vote_key(state)):
+            return {}
+        
+        state.committed = True
+        state.committed_at = time.time()
+        self.current_state = state
+        self._ready[state.sequence] = state
+        return self._execute_ready()
     
-    def _finalize_consensus(self) -> ConsensusResult:
+    def _execute_ready(self) -> Dict[int, ConsensusResult]:
+        """
+        Execute committed instances in sequence order.
+        
+        Each execution advances the low watermark, which slides the window
+        forward and frees the instances it leaves behind.
+        """
+        executed: Dict[int, ConsensusResult] = {}
+        
+        while self.low_watermark + 1 in self._ready:
+            state = self._ready.pop(self.low_watermark + 1)
+            result = self._finalize_consensus(state)
+            state.executed = True
+            executed[state.sequence] = result
+            self.advance_watermark(state.sequence)
+            
+            if self.finalization_handler:
+                self.finalization_handler(result)
+        
+        return executed
+    
+    def advance_watermark(self, stable_sequence: int) -> None:
+        """
+        Move the low watermark to a stable (executed) sequence.
+        
+        Called after each in-order execution, and by state sync when a
+        node catches up from a checkpoint. Instances at or below the new
+        low watermark are discarded.
+        
+        Args:
+            stable_sequence: Highest sequence whose state is final locally
+        """
+        if stable_sequence <= self.low_watermark:
+            return
+        
+        self.low_watermark = stable_sequence
+        self.sequence = max(self.sequence, stable_sequence)
+        
+        for key in [key for key in self.instances if key[1] <= stable_sequence]:
+            del self.instances[key]
+        self._prepare_votes.discard_where(lambda key: key[1] <= stable_sequence)
+        self._commit_votes.discard_where(lambda key: key[1] <= stable_sequence)
+        for sequence in [seq for seq in self._ready if seq <= stable_sequence]:
+            del self._ready[sequence]
+    
+    def _finalize_consensus(self, state: Optional[ConsensusState] = None) -> ConsensusResult:
         """
         Finalize consensus after reaching commit quorum.
         
@@ -631,17 +832,23 @@ class ConsensusEngine:
         4. Emit metrics (Requirement 8.1, Property 32)
         5. Reset for next round
         
+        Args:
+            state: Instance to finalize (defaults to current_state)
+        
         Returns:
             ConsensusResult with finalization details
         """
-        if self.current_state is None or self.current_state.proof_block is None:
+        if state is None:
+            state = self.current_state
+        
+        if state is None or state.proof_block is None:
             return ConsensusResult(
                 consensus_reached=False,
                 finalized_state=None,
             )
         
         # Get verification result
-        verification_result = self.current_state.verification_result
+        verification_result = state.verification_result
         if verification_result is None:
             return ConsensusResult(
                 consensus_reached=False,
@@ -649,29 +856,25 @@ class ConsensusEngine:
             )
         
         # Calculate consensus duration
-        consensus_duration = time.time() - self.last_consensus_time
+        finalized_at = time.time()
+        consensus_duration = finalized_at - state.started_at
         
         # Remove proofs from mempool (they've been finalized)
         # Convert proof objects to hashes for removal
-        proof_hashes = []
-        for proof in self.current_state.proof_block.proofs:
-            if isinstance(proof, dict):
-                import json
-                proof_hash = hashlib.sha256(json.dumps(proof).encode()).hexdigest()
-            else:
-                proof_hash = hashlib.sha256(str(proof).encode()).hexdigest()
-            proof_hashes.append(proof_hash)
+        proof_hashes = [self._proof_hash(proof) for proof in state.proof_block.proofs]
         
         self.proof_mempool.remove_proofs(proof_hashes)
+        self._in_flight_proofs.difference_update(proof_hashes)
         
         # Collect participating nodes
-        participating_nodes = list(self.current_state.commit_messages.keys())
-        participating_nodes.append(self.node_id)  # Include self
+        participating_nodes = list(state.commit_messages.keys())
+        if self.node_id not in participating_nodes:
+            participating_nodes.append(self.node_id)  # Include self
         
         # Create consensus result
         result = ConsensusResult(
             consensus_reached=True,
-            finalized_state=self.current_state.block_digest,
+            finalized_state=state.block_digest,
             total_difficulty=verification_result.total_difficulty,
             verifications={},  # Will be populated with verification results
             participating_nodes=participating_nodes,
@@ -679,14 +882,15 @@ class ConsensusEngine:
         
         # Emit consensus metrics (Property 32: Consensus Metrics Emission)
         self.metrics.record_consensus_round(
-            round_id=self.current_state.block_digest,
+            round_id=state.block_digest,
             duration=consensus_duration,
             participants=participating_nodes,
-            proof_count=len(self.current_state.proof_block.proofs),
+            proof_count=len(state.proof_block.proofs),
             total_difficulty=verification_result.total_difficulty,
-            view=self.view,
-            sequence=self.sequence,
+            view=state.view,
+            sequence=state.sequence,
             success=True,
+            phase_durations=self._phase_durations(state, finalized_at),
         )
         
         # Record verification accuracy for all participants (Property 34)
@@ -699,6 +903,33 @@ class ConsensusEngine:
         
         return result
     
+    def _verify_block(self, state: ConsensusState, proof_block: ProofBlock) -> BlockVerificationResult:
+        """Verify a proposed block, timing it for the verification histograms."""
+        started = time.perf_counter()
+        result = self.proof_verifier.verify_proof_block(proof_block)
+        self.metrics.record_block_verification(
+            time.perf_counter() - started,
+            [r.verification_time for r in result.results],
+        )
+        state.verified_at = time.time()
+        return result
+    
+    @staticmethod
+    def _phase_durations(state: ConsensusState, finalized_at: float) -> Dict[str, float]:
+        """
+        Seconds spent in each phase of an executed instance.
+        
+        pre_prepare runs until local verification finishes, prepare until
+        PREPARE quorum, commit until COMMIT quorum and execute until the
+        instance is executed in sequence order.
+        """
+        marks = [state.started_at, state.verified_at, state.prepared_at, state.committed_at, finalized_at]
+        durations = {}
+        for phase, start, end in zip(CONSENSUS_PHASES, marks, marks[1:]):
+            if start and end:
+                durations[phase] = max(0.0, end - start)
+        return durations
+    
     def initiate_view_change(self) -> None:
         """
         Initiate a view change due to timeout or leader failure.
@@ -737,6 +968,9 @@ class ConsensusEngine:
         
         # Broadcast to all nodes
         self.network.broadcast("consensus", view_change)
+        
+        # Our own vote counts towards the quorum
+        self._view_change_votes.add_vote(new_view, self.node_id)
     
     def handle_view_change(self, message: ViewChangeMessage) -> None:
         """
@@ -758,11 +992,16 @@ class ConsensusEngine:
             self.view_change_messages[message.new_view] = {}
         self.view_change_messages[message.new_view][message.sender_id] = message
         
-        # Check if we have Byzantine quorum for this new view
-        view_change_list = list(self.view_change_messages[message.new_view].values())
-        if self.verify_quorum(view_change_list):
-            # We have quorum, transition to new view
-            self._transition_to_new_view(message.new_view, view_change_list)
+        # _on_view_change_quorum fires once this view has 2f+1 votes
+        self._view_change_votes.add_vote(message.new_view, message.sender_id)
+    
+    def _on_view_change_quorum(self, new_view: int) -> None:
+        """Transition the first time VIEW-CHANGE votes for new_view reach quorum."""
+        if new_view <= self.view:
+            return
+        
+        view_change_list = list(self.view_change_messages[new_view].values())
+        self._transition_to_new_view(new_view, view_change_list)
     
     def _transition_to_new_view(
         self,
@@ -782,7 +1021,8 @@ class ConsensusEngine:
         self.in_view_change = False
         
         # Reset consensus state for new view
-        self.current_state = None
+        self._abandon_in_flight()
+        self._view_change_votes.discard_where(lambda view: view <= new_view)
         
         # If we're the new leader, broadcast NEW-VIEW message
         if self.is_leader():
@@ -855,12 +1095,28 @@ class ConsensusEngine:
         self.in_view_change = False
         
         # Reset consensus state
-        self.current_state = None
+        self._abandon_in_flight()
         
         # Sync state from checkpoint if needed
         if message.checkpoint and message.checkpoint != self._get_last_stable_checkpoint():
             self._sync_from_checkpoint(message.checkpoint)
     
+    def _abandon_in_flight(self) -> None:
+        """
+        Drop every instance that has not executed.
+        
+        The new view restarts numbering right after the low watermark.
+        Proofs of abandoned blocks are still in the mempool (they are only
+        removed on execution), so the new leader proposes them again.
+        """
+        self.current_state = None
+        self.instances.clear()
+        self._ready.clear()
+        self._prepare_votes.clear()
+        self._commit_votes.clear()
+        self._in_flight_proofs.clear()
+        self.sequence = self.low_watermark
+    
     def _get_last_stable_checkpoint(self) -> str:
         """
         Get the hash of the last stable checkpoint (finalized state).
@@ -981,6 +1237,19 @@ class ConsensusEngine:
         
         return has_timed_out
     
+    def get_instance(self, sequence: int, view: Optional[int] = None) -> Optional[ConsensusState]:
+        """
+        Get the consensus instance for a sequence number.
+        
+        Args:
+            sequence: Sequence number
+            view: View number (defaults to the current view)
+        
+        Returns:
+            ConsensusState or None if the instance is unknown or executed
+        """
+        return self.instances.get((self.view if view is None else view, sequence))
+    
     def get_consensus_state(self) -> Optional[ConsensusState]:
         """
         Get current consensus state.
@@ -990,6 +1259,13 @@ class ConsensusEngine:
         """
         return self.current_state
     
+    @staticmethod
+    def _proof_hash(proof: Any) -> str:
+        """Hash a proof the same way ProofMempool does."""
+        if isinstance(proof, dict):
+            return hashlib.sha256(json.dumps(proof).encode()).hexdigest()
+        return hashlib.sha256(str(proof).encode()).hexdigest()
+    
     def _get_last_block_hash(self) -> str:
         """
         Get hash of the last finalized block.
@@ -1019,11 +1295,20 @@ class ConsensusEngine:
         
         This is more efficient than processing messages one at a time
         because it reduces context switching and allows for optimizations
-        like parallel signature verification.
+        like parallel signature verification. Ghost Identity proofs in the
+        batch are verified together up front; messages that fail are
+        dropped, and the handlers' own checks on the rest hit the verified
+        message cache instead of re-verifying ring signatures.
         
         Args:
             messages: List of consensus messages to process
         """
+        ghost_msgs = [msg for msg in messages if msg.use_ghost_identity]
+        if ghost_msgs:
+            verdicts = self.ghost_consensus.verify_ghost_consensus_messages(ghost_msgs)
+            rejected = {id(msg) for msg, valid in zip(ghost_msgs, verdicts) if not valid}
+            messages = [msg for msg in messages if id(msg) not in rejected]
+        
         # Group messages by type for efficient processing
         pre_prepare_msgs = []
         prepare_msgs = []
@@ -1116,5 +1401,9 @@ class ConsensusEngine:
             'view': self.view,
             'sequence': self.sequence,
             'in_view_change': self.in_view_change,
+            'low_watermark': self.low_watermark,
+            'high_watermark': self.high_watermark,
+            'in_flight': len(self.instances),
+            'awaiting_execution': len(self._ready),
         }
 
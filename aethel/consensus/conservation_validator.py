@@ -13,7 +13,7 @@ Version: 3.0.0
 Date: February 10, 2026
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Optional
 from dataclasses import dataclass
 
 from aethel.consensus.data_models import StateTransition, StateChange
@@ -154,6 +154,55 @@ class ConservationValidator:
                 error_message=error_msg
             )
     
+    def validate_changes(
+        self,
+        transition: StateTransition,
+        get_value: Callable[[str], Any]
+    ) -> bool:
+        """
+        Validate conservation by looking only at the keys a transition touches.
+        
+        Unchanged keys contribute equally to both totals, so the sum over
+        the changed keys before and after is enough. This costs O(changes)
+        instead of copying and summing the whole state.
+        
+        Args:
+            transition: StateTransition to validate
+            get_value: Returns the current value for a key (None if absent)
+        
+        Returns:
+            True if conservation is preserved, False otherwise
+        
+        Validates:
+            Requirements 3.6, 5.2
+        """
+        # Changes are final values: the last write to a key wins
+        updates = {change.key: change.value for change in transition.changes}
+        delta = self.calculate_change_delta(updates, get_value)
+        return abs(delta) < 1e-10
+    
+    def calculate_change_delta(
+        self,
+        updates: Dict[str, Any],
+        get_value: Callable[[str], Any]
+    ) -> int:
+        """
+        Calculate how much a set of updates moves the total value.
+        
+        Args:
+            updates: Final value for each changed key
+            get_value: Returns the current value for a key (None if absent)
+        
+        Returns:
+            total_after - total_before
+        """
+        delta = 0
+        for key, value in updates.items():
+            delta += self._extract_numeric_value(value)
+            delta -= self._extract_numeric_value(get_value(key))
+        
+        return delta
+    
     def calculate_total_value(self, merkle_tree: MerkleTree) -> int:
         """
         Calculate total value in the Merkle tree.
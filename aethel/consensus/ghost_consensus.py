@@ -11,8 +11,10 @@ Key Features:
 - Double-signing prevention with key images
 """
 
-from typing import List, Optional, Dict, Set
+from typing import List, Optional, Dict, Set, Tuple
 from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import hashlib
 
 from aethel.core.ghost_identity import (
@@ -36,6 +38,8 @@ class GhostConsensusConfig:
     min_ring_size: int = 3
     max_ring_size: int = 100
     require_ghost_for_all: bool = False  # If True, all messages must use Ghost ID
+    verified_cache_size: int = 4096  # Verified (key image, digest) pairs remembered
+    verify_workers: int = 4  # Threads used by batch verification
 
 
 class GhostConsensusIntegration:
@@ -65,6 +69,10 @@ class GhostConsensusIntegration:
         
         # Track authorized validator keys (public keys of validators)
         self.authorized_validators: List[Ed25519PublicKey] = []
+        
+        # Messages already verified, keyed by (key image, payload digest)
+        self._verified: "OrderedDict[Tuple[bytes, bytes], bool]" = OrderedDict()
+        self._verify_cache_hits = 0
     
     def register_validator(self, public_key: Ed25519PublicKey) -> None:
         """
@@ -141,6 +149,10 @@ class GhostConsensusIntegration:
         """
         Verify a consensus message with Ghost Identity proof.
         
+        A message identical to one already accepted (same key image and
+        payload) is a re-delivery rather than a double-sign, so it is
+        accepted from the cache without checking the ring signature again.
+        
         Args:
             message: The consensus message to verify
         
@@ -154,7 +166,83 @@ class GhostConsensusIntegration:
         if message.ghost_proof is None:
             return False
         
-        # Serialize message for verification (same as when signature was created)
+        message_data = self._signing_payload(message)
+        cache_key = self._cache_key(message, message_data)
+        if cache_key in self._verified:
+            self._verify_cache_hits += 1
+            return True
+        
+        # Verify Ghost ID proof
+        is_valid = self.ghost_id.verify_ghost_proof(
+            message_data,
+            message.ghost_proof,
+            self.authorized_validators
+        )
+        
+        return self._admit(cache_key, is_valid)
+    
+    def verify_ghost_consensus_messages(
+        self,
+        messages: List[ConsensusMessage]
+    ) -> List[bool]:
+        """
+        Verify a batch of consensus messages.
+        
+        Ring signatures of messages not already in the verified cache are
+        checked on a thread pool; key images are then admitted in message
+        order, so the double-signing outcome matches verifying the messages
+        one at a time.
+        
+        Args:
+            messages: Consensus messages to verify
+        
+        Returns:
+            One verdict per message, in the same order
+        """
+        verdicts: List[Optional[bool]] = [None] * len(messages)
+        pending: Dict[Tuple[bytes, bytes], Tuple[bytes, ConsensusMessage]] = {}
+        keys: List[Optional[Tuple[bytes, bytes]]] = [None] * len(messages)
+        
+        for i, message in enumerate(messages):
+            if not message.use_ghost_identity:
+                verdicts[i] = True
+            elif message.ghost_proof is None:
+                verdicts[i] = False
+            else:
+                message_data = self._signing_payload(message)
+                keys[i] = self._cache_key(message, message_data)
+                if keys[i] not in self._verified:
+                    pending.setdefault(keys[i], (message_data, message))
+        
+        checked: Dict[Tuple[bytes, bytes], bool] = {}
+        if len(pending) > 1 and self.config.verify_workers > 1:
+            with ThreadPoolExecutor(max_workers=self.config.verify_workers) as executor:
+                results = executor.map(
+                    lambda item: self.ghost_id.verify_ghost_proof(
+                        item[0], item[1].ghost_proof, self.authorized_validators
+                    ),
+                    pending.values()
+                )
+                checked = dict(zip(pending.keys(), results))
+        else:
+            for cache_key, (message_data, message) in pending.items():
+                checked[cache_key] = self.ghost_id.verify_ghost_proof(
+                    message_data, message.ghost_proof, self.authorized_validators
+                )
+        
+        for i, cache_key in enumerate(keys):
+            if cache_key is None:
+                continue
+            if cache_key in self._verified:
+                self._verify_cache_hits += 1
+                verdicts[i] = True
+            else:
+                verdicts[i] = self._admit(cache_key, checked[cache_key])
+        
+        return verdicts
+    
+    def _signing_payload(self, message: ConsensusMessage) -> bytes:
+        """Serialize a message the way it was serialized when signed."""
         # Temporarily set fields to match creation state
         temp_proof = message.ghost_proof
         temp_use_ghost = message.use_ghost_identity
@@ -166,24 +254,34 @@ class GhostConsensusIntegration:
         message.ghost_proof = temp_proof
         message.use_ghost_identity = temp_use_ghost
         
-        # Verify Ghost ID proof
-        is_valid = self.ghost_id.verify_ghost_proof(
-            message_data,
-            message.ghost_proof,
-            self.authorized_validators
-        )
-        
+        return message_data
+    
+    @staticmethod
+    def _cache_key(message: ConsensusMessage, message_data: bytes) -> Tuple[bytes, bytes]:
+        """Key a message by its key image and a digest of payload and proof."""
+        signature = message.ghost_proof.signature
+        h = hashlib.sha256(message_data)
+        for part in signature.c + signature.r:
+            h.update(part)
+        return signature.key_image, h.digest()
+    
+    def _admit(self, cache_key: Tuple[bytes, bytes], is_valid: bool) -> bool:
+        """Record a verified message's key image, rejecting double-signs."""
         if not is_valid:
             return False
         
         # Check for double-signing AFTER verification succeeds
-        key_image = message.ghost_proof.signature.key_image
+        key_image = cache_key[0]
         if key_image in self.used_key_images:
             return False
         
         # Mark key image as used
         self.used_key_images.add(key_image)
         
+        self._verified[cache_key] = True
+        if len(self._verified) > self.config.verified_cache_size:
+            self._verified.popitem(last=False)
+        
         return True
     
     def create_ghost_proof_block(
@@ -308,6 +406,7 @@ class GhostConsensusIntegration:
         WARNING: Only use this when starting a new consensus epoch.
         """
         self.used_key_images.clear()
+        self._verified.clear()
     
     def detect_double_signing(
         self,
@@ -78,6 +78,9 @@ class MerkleTree:
     - Batch updates to amortize rebuild cost
     - LRU cache for frequently accessed nodes
     - Lazy rebuilding (only when root hash needed)
+    - Path rehashing: updating keys that already exist only rehashes the
+      paths from those leaves to the root; full rebuilds are reserved for
+      inserts and deletes, which change the tree shape
     """
     
     def __init__(self, cache_size: int = 1000):
@@ -91,6 +94,13 @@ class MerkleTree:
         self.leaves: Dict[str, MerkleNode] = {}  # Map key -> leaf node
         self._dirty = False  # Track if tree needs rebuilding
         
+        # Tree levels from the last rebuild (level 0 = sorted leaves)
+        self._levels: List[List[MerkleNode]] = []
+        self._positions: Dict[str, int] = {}  # key -> index in level 0
+        
+        # Incremented on every mutation so owners can detect outside writes
+        self.version = 0
+        
         # Performance optimizations
         self._node_cache: Dict[str, MerkleNode] = {}  # Cache for internal nodes
         self._cache_size = cache_size
@@ -118,6 +128,12 @@ class MerkleTree:
             leaf = self.leaves[key]
             leaf.value = value
             leaf.hash = leaf_hash
+            
+            if self._dirty or not self._levels:
+                self._dirty = True
+            else:
+                # Same shape: rehash the path to the root only
+                self._update_paths([self._positions[key]])
         else:
             # Create new leaf
             leaf = MerkleNode(
@@ -126,9 +142,11 @@ class MerkleTree:
                 value=value
             )
             self.leaves[key] = leaf
+            
+            # Mark tree as dirty (needs rebuilding)
+            self._dirty = True
         
-        # Mark tree as dirty (needs rebuilding)
-        self._dirty = True
+        self.version += 1
         
         # Invalidate cache since tree structure changed
         self._node_cache.clear()
@@ -143,6 +161,8 @@ class MerkleTree:
         Args:
             updates: Dictionary of key-value pairs to update
         """
+        positions = []
+        
         for key, value in updates.items():
             # Calculate leaf hash
             leaf_hash = self._hash_leaf(key, value)
@@ -153,6 +173,7 @@ class MerkleTree:
                 leaf = self.leaves[key]
                 leaf.value = value
                 leaf.hash = leaf_hash
+                positions.append(self._positions.get(key))
             else:
                 # Create new leaf
                 leaf = MerkleNode(
@@ -161,9 +182,20 @@ class MerkleTree:
                     value=value
                 )
                 self.leaves[key] = leaf
+                
+                # Mark tree as dirty (needs rebuilding)
+                self._dirty = True
+        
+        if not updates:
+            return
         
-        # Mark tree as dirty (needs rebuilding)
-        self._dirty = True
+        if self._dirty or not self._levels:
+            self._dirty = True
+        else:
+            # Only existing keys changed: rehash their paths (O(k log n))
+            self._update_paths(positions)
+        
+        self.version += 1
         
         # Invalidate cache since tree structure changed
         self._node_cache.clear()
@@ -192,6 +224,7 @@ class MerkleTree:
         if key in self.leaves:
             del self.leaves[key]
             self._dirty = True
+            self.version += 1
     
     def generate_proof(self, key: str) -> Optional[MerkleProof]:
         """
@@ -310,14 +343,18 @@ class MerkleTree:
         """
         if not self.leaves:
             self.root = None
+            self._levels = []
+            self._positions = {}
             self._dirty = False
             return
         
         # Sort leaves by key for deterministic ordering
         sorted_leaves = sorted(self.leaves.values(), key=lambda n: n.key)
+        self._positions = {leaf.key: i for i, leaf in enumerate(sorted_leaves)}
         
         # Build tree bottom-up
         current_level = sorted_leaves
+        self._levels = [current_level]
         
         while len(current_level) > 1:
             next_level = []
@@ -358,11 +395,47 @@ class MerkleTree:
                 next_level.append(parent)
             
             current_level = next_level
+            self._levels.append(current_level)
         
         # Set root
         self.root = current_level[0]
         self._dirty = False
     
+    def _update_paths(self, positions: List[int]) -> None:
+        """
+        Rehash the paths from the given leaves to the root.
+        
+        Only valid while the tree shape is unchanged since the last
+        rebuild. Pairing matches _rebuild_tree (the last node of an odd
+        level is paired with itself), so the root is identical to a full
+        rebuild. Parents are replaced, not mutated, because cached nodes
+        may be shared with earlier trees.
+        """
+        indices = set(positions)
+        
+        for level in range(len(self._levels) - 1):
+            nodes = self._levels[level]
+            parents = self._levels[level + 1]
+            parent_indices = set()
+            
+            for i in indices:
+                p = i // 2
+                if p in parent_indices:
+                    continue
+                
+                left = nodes[2 * p]
+                right = nodes[2 * p + 1] if 2 * p + 1 < len(nodes) else left
+                parents[p] = MerkleNode(
+                    hash=self._hash_pair(left.hash, right.hash),
+                    left=left,
+                    right=right
+                )
+                parent_indices.add(p)
+            
+            indices = parent_indices
+        
+        self.root = self._levels[-1][0]
+    
     def get_cache_stats(self) -> Dict[str, int]:
         """
         Get cache performance statistics.
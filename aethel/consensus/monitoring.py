@@ -8,8 +8,11 @@ consensus protocol. It provides:
 - Verification accuracy tracking
 - Reward tracking
 - Byzantine behavior logging
+- Latency histograms per consensus phase and for proof verification
 
 All metrics are Prometheus-compatible and can be exposed via HTTP endpoint.
+They live in a MetricsRegistry (aethel.core.metrics_registry), so a scrape
+renders counters and histograms directly instead of walking the history.
 """
 
 import time
@@ -19,6 +22,11 @@ from dataclasses import dataclass, field
 from collections import deque
 from datetime import datetime
 
+from aethel.core.metrics_registry import MetricsRegistry
+
+# Phases timed for each executed instance
+CONSENSUS_PHASES = ("pre_prepare", "prepare", "commit", "execute")
+
 
 @dataclass
 class ConsensusMetrics:
@@ -91,6 +99,8 @@ class MetricsCollector:
     - Byzantine behavior logging
     
     All metrics are stored in memory with configurable retention periods.
+    Prometheus counters, gauges and histograms are kept in a MetricsRegistry;
+    pass a shared registry to expose several components on one endpoint.
     """
     
     def __init__(
@@ -99,6 +109,7 @@ class MetricsCollector:
         max_reward_history: int = 10000,
         max_incident_history: int = 1000,
         accuracy_window_size: int = 100,
+        registry: Optional[MetricsRegistry] = None,
     ):
         """
         Initialize MetricsCollector.
@@ -108,6 +119,7 @@ class MetricsCollector:
             max_reward_history: Maximum reward records to store
             max_incident_history: Maximum Byzantine incidents to store
             accuracy_window_size: Window size for accuracy calculation
+            registry: MetricsRegistry to register metrics in (creates new if None)
         """
         self.max_consensus_history = max_consensus_history
         self.max_reward_history = max_reward_history
@@ -137,7 +149,41 @@ class MetricsCollector:
         self.incident_count = 0
         
         # Thread safety
-        self._lock = threading.Lock()
+        self._lock = threading.RLock()  # Re-entrant: record_* calls get_* under the lock
+        
+        # Prometheus metrics
+        self.registry = registry or MetricsRegistry()
+        self._register_metrics()
+    
+    def _register_metrics(self) -> None:
+        """Create (or look up, in a shared registry) the exported metrics."""
+        registry = self.registry
+        self._rounds_total = registry.counter(
+            "consensus_rounds_total", "Total number of consensus rounds")
+        self._success_total = registry.counter(
+            "consensus_success_total", "Total number of successful consensus rounds")
+        self._failure_total = registry.counter(
+            "consensus_failure_total", "Total number of failed consensus rounds")
+        self._round_duration = registry.histogram(
+            "consensus_duration_seconds", "Consensus round duration from first sight to execution")
+        self._phase_duration = registry.histogram(
+            "consensus_phase_duration_seconds", "Time spent in each consensus phase", ["phase"])
+        self._block_verification = registry.histogram(
+            "block_verification_seconds", "Time to verify a proposed proof block")
+        self._proof_verification = registry.histogram(
+            "proof_verification_seconds", "Time to verify a single proof")
+        self._mempool_size = registry.gauge(
+            "mempool_size", "Current number of proofs in mempool")
+        self._mempool_utilization = registry.gauge(
+            "mempool_utilization", "Mempool utilization (0-1)")
+        self._mempool_rate = registry.gauge(
+            "mempool_processing_rate", "Proof processing rate (proofs/second)")
+        self._rewards_total = registry.counter(
+            "rewards_distributed_total", "Total rewards distributed")
+        self._incidents_total = registry.counter(
+            "byzantine_incidents_total", "Total Byzantine incidents detected")
+        self._alerts_total = registry.counter(
+            "accuracy_alerts_total", "Total accuracy alerts triggered")
     
     def record_consensus_round(
         self,
@@ -149,6 +195,7 @@ class MetricsCollector:
         view: int,
         sequence: int,
         success: bool = True,
+        phase_durations: Optional[Dict[str, float]] = None,
     ) -> None:
         """
         Record metrics for a completed consensus round.
@@ -164,7 +211,14 @@ class MetricsCollector:
             view: View number
             sequence: Sequence number
             success: Whether consensus was successful
+            phase_durations: Seconds spent per phase (keys from CONSENSUS_PHASES)
         """
+        self._rounds_total.inc()
+        (self._success_total if success else self._failure_total).inc()
+        self._round_duration.observe(duration)
+        for phase, seconds in (phase_durations or {}).items():
+            self._phase_duration.labels(phase).observe(seconds)
+        
         with self._lock:
             metrics = ConsensusMetrics(
                 round_id=round_id,
@@ -228,6 +282,47 @@ class MetricsCollector:
             
             self.current_mempool_metrics = metrics
             self.mempool_history.append(metrics)
+        
+        self._mempool_size.set(size)
+        self._mempool_utilization.set(metrics.utilization)
+        self._mempool_rate.set(processing_rate)
+    
+    def record_block_verification(self, duration: float, proof_times_ms: Optional[List[float]] = None) -> None:
+        """
+        Record how long verifying a proof block took.
+        
+        Args:
+            duration: Seconds spent verifying the block
+            proof_times_ms: Per-proof verification times (milliseconds)
+        """
+        self._block_verification.observe(duration)
+        for elapsed_ms in proof_times_ms or ():
+            self._proof_verification.observe(elapsed_ms / 1000.0)
+    
+    def get_latency_percentiles(self) -> Dict[str, Dict[str, float]]:
+        """
+        Estimated p50/p95/p99 latencies in seconds.
+        
+        Returns:
+            Mapping of "round", each consensus phase, "block_verification" and
+            "proof_verification" to their percentiles (phases without
+            observations are omitted)
+        """
+        histograms = {"round": self._round_duration}
+        for phase in CONSENSUS_PHASES:
+            histograms[phase] = self._phase_duration.labels(phase)
+        histograms["block_verification"] = self._block_verification
+        histograms["proof_verification"] = self._proof_verification
+        
+        return {
+            name: {
+                "p50": histogram.quantile(0.50),
+                "p95": histogram.quantile(0.95),
+                "p99": histogram.quantile(0.99),
+            }
+            for name, histogram in histograms.items()
+            if histogram.count()
+        }
     
     def record_verification(self, node_id: str, correct: bool) -> None:
         """
@@ -306,6 +401,7 @@ class MetricsCollector:
         }
         
         self.accuracy_alerts.append(alert)
+        self._alerts_total.inc()
     
     def record_reward(
         self,
@@ -340,6 +436,8 @@ class MetricsCollector:
             if node_id not in self.cumulative_rewards:
                 self.cumulative_rewards[node_id] = 0
             self.cumulative_rewards[node_id] += reward_amount
+        
+        self._rewards_total.inc(reward_amount)
     
     def get_cumulative_rewards(self, node_id: str) -> int:
         """
@@ -389,6 +487,7 @@ class MetricsCollector:
             
             self.incident_history.append(incident)
             self.incident_count += 1
+            self._incidents_total.inc()
             
             return incident_id
     
@@ -510,65 +609,17 @@ class MetricsCollector:
                     'nodes_tracked': len(self.verification_records),
                     'alerts_triggered': len(self.accuracy_alerts),
                 },
+                'latency': self.get_latency_percentiles(),
             }
     
     def export_prometheus_metrics(self) -> str:
         """
         Export metrics in Prometheus format.
         
+        Renders the registry, so the cost is proportional to the number of
+        metrics, not to the amount of history kept.
+        
         Returns:
             Prometheus-formatted metrics string
         """
-        with self._lock:
-            lines = []
-            
-            # Consensus metrics
-            lines.append("# HELP consensus_rounds_total Total number of consensus rounds")
-            lines.append("# TYPE consensus_rounds_total counter")
-            lines.append(f"consensus_rounds_total {self.consensus_count}")
-            
-            lines.append("# HELP consensus_success_total Total number of successful consensus rounds")
-            lines.append("# TYPE consensus_success_total counter")
-            lines.append(f"consensus_success_total {self.consensus_success_count}")
-            
-            lines.append("# HELP consensus_failure_total Total number of failed consensus rounds")
-            lines.append("# TYPE consensus_failure_total counter")
-            lines.append(f"consensus_failure_total {self.consensus_failure_count}")
-            
-            # Average duration
-            if self.consensus_history:
-                avg_duration = sum(m.duration for m in self.consensus_history) / len(self.consensus_history)
-                lines.append("# HELP consensus_duration_seconds Average consensus duration")
-                lines.append("# TYPE consensus_duration_seconds gauge")
-                lines.append(f"consensus_duration_seconds {avg_duration:.6f}")
-            
-            # Mempool metrics
-            if self.current_mempool_metrics:
-                lines.append("# HELP mempool_size Current number of proofs in mempool")
-                lines.append("# TYPE mempool_size gauge")
-                lines.append(f"mempool_size {self.current_mempool_metrics.size}")
-                
-                lines.append("# HELP mempool_utilization Mempool utilization (0-1)")
-                lines.append("# TYPE mempool_utilization gauge")
-                lines.append(f"mempool_utilization {self.current_mempool_metrics.utilization:.6f}")
-                
-                lines.append("# HELP mempool_processing_rate Proof processing rate (proofs/second)")
-                lines.append("# TYPE mempool_processing_rate gauge")
-                lines.append(f"mempool_processing_rate {self.current_mempool_metrics.processing_rate:.6f}")
-            
-            # Reward metrics
-            lines.append("# HELP rewards_distributed_total Total rewards distributed")
-            lines.append("# TYPE rewards_distributed_total counter")
-            lines.append(f"rewards_distributed_total {sum(self.cumulative_rewards.values())}")
-            
-            # Byzantine incidents
-            lines.append("# HELP byzantine_incidents_total Total Byzantine incidents detected")
-            lines.append("# TYPE byzantine_incidents_total counter")
-            lines.append(f"byzantine_incidents_total {self.incident_count}")
-            
-            # Accuracy alerts
-            lines.append("# HELP accuracy_alerts_total Total accuracy alerts triggered")
-            lines.append("# TYPE accuracy_alerts_total counter")
-            lines.append(f"accuracy_alerts_total {len(self.accuracy_alerts)}")
-            
-            return "\n".join(lines)
+        return self.registry.render()
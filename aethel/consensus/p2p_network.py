@@ -11,11 +11,13 @@ Key Features:
 - Gossip protocol with message deduplication
 - Exponential backoff for retries
 - Graceful handling of network partitions
+- Optional persistent TCP transport (see transport.py)
 """
 
 import asyncio
 import hashlib
 import json
+import threading
 import time
 from typing import Dict, List, Callable, Optional, Set, Any
 from dataclasses import dataclass, field
@@ -27,6 +29,8 @@ from aethel.consensus.data_models import (
     PeerInfo,
     MessageType,
 )
+from aethel.consensus.transport import TCPTransport
+from aethel.consensus.wire_codec import WireError, decode_message, encode_message
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -54,7 +58,11 @@ class GossipMessage:
         """Convert to dictionary for serialization."""
         return {
             "message_id": self.message_id,
-            "payload": self.payload if isinstance(self.payload, dict) else str(self.payload),
+            "payload": (
+                self.payload if isinstance(self.payload, dict)
+                else self.payload.hex() if isinstance(self.payload, bytes)
+                else str(self.payload)
+            ),
             "timestamp": self.timestamp,
             "ttl": self.ttl,
             "seen_by": list(self.seen_by),
@@ -98,7 +106,9 @@ class P2PNetwork:
     propagation with Byzantine fault tolerance.
     
     Note: This is a simplified implementation that uses asyncio for async operations.
-    A production implementation would use actual libp2p-python library.
+    Without a transport, sends are only logged. With a TCPTransport, messages
+    travel over one persistent connection per peer and received gossip is
+    delivered to subscribers and relayed while its TTL lasts.
     """
     
     def __init__(
@@ -106,6 +116,7 @@ class P2PNetwork:
         node_id: str,
         listen_port: int = 0,
         bootstrap_peers: Optional[List[str]] = None,
+        transport: Optional[TCPTransport] = None,
     ):
         """
         Initialize P2P network.
@@ -114,11 +125,19 @@ class P2PNetwork:
             node_id: Unique identifier for this node
             listen_port: Port to listen on (0 for random)
             bootstrap_peers: List of bootstrap peer addresses
+            transport: Optional TCPTransport carrying the messages
         """
         self.node_id = node_id
         self.listen_port = listen_port
         self.bootstrap_peers = bootstrap_peers or []
         
+        # Transport (None keeps the log-only behaviour)
+        self.transport = transport
+        if transport is not None:
+            transport.on_message = self._on_transport_message
+        self._background_tasks: List[asyncio.Task] = []
+        self._relay_tasks: Set[asyncio.Task] = set()
+        
         # Peer management
         self.peers: Dict[str, PeerInfo] = {}
         self.connected_peers: Set[str] = set()
@@ -161,6 +180,12 @@ class P2PNetwork:
         self.is_running = True
         logger.info(f"Starting P2P network for node {self.node_id}")
         
+        if self.transport is not None:
+            if self.listen_port and not self.transport.port:
+                self.transport.port = self.listen_port
+            await self.transport.start()
+            self.listen_port = self.transport.port
+        
         # Connect to bootstrap peers
         for peer_address in self.bootstrap_peers:
             try:
@@ -169,8 +194,10 @@ class P2PNetwork:
                 logger.error(f"Failed to connect to bootstrap peer {peer_address}: {e}")
         
         # Start background tasks
-        asyncio.create_task(self._cleanup_seen_messages())
-        asyncio.create_task(self._detect_partitions())
+        self._background_tasks = [
+            asyncio.create_task(self._cleanup_seen_messages()),
+            asyncio.create_task(self._detect_partitions()),
+        ]
         
         logger.info(f"P2P network started for node {self.node_id}")
     
@@ -180,6 +207,12 @@ class P2PNetwork:
             return
         
         self.is_running = False
+        for task in self._background_tasks + list(self._relay_tasks):
+            task.cancel()
+        self._background_tasks = []
+        self._relay_tasks.clear()
+        if self.transport is not None:
+            await self.transport.stop()
         self.connected_peers.clear()
         logger.info(f"P2P network stopped for node {self.node_id}")
     
@@ -222,13 +255,17 @@ class P2PNetwork:
         self.messages_sent += len(self.connected_peers)
         logger.debug(f"Broadcasted message {message_id} to {len(self.connected_peers)} peers")
     
-    async def send_to_peer(self, peer_id: str, message: ConsensusMessage) -> bool:
+    async def send_to_peer(self, peer_id: str, message: ConsensusMessage, topic: str = "consensus") -> bool:
         """
         Send message to specific peer with retry logic.
         
+        With a transport, the message is queued on the peer's connection;
+        this waits while that peer's send queue is full.
+        
         Args:
             peer_id: ID of peer to send to
             message: Message to send
+            topic: Topic the receiver dispatches on
             
         Returns:
             True if message was sent successfully
@@ -251,7 +288,7 @@ class P2PNetwork:
         
         for attempt in range(self.retry_config.max_retries):
             try:
-                await self._send_direct_message(peer_id, message)
+                await self._send_direct_message(peer_id, message, topic)
                 
                 # Reset retry state on success
                 self.retry_counts[retry_key] = 0
@@ -371,13 +408,19 @@ class P2PNetwork:
         Returns:
             Dictionary of metric name to value
         """
-        return {
+        metrics = {
             "messages_sent": self.messages_sent,
             "messages_received": self.messages_received,
             "messages_dropped": self.messages_dropped,
             "connected_peers": len(self.connected_peers),
             "seen_messages": len(self.seen_messages),
         }
+        if self.transport is not None:
+            metrics.update({
+                f"transport_{name}": value
+                for name, value in self.transport.get_stats().items()
+            })
+        return metrics
     
     # Private helper methods
     
@@ -386,10 +429,17 @@ class P2PNetwork:
         # In a real implementation, this would establish a libp2p connection
         logger.debug(f"Connecting to peer at {peer_address}")
     
-    async def _send_direct_message(self, peer_id: str, message: ConsensusMessage) -> None:
+    async def _send_direct_message(self, peer_id: str, message: ConsensusMessage, topic: str = "consensus") -> None:
         """Send a direct message to a peer."""
-        # In a real implementation, this would send via libp2p stream
         logger.debug(f"Sending direct message to {peer_id}")
+        if self.transport is not None:
+            peer = self.peers.get(peer_id)
+            await self.transport.send(
+                peer_id,
+                peer.address if peer else None,
+                topic,
+                self._serialize_message(message),
+            )
     
     async def _gossip_to_peers(self, topic: str, gossip_msg: GossipMessage) -> None:
         """
@@ -417,23 +467,68 @@ class P2PNetwork:
         for peer_id in selected_peers:
             if peer_id not in gossip_msg.seen_by:
                 gossip_msg.seen_by.add(peer_id)
-                # In real implementation, send gossip_msg to peer
                 logger.debug(f"Gossiping message {gossip_msg.message_id} to {peer_id}")
+                if self.transport is not None:
+                    await self.transport.send(
+                        peer_id,
+                        self.peers[peer_id].address,
+                        topic,
+                        gossip_msg.payload,
+                        gossip_msg.ttl,
+                    )
     
-    def _serialize_message(self, message: ConsensusMessage) -> dict:
-        """Serialize a consensus message to dictionary."""
-        return {
-            "message_type": message.message_type.value,
-            "view": message.view,
-            "sequence": message.sequence,
-            "sender_id": message.sender_id,
-            "signature": message.signature.hex() if message.signature else "",
-        }
-    
-    def _generate_message_id(self, message_data: dict) -> str:
+    def _on_transport_message(self, peer_id: str, topic: str, ttl: int, payload: bytes) -> None:
+        """
+        Deliver a message received from the transport.
+        
+        Duplicates are dropped by message ID; gossip with hops left is
+        relayed to other peers.
+        
+        Args:
+            peer_id: Peer the frame arrived from
+            topic: Topic to dispatch on
+            ttl: Remaining gossip hops
+            payload: Wire-encoded consensus message
+        """
+        message_id = self._generate_message_id(payload)
+        if message_id in self.seen_messages:
+            return
+        self.seen_messages[message_id] = time.time()
+        self.last_peer_contact[peer_id] = time.time()
+        
+        try:
+            message = decode_message(payload)
+        except WireError as e:
+            logger.warning(f"Dropping undecodable message from {peer_id}: {e}")
+            self.messages_dropped += 1
+            return
+        
+        self.messages_received += 1
+        for handler in self.message_handlers.get(topic, []):
+            try:
+                handler(message)
+            except Exception as e:
+                logger.error(f"Handler for {topic} failed: {e}")
+        
+        if ttl > 0 and self.is_running:
+            gossip_msg = GossipMessage(
+                message_id=message_id,
+                payload=payload,
+                timestamp=time.time(),
+                ttl=ttl,
+                seen_by={self.node_id, peer_id},
+            )
+            task = asyncio.ensure_future(self._gossip_to_peers(topic, gossip_msg))
+            self._relay_tasks.add(task)
+            task.add_done_callback(self._relay_tasks.discard)
+    
+    def _serialize_message(self, message: ConsensusMessage) -> bytes:
+        """Serialize a consensus message to a binary wire frame."""
+        return encode_message(message)
+    
+    def _generate_message_id(self, message_data: bytes) -> str:
         """Generate unique message ID for deduplication."""
-        serialized = json.dumps(message_data, sort_keys=True).encode()
-        return hashlib.sha256(serialized).hexdigest()
+        return hashlib.sha256(message_data).hexdigest()
     
     def _is_peer_partitioned(self, peer_id: str) -> bool:
         """
@@ -493,33 +588,62 @@ class P2PNetworkSync:
     
     This class provides a synchronous interface to the async P2PNetwork
     for easier integration with existing synchronous code.
+    
+    The network lives on one event loop running in a background thread for
+    the wrapper's lifetime, so transport connections, background tasks and
+    inbound reads keep running between calls. Subscribed handlers are
+    invoked on that thread.
     """
     
-    def __init__(self, node_id: str, listen_port: int = 0):
+    def __init__(self, node_id: str, listen_port: int = 0, transport: Optional[TCPTransport] = None):
         """Initialize synchronous P2P network wrapper."""
-        self.network = P2PNetwork(node_id, listen_port)
+        self.network = P2PNetwork(node_id, listen_port, transport=transport)
         self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+    
+    def _run(self, coro):
+        """Run a coroutine on the network's loop and wait for its result."""
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self.loop.run_forever,
+                    name=f"p2p-{self.network.node_id}",
+                    daemon=True,
+                )
+                self._thread.start()
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
     
     def start(self) -> None:
         """Start P2P network."""
-        self.loop.run_until_complete(self.network.start())
+        self._run(self.network.start())
     
     def stop(self) -> None:
         """Stop P2P network."""
-        self.loop.run_until_complete(self.network.stop())
+        self._run(self.network.stop())
+    
+    def close(self) -> None:
+        """Stop the network and shut down its event loop thread."""
+        if self._thread is None:
+            self.loop.close()
+            return
+        self.stop()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self._thread = None
+        self.loop.close()
     
     def broadcast(self, topic: str, message: ConsensusMessage) -> None:
         """Broadcast message to all peers."""
-        self.loop.run_until_complete(self.network.broadcast(topic, message))
+        self._run(self.network.broadcast(topic, message))
     
-    def send_to_peer(self, peer_id: str, message: ConsensusMessage) -> bool:
+    def send_to_peer(self, peer_id: str, message: ConsensusMessage, topic: str = "consensus") -> bool:
         """Send message to specific peer."""
-        return self.loop.run_until_complete(self.network.send_to_peer(peer_id, message))
+        return self._run(self.network.send_to_peer(peer_id, message, topic))
     
     def discover_peers(self) -> List[PeerInfo]:
         """Discover peers using DHT."""
-        return self.loop.run_until_complete(self.network.discover_peers())
+        return self._run(self.network.discover_peers())
     
     def subscribe(self, topic: str, handler: Callable) -> None:
         """Subscribe to messages on a topic."""
@@ -3,13 +3,19 @@ Proof Mempool for Proof-of-Proof consensus protocol.
 
 This module implements a priority queue for pending proofs awaiting verification.
 Proofs are ordered by difficulty (highest first) to maximize network rewards.
+
+The queue is an indexed binary heap (heap plus proof_hash -> position map), so
+removal by hash is O(log n) and block selection reads the top k entries in
+O(k log k) without copying the heap.
 """
 
 import heapq
+import itertools
 import time
 import hashlib
 import json
-from typing import List, Optional, Dict, Any, Set
+from collections import OrderedDict
+from typing import Callable, Iterator, List, Optional, Dict, Any, Set, Tuple
 from dataclasses import dataclass, field
 from threading import Lock
 
@@ -39,6 +45,9 @@ class PendingProof:
     proof_hash: str = field(compare=False, default="")
     difficulty: int = field(compare=False, default=0)
     timestamp: int = field(compare=False, default_factory=lambda: int(time.time()))
+    sender: Optional[str] = field(compare=False, default=None)
+    size: int = field(compare=False, default=0)  # Serialized size in bytes
+    sequence: int = field(compare=False, default=0)  # Arrival order (tie-breaker)
     
     def __post_init__(self):
         """Calculate proof hash and set priority."""
@@ -52,6 +61,105 @@ class PendingProof:
         self.priority = -self.difficulty
 
 
+class _IndexedHeap:
+    """
+    Binary min-heap of PendingProofs with a proof_hash -> index map.
+    
+    The position map makes removal of an arbitrary entry O(log n): the
+    entry is swapped with the last element, which is then sifted into place.
+    """
+    
+    def __init__(self, key: Callable[[PendingProof], Tuple]):
+        self.items: List[PendingProof] = []
+        self.positions: Dict[str, int] = {}
+        self._key = key
+    
+    def __len__(self) -> int:
+        return len(self.items)
+    
+    def push(self, pending: PendingProof) -> None:
+        self.items.append(pending)
+        self.positions[pending.proof_hash] = len(self.items) - 1
+        self._sift_up(len(self.items) - 1)
+    
+    def peek(self) -> Optional[PendingProof]:
+        return self.items[0] if self.items else None
+    
+    def remove(self, proof_hash: str) -> Optional[PendingProof]:
+        index = self.positions.pop(proof_hash, None)
+        if index is None:
+            return None
+        
+        removed = self.items[index]
+        last = self.items.pop()
+        if index < len(self.items):
+            self.items[index] = last
+            self.positions[last.proof_hash] = index
+            self._sift_up(index)
+            self._sift_down(self.positions[last.proof_hash])
+        
+        return removed
+    
+    def top(self, k: int) -> List[PendingProof]:
+        """Return the k smallest entries in order, leaving the heap untouched."""
+        return list(itertools.islice(self.iter_sorted(), max(k, 0)))
+    
+    def iter_sorted(self) -> Iterator[PendingProof]:
+        """
+        Yield entries smallest first without modifying the heap.
+        
+        Walks the heap with a frontier of candidate indices, so taking the
+        first k entries costs O(k log k).
+        """
+        if not self.items:
+            return
+        
+        frontier = [(self._key(self.items[0]), 0)]
+        while frontier:
+            _, index = heapq.heappop(frontier)
+            yield self.items[index]
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(self.items):
+                    heapq.heappush(frontier, (self._key(self.items[child]), child))
+    
+    def clear(self) -> None:
+        self.items.clear()
+        self.positions.clear()
+    
+    def _sift_up(self, index: int) -> None:
+        items = self.items
+        item = items[index]
+        key = self._key(item)
+        while index > 0:
+            parent = (index - 1) // 2
+            if self._key(items[parent]) <= key:
+                break
+            items[index] = items[parent]
+            self.positions[items[index].proof_hash] = index
+            index = parent
+        items[index] = item
+        self.positions[item.proof_hash] = index
+    
+    def _sift_down(self, index: int) -> None:
+        items = self.items
+        size = len(items)
+        item = items[index]
+        key = self._key(item)
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and self._key(items[child + 1]) < self._key(items[child]):
+                child += 1
+            if key <= self._key(items[child]):
+                break
+            items[index] = items[child]
+            self.positions[items[index].proof_hash] = index
+            index = child
+        items[index] = item
+        self.positions[item.proof_hash] = index
+
+
 class ProofMempool:
     """
     Priority queue for pending proofs awaiting consensus.
@@ -61,10 +169,11 @@ class ProofMempool:
     and removing proofs.
     
     Key features:
-    - Priority queue ordered by difficulty (highest first)
+    - Priority queue ordered by difficulty (highest first, FIFO on ties)
     - Deduplication by proof hash
     - Thread-safe operations
     - Configurable maximum size
+    - Optional TTL, per-sender quota and memory cap (evicts lowest difficulty)
     """
     
     def __init__(
@@ -72,6 +181,10 @@ class ProofMempool:
         max_size: int = 10000,
         proof_verifier: Optional[ProofVerifier] = None,
         metrics_collector: Optional['MetricsCollector'] = None,
+        ttl_seconds: Optional[float] = None,
+        max_per_sender: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        speculative_verification: bool = True,
     ):
         """
         Initialize ProofMempool.
@@ -80,16 +193,35 @@ class ProofMempool:
             max_size: Maximum number of proofs to store
             proof_verifier: ProofVerifier instance for difficulty calculation
             metrics_collector: MetricsCollector instance for metrics emission
+            ttl_seconds: Drop proofs older than this (None = never expire)
+            max_per_sender: Maximum pending proofs per sender (None = unlimited)
+            max_bytes: Memory cap on serialized proofs; when exceeded the
+                lowest-difficulty proofs are evicted (None = unlimited)
+            speculative_verification: Pre-verify proofs added with a given
+                difficulty in the background, so block validation finds
+                their results cached
         """
         self.max_size = max_size
         self.proof_verifier = proof_verifier or ProofVerifier()
         self.metrics_collector = metrics_collector
+        self.ttl_seconds = ttl_seconds
+        self.max_per_sender = max_per_sender
+        self.max_bytes = max_bytes
+        self.speculative_verification = speculative_verification
         
-        # Priority queue (min-heap with negative priorities for max-heap behavior)
-        self._heap: List[PendingProof] = []
+        # Selection heap: highest difficulty first, then arrival order
+        self._queue = _IndexedHeap(key=lambda p: (p.priority, p.sequence))
+        self._heap: List[PendingProof] = self._queue.items
         
-        # Set of proof hashes for deduplication
-        self._proof_hashes: Set[str] = set()
+        # Eviction heap: lowest difficulty first, newest first on ties
+        self._eviction_queue = _IndexedHeap(key=lambda p: (p.difficulty, -p.sequence))
+        
+        # Proofs in arrival order (hash -> pending) for TTL expiry and dedup
+        self._by_arrival: 'OrderedDict[str, PendingProof]' = OrderedDict()
+        
+        self._sender_counts: Dict[str, int] = {}
+        self._total_bytes = 0
+        self._sequence = itertools.count()
         
         # Lock for thread-safe operations
         self._lock = Lock()
@@ -98,8 +230,15 @@ class ProofMempool:
         self._total_added = 0
         self._total_removed = 0
         self._total_rejected = 0
+        self._total_evicted = 0
+        self._total_expired = 0
     
-    def add_proof(self, proof: Any, difficulty: Optional[int] = None) -> bool:
+    def add_proof(
+        self,
+        proof: Any,
+        difficulty: Optional[int] = None,
+        sender: Optional[str] = None
+    ) -> bool:
         """
         Add a proof to the mempool.
         
@@ -109,18 +248,21 @@ class ProofMempool:
         Args:
             proof: Proof object to add
             difficulty: Pre-calculated difficulty (optional)
+            sender: Submitting node, used for per-sender quotas (optional)
             
         Returns:
-            True if proof was added, False if rejected (duplicate or mempool full)
+            True if proof was added, False if rejected (duplicate, mempool
+            full, sender over quota or too low difficulty for the memory cap)
         """
         with self._lock:
+            self._expire(time.time())
+            
             # Calculate proof hash
-            proof_hash = hashlib.sha256(
-                json.dumps(proof).encode()
-            ).hexdigest()
+            encoded = json.dumps(proof).encode()
+            proof_hash = hashlib.sha256(encoded).hexdigest()
             
             # Check for duplicates
-            if proof_hash in self._proof_hashes:
+            if proof_hash in self._by_arrival:
                 self._total_rejected += 1
                 return False
             
@@ -130,6 +272,19 @@ class ProofMempool:
                 self._total_rejected += 1
                 return False
             
+            # Check per-sender quota
+            if (
+                sender is not None
+                and self.max_per_sender is not None
+                and self._sender_counts.get(sender, 0) >= self.max_per_sender
+            ):
+                self._total_rejected += 1
+                return False
+            
+            # Proofs arriving with a claimed difficulty (e.g. via gossip) are
+            # checked in the background once admitted
+            speculate = difficulty is not None and self.speculative_verification
+            
             # Calculate difficulty if not provided
             if difficulty is None:
                 verification_result = self.proof_verifier.verify_proof(proof)
@@ -139,18 +294,26 @@ class ProofMempool:
                     return False
                 difficulty = verification_result.difficulty
             
+            # Make room under the memory cap by evicting easier proofs
+            if not self._reserve_bytes(len(encoded), difficulty):
+                self._total_rejected += 1
+                return False
+            
             # Create pending proof
             pending = PendingProof(
                 priority=-difficulty,  # Negative for max-heap
                 proof=proof,
                 proof_hash=proof_hash,
                 difficulty=difficulty,
-                timestamp=int(time.time())
+                timestamp=int(time.time()),
+                sender=sender,
+                size=len(encoded),
+                sequence=next(self._sequence)
             )
             
-            # Add to heap and hash set
-            heapq.heappush(self._heap, pending)
-            self._proof_hashes.add(proof_hash)
+            self._insert(pending)
+            if speculate:
+                self.proof_verifier.speculate(proof)
             
             self._total_added += 1
             
@@ -162,7 +325,8 @@ class ProofMempool:
     def get_next_block(
         self,
         block_size: int = 10,
-        proposer_id: str = "unknown"
+        proposer_id: str = "unknown",
+        exclude: Optional[Set[str]] = None
     ) -> Optional[ProofBlock]:
         """
         Select proofs for the next consensus block.
@@ -173,25 +337,25 @@ class ProofMempool:
         Args:
             block_size: Maximum number of proofs to include
             proposer_id: ID of the node proposing this block
+            exclude: Proof hashes to skip (e.g. proofs already in blocks
+                that are still going through consensus)
             
         Returns:
             ProofBlock with selected proofs, or None if mempool is empty
         """
         with self._lock:
+            self._expire(time.time())
+            
             if not self._heap:
                 return None
             
-            # Get top proofs without removing them
-            # We need to peek at the heap without modifying it
-            selected_proofs = []
-            
-            # Create a copy of the heap to peek at top elements
-            heap_copy = self._heap.copy()
-            
-            for _ in range(min(block_size, len(heap_copy))):
-                if heap_copy:
-                    pending = heapq.heappop(heap_copy)
-                    selected_proofs.append(pending.proof)
+            # Peek at the top proofs without copying or modifying the heap
+            if exclude:
+                candidates = (p for p in self._queue.iter_sorted() if p.proof_hash not in exclude)
+                selected = itertools.islice(candidates, max(block_size, 0))
+            else:
+                selected = self._queue.top(block_size)
+            selected_proofs = [pending.proof for pending in selected]
             
             if not selected_proofs:
                 return None
@@ -222,17 +386,9 @@ class ProofMempool:
             True if proof was removed, False if not found
         """
         with self._lock:
-            if proof_hash not in self._proof_hashes:
+            if self._discard(proof_hash) is None:
                 return False
             
-            # Remove from hash set
-            self._proof_hashes.remove(proof_hash)
-            
-            # Remove from heap (requires rebuilding heap)
-            # This is O(n) but acceptable for mempool operations
-            self._heap = [p for p in self._heap if p.proof_hash != proof_hash]
-            heapq.heapify(self._heap)
-            
             self._total_removed += 1
             
             # Update metrics (Property 33: Real-Time Mempool Metrics)
@@ -253,21 +409,11 @@ class ProofMempool:
             Number of proofs actually removed
         """
         with self._lock:
-            # Convert to set for O(1) lookup
-            hashes_to_remove = set(proof_hashes)
-            
-            # Count how many we'll actually remove
-            removed_count = len(hashes_to_remove & self._proof_hashes)
-            
-            # Remove from hash set
-            self._proof_hashes -= hashes_to_remove
-            
-            # Remove from heap
-            self._heap = [
-                p for p in self._heap
-                if p.proof_hash not in hashes_to_remove
-            ]
-            heapq.heapify(self._heap)
+            # O(k log n): each hash is removed through the position map
+            removed_count = 0
+            for proof_hash in set(proof_hashes):
+                if self._discard(proof_hash) is not None:
+                    removed_count += 1
             
             self._total_removed += removed_count
             
@@ -307,7 +453,7 @@ class ProofMempool:
             True if proof is in mempool
         """
         with self._lock:
-            return proof_hash in self._proof_hashes
+            return proof_hash in self._by_arrival
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -323,6 +469,9 @@ class ProofMempool:
                 'total_added': self._total_added,
                 'total_removed': self._total_removed,
                 'total_rejected': self._total_rejected,
+                'total_evicted': self._total_evicted,
+                'total_expired': self._total_expired,
+                'bytes': self._total_bytes,
                 'utilization': len(self._heap) / self.max_size if self.max_size > 0 else 0
             }
     
@@ -333,8 +482,106 @@ class ProofMempool:
         This is primarily for testing purposes.
         """
         with self._lock:
-            self._heap.clear()
-            self._proof_hashes.clear()
+            self._queue.clear()
+            self._eviction_queue.clear()
+            self._by_arrival.clear()
+            self._sender_counts.clear()
+            self._total_bytes = 0
+    
+    def evict_expired(self, now: Optional[float] = None) -> int:
+        """
+        Drop proofs older than ttl_seconds.
+        
+        Expiry also runs on add_proof() and get_next_block(); this is for
+        callers that want to reclaim memory on a timer.
+        
+        Args:
+            now: Current time (defaults to time.time())
+        
+        Returns:
+            Number of proofs expired
+        """
+        with self._lock:
+            expired = self._expire(time.time() if now is None else now)
+            if expired:
+                self._update_metrics()
+            return expired
+    
+    def _insert(self, pending: PendingProof) -> None:
+        """Add a pending proof to every index."""
+        self._queue.push(pending)
+        self._eviction_queue.push(pending)
+        self._by_arrival[pending.proof_hash] = pending
+        self._total_bytes += pending.size
+        if pending.sender is not None:
+            self._sender_counts[pending.sender] = self._sender_counts.get(pending.sender, 0) + 1
+    
+    def _discard(self, proof_hash: str) -> Optional[PendingProof]:
+        """Remove a pending proof from every index in O(log n)."""
+        pending = self._by_arrival.pop(proof_hash, None)
+        if pending is None:
+            return None
+        
+        self._queue.remove(proof_hash)
+        self._eviction_queue.remove(proof_hash)
+        self._total_bytes -= pending.size
+        
+        if pending.sender is not None:
+            remaining = self._sender_counts[pending.sender] - 1
+            if remaining:
+                self._sender_counts[pending.sender] = remaining
+            else:
+                del self._sender_counts[pending.sender]
+        
+        return pending
+    
+    def _expire(self, now: float) -> int:
+        """Pop expired proofs from the front of the arrival order."""
+        if self.ttl_seconds is None:
+            return 0
+        
+        expired = 0
+        cutoff = now - self.ttl_seconds
+        while self._by_arrival:
+            oldest = next(iter(self._by_arrival.values()))
+            if oldest.timestamp > cutoff:
+                break
+            self._discard(oldest.proof_hash)
+            expired += 1
+        
+        self._total_expired += expired
+        return expired
+    
+    def _reserve_bytes(self, size: int, difficulty: int) -> bool:
+        """
+        Evict lowest-difficulty proofs until a new proof of the given size fits.
+        
+        Only proofs strictly easier than the incoming one are evicted; if that
+        is not enough the new proof is rejected and nothing is evicted.
+        """
+        if self.max_bytes is None:
+            return True
+        
+        if size > self.max_bytes:
+            return False
+        
+        # Check the eviction is possible before touching the pool
+        needed = self._total_bytes + size - self.max_bytes
+        if needed > 0:
+            freed = 0
+            for pending in self._eviction_queue.iter_sorted():
+                if pending.difficulty >= difficulty:
+                    return False
+                freed += pending.size
+                if freed >= needed:
+                    break
+        
+        while self._total_bytes + size > self.max_bytes:
+            victim = self._eviction_queue.peek()
+            self._discard(victim.proof_hash)
+            self._total_evicted += 1
+        
+        return True
     
     def _generate_block_id(self) -> str:
         """
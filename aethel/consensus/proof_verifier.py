@@ -10,16 +10,21 @@ signatures on proofs before consensus.
 
 Performance optimizations:
 - Parallel proof verification using multiprocessing
-- Batch signature verification
-- Verification result caching
+- Batch signature verification on a thread pool
+- Verified signature caching, so re-delivered proofs cost nothing
+- Verification results cached by proof hash; block validation rechecks
+  only proofs not seen before, on a persistent worker pool
+- Speculative pre-verification of proofs as they enter the mempool
 """
 
 import time
 import hashlib
 import json
-from typing import Optional, Dict, Any, List
+import threading
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from aethel.core.judge import AethelJudge
 from aethel.core.crypto import AethelCrypt
@@ -31,6 +36,9 @@ from aethel.consensus.data_models import (
 )
 
 
+SIGNATURE_ERROR = "Invalid or missing signature"
+
+
 @dataclass
 class SolverStats:
     """Statistics from Z3 solver execution."""
@@ -62,7 +70,9 @@ class ProofVerifier:
         self,
         judge: Optional[AethelJudge] = None,
         require_signatures: bool = True,
-        max_workers: int = 4
+        max_workers: int = 4,
+        signature_cache_size: int = 10000,
+        verification_cache_size: int = 10000
     ):
         """
         Initialize ProofVerifier.
@@ -71,6 +81,8 @@ class ProofVerifier:
             judge: AethelJudge instance (creates new one if None)
             require_signatures: Whether to require valid signatures on proofs
             max_workers: Maximum number of parallel verification workers
+            signature_cache_size: Number of signature verdicts to remember
+            verification_cache_size: Number of proof results to remember
         """
         self.judge = judge
         self.require_signatures = require_signatures
@@ -81,9 +93,21 @@ class ProofVerifier:
         
         # Performance optimizations
         self.max_workers = max_workers
-        self._verification_cache: Dict[str, VerificationResult] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._speculation_executor: Optional[ThreadPoolExecutor] = None
+        
+        # Results keyed by proof content hash; speculative runs in flight
+        self.verification_cache_size = verification_cache_size
+        self._verification_cache: "OrderedDict[str, VerificationResult]" = OrderedDict()
+        self._speculative: Dict[str, Future] = {}
+        self._cache_lock = threading.Lock()
         self._cache_hits = 0
         self._cache_misses = 0
+        
+        # Signature verdicts keyed by (public key, digest of message and signature)
+        self.signature_cache_size = signature_cache_size
+        self._signature_cache: "OrderedDict[Tuple[str, str], bool]" = OrderedDict()
+        self._signature_cache_hits = 0
     
     def verify_signature(self, signed_proof: SignedProof) -> bool:
         """
@@ -104,28 +128,80 @@ class ProofVerifier:
         if not signed_proof.public_key or not signed_proof.signature:
             return False
         
-        # Serialize proof data to canonical JSON for verification
-        if isinstance(signed_proof.proof_data, dict):
-            message = json.dumps(signed_proof.proof_data, sort_keys=True, separators=(',', ':'))
+        message = self._signature_message(signed_proof)
+        cache_key = self._signature_cache_key(signed_proof, message)
+        
+        is_valid = self._signature_cache.get(cache_key)
+        if is_valid is None:
+            is_valid = self._check_signature(signed_proof, message)
+            self._remember_signature(cache_key, is_valid)
         else:
-            message = str(signed_proof.proof_data)
+            self._signature_cache_hits += 1
+        
+        if not is_valid:
+            self._signature_failures += 1
         
-        # Verify signature using AethelCrypt
+        return is_valid
+    
+    def _signature_message(self, signed_proof: SignedProof) -> str:
+        """Serialize proof data to the canonical form that was signed."""
+        if isinstance(signed_proof.proof_data, dict):
+            return json.dumps(signed_proof.proof_data, sort_keys=True, separators=(',', ':'))
+        return str(signed_proof.proof_data)
+    
+    @staticmethod
+    def _signature_cache_key(signed_proof: SignedProof, message: str) -> Tuple[str, str]:
+        """Key a signature by signer and a digest of message and signature."""
+        digest = hashlib.sha256(
+            message.encode() + b"\x00" + signed_proof.signature.encode()
+        ).hexdigest()
+        return signed_proof.public_key, digest
+    
+    def _check_signature(self, signed_proof: SignedProof, message: str) -> bool:
+        """Run the ED25519 check through AethelCrypt."""
         try:
-            is_valid = self.crypto.verify_signature(
+            return self.crypto.verify_signature(
                 public_key_hex=signed_proof.public_key,
                 message=message,
                 signature_hex=signed_proof.signature
             )
-            
-            if not is_valid:
-                self._signature_failures += 1
-            
-            return is_valid
         except Exception:
-            self._signature_failures += 1
             return False
     
+    def _remember_signature(self, cache_key: Tuple[str, str], is_valid: bool) -> None:
+        """Store a verdict, evicting the oldest entry past the cache size."""
+        self._signature_cache[cache_key] = is_valid
+        if len(self._signature_cache) > self.signature_cache_size:
+            self._signature_cache.popitem(last=False)
+    
+    @staticmethod
+    def proof_cache_key(proof: Any) -> Optional[str]:
+        """
+        Content hash under which a proof's result is cached.
+        
+        Only self-contained proofs (dicts, and SignedProofs wrapping a
+        dict) are cached. Intent names, bare or signed, are not: their
+        result depends on the judge and its current intent map.
+        
+        Args:
+            proof: Proof object
+        
+        Returns:
+            Hex digest, or None if the proof is not cacheable
+        """
+        try:
+            if isinstance(proof, SignedProof):
+                if not isinstance(proof.proof_data, dict):
+                    return None
+                encoded = json.dumps(proof.to_dict(), sort_keys=True)
+            elif isinstance(proof, dict):
+                encoded = json.dumps(proof, sort_keys=True)
+            else:
+                return None
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(encoded.encode()).hexdigest()
+    
     def verify_proof(self, proof: Any) -> VerificationResult:
         """
         Verify a single Z3 proof and measure difficulty.
@@ -136,12 +212,127 @@ class ProofVerifier:
         - Difficulty calculation
         - Error handling
         
+        A proof verified before (or being verified speculatively) returns
+        the cached result instead of being verified again.
+        
         Args:
             proof: Proof object to verify (SignedProof, intent_name string, or dict)
             
         Returns:
             VerificationResult with validity, difficulty, and timing info
         """
+        key = self.proof_cache_key(proof)
+        if key is None:
+            return self._verify_uncached(proof)
+        
+        cached = self._cached_result(key)
+        if cached is not None:
+            return cached
+        
+        result = self._verify_uncached(proof)
+        self._store_result(key, result)
+        return result
+    
+    def speculate(self, proof: Any) -> None:
+        """
+        Start verifying a proof in the background.
+        
+        Called when a proof enters the mempool, so that by the time it is
+        proposed in a block its result is already cached. Does nothing for
+        proofs already cached, already in flight or not cacheable.
+        
+        Args:
+            proof: Proof object to pre-verify
+        """
+        key = self.proof_cache_key(proof)
+        if key is None:
+            return
+        
+        with self._cache_lock:
+            if key in self._verification_cache or key in self._speculative:
+                return
+            self._speculative[key] = self._speculation_pool().submit(
+                self._run_speculative, key, proof
+            )
+    
+    def is_cached(self, proof: Any) -> bool:
+        """Whether a proof's result is cached or being computed."""
+        key = self.proof_cache_key(proof)
+        if key is None:
+            return False
+        with self._cache_lock:
+            return key in self._verification_cache or key in self._speculative
+    
+    def shutdown(self) -> None:
+        """Stop the worker pools (they are recreated on next use)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._speculation_executor is not None:
+            self._speculation_executor.shutdown(wait=True)
+            self._speculation_executor = None
+    
+    def _pool(self) -> ThreadPoolExecutor:
+        """Persistent worker pool for block validation."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="proof-verify"
+            )
+        return self._executor
+    
+    def _speculation_pool(self) -> ThreadPoolExecutor:
+        """
+        Separate pool for speculative runs.
+        
+        Block validation tasks wait on speculative futures; if both shared
+        one pool, a block could occupy every worker while the speculative
+        runs it waits for sit queued behind it.
+        """
+        if self._speculation_executor is None:
+            self._speculation_executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="proof-speculate"
+            )
+        return self._speculation_executor
+    
+    def _run_speculative(self, key: str, proof: Any) -> VerificationResult:
+        try:
+            result = self._verify_uncached(proof)
+            self._store_result(key, result)
+            return result
+        finally:
+            with self._cache_lock:
+                self._speculative.pop(key, None)
+    
+    def _cached_result(self, key: str) -> Optional[VerificationResult]:
+        """Return a cached result, waiting for a speculative run if one is in flight."""
+        with self._cache_lock:
+            result = self._verification_cache.get(key)
+            if result is not None:
+                self._verification_cache.move_to_end(key)
+                self._cache_hits += 1
+                return result
+            future = self._speculative.get(key)
+            if future is None:
+                self._cache_misses += 1
+                return None
+            self._cache_hits += 1
+        return future.result()
+    
+    def _store_result(self, key: str, result: VerificationResult) -> None:
+        # Signature rejections are re-checked (cheaply, via the signature
+        # cache) on every call so each one is counted as a failure
+        if result.error == SIGNATURE_ERROR:
+            return
+        with self._cache_lock:
+            self._verification_cache[key] = result
+            self._verification_cache.move_to_end(key)
+            if len(self._verification_cache) > self.verification_cache_size:
+                self._verification_cache.popitem(last=False)
+    
+    def _verify_uncached(self, proof: Any) -> VerificationResult:
+        """Verify a proof without consulting the result cache."""
         start_time = time.time()
         solver_stats = SolverStats()
         
@@ -157,7 +348,7 @@ class ProofVerifier:
                         proof_hash=hashlib.sha256(
                             json.dumps(proof.to_dict()).encode()
                         ).hexdigest(),
-                        error="Invalid or missing signature"
+                        error=SIGNATURE_ERROR
                     )
             
             # Extract the actual proof data
@@ -309,7 +500,9 @@ class ProofVerifier:
         This method verifies each proof in the block and aggregates
         the results. If any proof fails, the entire block is marked as invalid.
         
-        Performance optimization: Uses parallel verification when enabled.
+        Proofs whose results are cached (for example pre-verified when they
+        entered the mempool) are not verified again; the remaining proofs
+        are verified on the worker pool when parallel is enabled.
         
         Args:
             block: ProofBlock containing proofs to verify
@@ -325,7 +518,7 @@ class ProofVerifier:
     
     def _verify_proof_block_sequential(self, block: ProofBlock) -> BlockVerificationResult:
         """
-        Verify proofs sequentially (original implementation).
+        Verify proofs one after another, stopping at the first failure.
         
         Args:
             block: ProofBlock containing proofs to verify
@@ -333,37 +526,14 @@ class ProofVerifier:
         Returns:
             BlockVerificationResult with validity and aggregated difficulty
         """
-        results = []
-        total_difficulty = 0
-        
-        for proof in block.proofs:
-            result = self.verify_proof(proof)
-            results.append(result)
-            
-            if not result.valid:
-                # Block is invalid if any proof fails
-                return BlockVerificationResult(
-                    valid=False,
-                    total_difficulty=total_difficulty,
-                    results=results,
-                    failed_proof=proof
-                )
-            
-            total_difficulty += result.difficulty
-        
-        # All proofs valid
-        return BlockVerificationResult(
-            valid=True,
-            total_difficulty=total_difficulty,
-            results=results,
-            failed_proof=None
-        )
+        return self._collect_block_results(block, {})
     
     def _verify_proof_block_parallel(self, block: ProofBlock) -> BlockVerificationResult:
         """
-        Verify proofs in parallel using thread pool.
+        Verify uncached proofs on the worker pool.
         
-        This provides significant speedup for blocks with many proofs.
+        Results are collected in block order, so the outcome (including
+        which proof is reported as failed) matches sequential verification.
         
         Args:
             block: ProofBlock containing proofs to verify
@@ -371,59 +541,58 @@ class ProofVerifier:
         Returns:
             BlockVerificationResult with validity and aggregated difficulty
         """
+        uncached = [
+            index for index, proof in enumerate(block.proofs)
+            if not self.is_cached(proof)
+        ]
+        futures: Dict[int, Future] = {}
+        if len(uncached) > 1:
+            pool = self._pool()
+            futures = {
+                index: pool.submit(self.verify_proof, block.proofs[index])
+                for index in uncached
+            }
+        
+        try:
+            return self._collect_block_results(block, futures)
+        finally:
+            for future in futures.values():
+                future.cancel()
+    
+    def _collect_block_results(
+        self,
+        block: ProofBlock,
+        futures: Dict[int, Future]
+    ) -> BlockVerificationResult:
+        """Gather per-proof results in block order, stopping at the first failure."""
         results = []
         total_difficulty = 0
         
-        # Use thread pool for parallel verification
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all verification tasks
-            future_to_proof = {
-                executor.submit(self.verify_proof, proof): proof
-                for proof in block.proofs
-            }
+        for index, proof in enumerate(block.proofs):
+            try:
+                future = futures.get(index)
+                result = future.result() if future is not None else self.verify_proof(proof)
+            except Exception as e:
+                # Verification failed with exception
+                result = VerificationResult(
+                    valid=False,
+                    difficulty=0,
+                    verification_time=0.0,
+                    proof_hash="",
+                    error=str(e)
+                )
+            results.append(result)
             
-            # Collect results as they complete
-            for future in as_completed(future_to_proof):
-                proof = future_to_proof[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                    
-                    if not result.valid:
-                        # Block is invalid if any proof fails
-                        # Cancel remaining tasks
-                        for f in future_to_proof:
-                            f.cancel()
-                        
-                        return BlockVerificationResult(
-                            valid=False,
-                            total_difficulty=total_difficulty,
-                            results=results,
-                            failed_proof=proof
-                        )
-                    
-                    total_difficulty += result.difficulty
-                    
-                except Exception as e:
-                    # Verification failed with exception
-                    results.append(VerificationResult(
-                        valid=False,
-                        difficulty=0,
-                        verification_time=0.0,
-                        proof_hash="",
-                        error=str(e)
-                    ))
-                    
-                    # Cancel remaining tasks
-                    for f in future_to_proof:
-                        f.cancel()
-                    
-                    return BlockVerificationResult(
-                        valid=False,
-                        total_difficulty=total_difficulty,
-                        results=results,
-                        failed_proof=proof
-                    )
+            if not result.valid:
+                # Block is invalid if any proof fails
+                return BlockVerificationResult(
+                    valid=False,
+                    total_difficulty=total_difficulty,
+                    results=results,
+                    failed_proof=proof
+                )
+            
+            total_difficulty += result.difficulty
         
         # All proofs valid
         return BlockVerificationResult(
@@ -437,7 +606,9 @@ class ProofVerifier:
         """
         Verify signatures for multiple proofs in batch.
         
-        This is more efficient than verifying signatures one at a time.
+        Cached verdicts are answered directly and duplicates inside the
+        batch are checked once; the remaining signatures are verified on
+        the worker pool.
         
         Args:
             signed_proofs: List of SignedProof objects to verify
@@ -446,6 +617,8 @@ class ProofVerifier:
             Dictionary mapping proof hash to verification result
         """
         results = {}
+        pending: Dict[Tuple[str, str], Tuple[SignedProof, str]] = {}
+        keyed: List[Tuple[str, Optional[Tuple[str, str]], Optional[bool]]] = []
         
         for signed_proof in signed_proofs:
             # Calculate proof hash
@@ -453,8 +626,43 @@ class ProofVerifier:
                 json.dumps(signed_proof.to_dict()).encode()
             ).hexdigest()
             
-            # Verify signature
-            is_valid = self.verify_signature(signed_proof)
+            if not signed_proof.public_key or not signed_proof.signature:
+                keyed.append((proof_hash, None, False))
+                continue
+            
+            message = self._signature_message(signed_proof)
+            cache_key = self._signature_cache_key(signed_proof, message)
+            cached = self._signature_cache.get(cache_key)
+            keyed.append((proof_hash, cache_key, cached))
+            if cached is None:
+                pending.setdefault(cache_key, (signed_proof, message))
+        
+        # Verify the misses, in parallel when there is more than one
+        if len(pending) > 1 and self.max_workers > 1:
+            verdicts = list(self._pool().map(
+                lambda item: self._check_signature(*item),
+                pending.values()
+            ))
+        else:
+            verdicts = [self._check_signature(*item) for item in pending.values()]
+        
+        checked = dict(zip(pending.keys(), verdicts))
+        for cache_key, is_valid in checked.items():
+            self._remember_signature(cache_key, is_valid)
+        
+        for proof_hash, cache_key, is_valid in keyed:
+            if is_valid is None:
+                is_valid = checked[cache_key]
+                if cache_key in pending:
+                    del pending[cache_key]
+                else:
+                    # Repeat of a signature verified earlier in this batch
+                    self._signature_cache_hits += 1
+            elif cache_key is not None:
+                self._signature_cache_hits += 1
+            
+            if not is_valid and cache_key is not None:
+                self._signature_failures += 1
             results[proof_hash] = is_valid
         
         return results
@@ -502,8 +710,11 @@ class ProofVerifier:
                 else 0
             ),
             'signature_failures': self._signature_failures,
+            'signature_cache_hits': self._signature_cache_hits,
             'cache_hits': self._cache_hits,
             'cache_misses': self._cache_misses,
+            'cached_results': len(self._verification_cache),
+            'speculative_in_flight': len(self._speculative),
             'cache_hit_rate': (
                 self._cache_hits / (self._cache_hits + self._cache_misses) * 100
                 if (self._cache_hits + self._cache_misses) > 0
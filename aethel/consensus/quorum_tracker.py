@@ -0,0 +1,126 @@
+"""
+Incremental quorum counting for the consensus protocol.
+
+Votes are recorded as bitsets indexed by each validator's position in the
+sorted validator list, with a running count per vote key (for example a
+(view, sequence, digest) triple). Recording a vote is O(1) and a threshold
+callback fires exactly once per key, the first time its count reaches the
+quorum, so handlers never rescan the messages they have already counted.
+"""
+
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Set
+
+
+class ValidatorIndex:
+    """
+    Assigns each validator a fixed bit position.
+
+    Validators known up front get positions in sorted order; validators
+    first seen later (peers that joined after start-up) are appended.
+    """
+
+    def __init__(self, validator_ids: Iterable[str] = ()):
+        self._ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        for validator_id in sorted(validator_ids):
+            self.position(validator_id)
+
+    def position(self, validator_id: str) -> int:
+        """Get a validator's bit position, assigning the next one if new."""
+        position = self._positions.get(validator_id)
+        if position is None:
+            position = len(self._ids)
+            self._positions[validator_id] = position
+            self._ids.append(validator_id)
+        return position
+
+    def members(self, bits: int) -> List[str]:
+        """List the validators whose bits are set."""
+        members = []
+        while bits:
+            low = bits & -bits
+            members.append(self._ids[low.bit_length() - 1])
+            bits ^= low
+        return members
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+class QuorumTracker:
+    """
+    Counts votes per key and reports when a key first reaches quorum.
+
+    Attributes:
+        index: Shared validator bit positions
+        threshold: Callable returning the current quorum size (2f+1)
+        on_quorum: Optional callback invoked once with each key reaching quorum
+    """
+
+    def __init__(
+        self,
+        index: ValidatorIndex,
+        threshold: Callable[[], int],
+        on_quorum: Optional[Callable[[Hashable], None]] = None
+    ):
+        self.index = index
+        self.threshold = threshold
+        self.on_quorum = on_quorum
+        self._votes: Dict[Hashable, int] = {}
+        self._counts: Dict[Hashable, int] = {}
+        self._reached: Set[Hashable] = set()
+
+    def add_vote(self, key: Hashable, voter_id: str) -> bool:
+        """
+        Record a vote for key.
+
+        Repeated votes from the same validator are ignored.
+
+        Args:
+            key: What is being voted on
+            voter_id: Validator casting the vote
+
+        Returns:
+            True only for the vote that first brings key to quorum
+        """
+        bit = 1 << self.index.position(voter_id)
+        votes = self._votes.get(key, 0)
+        if votes & bit:
+            return False
+
+        self._votes[key] = votes | bit
+        count = self._counts.get(key, 0) + 1
+        self._counts[key] = count
+
+        if key in self._reached or count < self.threshold():
+            return False
+
+        self._reached.add(key)
+        if self.on_quorum:
+            self.on_quorum(key)
+        return True
+
+    def count(self, key: Hashable) -> int:
+        """Number of distinct validators that voted for key."""
+        return self._counts.get(key, 0)
+
+    def has_quorum(self, key: Hashable) -> bool:
+        """Whether key has reached quorum."""
+        return key in self._reached
+
+    def voters(self, key: Hashable) -> List[str]:
+        """Validators that voted for key."""
+        return self.index.members(self._votes.get(key, 0))
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Forget every key matching predicate."""
+        for key in [key for key in self._votes if predicate(key)]:
+            del self._votes[key]
+            del self._counts[key]
+            self._reached.discard(key)
+
+    def clear(self) -> None:
+        """Forget all votes."""
+        self._votes.clear()
+        self._counts.clear()
+        self._reached.clear()
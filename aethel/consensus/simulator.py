@@ -0,0 +1,509 @@
+"""
+Discrete-event consensus simulator.
+
+MockP2PNetwork delivers every message synchronously through a global
+registry, which is fine for correctness tests but says nothing about
+latency, throughput or view-change behaviour at scale. This module runs
+hundreds of unmodified ConsensusEngine (and ByzantineNode) instances in one
+process against a virtual clock:
+
+- SimulatedNetwork is a MockP2PNetwork whose sends become timed events
+- LinkProfile models latency (base + exponential jitter), uplink
+  bandwidth and loss, globally or per link
+- Each node's uplink and CPU are serial resources, so a leader
+  broadcasting to 500 validators queues behind its own bandwidth
+- Message sizes are the real wire_codec frame sizes
+- Partitions can be opened and healed at given virtual times
+- Byzantine validators use the ByzantineAttackStrategy behaviours
+- Nodes stuck on a pending instance past view_change_timeout_ms start a
+  view change, so faulty leaders produce view-change storms
+
+Runs are deterministic for a given seed. ByzantineNode draws from the
+module-level random generator, so the simulator seeds it too.
+
+Example:
+    config = SimulationConfig(validator_count=200, duration_ms=2000)
+    report = ConsensusSimulator(config).run()
+    print(report.rounds_per_sec, report.finality_latency_ms["p99"])
+"""
+
+import heapq
+import itertools
+import math
+import random
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from aethel.consensus.byzantine_node import ByzantineAttackStrategy, ByzantineNode
+from aethel.consensus.consensus_engine import ConsensusEngine
+from aethel.consensus.data_models import ConsensusMessage, ConsensusResult, PeerInfo
+from aethel.consensus.mock_network import MockP2PNetwork, NetworkConfig
+from aethel.consensus.monitoring import MetricsCollector
+from aethel.consensus.proof_mempool import ProofMempool
+from aethel.consensus.proof_verifier import ProofVerifier
+from aethel.consensus.state_store import StateStore
+from aethel.consensus.wire_codec import WireError, encode_message
+
+
+@dataclass
+class LinkProfile:
+    """
+    Network characteristics of a link.
+    
+    Attributes:
+        latency_ms: Base one-way propagation delay
+        jitter_ms: Mean of the exponential delay added to each message
+        bandwidth_mbps: Sender uplink bandwidth used on this link
+        loss_rate: Probability a message is dropped (0.0 to 1.0)
+    """
+    latency_ms: float = 20.0
+    jitter_ms: float = 5.0
+    bandwidth_mbps: float = 1000.0
+    loss_rate: float = 0.0
+
+
+@dataclass
+class SimulationConfig:
+    """
+    Parameters of a simulation run.
+    
+    Attributes:
+        validator_count: Number of ConsensusEngine instances
+        byzantine_count: How many of them are ByzantineNodes
+        byzantine_strategy: ByzantineAttackStrategy used by Byzantine nodes
+        link: Default profile for every link
+        proofs_per_block: Proofs the leader puts in each block
+        proposal_interval_ms: How often the leader tries to propose
+        processing_ms: Virtual CPU time to handle one message
+        view_change_timeout_ms: Progress timeout before a view change
+        watermark_window: Pipelined sequence numbers in flight
+        duration_ms: Virtual time to simulate
+        max_blocks: Stop proposing after this many blocks (None = no limit)
+        seed: Random seed
+    """
+    validator_count: int = 100
+    byzantine_count: int = 0
+    byzantine_strategy: str = ByzantineAttackStrategy.SILENT
+    link: LinkProfile = field(default_factory=LinkProfile)
+    proofs_per_block: int = 1
+    proposal_interval_ms: float = 50.0
+    processing_ms: float = 0.05
+    view_change_timeout_ms: float = 2000.0
+    watermark_window: int = 8
+    duration_ms: float = 5000.0
+    max_blocks: Optional[int] = None
+    seed: int = 0
+
+
+@dataclass
+class SimulationReport:
+    """
+    Results of a simulation run.
+    
+    Attributes:
+        validators: Number of validators simulated
+        byzantine: Number of Byzantine validators
+        simulated_seconds: Virtual time covered
+        wall_seconds: Real time the run took
+        blocks_proposed: Blocks the leaders started consensus on
+        blocks_finalized: Blocks executed by a 2f+1 quorum of honest nodes
+        rounds_per_sec: Finalized blocks per virtual second
+        finality_latency_ms: p50/p95/p99/max from proposal to quorum execution
+        messages_sent: Point-to-point messages put on the wire
+        messages_delivered: Messages handed to a node (not lost or partitioned)
+        messages_per_round: messages_sent per finalized block
+        bytes_per_round: Wire bytes per finalized block
+        messages_by_type: messages_sent split by consensus message type
+        view_changes: Highest view reached by any honest node
+        events_processed: Discrete events executed
+    """
+    validators: int
+    byzantine: int
+    simulated_seconds: float
+    wall_seconds: float
+    blocks_proposed: int
+    blocks_finalized: int
+    rounds_per_sec: float
+    finality_latency_ms: Dict[str, float]
+    messages_sent: int
+    messages_delivered: int
+    messages_per_round: float
+    bytes_per_round: float
+    messages_by_type: Dict[str, int]
+    view_changes: int
+    events_processed: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return asdict(self)
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of samples (0.0 if empty)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class SimulatedNetwork(MockP2PNetwork):
+    """
+    MockP2PNetwork that hands every send to the simulator.
+    
+    Simulated nodes are reached through the simulator, not through the
+    MockP2PNetwork global registry, so they are removed from it.
+    """
+    
+    def __init__(self, node_id: str, simulator: "ConsensusSimulator"):
+        super().__init__(node_id, NetworkConfig())
+        MockP2PNetwork._global_registry.pop(node_id, None)
+        self.simulator = simulator
+        self.is_running = True
+    
+    def broadcast(self, topic: str, message: ConsensusMessage) -> None:
+        """Queue message to every peer behind this node's uplink."""
+        if not self.is_running:
+            return
+        size = self.simulator.message_size(message)
+        for peer_id in self.peers:
+            self.simulator.transmit(self.node_id, peer_id, topic, message, size)
+    
+    def send_to_peer(self, peer_id: str, message: ConsensusMessage, topic: str = "default") -> None:
+        """Queue message to one peer."""
+        if not self.is_running:
+            return
+        self.simulator.transmit(
+            self.node_id, peer_id, topic, message, self.simulator.message_size(message)
+        )
+    
+    def receive(self, topic: str, message: ConsensusMessage) -> None:
+        """Run this node's handlers for a delivered message."""
+        for handler in self.message_handlers.get(topic, []):
+            handler(message)
+
+
+class ConsensusSimulator:
+    """
+    Discrete-event simulator for a network of consensus engines.
+    
+    Events are (virtual time, tie-breaker, callback) entries in a heap;
+    run() pops them in order until duration_ms. Only the simulator's
+    random generators (seeded from config.seed) introduce randomness.
+    """
+    
+    def __init__(self, config: Optional[SimulationConfig] = None):
+        """
+        Build the validator set.
+        
+        Args:
+            config: Simulation parameters (defaults if None)
+        """
+        self.config = config or SimulationConfig()
+        self.rng = random.Random(self.config.seed)
+        random.seed(self.config.seed)
+        
+        self.now = 0.0  # Virtual milliseconds
+        self._events: List[Tuple[float, int, Callable[[], None]]] = []
+        self._tiebreak = itertools.count()
+        self._events_processed = 0
+        
+        self._links: Dict[Tuple[str, str], LinkProfile] = {}
+        self._partitions: List[Set[str]] = []
+        self._uplink_free: Dict[str, float] = {}
+        self._cpu_free: Dict[str, float] = {}
+        self._send_offset = 0.0
+        
+        self.messages_sent = 0
+        self.messages_delivered = 0
+        self.bytes_sent = 0
+        self.messages_by_type: Dict[str, int] = {}
+        # Holds the message itself: an id() could be reused once it is freed
+        self._size_cache: Tuple[Optional[ConsensusMessage], int] = (None, 0)
+        
+        # Finality bookkeeping: digest -> proposal time / honest executions
+        self._proposed_at: Dict[str, float] = {}
+        self._executions: Dict[str, int] = {}
+        self._finalized_at: Dict[str, float] = {}
+        self._proof_counter = itertools.count()
+        
+        self.node_ids = [f"sim_{i:04d}" for i in range(self.config.validator_count)]
+        self.byzantine_ids: Set[str] = set(
+            self.rng.sample(self.node_ids, self.config.byzantine_count)
+        )
+        self.honest_quorum = 2 * ((self.config.validator_count - 1) // 3) + 1
+        
+        # One verifier for the whole process; verification cost is modelled
+        # by processing_ms rather than spent for real on every node
+        self.verifier = ProofVerifier()
+        self.networks: Dict[str, SimulatedNetwork] = {}
+        self.engines: Dict[str, ConsensusEngine] = {}
+        self._progress: Dict[str, int] = {}
+        
+        for node_id in self.node_ids:
+            self._add_node(node_id)
+        peers = [
+            PeerInfo(peer_id=node_id, address=f"sim://{node_id}", stake=1000)
+            for node_id in self.node_ids
+        ]
+        for network in self.networks.values():
+            for peer in peers:
+                if peer.peer_id != network.node_id:
+                    network.peers[peer.peer_id] = peer
+    
+    def _add_node(self, node_id: str) -> None:
+        network = SimulatedNetwork(node_id, self)
+        mempool = ProofMempool(proof_verifier=self.verifier, speculative_verification=False)
+        if node_id in self.byzantine_ids:
+            engine = ByzantineNode(
+                node_id=node_id,
+                validator_stake=1000,
+                network=network,
+                attack_strategy=self.config.byzantine_strategy,
+                proof_verifier=self.verifier,
+                state_store=StateStore(),
+                proof_mempool=mempool,
+            )
+            engine.watermark_window = self.config.watermark_window
+        else:
+            engine = ConsensusEngine(
+                node_id=node_id,
+                validator_stake=1000,
+                network=network,
+                proof_verifier=self.verifier,
+                state_store=StateStore(),
+                proof_mempool=mempool,
+                metrics_collector=MetricsCollector(),
+                watermark_window=self.config.watermark_window,
+            )
+            engine.finalization_handler = (
+                lambda result, node_id=node_id: self._on_executed(node_id, result)
+            )
+        
+        engine.pre_prepare_handler = engine.handle_pre_prepare
+        engine.prepare_handler = engine.handle_prepare
+        engine.commit_handler = engine.handle_commit
+        engine.view_change_handler = engine.handle_view_change
+        self.networks[node_id] = network
+        self.engines[node_id] = engine
+        self._progress[node_id] = 0
+    
+    # Topology
+    
+    def set_link(self, node_a: str, node_b: str, profile: LinkProfile) -> None:
+        """Override the profile of the link between two nodes (both directions)."""
+        self._links[(node_a, node_b)] = profile
+        self._links[(node_b, node_a)] = profile
+    
+    def partition(self, groups: List[Set[str]], start_ms: float, end_ms: Optional[float] = None) -> None:
+        """
+        Split the network into groups between start_ms and end_ms.
+        
+        Nodes in different groups cannot exchange messages while the
+        partition holds; messages already in flight still arrive.
+        """
+        self.schedule_at(start_ms, lambda: self._set_partitions([set(g) for g in groups]))
+        if end_ms is not None:
+            self.schedule_at(end_ms, lambda: self._set_partitions([]))
+    
+    def _set_partitions(self, groups: List[Set[str]]) -> None:
+        self._partitions = groups
+    
+    def _partitioned(self, node_a: str, node_b: str) -> bool:
+        if not self._partitions:
+            return False
+        group_a = group_b = None
+        for index, group in enumerate(self._partitions):
+            if node_a in group:
+                group_a = index
+            if node_b in group:
+                group_b = index
+        return group_a is not None and group_b is not None and group_a != group_b
+    
+    # Event loop
+    
+    def schedule_at(self, at_ms: float, callback: Callable[[], None]) -> None:
+        """Run callback at virtual time at_ms."""
+        heapq.heappush(self._events, (at_ms, next(self._tiebreak), callback))
+    
+    def schedule(self, delay_ms: float, callback: Callable[[], None]) -> None:
+        """Run callback delay_ms after the current virtual time."""
+        self.schedule_at(self.now + delay_ms, callback)
+    
+    def message_size(self, message: ConsensusMessage) -> int:
+        """Wire size of a message (cached for the broadcast in progress)."""
+        if self._size_cache[0] is message:
+            return self._size_cache[1]
+        try:
+            size = len(encode_message(message))
+        except WireError:
+            size = len(message.serialize())
+        self._size_cache = (message, size)
+        return size
+    
+    def transmit(self, sender: str, receiver: str, topic: str, message: ConsensusMessage, size: int) -> None:
+        """
+        Put one message on the wire.
+        
+        The sender's uplink is serial: a message starts transmitting when
+        the previous one has left. Arrival adds propagation delay and
+        jitter; the receiver then queues it behind its own CPU.
+        """
+        link = self._links.get((sender, receiver), self.config.link)
+        self.messages_sent += 1
+        self.bytes_sent += size
+        kind = message.message_type.value
+        self.messages_by_type[kind] = self.messages_by_type.get(kind, 0) + 1
+        
+        if self._partitioned(sender, receiver) or self.rng.random() < link.loss_rate:
+            return
+        
+        depart = max(self.now + self._send_offset, self._uplink_free.get(sender, 0.0))
+        done = depart + size * 8 / (link.bandwidth_mbps * 1000.0)
+        self._uplink_free[sender] = done
+        
+        delay = link.latency_ms
+        if link.jitter_ms > 0:
+            delay += self.rng.expovariate(1.0 / link.jitter_ms)
+        self.schedule_at(done + delay, lambda: self._arrive(receiver, topic, message))
+    
+    def _arrive(self, receiver: str, topic: str, message: ConsensusMessage) -> None:
+        start = self._cpu_free.get(receiver, 0.0)
+        if start > self.now:
+            self.schedule_at(start, lambda: self._arrive(receiver, topic, message))
+            return
+        
+        self._cpu_free[receiver] = self.now + self.config.processing_ms
+        self.messages_delivered += 1
+        
+        # Anything the handler sends leaves once processing is done
+        self._send_offset = self.config.processing_ms
+        try:
+            self.networks[receiver].receive(topic, message)
+        finally:
+            self._send_offset = 0.0
+    
+    # Workload and timers
+    
+    def _propose(self) -> None:
+        if self.config.max_blocks is None or len(self._proposed_at) < self.config.max_blocks:
+            for node_id, engine in self.engines.items():
+                if not engine.is_leader() or engine.in_view_change:
+                    continue
+                # A silent Byzantine leader withholds proposals entirely
+                silent = (
+                    node_id in self.byzantine_ids
+                    and self.config.byzantine_strategy == ByzantineAttackStrategy.SILENT
+                )
+                if not silent and engine.can_start_round():
+                    self._propose_from(engine)
+                break
+        self.schedule(self.config.proposal_interval_ms, self._propose)
+    
+    def _propose_from(self, leader: ConsensusEngine) -> None:
+        for _ in range(self.config.proofs_per_block):
+            tag = next(self._proof_counter)
+            leader.proof_mempool.add_proof(
+                {'constraints': [f'sim_{tag} > 0'], 'valid': True},
+                difficulty=1000,
+            )
+        block = leader.propose_block_from_mempool(block_size=self.config.proofs_per_block)
+        if block is None:
+            return
+        self._proposed_at.setdefault(block.hash(), self.now)
+        leader.start_consensus_round(block)
+    
+    def _work_pending(self) -> bool:
+        return self.config.max_blocks is None or len(self._finalized_at) < self.config.max_blocks
+    
+    def _check_progress(self, node_id: str) -> None:
+        # No execution for a whole timeout while work is outstanding: suspect
+        # the leader. Repeating the VIEW-CHANGE also re-sends votes that a
+        # partition may have dropped.
+        engine = self.engines[node_id]
+        stalled = engine.low_watermark == self._progress[node_id]
+        if stalled and (engine.instances or self._work_pending()):
+            engine.initiate_view_change()
+        self._progress[node_id] = engine.low_watermark
+        self.schedule(self.config.view_change_timeout_ms, lambda: self._check_progress(node_id))
+    
+    def _on_executed(self, node_id: str, result: ConsensusResult) -> None:
+        digest = result.finalized_state
+        count = self._executions.get(digest, 0) + 1
+        self._executions[digest] = count
+        if count == self.honest_quorum and digest in self._proposed_at:
+            self._finalized_at[digest] = self.now
+    
+    # Running
+    
+    def run(self) -> SimulationReport:
+        """
+        Simulate config.duration_ms of virtual time.
+        
+        Returns:
+            SimulationReport with throughput, latency and message complexity
+        """
+        wall_start = time.perf_counter()
+        self.schedule(0.0, self._propose)
+        for node_id in self.node_ids:
+            if node_id not in self.byzantine_ids:
+                self.schedule(self.config.view_change_timeout_ms, lambda n=node_id: self._check_progress(n))
+        
+        while self._events and self._events[0][0] <= self.config.duration_ms:
+            self.now, _, callback = heapq.heappop(self._events)
+            callback()
+            self._events_processed += 1
+        self.now = self.config.duration_ms
+        
+        return self._report(time.perf_counter() - wall_start)
+    
+    def _report(self, wall_seconds: float) -> SimulationReport:
+        latencies = [
+            finalized - self._proposed_at[digest]
+            for digest, finalized in self._finalized_at.items()
+        ]
+        finalized = len(latencies)
+        seconds = self.config.duration_ms / 1000.0
+        honest_views = [
+            engine.view for node_id, engine in self.engines.items()
+            if node_id not in self.byzantine_ids
+        ]
+        
+        return SimulationReport(
+            validators=self.config.validator_count,
+            byzantine=self.config.byzantine_count,
+            simulated_seconds=seconds,
+            wall_seconds=wall_seconds,
+            blocks_proposed=len(self._proposed_at),
+            blocks_finalized=finalized,
+            rounds_per_sec=finalized / seconds if seconds > 0 else 0.0,
+            finality_latency_ms={
+                "p50": percentile(latencies, 0.50),
+                "p95": percentile(latencies, 0.95),
+                "p99": percentile(latencies, 0.99),
+                "max": max(latencies) if latencies else 0.0,
+            },
+            messages_sent=self.messages_sent,
+            messages_delivered=self.messages_delivered,
+            messages_per_round=self.messages_sent / finalized if finalized else 0.0,
+            bytes_per_round=self.bytes_sent / finalized if finalized else 0.0,
+            messages_by_type=dict(self.messages_by_type),
+            view_changes=max(honest_views) if honest_views else 0,
+            events_processed=self._events_processed,
+        )
+
+
+def simulate(validator_count: int, **overrides: Any) -> SimulationReport:
+    """
+    Run one simulation with default settings and the given overrides.
+    
+    Args:
+        validator_count: Number of validators
+        **overrides: Any SimulationConfig field
+    
+    Returns:
+        SimulationReport for the run
+    """
+    config = SimulationConfig(validator_count=validator_count, **overrides)
+    return ConsensusSimulator(config).run()
@@ -14,6 +14,12 @@ The StateStore ensures that all state changes are:
 2. Conservation-preserving (total value unchanged)
 3. Persistently stored for recovery
 4. Efficiently synchronized across nodes
+
+Conservation is checked against the keys a transition touches and the
+conservation checksum is kept as a running total, so applying a transition
+costs O(changes * log n) rather than a pass over the whole state.
+Transition records are buffered and written to the persistence layer at
+checkpoint intervals (or on flush()).
 """
 
 import time
@@ -70,6 +76,14 @@ class StateStore:
         self._checkpoints: List[Dict[str, Any]] = []  # List of finalized states
         self._checkpoint_interval = 10  # Checkpoint every 10 state transitions
         self._transition_count = 0
+        
+        # Running conservation checksum, valid while the tree version matches.
+        # Writes that bypass the store (merkle_tree.update) trigger a recount.
+        self._conservation_checksum = 0
+        self._checksum_version: Optional[int] = self.merkle_tree.version
+        
+        # Records waiting for the next checkpoint flush
+        self._pending_records: Dict[str, Any] = {}
     
     def apply_state_transition(self, transition: StateTransition) -> bool:
         """
@@ -86,13 +100,8 @@ class StateStore:
         Returns:
             True if transition was applied successfully
         """
-        # Get current state as dictionary
-        current_state = {}
-        for key in self.merkle_tree.get_all_keys():
-            current_state[key] = self.merkle_tree.get(key)
-        
-        # Validate conservation property
-        if not self.conservation_validator.validate(transition, current_state):
+        # Validate conservation property against the touched keys only
+        if not self.conservation_validator.validate_changes(transition, self.merkle_tree.get):
             return False
         
         # Record current root hash
@@ -100,7 +109,7 @@ class StateStore:
         
         # Apply changes to Merkle tree using batch update for efficiency
         updates = {change.key: change.value for change in transition.changes}
-        self.merkle_tree.batch_update(updates)
+        self._write(updates)
         
         # Get new root hash
         root_after = self.merkle_tree.get_root_hash()
@@ -109,27 +118,21 @@ class StateStore:
         transition.merkle_root_before = root_before
         transition.merkle_root_after = root_after
         
-        # Calculate conservation checksums
-        transition.conservation_checksum_before = self.conservation_validator.calculate_total_value(
-            self.merkle_tree
-        )
+        # Conservation checksums (unchanged by a validated transition)
+        transition.conservation_checksum_before = self.get_conservation_checksum()
         transition.conservation_checksum_after = transition.conservation_checksum_before
         
-        # Persist to disk if persistence layer available
+        # Buffer for persistence; written out at the next checkpoint
         if self.persistence:
-            self.persistence.merkle_db.put(
-                f"state_transition_{int(time.time())}",
-                {
-                    'root_before': root_before,
-                    'root_after': root_after,
-                    'changes': [
-                        {'key': c.key, 'value': c.value}
-                        for c in transition.changes
-                    ],
-                    'timestamp': transition.timestamp
-                }
-            )
-            self.persistence.merkle_db.save_snapshot()
+            self._pending_records[f"state_transition_{int(time.time())}"] = {
+                'root_before': root_before,
+                'root_after': root_after,
+                'changes': [
+                    {'key': c.key, 'value': c.value}
+                    for c in transition.changes
+                ],
+                'timestamp': transition.timestamp
+            }
         
         # Add to history
         self._state_history.append(root_after)
@@ -199,12 +202,12 @@ class StateStore:
         
         # Adopt peer state
         self.merkle_tree = temp_tree
+        self._checksum_version = None  # New tree: recount on next read
         
         # Persist to disk if persistence layer available
         if self.persistence:
-            for key, value in peer_state.items():
-                self.persistence.merkle_db.put(key, value)
-            self.persistence.merkle_db.save_snapshot()
+            self._pending_records.update(peer_state)
+            self.flush()
         
         # Add to history
         self._state_history.append(peer_root_hash)
@@ -245,7 +248,7 @@ class StateStore:
             balance: New balance
         """
         key = f"balance:{node_id}"
-        self.merkle_tree.update(key, balance)
+        self._write({key: balance})
     
     def get_validator_stake(self, node_id: str) -> int:
         """
@@ -279,7 +282,7 @@ class StateStore:
             stake: New stake amount
         """
         key = f"stake:{node_id}"
-        self.merkle_tree.update(key, stake)
+        self._write({key: stake})
     
     def reduce_stake(self, node_id: str, amount: int) -> None:
         """
@@ -331,12 +334,51 @@ class StateStore:
     
     def get_conservation_checksum(self) -> int:
         """
-        Calculate total value in system (conservation checksum).
+        Get total value in system (conservation checksum).
+        
+        Served from the running total. If the Merkle tree was modified
+        directly (bypassing the store) the total is recounted once.
         
         Returns:
             Total value as integer
         """
-        return self.conservation_validator.calculate_total_value(self.merkle_tree)
+        if self._checksum_version != self.merkle_tree.version:
+            self._conservation_checksum = self.conservation_validator.calculate_total_value(
+                self.merkle_tree
+            )
+            self._checksum_version = self.merkle_tree.version
+        
+        return self._conservation_checksum
+    
+    def flush(self) -> None:
+        """
+        Write buffered transition records to the persistence layer.
+        
+        The records are stored with a single Merkle root computation and
+        one snapshot. Called at every checkpoint; call it directly before
+        shutdown to persist transitions since the last checkpoint.
+        """
+        if not self.persistence or not self._pending_records:
+            return
+        
+        self.persistence.merkle_db.put_many(self._pending_records)
+        self.persistence.merkle_db.save_snapshot()
+        self._pending_records = {}
+    
+    def _write(self, updates: Dict[str, Any]) -> None:
+        """
+        Apply updates to the Merkle tree and the running checksum.
+        
+        Args:
+            updates: Final value for each changed key
+        """
+        total = self.get_conservation_checksum()
+        delta = self.conservation_validator.calculate_change_delta(updates, self.merkle_tree.get)
+        
+        self.merkle_tree.batch_update(updates)
+        
+        self._conservation_checksum = total + delta
+        self._checksum_version = self.merkle_tree.version
     
     def get_state_snapshot(self) -> Dict[str, Any]:
         """
@@ -382,13 +424,10 @@ class StateStore:
         
         self._checkpoints.append(checkpoint)
         
-        # Persist checkpoint if persistence layer available
+        # Persist checkpoint and buffered transitions in one write
         if self.persistence:
-            self.persistence.merkle_db.put(
-                f"checkpoint_{self._transition_count}",
-                checkpoint
-            )
-            self.persistence.merkle_db.save_snapshot()
+            self._pending_records[f"checkpoint_{self._transition_count}"] = checkpoint
+            self.flush()
     
     def get_latest_checkpoint(self) -> Optional[Dict[str, Any]]:
         """
@@ -492,7 +531,7 @@ class StateStore:
         self._spent_outputs[key] = True
         
         # Also store in Merkle tree for persistence
-        self.merkle_tree.update(f"spent:{key}", True)
+        self._write({f"spent:{key}": True})
     
     def is_output_spent(self, txid: str, output_index: int) -> bool:
         """
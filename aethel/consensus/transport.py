@@ -0,0 +1,340 @@
+"""
+Persistent TCP transport for the P2P network layer.
+
+P2PNetwork describes what to send; this module owns how bytes reach a
+peer. Each peer gets one long-lived connection, reused for every message
+in both directions, instead of a connection per send:
+
+- Framing: a 5-byte header (frame type, body length) then the body.
+  The first frame on a connection is HELLO carrying the sender's node ID.
+  DATA frames carry a gossip TTL, a topic and an opaque payload
+  (normally a wire_codec frame).
+- Backpressure: each peer has a bounded send queue. send() waits for
+  room, so a slow peer throttles its producer instead of growing memory
+  without limit. try_send() drops instead of waiting.
+- Batching: the per-peer writer task drains everything queued (up to
+  batch_max_bytes) into a single write() and drain().
+
+Everything runs on one asyncio event loop. Received frames are handed to
+on_message(peer_id, topic, ttl, payload) on that loop.
+"""
+
+import asyncio
+import logging
+import struct
+from typing import Callable, Dict, Optional, Set, Tuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+FRAME_HEADER = struct.Struct("<BI")
+DATA_PREFIX = struct.Struct("<BH")
+
+FRAME_HELLO = 1
+FRAME_DATA = 2
+
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+
+class TransportError(ConnectionError):
+    """Raised when a peer cannot be reached or sends a malformed frame."""
+
+
+def encode_frame(frame_type: int, body: bytes) -> bytes:
+    """Prefix body with the frame header."""
+    return FRAME_HEADER.pack(frame_type, len(body)) + body
+
+
+def encode_data(topic: str, payload: bytes, ttl: int = 0) -> bytes:
+    """Build a DATA frame."""
+    topic_bytes = topic.encode("utf-8")
+    body = DATA_PREFIX.pack(ttl, len(topic_bytes)) + topic_bytes + payload
+    return encode_frame(FRAME_DATA, body)
+
+
+def decode_data(body: bytes) -> Tuple[str, int, bytes]:
+    """
+    Split a DATA frame body.
+    
+    Returns:
+        (topic, ttl, payload)
+    """
+    if len(body) < DATA_PREFIX.size:
+        raise TransportError("truncated DATA frame")
+    ttl, topic_length = DATA_PREFIX.unpack_from(body)
+    start = DATA_PREFIX.size
+    end = start + topic_length
+    if end > len(body):
+        raise TransportError("truncated DATA topic")
+    return body[start:end].decode("utf-8"), ttl, body[end:]
+
+
+def parse_address(address: str) -> Tuple[str, int]:
+    """Split "host:port" (the PeerInfo address format)."""
+    host, _, port = address.rpartition(":")
+    if not host or not port.isdigit():
+        raise TransportError(f"invalid peer address {address!r}")
+    return host, int(port)
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Tuple[int, bytes]:
+    """Read one frame; raises IncompleteReadError at end of stream."""
+    header = await reader.readexactly(FRAME_HEADER.size)
+    frame_type, length = FRAME_HEADER.unpack(header)
+    if length > MAX_FRAME_SIZE:
+        raise TransportError(f"frame of {length} bytes exceeds limit")
+    return frame_type, await reader.readexactly(length)
+
+
+class PeerConnection:
+    """
+    The single connection to one peer plus its outbound queue.
+    
+    The connection is opened lazily by the writer task and re-opened after
+    a failure; frames that could not be written are counted as dropped.
+    """
+    
+    def __init__(self, transport: "TCPTransport", peer_id: str, address: Optional[str]):
+        self.transport = transport
+        self.peer_id = peer_id
+        self.address = address
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=transport.send_queue_size)
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._writer_task = asyncio.ensure_future(self._write_loop())
+    
+    @property
+    def connected(self) -> bool:
+        return self.writer is not None and not self.writer.is_closing()
+    
+    def attach(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Use an already-open stream (an accepted inbound connection)."""
+        self.reader = reader
+        self.writer = writer
+    
+    async def _connect(self) -> None:
+        if self.address is None:
+            raise TransportError(f"no address for peer {self.peer_id}")
+        host, port = parse_address(self.address)
+        delay = self.transport.connect_backoff
+        for attempt in range(self.transport.connect_retries):
+            try:
+                reader, writer = await asyncio.open_connection(host, port)
+                break
+            except OSError as e:
+                if attempt == self.transport.connect_retries - 1:
+                    raise TransportError(f"cannot connect to {self.peer_id}: {e}") from e
+                await asyncio.sleep(delay)
+                delay *= 2
+        
+        writer.write(encode_frame(FRAME_HELLO, self.transport.node_id.encode("utf-8")))
+        self.attach(reader, writer)
+        self.transport.stats["connections_opened"] += 1
+        self._reader_task = asyncio.ensure_future(
+            self.transport._read_loop(self.peer_id, reader, writer)
+        )
+    
+    async def _write_loop(self) -> None:
+        stats = self.transport.stats
+        limit = self.transport.batch_max_bytes
+        while True:
+            frame = await self.queue.get()
+            batch = [frame]
+            size = len(frame)
+            while size < limit and not self.queue.empty():
+                frame = self.queue.get_nowait()
+                batch.append(frame)
+                size += len(frame)
+            
+            try:
+                if not self.connected:
+                    await self._connect()
+                self.writer.write(b"".join(batch))
+                await self.writer.drain()
+            except (OSError, TransportError) as e:
+                logger.warning(f"Dropping {len(batch)} frames to {self.peer_id}: {e}")
+                stats["frames_dropped"] += len(batch)
+                self.close()
+                continue
+            
+            stats["frames_sent"] += len(batch)
+            stats["bytes_sent"] += size
+            stats["writes"] += 1
+    
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+        self.writer = None
+        self.reader = None
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+    
+    async def shutdown(self) -> None:
+        self._writer_task.cancel()
+        self.close()
+        await asyncio.gather(self._writer_task, return_exceptions=True)
+
+
+class TCPTransport:
+    """
+    Multiplexed TCP transport with one persistent connection per peer.
+    
+    Attributes:
+        node_id: This node's ID, sent in HELLO frames
+        host: Interface to listen on
+        port: Port to listen on (0 for random; updated once started)
+        on_message: Callback (peer_id, topic, ttl, payload) for DATA frames
+        send_queue_size: Frames buffered per peer before send() waits
+        batch_max_bytes: Upper bound on bytes coalesced into one write
+        connect_retries: Connection attempts before queued frames are dropped
+        connect_backoff: Initial delay between attempts (doubles each time)
+    """
+    
+    def __init__(
+        self,
+        node_id: str,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        on_message: Optional[Callable[[str, str, int, bytes], None]] = None,
+        send_queue_size: int = 1024,
+        batch_max_bytes: int = 64 * 1024,
+        connect_retries: int = 3,
+        connect_backoff: float = 0.05,
+    ):
+        self.node_id = node_id
+        self.host = host
+        self.port = port
+        self.on_message = on_message
+        self.send_queue_size = send_queue_size
+        self.batch_max_bytes = batch_max_bytes
+        self.connect_retries = connect_retries
+        self.connect_backoff = connect_backoff
+        
+        self.connections: Dict[str, PeerConnection] = {}
+        self._server: Optional[asyncio.base_events.Server] = None
+        self._inbound_tasks: Set[asyncio.Task] = set()
+        self.stats: Dict[str, int] = {
+            "frames_sent": 0,
+            "frames_received": 0,
+            "frames_dropped": 0,
+            "bytes_sent": 0,
+            "writes": 0,
+            "connections_opened": 0,
+            "connections_accepted": 0,
+        }
+    
+    @property
+    def address(self) -> str:
+        """Address peers use to reach this node ("host:port")."""
+        return f"{self.host}:{self.port}"
+    
+    @property
+    def is_running(self) -> bool:
+        return self._server is not None
+    
+    async def start(self) -> None:
+        """Start accepting connections."""
+        if self._server is not None:
+            return
+        self._server = await asyncio.start_server(self._accept, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Transport for {self.node_id} listening on {self.address}")
+    
+    async def stop(self) -> None:
+        """Close the listener and every peer connection."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for connection in list(self.connections.values()):
+            await connection.shutdown()
+        self.connections.clear()
+        for task in list(self._inbound_tasks):
+            task.cancel()
+        await asyncio.gather(*self._inbound_tasks, return_exceptions=True)
+        self._inbound_tasks.clear()
+    
+    def _connection(self, peer_id: str, address: Optional[str]) -> PeerConnection:
+        connection = self.connections.get(peer_id)
+        if connection is None:
+            connection = PeerConnection(self, peer_id, address)
+            self.connections[peer_id] = connection
+        elif address is not None:
+            connection.address = address
+        return connection
+    
+    async def send(self, peer_id: str, address: Optional[str], topic: str, payload: bytes, ttl: int = 0) -> None:
+        """
+        Queue a DATA frame for a peer, waiting while its queue is full.
+        
+        Args:
+            peer_id: Destination node ID
+            address: "host:port" used if a connection must be opened
+            topic: Topic the receiver dispatches on
+            payload: Message bytes
+            ttl: Remaining gossip hops (0 for direct messages)
+        """
+        await self._connection(peer_id, address).queue.put(encode_data(topic, payload, ttl))
+    
+    def try_send(self, peer_id: str, address: Optional[str], topic: str, payload: bytes, ttl: int = 0) -> bool:
+        """Queue a DATA frame without waiting; False (and dropped) if the queue is full."""
+        try:
+            self._connection(peer_id, address).queue.put_nowait(encode_data(topic, payload, ttl))
+            return True
+        except asyncio.QueueFull:
+            self.stats["frames_dropped"] += 1
+            return False
+    
+    def queued(self, peer_id: str) -> int:
+        """Frames waiting in a peer's send queue."""
+        connection = self.connections.get(peer_id)
+        return connection.queue.qsize() if connection else 0
+    
+    async def _accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self._inbound_tasks.add(task)
+        try:
+            frame_type, body = await read_frame(reader)
+            if frame_type != FRAME_HELLO:
+                raise TransportError("connection did not start with HELLO")
+            peer_id = body.decode("utf-8")
+            self.stats["connections_accepted"] += 1
+            
+            # Reuse the inbound stream for replies unless we already have a link
+            connection = self._connection(peer_id, None)
+            if not connection.connected:
+                connection.attach(reader, writer)
+            
+            await self._read_loop(peer_id, reader, writer)
+        except (asyncio.IncompleteReadError, TransportError, UnicodeDecodeError) as e:
+            logger.debug(f"Inbound connection to {self.node_id} closed: {e}")
+            writer.close()
+        finally:
+            self._inbound_tasks.discard(task)
+    
+    async def _read_loop(self, peer_id: str, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                frame_type, body = await read_frame(reader)
+                if frame_type != FRAME_DATA:
+                    continue
+                topic, ttl, payload = decode_data(body)
+                self.stats["frames_received"] += 1
+                if self.on_message:
+                    self.on_message(peer_id, topic, ttl, payload)
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            logger.debug(f"Connection from {peer_id} closed: {e}")
+            connection = self.connections.get(peer_id)
+            if connection is not None and connection.writer is writer:
+                connection.close()
+            else:
+                writer.close()
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Transport counters plus open connection count."""
+        stats = dict(self.stats)
+        stats["open_connections"] = sum(1 for c in self.connections.values() if c.connected)
+        return stats
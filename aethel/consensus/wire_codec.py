@@ -0,0 +1,622 @@
+"""
+Binary wire codec for the Proof-of-Proof consensus protocol.
+
+ProofBlock.serialize() and ConsensusMessage.serialize() stay JSON because
+signatures and ghost proofs are computed over those bytes. This module is
+the transport encoding: a versioned binary frame carrying every field of
+every data_models message type.
+
+Frame layout:
+    b"AW" | u8 version | u8 kind | u8 codec | u32 body length | body
+
+The body is a sequence of fields in a fixed per-kind order:
+- integers are little-endian i64, floats f64, flags u8
+- text and byte strings are u32-length-prefixed; signatures, key images
+  and ring values are sent as raw bytes rather than hex
+- hex digests (block hashes, checkpoints) are sent as raw bytes when they
+  are canonical lowercase hex, otherwise as text
+- proofs are tagged values: text, SignedProof, or compact JSON
+
+Bodies at or above compress_threshold bytes are compressed with zstd when
+zstandard is installed, zlib otherwise, and only if that makes them
+smaller. Decoding an uncompressed frame with copy=False returns raw byte
+fields as memoryviews into the caller's buffer instead of copies.
+
+Malformed input of any kind raises WireError.
+"""
+
+import json
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+from aethel.consensus.data_models import (
+    ProofBlock,
+    SignedProof,
+    ConsensusMessage,
+    PrePrepareMessage,
+    PrepareMessage,
+    CommitMessage,
+    ViewChangeMessage,
+    NewViewMessage,
+    MessageType,
+    VerificationResult,
+    BlockVerificationResult,
+)
+
+try:
+    from aethel.core.ghost_identity import GhostProof, RingSignature
+    GHOST_AVAILABLE = True
+except ImportError:
+    GHOST_AVAILABLE = False
+
+
+WIRE_MAGIC = b"AW"
+WIRE_VERSION = 1
+
+KIND_PRE_PREPARE = 1
+KIND_PREPARE = 2
+KIND_COMMIT = 3
+KIND_VIEW_CHANGE = 4
+KIND_NEW_VIEW = 5
+KIND_PROOF_BLOCK = 16
+
+CODEC_NONE = 0
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+
+DEFAULT_COMPRESS_THRESHOLD = 16 * 1024
+MAX_BODY_SIZE = 64 * 1024 * 1024
+
+_HEADER = struct.Struct("<2sBBBI")
+_U8 = struct.Struct("<B")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+# Tagged values (proofs, failed_proof, optional text)
+_TAG_NONE = 0
+_TAG_TEXT = 1
+_TAG_JSON = 2
+_TAG_SIGNED_PROOF = 3
+
+# Hex fields
+_HEX_RAW = 0
+_HEX_TEXT = 1
+
+_KIND_BY_TYPE = {
+    MessageType.PRE_PREPARE: KIND_PRE_PREPARE,
+    MessageType.PREPARE: KIND_PREPARE,
+    MessageType.COMMIT: KIND_COMMIT,
+    MessageType.VIEW_CHANGE: KIND_VIEW_CHANGE,
+    MessageType.NEW_VIEW: KIND_NEW_VIEW,
+}
+
+
+class WireError(ValueError):
+    """Raised when a frame cannot be encoded or decoded."""
+
+
+@dataclass(frozen=True)
+class WireHeader:
+    """Decoded frame header."""
+    version: int
+    kind: int
+    codec: int
+    body_length: int
+
+
+class _Writer:
+    """Appends fields to a growing buffer."""
+    
+    def __init__(self):
+        self.buffer = bytearray()
+    
+    def u8(self, value: int) -> None:
+        self.buffer += _U8.pack(value)
+    
+    def u32(self, value: int) -> None:
+        self.buffer += _U32.pack(value)
+    
+    def i64(self, value: int) -> None:
+        self.buffer += _I64.pack(value)
+    
+    def f64(self, value: float) -> None:
+        self.buffer += _F64.pack(value)
+    
+    def blob(self, value: bytes) -> None:
+        self.u32(len(value))
+        self.buffer += value
+    
+    def text(self, value: str) -> None:
+        self.blob(value.encode("utf-8"))
+    
+    def hex(self, value: str) -> None:
+        try:
+            raw = bytes.fromhex(value)
+        except ValueError:
+            raw = None
+        if raw is not None and raw.hex() == value:
+            self.u8(_HEX_RAW)
+            self.blob(raw)
+        else:
+            self.u8(_HEX_TEXT)
+            self.text(value)
+    
+    def value(self, value: Any) -> None:
+        if value is None:
+            self.u8(_TAG_NONE)
+        elif isinstance(value, str):
+            self.u8(_TAG_TEXT)
+            self.text(value)
+        elif isinstance(value, SignedProof):
+            self.u8(_TAG_SIGNED_PROOF)
+            self.value(value.proof_data)
+            self.hex(value.public_key)
+            self.hex(value.signature)
+            self.i64(value.timestamp)
+        else:
+            self.u8(_TAG_JSON)
+            self.blob(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+
+
+class _Reader:
+    """Reads fields from a memoryview, checking every bound."""
+    
+    def __init__(self, view: memoryview, copy: bool):
+        self.view = view
+        self.copy = copy
+        self.position = 0
+    
+    def _take(self, length: int) -> memoryview:
+        end = self.position + length
+        if end > len(self.view):
+            raise WireError("Frame truncated")
+        chunk = self.view[self.position:end]
+        self.position = end
+        return chunk
+    
+    def u8(self) -> int:
+        return self._take(1)[0]
+    
+    def u32(self) -> int:
+        return _U32.unpack(self._take(4))[0]
+    
+    def i64(self) -> int:
+        return _I64.unpack(self._take(8))[0]
+    
+    def f64(self) -> float:
+        return _F64.unpack(self._take(8))[0]
+    
+    def count(self) -> int:
+        # Every counted item takes at least one byte, which bounds
+        # allocations driven by a corrupted count
+        count = self.u32()
+        if count > len(self.view) - self.position:
+            raise WireError("Item count exceeds frame size")
+        return count
+    
+    def blob(self) -> Union[bytes, memoryview]:
+        chunk = self._take(self.u32())
+        return bytes(chunk) if self.copy else chunk
+    
+    def text(self) -> str:
+        return str(self._take(self.u32()), "utf-8")
+    
+    def hex(self) -> str:
+        kind = self.u8()
+        if kind == _HEX_RAW:
+            return self._take(self.u32()).hex()
+        if kind == _HEX_TEXT:
+            return self.text()
+        raise WireError(f"Unknown hex field kind {kind}")
+    
+    def value(self) -> Any:
+        tag = self.u8()
+        if tag == _TAG_NONE:
+            return None
+        if tag == _TAG_TEXT:
+            return self.text()
+        if tag == _TAG_SIGNED_PROOF:
+            return SignedProof(
+                proof_data=self.value(),
+                public_key=self.hex(),
+                signature=self.hex(),
+                timestamp=self.i64(),
+            )
+        if tag == _TAG_JSON:
+            return json.loads(str(self._take(self.u32()), "utf-8"))
+        raise WireError(f"Unknown value tag {tag}")
+    
+    def finish(self) -> None:
+        if self.position != len(self.view):
+            raise WireError("Trailing bytes after frame body")
+
+
+# Field order per type
+
+def _write_block(w: _Writer, block: ProofBlock) -> None:
+    w.text(block.block_id)
+    w.i64(block.timestamp)
+    w.u32(len(block.proofs))
+    for proof in block.proofs:
+        w.value(proof)
+    w.hex(block.previous_block_hash)
+    w.text(block.proposer_id)
+    w.blob(bytes(block.signature))
+    w.value(block.transactions)
+
+
+def _read_block(r: _Reader) -> ProofBlock:
+    block_id = r.text()
+    timestamp = r.i64()
+    proofs = [r.value() for _ in range(r.count())]
+    return ProofBlock(
+        block_id=block_id,
+        timestamp=timestamp,
+        proofs=proofs,
+        previous_block_hash=r.hex(),
+        proposer_id=r.text(),
+        signature=r.blob(),
+        transactions=r.value() or [],
+    )
+
+
+def _write_ghost_proof(w: _Writer, proof: Any) -> None:
+    signature = proof.signature
+    w.text(proof.proof_type)
+    w.u32(len(signature.c))
+    for part in signature.c:
+        w.blob(part)
+    w.u32(len(signature.r))
+    for part in signature.r:
+        w.blob(part)
+    w.blob(signature.key_image)
+    w.blob(signature.message_hash)
+    w.i64(proof.timestamp)
+    w.value(proof.metadata)
+
+
+def _read_ghost_proof(r: _Reader) -> Any:
+    if not GHOST_AVAILABLE:
+        raise WireError("Frame carries a ghost proof but Ghost Identity is not installed")
+    proof_type = r.text()
+    c = [r.blob() for _ in range(r.count())]
+    responses = [r.blob() for _ in range(r.count())]
+    signature = RingSignature(c=c, r=responses, key_image=r.blob(), message_hash=r.blob())
+    return GhostProof(
+        proof_type=proof_type,
+        signature=signature,
+        timestamp=r.i64(),
+        metadata=r.value(),
+    )
+
+
+def _write_header_fields(w: _Writer, message: ConsensusMessage) -> None:
+    w.i64(message.view)
+    w.i64(message.sequence)
+    w.text(message.sender_id)
+    w.blob(bytes(message.signature))
+    w.u8(1 if message.use_ghost_identity else 0)
+    if message.ghost_proof is None:
+        w.u8(0)
+    else:
+        w.u8(1)
+        _write_ghost_proof(w, message.ghost_proof)
+
+
+def _read_header_fields(r: _Reader) -> Dict[str, Any]:
+    fields = {
+        "view": r.i64(),
+        "sequence": r.i64(),
+        "sender_id": r.text(),
+        "signature": r.blob(),
+        "use_ghost_identity": r.u8() == 1,
+    }
+    fields["ghost_proof"] = _read_ghost_proof(r) if r.u8() else None
+    return fields
+
+
+def _write_verification(w: _Writer, result: Optional[BlockVerificationResult]) -> None:
+    if result is None:
+        w.u8(0)
+        return
+    w.u8(1)
+    w.u8(1 if result.valid else 0)
+    w.i64(result.total_difficulty)
+    w.u32(len(result.results))
+    for item in result.results:
+        w.u8(1 if item.valid else 0)
+        w.i64(item.difficulty)
+        w.f64(item.verification_time)
+        w.hex(item.proof_hash)
+        w.value(item.error)
+    w.value(result.failed_proof)
+
+
+def _read_verification(r: _Reader) -> Optional[BlockVerificationResult]:
+    if not r.u8():
+        return None
+    valid = r.u8() == 1
+    total_difficulty = r.i64()
+    results = [
+        VerificationResult(
+            valid=r.u8() == 1,
+            difficulty=r.i64(),
+            verification_time=r.f64(),
+            proof_hash=r.hex(),
+            error=r.value(),
+        )
+        for _ in range(r.count())
+    ]
+    return BlockVerificationResult(
+        valid=valid,
+        total_difficulty=total_difficulty,
+        results=results,
+        failed_proof=r.value(),
+    )
+
+
+def _write_view_change(w: _Writer, message: ViewChangeMessage) -> None:
+    _write_header_fields(w, message)
+    w.i64(message.new_view)
+    w.hex(message.last_stable_checkpoint)
+
+
+def _read_view_change(r: _Reader) -> ViewChangeMessage:
+    fields = _read_header_fields(r)
+    return ViewChangeMessage(
+        message_type=MessageType.VIEW_CHANGE,
+        new_view=r.i64(),
+        last_stable_checkpoint=r.hex(),
+        **fields
+    )
+
+
+def _write_message(w: _Writer, message: ConsensusMessage) -> None:
+    if message.message_type == MessageType.VIEW_CHANGE:
+        _write_view_change(w, message)
+        return
+    
+    _write_header_fields(w, message)
+    if message.message_type == MessageType.PRE_PREPARE:
+        if message.proof_block is None:
+            w.u8(0)
+        else:
+            w.u8(1)
+            _write_block(w, message.proof_block)
+    elif message.message_type == MessageType.PREPARE:
+        w.hex(message.block_digest)
+        _write_verification(w, message.verification_result)
+    elif message.message_type == MessageType.COMMIT:
+        w.hex(message.block_digest)
+    elif message.message_type == MessageType.NEW_VIEW:
+        w.i64(message.new_view)
+        w.u32(len(message.view_change_messages))
+        for view_change in message.view_change_messages:
+            _write_view_change(w, view_change)
+        w.hex(message.checkpoint)
+
+
+def _read_pre_prepare(r: _Reader) -> PrePrepareMessage:
+    fields = _read_header_fields(r)
+    return PrePrepareMessage(
+        message_type=MessageType.PRE_PREPARE,
+        proof_block=_read_block(r) if r.u8() else None,
+        **fields
+    )
+
+
+def _read_prepare(r: _Reader) -> PrepareMessage:
+    fields = _read_header_fields(r)
+    return PrepareMessage(
+        message_type=MessageType.PREPARE,
+        block_digest=r.hex(),
+        verification_result=_read_verification(r),
+        **fields
+    )
+
+
+def _read_commit(r: _Reader) -> CommitMessage:
+    fields = _read_header_fields(r)
+    return CommitMessage(message_type=MessageType.COMMIT, block_digest=r.hex(), **fields)
+
+
+def _read_new_view(r: _Reader) -> NewViewMessage:
+    fields = _read_header_fields(r)
+    new_view = r.i64()
+    view_changes = [_read_view_change(r) for _ in range(r.count())]
+    return NewViewMessage(
+        message_type=MessageType.NEW_VIEW,
+        new_view=new_view,
+        view_change_messages=view_changes,
+        checkpoint=r.hex(),
+        **fields
+    )
+
+
+_READERS: Dict[int, Callable[[_Reader], Any]] = {
+    KIND_PRE_PREPARE: _read_pre_prepare,
+    KIND_PREPARE: _read_prepare,
+    KIND_COMMIT: _read_commit,
+    KIND_VIEW_CHANGE: _read_view_change,
+    KIND_NEW_VIEW: _read_new_view,
+    KIND_PROOF_BLOCK: _read_block,
+}
+
+
+# Framing
+
+def _compress(body: bytes) -> Tuple[int, bytes]:
+    if ZSTD_AVAILABLE:
+        return CODEC_ZSTD, zstandard.ZstdCompressor(level=3).compress(body)
+    return CODEC_ZLIB, zlib.compress(body, 6)
+
+
+def _decompress(body: memoryview, codec: int, limit: int) -> memoryview:
+    if codec == CODEC_ZLIB:
+        decompressor = zlib.decompressobj()
+        data = decompressor.decompress(body, limit)
+        if decompressor.unconsumed_tail or not decompressor.eof:
+            raise WireError("Compressed body is corrupt or exceeds the size limit")
+        return memoryview(data)
+    if codec == CODEC_ZSTD:
+        if not ZSTD_AVAILABLE:
+            raise WireError("Frame is zstd-compressed but zstandard is not installed")
+        size = zstandard.frame_content_size(bytes(body[:18]))
+        if size > limit:
+            raise WireError("Compressed body exceeds the size limit")
+        return memoryview(zstandard.ZstdDecompressor().decompress(body, max_output_size=limit))
+    raise WireError(f"Unknown codec {codec}")
+
+
+def _frame(kind: int, body: bytes, compress_threshold: Optional[int]) -> bytes:
+    codec = CODEC_NONE
+    if compress_threshold is not None and len(body) >= compress_threshold:
+        compressed_codec, compressed = _compress(body)
+        if len(compressed) < len(body):
+            codec, body = compressed_codec, compressed
+    return _HEADER.pack(WIRE_MAGIC, WIRE_VERSION, kind, codec, len(body)) + body
+
+
+def peek_header(data: Union[bytes, bytearray, memoryview]) -> WireHeader:
+    """
+    Read a frame header without decoding the body.
+    
+    Args:
+        data: Encoded frame
+    
+    Returns:
+        WireHeader with version, kind, codec and body length
+    
+    Raises:
+        WireError: If the header is missing, foreign or from a newer version
+    """
+    if len(data) < _HEADER.size:
+        raise WireError("Frame shorter than header")
+    magic, version, kind, codec, body_length = _HEADER.unpack_from(data, 0)
+    if magic != WIRE_MAGIC:
+        raise WireError("Not an Aethel wire frame")
+    if version != WIRE_VERSION:
+        raise WireError(f"Unsupported wire version {version}")
+    if kind not in _READERS:
+        raise WireError(f"Unknown frame kind {kind}")
+    if _HEADER.size + body_length != len(data):
+        raise WireError("Frame length does not match header")
+    return WireHeader(version=version, kind=kind, codec=codec, body_length=body_length)
+
+
+def encode_message(
+    message: ConsensusMessage,
+    compress_threshold: Optional[int] = DEFAULT_COMPRESS_THRESHOLD
+) -> bytes:
+    """
+    Encode a consensus message as a wire frame.
+    
+    Args:
+        message: Any data_models consensus message
+        compress_threshold: Body size from which compression is tried (None disables)
+    
+    Returns:
+        Encoded frame
+    
+    Raises:
+        WireError: If a field cannot be represented
+    """
+    kind = _KIND_BY_TYPE.get(message.message_type)
+    if kind is None:
+        raise WireError(f"Unknown message type {message.message_type}")
+    
+    w = _Writer()
+    try:
+        _write_message(w, message)
+    except (struct.error, TypeError, ValueError, AttributeError) as e:
+        raise WireError(f"Cannot encode {message.message_type.value}: {e}") from e
+    return _frame(kind, bytes(w.buffer), compress_threshold)
+
+
+def encode_block(
+    block: ProofBlock,
+    compress_threshold: Optional[int] = DEFAULT_COMPRESS_THRESHOLD
+) -> bytes:
+    """
+    Encode a proof block as a wire frame.
+    
+    Args:
+        block: Block to encode
+        compress_threshold: Body size from which compression is tried (None disables)
+    
+    Returns:
+        Encoded frame
+    """
+    w = _Writer()
+    try:
+        _write_block(w, block)
+    except (struct.error, TypeError, ValueError) as e:
+        raise WireError(f"Cannot encode block {block.block_id}: {e}") from e
+    return _frame(KIND_PROOF_BLOCK, bytes(w.buffer), compress_threshold)
+
+
+def decode(
+    data: Union[bytes, bytearray, memoryview],
+    copy: bool = True,
+    max_body_size: int = MAX_BODY_SIZE
+) -> Union[ConsensusMessage, ProofBlock]:
+    """
+    Decode a wire frame into the message or block it carries.
+    
+    Args:
+        data: Encoded frame
+        copy: If False, raw byte fields of uncompressed frames are
+            memoryviews into data (data must outlive the result)
+        max_body_size: Largest decompressed body accepted
+    
+    Returns:
+        The decoded ConsensusMessage subclass or ProofBlock
+    
+    Raises:
+        WireError: If the frame is malformed
+    """
+    view = memoryview(data).cast("B")
+    header = peek_header(view)
+    body = view[_HEADER.size:]
+    
+    try:
+        if header.codec != CODEC_NONE:
+            body = _decompress(body, header.codec, max_body_size)
+            copy = True
+        reader = _Reader(body, copy)
+        result = _READERS[header.kind](reader)
+        reader.finish()
+    except WireError:
+        raise
+    except (struct.error, UnicodeDecodeError, ValueError, TypeError, zlib.error, RecursionError) as e:
+        raise WireError(f"Malformed frame body: {e}") from e
+    except Exception as e:
+        if ZSTD_AVAILABLE and isinstance(e, zstandard.ZstdError):
+            raise WireError(f"Malformed compressed body: {e}") from e
+        raise
+    return result
+
+
+def decode_message(data: Union[bytes, bytearray, memoryview], copy: bool = True) -> ConsensusMessage:
+    """Decode a frame that must carry a consensus message."""
+    result = decode(data, copy=copy)
+    if not isinstance(result, ConsensusMessage):
+        raise WireError("Frame does not carry a consensus message")
+    return result
+
+
+def decode_block(data: Union[bytes, bytearray, memoryview], copy: bool = True) -> ProofBlock:
+    """Decode a frame that must carry a proof block."""
+    result = decode(data, copy=copy)
+    if not isinstance(result, ProofBlock):
+        raise WireError("Frame does not carry a proof block")
+    return result
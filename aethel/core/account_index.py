@@ -0,0 +1,141 @@
+"""
+Aethel Account Index - Synchrony Protocol v1.8.0
+
+Inverted index from account to the transactions that read or write it.
+Dependency analysis and conflict detection both walk this index instead of
+intersecting the read/write sets of every pair of transactions, so only
+transactions that actually share an account are ever compared.
+
+Complexity: building the index is O(n + total accesses); enumerating the
+conflicting pairs is O(sum over accounts of accessors × writers), which is
+the number of candidate edges. A batch of mostly-disjoint transfers costs
+close to O(n) instead of O(n²).
+
+Author: Aethel Team
+Version: 1.8.0
+Date: February 4, 2026
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from aethel.core.synchrony import Transaction
+
+
+ReadWriteSets = Tuple[Set[str], Set[str]]
+
+
+class AccountIndex:
+    """
+    Account → (readers, writers) index over an ordered batch.
+    
+    Readers and writers are kept as lists of transaction positions in batch
+    order, so every pair produced by conflicting_pairs() is (i, j) with
+    i < j and pairs come out in the same order as the nested pairwise loop
+    they replace.
+    """
+    
+    def __init__(self,
+                 transactions: Sequence[Transaction],
+                 rw_sets: Sequence[ReadWriteSets]):
+        """
+        Build the index.
+        
+        Args:
+            transactions: Transactions in batch order
+            rw_sets: (read_set, write_set) for each transaction, same order
+        """
+        self.transactions: List[Transaction] = list(transactions)
+        self.read_sets: List[Set[str]] = [reads for reads, _ in rw_sets]
+        self.write_sets: List[Set[str]] = [writes for _, writes in rw_sets]
+        self.readers: Dict[str, List[int]] = {}
+        self.writers: Dict[str, List[int]] = {}
+        self._pairs: Optional[List[Tuple[int, int]]] = None
+        
+        for position, (reads, writes) in enumerate(rw_sets):
+            for account in reads:
+                self.readers.setdefault(account, []).append(position)
+            for account in writes:
+                self.writers.setdefault(account, []).append(position)
+    
+    @classmethod
+    def build(cls,
+              transactions: Sequence[Transaction],
+              extract: Optional[Callable[[Transaction], ReadWriteSets]] = None) -> "AccountIndex":
+        """
+        Build an index using an extraction function.
+        
+        Args:
+            transactions: Transactions in batch order
+            extract: Returns (read_set, write_set) for a transaction;
+                defaults to the transaction's cached get_read_set/get_write_set
+        
+        Returns:
+            AccountIndex over the batch
+        """
+        if extract is None:
+            extract = lambda txn: (txn.get_read_set(), txn.get_write_set())
+        return cls(transactions, [extract(txn) for txn in transactions])
+    
+    def covers(self, transactions: Sequence[Transaction]) -> bool:
+        """True if the index was built over exactly this batch, in order."""
+        if len(transactions) != len(self.transactions):
+            return False
+        return all(a is b or a.id == b.id for a, b in zip(transactions, self.transactions))
+    
+    def accessors(self, account: str) -> Set[int]:
+        """Positions of transactions that read or write an account."""
+        return set(self.readers.get(account, ())) | set(self.writers.get(account, ()))
+    
+    def conflicting_pairs(self) -> List[Tuple[int, int]]:
+        """
+        Positions (i, j), i < j, of transactions that share an account
+        which at least one of them writes.
+        
+        These are exactly the pairs for which a RAW, WAW or WAR conflict
+        exists; every other pair is independent. The result is computed
+        once and cached.
+        
+        Returns:
+            Sorted list of conflicting position pairs
+        """
+        if self._pairs is not None:
+            return self._pairs
+        
+        partners: Dict[int, Set[int]] = {}
+        for account, writer_positions in self.writers.items():
+            accessor_positions = self.accessors(account)
+            for writer in writer_positions:
+                for other in accessor_positions:
+                    if other == writer:
+                        continue
+                    low, high = (writer, other) if writer < other else (other, writer)
+                    partners.setdefault(low, set()).add(high)
+        
+        self._pairs = [
+            (low, high)
+            for low in sorted(partners)
+            for high in sorted(partners[low])
+        ]
+        return self._pairs
+    
+    def to_dict(self) -> Dict[str, Dict[str, List[str]]]:
+        """Convert to dictionary of account → reader/writer transaction IDs"""
+        accounts = set(self.readers) | set(self.writers)
+        return {
+            account: {
+                "readers": [self.transactions[i].id for i in self.readers.get(account, ())],
+                "writers": [self.transactions[i].id for i in self.writers.get(account, ())],
+            }
+            for account in sorted(accounts)
+        }
+
+
+# ============================================================================
+# MODULE INFO
+# ============================================================================
+
+__version__ = "1.8.0"
+__author__ = "Aethel Team"
+__all__ = [
+    "AccountIndex",
+]
@@ -11,7 +11,7 @@ Version: 1.8.0
 Date: February 4, 2026
 """
 
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 import time
 import copy
 
@@ -28,6 +28,7 @@ from aethel.core.synchrony import (
 from aethel.core.dependency_analyzer import DependencyAnalyzer
 from aethel.core.conflict_detector import ConflictDetector
 from aethel.core.parallel_executor import ParallelExecutor
+from aethel.core.optimistic_executor import OptimisticExecutor
 from aethel.core.linearizability_prover import LinearizabilityProver
 from aethel.core.conservation_validator import ConservationValidator
 from aethel.core.commit_manager import CommitManager
@@ -61,25 +62,62 @@ class BatchProcessor:
         Requirements 1.1, 2.1, 2.2, 3.1-3.4, 4.1-4.2, 7.1-7.5, 9.1-9.5
     """
     
-    def __init__(self, num_threads: int = 8, timeout_seconds: float = 300.0):
+    def __init__(self,
+                 num_threads: int = 8,
+                 timeout_seconds: float = 300.0,
+                 execution_backend: str = "thread",
+                 num_processes: Optional[int] = None,
+                 process_threshold: int = 64,
+                 optimistic: bool = False,
+                 trace_mode: str = "full",
+                 trace_sample_rate: float = 0.01):
         """
         Initialize batch processor.
         
         Args:
             num_threads: Number of threads for parallel execution (default 8)
             timeout_seconds: Timeout for batch execution (default 300s = 5 minutes)
+            execution_backend: "thread" (default) or "process" to run large
+                independent sets on a process pool, bypassing the GIL
+            num_processes: Worker processes for the process backend
+                (default: CPU count)
+            process_threshold: Smallest independent set shipped to the
+                process pool; smaller sets stay on the thread pool
+            optimistic: Skip dependency analysis and execute speculatively,
+                re-executing only transactions whose reads were invalidated
+            trace_mode: Execution trace recording: "full" (default),
+                "sampled" or "off"
+            trace_sample_rate: Fraction of transactions traced when sampled
         """
         self.num_threads = num_threads
         self.timeout_seconds = timeout_seconds
+        self.execution_backend = execution_backend
+        self.optimistic = optimistic
         
         # Initialize components
         self.dependency_analyzer = DependencyAnalyzer()
         self.conflict_detector = ConflictDetector()
-        self.parallel_executor = ParallelExecutor(thread_count=num_threads)
+        self.parallel_executor = ParallelExecutor(
+            thread_count=num_threads,
+            backend=execution_backend,
+            process_count=num_processes,
+            process_threshold=process_threshold,
+            trace_mode=trace_mode,
+            trace_sample_rate=trace_sample_rate
+        )
+        self.optimistic_executor = OptimisticExecutor(
+            thread_count=num_threads,
+            timeout_seconds=timeout_seconds
+        )
         self.linearizability_prover = LinearizabilityProver()
         self.conservation_validator = ConservationValidator()
         self.commit_manager = CommitManager()
     
+    def shutdown(self):
+        """Release the executors' thread pools and worker processes"""
+        self.parallel_executor.shutdown()
+        self.optimistic_executor.shutdown()
+    
     def execute_batch(self, transactions: List[Transaction]) -> BatchResult:
         """
         Execute a batch of transactions with parallel optimization.
@@ -114,90 +152,18 @@ class BatchProcessor:
         initial_states = self._capture_initial_states(transactions)
         
         try:
-            # ============================================================
-            # STAGE 1: Dependency Analysis
-            # ============================================================
-            dependency_graph = self.dependency_analyzer.analyze(transactions)
-            
-            # Check for circular dependencies
-            if dependency_graph.has_cycle():
-                cycle = dependency_graph.find_cycle()
-                raise CircularDependencyError(cycle)
-            
-            # ============================================================
-            # STAGE 2: Conflict Detection
-            # ============================================================
-            conflicts = self.conflict_detector.detect_conflicts(
-                transactions,
-                dependency_graph
-            )
-            
-            # Resolve conflicts deterministically
-            resolution_strategy = self.conflict_detector.resolve_conflicts(conflicts)
+            if self.optimistic:
+                result, _ = self._execute_optimistic(transactions, initial_states, start_time)
+                return result
             
-            # ============================================================
-            # STAGE 3: Parallel Execution
-            # ============================================================
-            execution_result = self.parallel_executor.execute_parallel(
+            dependency_graph, conflicts = self._analyze(transactions)
+            result, _ = self._execute_analyzed(
                 transactions,
+                initial_states,
                 dependency_graph,
-                initial_states
-            )
-            
-            # ============================================================
-            # STAGE 4: Linearizability Proof
-            # ============================================================
-            proof_result = self.linearizability_prover.prove_linearizability(
-                execution_result,
-                transactions
-            )
-            
-            if not proof_result.is_linearizable:
-                # Parallel execution failed linearizability
-                # Fall back to serial execution
-                return self._fallback_to_serial(
-                    transactions,
-                    initial_states,
-                    proof_result,
-                    start_time
-                )
-            
-            # ============================================================
-            # STAGE 5: Conservation Validation
-            # ============================================================
-            conservation_result = self.conservation_validator.validate_batch_conservation(
-                execution_result,
-                initial_states
+                conflicts,
+                start_time
             )
-            
-            if not conservation_result.is_valid:
-                raise ConservationViolationError(
-                    expected=self._compute_total_balance(initial_states),
-                    actual=self._compute_total_balance(execution_result.final_states),
-                    details={
-                        "violation_amount": conservation_result.violation_amount,
-                        "error_message": conservation_result.error_message
-                    }
-                )
-            
-            # ============================================================
-            # STAGE 6: Atomic Commit
-            # ============================================================
-            result = self.commit_manager.commit_batch(
-                execution_result=execution_result,
-                transactions=transactions,
-                initial_states=initial_states,
-                proof_result=proof_result,
-                conservation_result=conservation_result
-            )
-            
-            # Add conflicts to result
-            result.conflicts_detected = conflicts
-            
-            # Calculate final metrics
-            total_time = time.time() - start_time
-            result.execution_time = total_time
-            
             return result
         
         except CircularDependencyError as e:
@@ -284,6 +250,216 @@ class BatchProcessor:
         # Create 1-transaction batch
         return self.execute_batch([transaction])
     
+    def _analyze(self, transactions: List[Transaction]) -> Tuple[Any, List[Any]]:
+        """
+        Run the analysis stages of the pipeline.
+        
+        Args:
+            transactions: List of transactions
+        
+        Returns:
+            (dependency_graph, conflicts)
+        
+        Raises:
+            CircularDependencyError: If the transactions cannot be ordered
+        """
+        # ============================================================
+        # STAGE 1: Dependency Analysis
+        # ============================================================
+        dependency_graph = self.dependency_analyzer.analyze(transactions)
+        
+        # Check for circular dependencies
+        if dependency_graph.has_cycle():
+            cycle = dependency_graph.find_cycle()
+            raise CircularDependencyError(cycle)
+        
+        # ============================================================
+        # STAGE 2: Conflict Detection
+        # ============================================================
+        conflicts = self.conflict_detector.detect_conflicts(
+            transactions,
+            dependency_graph
+        )
+        
+        # Resolve conflicts deterministically
+        resolution_strategy = self.conflict_detector.resolve_conflicts(conflicts)
+        
+        return dependency_graph, conflicts
+    
+    def _execute_analyzed(self,
+                          transactions: List[Transaction],
+                          initial_states: Dict[str, Any],
+                          dependency_graph: Any,
+                          conflicts: List[Any],
+                          start_time: float) -> Tuple[BatchResult, Dict[str, Any]]:
+        """
+        Run the execution, proof and commit stages of the pipeline.
+        
+        Args:
+            transactions: List of transactions
+            initial_states: Initial account states
+            dependency_graph: Graph from _analyze()
+            conflicts: Conflicts from _analyze()
+            start_time: Batch start time
+        
+        Returns:
+            (BatchResult, account states after the commit or rollback)
+        """
+        # ============================================================
+        # STAGE 3: Parallel Execution
+        # ============================================================
+        execution_result = self.parallel_executor.execute_parallel(
+            transactions,
+            dependency_graph,
+            initial_states
+        )
+        
+        # ============================================================
+        # STAGE 4: Linearizability Proof
+        # ============================================================
+        proof_result = self.linearizability_prover.prove_linearizability(
+            execution_result,
+            transactions,
+            dependency_graph
+        )
+        
+        if not proof_result.is_linearizable:
+            # Parallel execution failed linearizability
+            # Fall back to serial execution
+            result = self._fallback_to_serial(
+                transactions,
+                initial_states,
+                proof_result,
+                start_time
+            )
+            # The serial re-execution leaves every account as it started
+            return result, initial_states
+        
+        # ============================================================
+        # STAGE 5: Conservation Validation
+        # ============================================================
+        conservation_result = self.conservation_validator.validate_batch_conservation(
+            execution_result,
+            initial_states
+        )
+        
+        if not conservation_result.is_valid:
+            raise ConservationViolationError(
+                expected=self._compute_total_balance(initial_states),
+                actual=self._compute_total_balance(execution_result.final_states),
+                details={
+                    "violation_amount": conservation_result.violation_amount,
+                    "error_message": conservation_result.error_message
+                }
+            )
+        
+        # Split hot accounts: prove the sub-accumulator merge
+        if dependency_graph.split_accounts:
+            merge_result = self.conservation_validator.validate_accumulator_merge(
+                execution_result,
+                transactions,
+                initial_states
+            )
+            if not merge_result.is_valid:
+                raise ConservationViolationError(
+                    expected=self._compute_total_balance(initial_states),
+                    actual=self._compute_total_balance(execution_result.final_states),
+                    details={
+                        "violation_amount": merge_result.violation_amount,
+                        "error_message": merge_result.error_message
+                    }
+                )
+        
+        # ============================================================
+        # STAGE 6: Atomic Commit
+        # ============================================================
+        result = self.commit_manager.commit_batch(
+            execution_result=execution_result,
+            transactions=transactions,
+            initial_states=initial_states,
+            proof_result=proof_result,
+            conservation_result=conservation_result
+        )
+        
+        # Add conflicts to result
+        result.conflicts_detected = conflicts
+        if dependency_graph.hot_accounts:
+            result.diagnostic_info = {
+                **(result.diagnostic_info or {}),
+                "hot_accounts": dict(dependency_graph.hot_accounts),
+                "split_accounts": sorted(dependency_graph.split_accounts)
+            }
+        
+        # Calculate final metrics
+        total_time = time.time() - start_time
+        result.execution_time = total_time
+        
+        # Rolled-back accounts were restored in place by the commit manager
+        return result, execution_result.final_states
+    
+    def _execute_optimistic(self,
+                            transactions: List[Transaction],
+                            initial_states: Dict[str, Any],
+                            start_time: float) -> Tuple[BatchResult, Dict[str, Any]]:
+        """
+        Execute a batch in optimistic mode.
+        
+        Replaces stages 1-3 with speculative execution: conflicts are found
+        by read-set validation instead of static analysis, and only the
+        transactions they invalidate are re-executed. There is no serial
+        fallback; a batch that cannot be proven is rolled back.
+        
+        Args:
+            transactions: List of transactions
+            initial_states: Initial account states
+            start_time: Batch start time
+        
+        Returns:
+            (BatchResult with optimistic execution statistics in
+            diagnostic_info, account states after the commit or rollback)
+        """
+        execution_result = self.optimistic_executor.execute_optimistic(
+            transactions,
+            initial_states
+        )
+        
+        proof_result = self.linearizability_prover.prove_linearizability(
+            execution_result,
+            transactions
+        )
+        if not proof_result.is_linearizable:
+            raise LinearizabilityError(proof_result.counterexample)
+        
+        conservation_result = self.conservation_validator.validate_batch_conservation(
+            execution_result,
+            initial_states
+        )
+        if not conservation_result.is_valid:
+            raise ConservationViolationError(
+                expected=self._compute_total_balance(initial_states),
+                actual=self._compute_total_balance(execution_result.final_states),
+                details={
+                    "violation_amount": conservation_result.violation_amount,
+                    "error_message": conservation_result.error_message
+                }
+            )
+        
+        result = self.commit_manager.commit_batch(
+            execution_result=execution_result,
+            transactions=transactions,
+            initial_states=initial_states,
+            proof_result=proof_result,
+            conservation_result=conservation_result
+        )
+        result.execution_time = time.time() - start_time
+        result.diagnostic_info = {
+            **(result.diagnostic_info or {}),
+            "mode": "optimistic",
+            **self.optimistic_executor.get_stats()
+        }
+        
+        return result, execution_result.final_states
+    
     def _fallback_to_serial(self,
                            transactions: List[Transaction],
                            initial_states: Dict[str, Any],
@@ -22,6 +22,7 @@ from aethel.core.synchrony import (
     DependencyGraph,
     ConflictResolutionError
 )
+from aethel.core.account_index import AccountIndex
 
 
 @dataclass
@@ -69,7 +70,9 @@ class ConflictDetector:
         Detect all conflicts between transactions.
         
         Algorithm:
-        1. For each pair of transactions (Ti, Tj):
+        1. For each pair of transactions (Ti, Tj) sharing an account, taken
+           from the account index (the one attached to dependency_graph by
+           the DependencyAnalyzer when it covers this batch):
            a. Get read and write sets for both
            b. Check for RAW: Ti writes ∩ Tj reads
            c. Check for WAW: Ti writes ∩ Tj writes
@@ -89,75 +92,77 @@ class ConflictDetector:
         """
         conflicts = []
         
-        # Create transaction lookup map
-        tx_map = {tx.id: tx for tx in transactions}
+        # Reuse the analyzer's index when it was built over this batch
+        index = getattr(dependency_graph, "account_index", None)
+        if not isinstance(index, AccountIndex) or not index.covers(transactions):
+            index = AccountIndex.build(transactions)
         
-        # Check each pair of transactions
-        for i, tx1 in enumerate(transactions):
-            for tx2 in transactions[i+1:]:
-                # Get read and write sets
-                tx1_reads = tx1.get_read_set()
-                tx1_writes = tx1.get_write_set()
-                tx2_reads = tx2.get_read_set()
-                tx2_writes = tx2.get_write_set()
-                
-                # Detect RAW conflicts: T1 writes X, T2 reads X
-                raw_resources = tx1_writes & tx2_reads
-                for resource in raw_resources:
-                    conflicts.append(Conflict(
-                        type=ConflictType.RAW,
-                        transaction_1=tx1.id,
-                        transaction_2=tx2.id,
-                        resource=resource,
-                        resolution="enforce_order"
-                    ))
-                
-                # Detect WAW conflicts: T1 writes X, T2 writes X
-                waw_resources = tx1_writes & tx2_writes
-                for resource in waw_resources:
-                    conflicts.append(Conflict(
-                        type=ConflictType.WAW,
-                        transaction_1=tx1.id,
-                        transaction_2=tx2.id,
-                        resource=resource,
-                        resolution="enforce_order"
-                    ))
-                
-                # Detect WAR conflicts: T1 reads X, T2 writes X
-                war_resources = tx1_reads & tx2_writes
-                for resource in war_resources:
-                    conflicts.append(Conflict(
-                        type=ConflictType.WAR,
-                        transaction_1=tx1.id,
-                        transaction_2=tx2.id,
-                        resource=resource,
-                        resolution="enforce_order"
-                    ))
-                
-                # Also check reverse direction (T2 before T1)
-                # Detect RAW conflicts: T2 writes X, T1 reads X
-                raw_resources_rev = tx2_writes & tx1_reads
-                for resource in raw_resources_rev:
-                    conflicts.append(Conflict(
-                        type=ConflictType.RAW,
-                        transaction_1=tx2.id,
-                        transaction_2=tx1.id,
-                        resource=resource,
-                        resolution="enforce_order"
-                    ))
-                
-                # WAW is symmetric, already covered above
-                
-                # Detect WAR conflicts: T2 reads X, T1 writes X
-                war_resources_rev = tx2_reads & tx1_writes
-                for resource in war_resources_rev:
-                    conflicts.append(Conflict(
-                        type=ConflictType.WAR,
-                        transaction_1=tx2.id,
-                        transaction_2=tx1.id,
-                        resource=resource,
-                        resolution="enforce_order"
-                    ))
+        # Check only pairs of transactions that share an account
+        for i, j in index.conflicting_pairs():
+            tx1 = transactions[i]
+            tx2 = transactions[j]
+            tx1_reads = index.read_sets[i]
+            tx1_writes = index.write_sets[i]
+            tx2_reads = index.read_sets[j]
+            tx2_writes = index.write_sets[j]
+            
+            # Detect RAW conflicts: T1 writes X, T2 reads X
+            raw_resources = tx1_writes & tx2_reads
+            for resource in raw_resources:
+                conflicts.append(Conflict(
+                    type=ConflictType.RAW,
+                    transaction_1=tx1.id,
+                    transaction_2=tx2.id,
+                    resource=resource,
+                    resolution="enforce_order"
+                ))
+            
+            # Detect WAW conflicts: T1 writes X, T2 writes X
+            waw_resources = tx1_writes & tx2_writes
+            for resource in waw_resources:
+                conflicts.append(Conflict(
+                    type=ConflictType.WAW,
+                    transaction_1=tx1.id,
+                    transaction_2=tx2.id,
+                    resource=resource,
+                    resolution="enforce_order"
+                ))
+            
+            # Detect WAR conflicts: T1 reads X, T2 writes X
+            war_resources = tx1_reads & tx2_writes
+            for resource in war_resources:
+                conflicts.append(Conflict(
+                    type=ConflictType.WAR,
+                    transaction_1=tx1.id,
+                    transaction_2=tx2.id,
+                    resource=resource,
+                    resolution="enforce_order"
+                ))
+            
+            # Also check reverse direction (T2 before T1)
+            # Detect RAW conflicts: T2 writes X, T1 reads X
+            raw_resources_rev = tx2_writes & tx1_reads
+            for resource in raw_resources_rev:
+                conflicts.append(Conflict(
+                    type=ConflictType.RAW,
+                    transaction_1=tx2.id,
+                    transaction_2=tx1.id,
+                    resource=resource,
+                    resolution="enforce_order"
+                ))
+            
+            # WAW is symmetric, already covered above
+            
+            # Detect WAR conflicts: T2 reads X, T1 writes X
+            war_resources_rev = tx2_reads & tx1_writes
+            for resource in war_resources_rev:
+                conflicts.append(Conflict(
+                    type=ConflictType.WAR,
+                    transaction_1=tx2.id,
+                    transaction_2=tx1.id,
+                    resource=resource,
+                    resolution="enforce_order"
+                ))
         
         self.detected_conflicts = conflicts
         return conflicts
@@ -17,6 +17,7 @@ import z3
 
 from aethel.core.synchrony import (
     Transaction,
+    Credit,
     ExecutionResult,
     ProofResult,
     ConservationViolationError
@@ -43,6 +44,7 @@ class ConservationValidator:
     3. Compute global balance sum after batch
     4. Verify: sum_before == sum_after
     5. Generate Z3 proof of conservation invariant
+    6. Prove split hot-account sub-accumulators merged without loss
     
     Validates:
         Requirements 3.3
@@ -209,6 +211,87 @@ class ConservationValidator:
                 proof_time=0.0
             )
     
+    def validate_accumulator_merge(self,
+                                   execution_result: ExecutionResult,
+                                   transactions: List[Transaction],
+                                   initial_states: Dict[str, Dict]) -> ConservationResult:
+        """
+        Prove that merging per-worker sub-accumulators lost no credit.
+        
+        For every split account, Z3 checks that no assignment of the
+        partial sums (fixed to the values the workers produced) violates
+        
+            final == initial + sum(partials)
+            sum(partials) == sum of the batch's Credit operations
+        
+        so the merged balance is exactly what applying every credit in any
+        serial order would give.
+        
+        Args:
+            execution_result: Result from parallel execution
+            transactions: List of transactions in batch
+            initial_states: Initial account states before batch
+        
+        Returns:
+            ConservationResult indicating if every merge holds
+        """
+        epsilon = 1e-10  # Floating point tolerance, as in validate_batch_conservation
+        
+        credited: Dict[str, float] = {}
+        for tx in transactions:
+            for op in tx.operations:
+                if isinstance(op, Credit) and op.account_id in execution_result.accumulators:
+                    credited[op.account_id] = credited.get(op.account_id, 0) + op.amount
+        
+        # One query for the whole batch: is any merge violated?
+        self.solver.reset()
+        violations = {}
+        for account_id, values in execution_result.accumulators.items():
+            initial = (initial_states.get(account_id) or {}).get('balance', 0)
+            final = (execution_result.final_states.get(account_id) or {}).get('balance', 0)
+            
+            # Empty sub-accumulators add nothing to the sum
+            partials = []
+            for i, value in enumerate(values):
+                if value:
+                    partial = z3.Real(f"{account_id}_partial_{i}")
+                    self.solver.add(partial == value)
+                    partials.append(partial)
+            merged = z3.Sum(partials) if partials else z3.RealVal(0)
+            
+            merge_holds = z3.And(
+                z3.Abs(merged + initial - final) <= epsilon,
+                z3.Abs(merged - credited.get(account_id, 0)) <= epsilon
+            )
+            violations[account_id] = (z3.Not(merge_holds), initial, final, values)
+        
+        if violations:
+            self.solver.add(z3.Or([violated for violated, _, _, _ in violations.values()]))
+        
+        if not violations or self.solver.check() == z3.unsat:
+            return ConservationResult(
+                is_valid=True,
+                changes=[],
+                violation_amount=None,
+                error_message=None
+            )
+        
+        model = self.solver.model()
+        for account_id, (violated, initial, final, values) in violations.items():
+            if z3.is_true(model.eval(violated, model_completion=True)):
+                break
+        expected = initial + credited.get(account_id, 0)
+        return ConservationResult(
+            is_valid=False,
+            changes=[],
+            violation_amount=final - expected,
+            error_message=(
+                f"Sub-accumulator merge violated for {account_id}: "
+                f"initial={initial}, credited={credited.get(account_id, 0)}, "
+                f"partials={values}, final={final}"
+            )
+        )
+    
     def _generate_conservation_proof(self,
                                     accounts: Set[str],
                                     initial_vars: Dict[str, z3.ArithRef],
@@ -0,0 +1,249 @@
+"""
+Aethel DAG Scheduler - Synchrony Protocol v1.8.0
+
+Wavefront scheduler for dependency graphs. A transaction is dispatched the
+moment its last dependency completes instead of waiting for the rest of
+its topological level, so one long transaction no longer holds back every
+independent transaction behind a level barrier.
+
+Work distribution:
+- Each worker owns a deque. Transactions made ready by a worker are pushed
+  onto that worker's deque (they usually touch the accounts it just
+  wrote), and the worker pops from the same end (LIFO).
+- An idle worker steals from the opposite end of another worker's deque
+  (FIFO), taking the oldest ready work.
+- Workers with nothing to run or steal sleep on a condition variable until
+  new work is published or the graph is finished. Deque operations happen
+  under one short-held lock, so the ready count is exact and idle workers
+  never spin.
+
+Author: Aethel Team
+Version: 1.8.0
+Date: February 4, 2026
+"""
+
+from collections import deque
+from concurrent.futures import Executor
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+import threading
+import time
+
+from aethel.core.synchrony import TimeoutError
+
+
+class WorkStealingScheduler:
+    """
+    Runs a task per DAG node as soon as the node's in-degree reaches zero.
+    
+    The scheduler does not own threads: run() submits one worker loop per
+    worker to the given executor and waits for the graph to drain.
+    """
+    
+    def __init__(self, worker_count: int = 8):
+        """
+        Initialize scheduler.
+        
+        Args:
+            worker_count: Number of worker loops (default 8)
+        """
+        if worker_count < 1:
+            raise ValueError("worker_count must be at least 1")
+        self.worker_count = worker_count
+        self.stats: Dict[str, Any] = {}
+    
+    def run(self,
+            dependencies: Dict[str, Iterable[str]],
+            task: Callable[[str, int], None],
+            executor: Executor,
+            timeout_seconds: Optional[float] = None) -> List[str]:
+        """
+        Execute task(node_id, worker_index) for every node in dependency order.
+        
+        Args:
+            dependencies: node_id -> IDs it depends on; insertion order sets
+                the initial dispatch order and unknown IDs are ignored
+            task: Callable run once per node on a worker thread
+            executor: Executor the worker loops are submitted to; needs at
+                least worker_count free threads
+            timeout_seconds: Deadline for the whole graph (None = no limit)
+        
+        Returns:
+            Node IDs in completion order. Nodes on a cycle never become
+            ready and are left out.
+        
+        Raises:
+            TimeoutError: If the graph does not finish before the deadline
+            Exception: The first exception raised by a task
+        """
+        run = _Run(dependencies, task, self.worker_count)
+        if run.total == 0:
+            self.stats = run.get_stats()
+            return []
+        
+        workers = [executor.submit(run.worker, index) for index in range(self.worker_count)]
+        finished = run.wait(timeout_seconds)
+        if not finished:
+            run.cancel()
+            self.stats = run.get_stats()
+            raise TimeoutError(
+                timeout_seconds=timeout_seconds,
+                completed=len(run.completed),
+                pending=run.total - len(run.completed)
+            )
+        
+        run.cancel()
+        for worker in workers:
+            worker.result()
+        
+        self.stats = run.get_stats()
+        if run.error is not None:
+            raise run.error
+        return run.completed
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Statistics from the last run"""
+        return dict(self.stats)
+
+
+class _Run:
+    """State of one scheduler run, shared by its workers."""
+    
+    def __init__(self,
+                 dependencies: Dict[str, Iterable[str]],
+                 task: Callable[[str, int], None],
+                 worker_count: int):
+        self.task = task
+        self.worker_count = worker_count
+        self.deques: List[Deque[str]] = [deque() for _ in range(worker_count)]
+        self.lock = threading.Lock()
+        # Workers sleep on work_available; run() sleeps on finished
+        self.work_available = threading.Condition(self.lock)
+        self.finished = threading.Condition(self.lock)
+        self.completed: List[str] = []
+        self.error: Optional[BaseException] = None
+        self.cancelled = False
+        
+        # Deques and counters are guarded by the lock
+        self.queued = 0
+        self.running = 0
+        self.steals = 0
+        self.executed = [0] * worker_count
+        
+        # Build in-degrees and the reverse adjacency
+        self.in_degree: Dict[str, int] = {}
+        self.dependents: Dict[str, List[str]] = {node_id: [] for node_id in dependencies}
+        for node_id, deps in dependencies.items():
+            known = {dep for dep in deps if dep in self.dependents and dep != node_id}
+            self.in_degree[node_id] = len(known)
+            for dep in known:
+                self.dependents[dep].append(node_id)
+        self.total = len(self.in_degree)
+        
+        # Seed ready nodes round-robin across workers
+        ready = [node_id for node_id, degree in self.in_degree.items() if degree == 0]
+        for position, node_id in enumerate(ready):
+            self.deques[position % worker_count].append(node_id)
+        self.queued = len(ready)
+    
+    def _take(self, index: int) -> Optional[str]:
+        """Pop from own deque, else steal the oldest node from another (lock held)."""
+        if self.deques[index]:
+            return self.deques[index].pop()
+        for offset in range(1, self.worker_count):
+            victim = self.deques[(index + offset) % self.worker_count]
+            if victim:
+                self.steals += 1
+                return victim.popleft()
+        return None
+    
+    def _done(self) -> bool:
+        """Finished, failed, cancelled or stalled (lock held)."""
+        return (
+            self.cancelled
+            or self.error is not None
+            or len(self.completed) == self.total
+            or (self.queued == 0 and self.running == 0)
+        )
+    
+    def _wake_all(self) -> None:
+        self.work_available.notify_all()
+        self.finished.notify_all()
+    
+    def worker(self, index: int) -> None:
+        """Worker loop: take or steal a ready node, run it, release dependents."""
+        while True:
+            # Taking under the lock keeps queued equal to the nodes sitting in
+            # deques, so an idle worker can sleep instead of spinning
+            with self.lock:
+                while True:
+                    if self._done():
+                        return
+                    node_id = self._take(index)
+                    if node_id is not None:
+                        break
+                    self.work_available.wait()
+                self.queued -= 1
+                self.running += 1
+            
+            try:
+                self.task(node_id, index)
+            except BaseException as error:
+                with self.lock:
+                    self.running -= 1
+                    if self.error is None:
+                        self.error = error
+                    self._wake_all()
+                return
+            
+            with self.lock:
+                self.running -= 1
+                self.executed[index] += 1
+                self.completed.append(node_id)
+                released = 0
+                for dependent in self.dependents[node_id]:
+                    self.in_degree[dependent] -= 1
+                    if self.in_degree[dependent] == 0:
+                        self.deques[index].append(dependent)
+                        released += 1
+                self.queued += released
+                if self._done():
+                    self._wake_all()
+                elif released > 1:
+                    # Keep one for ourselves, wake sleepers to steal the rest
+                    self.work_available.notify(released - 1)
+    
+    def wait(self, timeout_seconds: Optional[float]) -> bool:
+        """Block until the run is done; False if the deadline passed first."""
+        deadline = None if timeout_seconds is None else time.monotonic() + timeout_seconds
+        with self.lock:
+            while not self._done():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self.finished.wait(remaining)
+        return True
+    
+    def cancel(self) -> None:
+        """Stop workers once their current node finishes."""
+        with self.lock:
+            self.cancelled = True
+            self._wake_all()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "nodes": self.total,
+            "completed": len(self.completed),
+            "steals": self.steals,
+            "executed_per_worker": list(self.executed),
+        }
+
+
+# ============================================================================
+# MODULE INFO
+# ============================================================================
+
+__version__ = "1.8.0"
+__author__ = "Aethel Team"
+__all__ = [
+    "WorkStealingScheduler",
+]
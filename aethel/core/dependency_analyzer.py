@@ -4,18 +4,26 @@ Aethel Dependency Analyzer - Synchrony Protocol v1.8.0
 Analyzes transaction dependencies and builds a directed acyclic graph (DAG).
 Detects RAW, WAW, and WAR dependencies between transactions.
 
+Hot accounts (fee sinks, exchange wallets) that most transactions touch
+would chain the whole batch together. When every transaction touching a
+hot account only credits it, the account is split out of dependency
+analysis: credits commute, so the executor sums them into per-worker
+sub-accumulators and merges them after the batch.
+
 Author: Aethel Team
 Version: 1.8.0
 Date: February 4, 2026
 """
 
-from typing import List, Set, Tuple, Dict
+from typing import Dict, List, Optional, Set, Tuple
 from aethel.core.synchrony import (
     Transaction,
+    Credit,
     ConflictType,
     CircularDependencyError
 )
 from aethel.core.dependency_graph import DependencyGraph
+from aethel.core.account_index import AccountIndex
 
 
 class DependencyAnalyzer:
@@ -26,11 +34,26 @@ class DependencyAnalyzer:
     - Ti writes to account A and Tj reads from account A (RAW dependency)
     - Ti writes to account A and Tj writes to account A (WAW dependency)
     - Ti reads from account A and Tj writes to account A (WAR dependency)
+    
+    Pairs are taken from an AccountIndex, so only transactions sharing an
+    account are compared. The index is attached to the returned graph as
+    graph.account_index for reuse by the ConflictDetector.
+    
+    Accounts touched by at least hot_account_threshold transactions are
+    reported as graph.hot_accounts. Hot accounts that every toucher only
+    credits are removed from the read/write sets and listed in
+    graph.split_accounts.
     """
     
-    def __init__(self):
-        """Initialize the dependency analyzer"""
-        pass
+    def __init__(self, hot_account_threshold: Optional[int] = 8):
+        """
+        Initialize the dependency analyzer.
+        
+        Args:
+            hot_account_threshold: Transactions touching an account for it
+                to count as hot (default 8; None disables splitting)
+        """
+        self.hot_account_threshold = hot_account_threshold
     
     def extract_read_write_sets(self, transaction: Transaction) -> Tuple[Set[str], Set[str]]:
         """
@@ -56,13 +79,55 @@ class DependencyAnalyzer:
             elif hasattr(op, 'account_id'):
                 write_set.add(op.account_id)
         
+        # Statically extracted write sets are exact, even when empty
+        if transaction._static_write_set is not None:
+            write_set = set(transaction._static_write_set)
         # If no explicit operations, assume all accounts are written
         # (conservative approach for safety)
-        if not transaction.operations:
+        elif not transaction.operations:
             write_set = set(transaction.accounts.keys())
         
         return read_set, write_set
     
+    def detect_hot_accounts(self, rw_sets: List[Tuple[Set[str], Set[str]]]) -> Dict[str, int]:
+        """
+        Count the transactions touching each account and keep the hot ones.
+        
+        Args:
+            rw_sets: (read_set, write_set) for each transaction
+        
+        Returns:
+            Dictionary of hot account -> number of transactions touching it
+        """
+        # No account can be touched by more transactions than the batch has
+        if self.hot_account_threshold is None or len(rw_sets) < self.hot_account_threshold:
+            return {}
+        
+        counts: Dict[str, int] = {}
+        for read_set, write_set in rw_sets:
+            for account_id in read_set | write_set:
+                counts[account_id] = counts.get(account_id, 0) + 1
+        
+        return {
+            account_id: count
+            for account_id, count in counts.items()
+            if count >= self.hot_account_threshold
+        }
+    
+    def is_credit_only(self, transaction: Transaction, account_id: str) -> bool:
+        """
+        True if the transaction's only operations on an account are credits.
+        
+        Args:
+            transaction: Transaction to inspect
+            account_id: Account to check
+        """
+        targeting = [
+            op for op in transaction.operations
+            if getattr(op, 'target_account', getattr(op, 'account_id', None)) == account_id
+        ]
+        return bool(targeting) and all(isinstance(op, Credit) for op in targeting)
+    
     def _detect_dependency(
         self,
         t1: Transaction,
@@ -122,38 +187,54 @@ class DependencyAnalyzer:
             graph.add_node(txn)
         
         # Extract read/write sets for all transactions (cache for performance)
-        rw_sets: Dict[str, Tuple[Set[str], Set[str]]] = {}
-        for txn in transactions:
-            read_set, write_set = self.extract_read_write_sets(txn)
-            rw_sets[txn.id] = (read_set, write_set)
+        rw_sets: List[Tuple[Set[str], Set[str]]] = [
+            self.extract_read_write_sets(txn) for txn in transactions
+        ]
+        
+        # Split hot accounts that are only ever credited
+        graph.hot_accounts = self.detect_hot_accounts(rw_sets)
+        for account_id in graph.hot_accounts:
+            touching = [
+                txn for txn, (read_set, write_set) in zip(transactions, rw_sets)
+                if account_id in read_set or account_id in write_set
+            ]
+            if all(self.is_credit_only(txn, account_id) for txn in touching):
+                graph.split_accounts[account_id] = [txn.id for txn in touching]
+        
+        if graph.split_accounts:
+            split = set(graph.split_accounts)
+            rw_sets = [(read_set - split, write_set - split) for read_set, write_set in rw_sets]
+        
+        for txn, (read_set, write_set) in zip(transactions, rw_sets):
             # Cache in transaction object for future use
             txn._read_set = read_set
             txn._write_set = write_set
         
-        # Analyze all pairs of transactions
-        for i, t1 in enumerate(transactions):
-            for j, t2 in enumerate(transactions):
-                if i >= j:  # Skip self and already processed pairs
-                    continue
-                
-                r1, w1 = rw_sets[t1.id]
-                r2, w2 = rw_sets[t2.id]
-                
-                # Check both directions
-                t1_to_t2 = self._detect_dependency(t1, t2, r1, w1, r2, w2)
-                t2_to_t1 = self._detect_dependency(t2, t1, r2, w2, r1, w1)
-                
-                # Add edges based on dependencies
-                if t1_to_t2 and t2_to_t1:
-                    # Bidirectional dependency - add both edges (creates cycle)
-                    graph.add_edge(t1.id, t2.id)
-                    graph.add_edge(t2.id, t1.id)
-                elif t1_to_t2:
-                    # Only t1 → t2
-                    graph.add_edge(t1.id, t2.id)
-                elif t2_to_t1:
-                    # Only t2 → t1
-                    graph.add_edge(t2.id, t1.id)
+        # Index accounts so only transactions sharing one are compared
+        index = AccountIndex(transactions, rw_sets)
+        graph.account_index = index
+        
+        for i, j in index.conflicting_pairs():
+            t1 = transactions[i]
+            t2 = transactions[j]
+            r1, w1 = rw_sets[i]
+            r2, w2 = rw_sets[j]
+            
+            # Check both directions
+            t1_to_t2 = self._detect_dependency(t1, t2, r1, w1, r2, w2)
+            t2_to_t1 = self._detect_dependency(t2, t1, r2, w2, r1, w1)
+            
+            # Add edges based on dependencies
+            if t1_to_t2 and t2_to_t1:
+                # Bidirectional dependency - add both edges (creates cycle)
+                graph.add_edge(t1.id, t2.id)
+                graph.add_edge(t2.id, t1.id)
+            elif t1_to_t2:
+                # Only t1 → t2
+                graph.add_edge(t1.id, t2.id)
+            elif t2_to_t1:
+                # Only t2 → t1
+                graph.add_edge(t2.id, t1.id)
         
         # Check for cycles
         if graph.has_cycle():
@@ -47,6 +47,10 @@ class DependencyGraph:
         """Initialize an empty dependency graph"""
         self.nodes: Dict[str, TransactionNode] = {}
         self.edges: List[Tuple[str, str]] = []  # (from_id, to_id)
+        self._edge_set: Set[Tuple[str, str]] = set()  # O(1) duplicate check
+        self.account_index: Optional[Any] = None  # AccountIndex set by DependencyAnalyzer
+        self.hot_accounts: Dict[str, int] = {}  # Hot account -> transactions touching it
+        self.split_accounts: Dict[str, List[str]] = {}  # Hot account -> IDs of credit-only transactions
     
     def add_node(self, transaction: Any) -> None:
         """
@@ -71,7 +75,8 @@ class DependencyGraph:
             from_id: ID of the transaction that must execute first
             to_id: ID of the transaction that depends on from_id
         """
-        if (from_id, to_id) not in self.edges:
+        if (from_id, to_id) not in self._edge_set:
+            self._edge_set.add((from_id, to_id))
             self.edges.append((from_id, to_id))
             if from_id in self.nodes:
                 self.nodes[from_id].dependents.add(to_id)
@@ -109,6 +114,10 @@ class DependencyGraph:
             
         Validates: Requirements 1.5, 10.1, 10.2
         """
+        # Without edges there is nothing to traverse
+        if not self.edges:
+            return False
+        
         visited = set()
         rec_stack = set()
         
@@ -0,0 +1,387 @@
+"""
+Aethel Execution Trace - Synchrony Protocol v1.8.0
+
+Compact, columnar execution traces. Instead of one ExecutionEvent object per
+START/READ/WRITE/COMMIT appended to a shared list under a lock, every worker
+thread writes into its own preallocated columns:
+    
+    (seq, timestamp_ns, tx_index, event_code, account_index, old, new, thread_id)
+
+Transaction and account IDs are interned per thread. A global sequence
+number, drawn without a lock, records the real order of events across
+threads, and the columns are merged once, in that order, when the trace is
+read. The merged CompactTrace still behaves as a read-only sequence of
+ExecutionEvent objects (built on access), and the linearizability prover
+reads its columns directly.
+
+Trace modes:
+- "full": every event (default)
+- "sampled": every event of a deterministic sample of transactions
+- "off": nothing is recorded
+
+Sampled and disabled traces are marked incomplete; the prover then decides
+linearizability from the dependency DAG instead of the trace.
+
+Author: Aethel Team
+Version: 1.8.0
+Date: February 4, 2026
+"""
+
+from typing import List, Dict, Optional, Any, Iterator, Sequence
+from array import array
+import itertools
+import threading
+import time
+import zlib
+
+from aethel.core.synchrony import ExecutionEvent, EventType
+
+
+# Trace modes
+TRACE_FULL = "full"
+TRACE_SAMPLED = "sampled"
+TRACE_OFF = "off"
+
+# Event codes stored in the event_code column
+EVENT_CODES: Dict[EventType, int] = {
+    EventType.START: 0,
+    EventType.READ: 1,
+    EventType.WRITE: 2,
+    EventType.COMMIT: 3,
+    EventType.ROLLBACK: 4,
+}
+EVENT_TYPES: List[EventType] = sorted(EVENT_CODES, key=EVENT_CODES.__getitem__)
+
+START = EVENT_CODES[EventType.START]
+READ = EVENT_CODES[EventType.READ]
+WRITE = EVENT_CODES[EventType.WRITE]
+COMMIT = EVENT_CODES[EventType.COMMIT]
+ROLLBACK = EVENT_CODES[EventType.ROLLBACK]
+
+NO_ACCOUNT = -1
+
+
+class _ThreadColumns:
+    """Preallocated columns written by a single thread."""
+    
+    def __init__(self, capacity: int):
+        self.size = 0
+        self.capacity = capacity
+        self.seq = array("q", bytes(8 * capacity))
+        self.timestamp_ns = array("q", bytes(8 * capacity))
+        self.tx_index = array("l", bytes(array("l").itemsize * capacity))
+        self.event_code = array("b", bytes(capacity))
+        self.account_index = array("l", bytes(array("l").itemsize * capacity))
+        self.thread_id = array("l", bytes(array("l").itemsize * capacity))
+        # Balances may be int, float or Decimal, so they stay objects
+        self.old_value: List[Any] = [None] * capacity
+        self.new_value: List[Any] = [None] * capacity
+        self.tx_ids: List[str] = []
+        self.tx_lookup: Dict[str, int] = {}
+        self.account_ids: List[str] = []
+        self.account_lookup: Dict[str, int] = {}
+    
+    def grow(self) -> None:
+        extra = self.capacity
+        self.seq.extend(array("q", bytes(8 * extra)))
+        self.timestamp_ns.extend(array("q", bytes(8 * extra)))
+        self.tx_index.extend(array("l", bytes(self.tx_index.itemsize * extra)))
+        self.event_code.extend(array("b", bytes(extra)))
+        self.account_index.extend(array("l", bytes(self.account_index.itemsize * extra)))
+        self.thread_id.extend(array("l", bytes(self.thread_id.itemsize * extra)))
+        self.old_value.extend([None] * extra)
+        self.new_value.extend([None] * extra)
+        self.capacity += extra
+
+
+class CompactTrace(Sequence):
+    """
+    Merged, read-only execution trace in columnar form.
+    
+    Indexing and iteration build ExecutionEvent objects on demand, so code
+    written against List[ExecutionEvent] keeps working; hot consumers use
+    the columns and the transaction_ids/account_ids tables directly.
+    """
+    
+    def __init__(self,
+                 timestamp_ns: array,
+                 tx_index: array,
+                 event_code: array,
+                 account_index: array,
+                 old_value: List[Any],
+                 new_value: List[Any],
+                 thread_id: array,
+                 transaction_ids: List[str],
+                 account_ids: List[str],
+                 mode: str = TRACE_FULL):
+        self.timestamp_ns = timestamp_ns
+        self.tx_index = tx_index
+        self.event_code = event_code
+        self.account_index = account_index
+        self.old_value = old_value
+        self.new_value = new_value
+        self.thread_id = thread_id
+        self.transaction_ids = transaction_ids
+        self.account_ids = account_ids
+        self.mode = mode
+    
+    @classmethod
+    def empty(cls, mode: str = TRACE_FULL) -> "CompactTrace":
+        return cls(array("q"), array("l"), array("b"), array("l"), [], [], array("l"), [], [], mode)
+    
+    @property
+    def complete(self) -> bool:
+        """True if every event of every transaction was recorded"""
+        return self.mode == TRACE_FULL
+    
+    def __len__(self) -> int:
+        return len(self.event_code)
+    
+    def event(self, i: int) -> ExecutionEvent:
+        """Build the ExecutionEvent at position i"""
+        account = self.account_index[i]
+        return ExecutionEvent(
+            timestamp=self.timestamp_ns[i] / 1e9,
+            transaction_id=self.transaction_ids[self.tx_index[i]],
+            event_type=EVENT_TYPES[self.event_code[i]],
+            account_id=None if account == NO_ACCOUNT else self.account_ids[account],
+            old_value=self.old_value[i],
+            new_value=self.new_value[i],
+            thread_id=self.thread_id[i]
+        )
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self.event(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("trace index out of range")
+        return self.event(i)
+    
+    def __iter__(self) -> Iterator[ExecutionEvent]:
+        for i in range(len(self)):
+            yield self.event(i)
+    
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (CompactTrace, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    def copy(self) -> List[ExecutionEvent]:
+        """Materialize as a list of ExecutionEvent objects"""
+        return list(self)
+    
+    def nbytes(self) -> int:
+        """Approximate size of the columns in bytes"""
+        columns = (self.timestamp_ns, self.tx_index, self.event_code, self.account_index, self.thread_id)
+        return sum(c.itemsize * len(c) for c in columns) + 16 * len(self)
+
+
+class TraceBuffer:
+    """
+    Lock-free (per-thread) recorder that produces a CompactTrace.
+    
+    Each thread gets its own _ThreadColumns the first time it records; the
+    only shared step per event is drawing the next sequence number from an
+    itertools.count, which is atomic in CPython. The count and the table of
+    per-thread columns live as long as the buffer, so a reset allocates
+    nothing.
+    """
+    
+    def __init__(self,
+                 mode: str = TRACE_FULL,
+                 sample_rate: float = 0.01,
+                 capacity_hint: int = 1024):
+        """
+        Initialize trace buffer.
+        
+        Args:
+            mode: "full" (default), "sampled" or "off"
+            sample_rate: Fraction of transactions traced in sampled mode
+            capacity_hint: Initial events preallocated per thread
+        """
+        if mode not in (TRACE_FULL, TRACE_SAMPLED, TRACE_OFF):
+            raise ValueError(f"Unknown trace mode: {mode}")
+        if not 0.0 < sample_rate <= 1.0:
+            raise ValueError("sample_rate must be in (0, 1]")
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self._sample_modulus = max(1, round(1.0 / sample_rate))
+        self.capacity_hint = max(16, capacity_hint)
+        self._threads_lock = threading.Lock()
+        # Thread ident -> that thread's columns; only the owner appends
+        self._threads: Dict[int, _ThreadColumns] = {}
+        # Only orders events, so it keeps counting across resets
+        self._seq = itertools.count()
+        self._merged: Optional[CompactTrace] = None
+    
+    def reset(self, capacity_hint: Optional[int] = None) -> None:
+        """Discard all recorded events"""
+        if capacity_hint is not None:
+            self.capacity_hint = max(16, capacity_hint)
+        self._threads.clear()
+        self._merged = None
+    
+    def traces(self, transaction_id: str) -> bool:
+        """Whether events of this transaction are recorded"""
+        if self.mode == TRACE_FULL:
+            return True
+        if self.mode == TRACE_OFF:
+            return False
+        return zlib.crc32(transaction_id.encode()) % self._sample_modulus == 0
+    
+    def _columns(self) -> _ThreadColumns:
+        ident = threading.get_ident()
+        columns = self._threads.get(ident)
+        if columns is None:
+            columns = _ThreadColumns(self.capacity_hint)
+            with self._threads_lock:
+                self._threads[ident] = columns
+        return columns
+    
+    def record(self,
+               event_type: EventType,
+               transaction_id: str,
+               account_id: Optional[str] = None,
+               old_value: Any = None,
+               new_value: Any = None,
+               thread_id: int = 0,
+               timestamp_ns: Optional[int] = None) -> None:
+        """
+        Append one event to the calling thread's columns.
+        
+        Callers check traces() once per transaction; record() does not
+        sample.
+        """
+        columns = self._columns()
+        if columns.size == columns.capacity:
+            columns.grow()
+        i = columns.size
+        
+        tx_index = columns.tx_lookup.get(transaction_id)
+        if tx_index is None:
+            tx_index = columns.tx_lookup[transaction_id] = len(columns.tx_ids)
+            columns.tx_ids.append(transaction_id)
+        if account_id is None:
+            account_index = NO_ACCOUNT
+        else:
+            account_index = columns.account_lookup.get(account_id)
+            if account_index is None:
+                account_index = columns.account_lookup[account_id] = len(columns.account_ids)
+                columns.account_ids.append(account_id)
+        
+        columns.seq[i] = next(self._seq)
+        columns.timestamp_ns[i] = time.time_ns() if timestamp_ns is None else timestamp_ns
+        columns.tx_index[i] = tx_index
+        columns.event_code[i] = EVENT_CODES[event_type]
+        columns.account_index[i] = account_index
+        columns.old_value[i] = old_value
+        columns.new_value[i] = new_value
+        columns.thread_id[i] = thread_id
+        columns.size = i + 1
+    
+    def record_event(self, event: ExecutionEvent) -> None:
+        """Append an ExecutionEvent (compatibility path)"""
+        self.record(
+            event.event_type,
+            event.transaction_id,
+            event.account_id,
+            event.old_value,
+            event.new_value,
+            event.thread_id,
+            int(event.timestamp * 1e9)
+        )
+    
+    def merge(self) -> CompactTrace:
+        """
+        Merge all threads' columns into one CompactTrace in real order.
+        
+        Call once recording has finished. The per-thread columns are
+        consumed, so their preallocated slack is released; events recorded
+        afterwards are appended to the cached result by the next merge().
+        """
+        with self._threads_lock:
+            if self._merged is not None and not self._threads:
+                return self._merged
+            threads = list(self._threads.values())
+            self._threads.clear()
+        base = self._merged or CompactTrace.empty(self.mode)
+        
+        # Concatenate the threads' columns, remapping their interned IDs
+        tx_lookup = {tx_id: i for i, tx_id in enumerate(base.transaction_ids)}
+        account_lookup = {account_id: i for i, account_id in enumerate(base.account_ids)}
+        seq, timestamp_ns, tx_index = array("q"), array("q"), array("l")
+        event_code, account_index, thread_id = array("b"), array("l"), array("l")
+        old_value: List[Any] = []
+        new_value: List[Any] = []
+        sources = len(threads)
+        while threads:
+            # Drop each thread's columns as soon as they are copied
+            columns = threads.pop()
+            size = columns.size
+            tx_map = [tx_lookup.setdefault(tx_id, len(tx_lookup)) for tx_id in columns.tx_ids]
+            account_map = [account_lookup.setdefault(a, len(account_lookup)) for a in columns.account_ids]
+            # NO_ACCOUNT (-1) indexes this trailing entry and maps to itself
+            account_map.append(NO_ACCOUNT)
+            seq.extend(columns.seq[:size])
+            timestamp_ns.extend(columns.timestamp_ns[:size])
+            tx_index.extend(map(tx_map.__getitem__, columns.tx_index[:size]))
+            event_code.extend(columns.event_code[:size])
+            account_index.extend(map(account_map.__getitem__, columns.account_index[:size]))
+            thread_id.extend(columns.thread_id[:size])
+            old_value.extend(columns.old_value[:size])
+            new_value.extend(columns.new_value[:size])
+        
+        # Each thread's run is already in sequence order; timsort merges runs
+        if sources > 1:
+            order = sorted(range(len(seq)), key=seq.__getitem__)
+            del seq
+            timestamp_ns = array("q", map(timestamp_ns.__getitem__, order))
+            tx_index = array("l", map(tx_index.__getitem__, order))
+            event_code = array("b", map(event_code.__getitem__, order))
+            account_index = array("l", map(account_index.__getitem__, order))
+            old_value = list(map(old_value.__getitem__, order))
+            new_value = list(map(new_value.__getitem__, order))
+            thread_id = array("l", map(thread_id.__getitem__, order))
+        
+        if len(base):
+            timestamp_ns = base.timestamp_ns + timestamp_ns
+            tx_index = base.tx_index + tx_index
+            event_code = base.event_code + event_code
+            account_index = base.account_index + account_index
+            old_value = base.old_value + old_value
+            new_value = base.new_value + new_value
+            thread_id = base.thread_id + thread_id
+        
+        merged = CompactTrace(
+            timestamp_ns,
+            tx_index,
+            event_code,
+            account_index,
+            old_value,
+            new_value,
+            thread_id,
+            list(tx_lookup),
+            list(account_lookup),
+            self.mode
+        )
+        
+        self._merged = merged
+        return merged
+
+
+# ============================================================================
+# MODULE INFO
+# ============================================================================
+
+__version__ = "1.8.0"
+__author__ = "Aethel Team"
+__all__ = [
+    "TraceBuffer",
+    "CompactTrace",
+    "TRACE_FULL",
+    "TRACE_SAMPLED",
+    "TRACE_OFF",
+    "EVENT_CODES",
+]
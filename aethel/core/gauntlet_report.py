@@ -26,6 +26,8 @@ from typing import List, Optional, Dict, Any
 from pathlib import Path
 from enum import Enum
 
+from aethel.core.sqlite_store import get_sqlite_store
+
 
 class AttackCategory(Enum):
     """Attack categories for classification"""
@@ -86,13 +88,15 @@ class GauntletReport:
             db_path: Path to SQLite database
         """
         self.db_path = db_path
+        self._db = get_sqlite_store(db_path)
         self._init_database()
     
     def _init_database(self) -> None:
         """Initialize SQLite database schema"""
-        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-        
-        conn = sqlite3.connect(self.db_path)
+        self._db.ensure_schema("gauntlet_report", self._create_tables)
+    
+    def _create_tables(self, conn: sqlite3.Connection) -> None:
+        """Create attack record table and indexes"""
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -114,9 +118,6 @@ class GauntletReport:
             CREATE INDEX IF NOT EXISTS idx_timestamp 
             ON attack_records(timestamp)
         """)
-        
-        conn.commit()
-        conn.close()
     
     def log_attack(self, record: AttackRecord) -> None:
         """
@@ -128,27 +129,24 @@ class GauntletReport:
         Validates: Requirements 7.1, 7.2, 7.3, 7.4
         Property 39: Complete attack record
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT INTO attack_records 
-            (timestamp, attack_type, category, code_snippet, detection_method, 
-             severity, blocked_by_layer, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            record.timestamp,
-            record.attack_type,
-            record.category,
-            record.code_snippet,
-            record.detection_method,
-            record.severity,
-            record.blocked_by_layer,
-            json.dumps(record.metadata)
-        ))
-        
-        conn.commit()
-        conn.close()
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute("""
+                INSERT INTO attack_records 
+                (timestamp, attack_type, category, code_snippet, detection_method, 
+                 severity, blocked_by_layer, metadata)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                record.timestamp,
+                record.attack_type,
+                record.category,
+                record.code_snippet,
+                record.detection_method,
+                record.severity,
+                record.blocked_by_layer,
+                json.dumps(record.metadata)
+            ))
     
     def categorize_attack(self, attack_type: str) -> AttackCategory:
         """
@@ -191,7 +189,7 @@ class GauntletReport:
         Validates: Requirements 7.6
         Property 41: Time-based aggregation
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connection()
         cursor = conn.cursor()
         
         # Build query with optional time filter
@@ -236,7 +234,6 @@ class GauntletReport:
         if stats["total_attacks"] > 0:
             stats["average_severity"] = total_severity / stats["total_attacks"]
         
-        conn.close()
         return stats
     
     def export_json(self, output_path: str, time_window: Optional[float] = None) -> None:
@@ -250,7 +247,7 @@ class GauntletReport:
         Validates: Requirements 7.7
         Property 42: Multi-format export
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connection()
         cursor = conn.cursor()
         
         if time_window:
@@ -291,8 +288,6 @@ class GauntletReport:
                 "total_records": len(records),
                 "records": records
             }, f, indent=2)
-        
-        conn.close()
     
     def export_pdf(self, output_path: str, time_window: Optional[float] = None) -> None:
         """
@@ -349,22 +344,19 @@ class GauntletReport:
         """
         cutoff_time = time.time() - (retention_days * 24 * 60 * 60)
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Count records to delete
-        cursor.execute("""
-            SELECT COUNT(*) FROM attack_records WHERE timestamp < ?
-        """, (cutoff_time,))
-        count = cursor.fetchone()[0]
-        
-        # Delete old records
-        cursor.execute("""
-            DELETE FROM attack_records WHERE timestamp < ?
-        """, (cutoff_time,))
-        
-        conn.commit()
-        conn.close()
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            
+            # Count records to delete
+            cursor.execute("""
+                SELECT COUNT(*) FROM attack_records WHERE timestamp < ?
+            """, (cutoff_time,))
+            count = cursor.fetchone()[0]
+            
+            # Delete old records
+            cursor.execute("""
+                DELETE FROM attack_records WHERE timestamp < ?
+            """, (cutoff_time,))
         
         return count
     
@@ -378,7 +370,7 @@ class GauntletReport:
         Returns:
             List of attack records
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connection()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -402,5 +394,4 @@ class GauntletReport:
                 metadata=json.loads(row[7])
             ))
         
-        conn.close()
         return records
@@ -0,0 +1,146 @@
+"""
+Aethel Intent Access Analysis - Synchrony Protocol v1.8.0
+
+Static read/write-set extraction for intent definitions, so transactions
+built from an atomic_batch carry precise account sets instead of none.
+
+State follows the language's pre-state convention: `old_x` is the value of
+`x` before the intent runs (the guard usually snapshots it with
+`old_x == x`). Names that are not intent parameters are state accounts,
+and `old_x` refers to account `x`.
+
+- Read set: every state account referenced in guard or verify
+- Write set: accounts a verify condition defines or changes:
+    x == <expr>             (unless <expr> is exactly old_x)
+    x <op> <expr with old_x> (e.g. balance < old_balance)
+  A frame condition `x == old_x` alone leaves x read-only.
+
+The analysis only depends on the intent's parameters and conditions, so
+results are cached per intent definition and reused across repeated
+batch submissions of the same program.
+
+Author: Aethel Team
+Version: 1.8.0
+Date: February 4, 2026
+"""
+
+from typing import Any, Dict, FrozenSet, List, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+import re
+
+
+OLD_PREFIX = "old_"
+
+_NAME = re.compile(r"\b[A-Za-z_][A-Za-z0-9_]*\b")
+
+# (left, operator, right)
+Condition = Tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class StateWrite:
+    """Write operation on one state account, as read by the DependencyAnalyzer"""
+    account_id: str
+    expression: str  # Verify condition that defines the new value
+
+
+@dataclass(frozen=True)
+class IntentAccess:
+    """Accounts an intent reads and writes"""
+    reads: FrozenSet[str]
+    writes: Tuple[StateWrite, ...]
+
+    @property
+    def write_set(self) -> FrozenSet[str]:
+        return frozenset(write.account_id for write in self.writes)
+
+    @property
+    def accounts(self) -> List[str]:
+        """All accounts touched, sorted"""
+        return sorted(self.reads | self.write_set)
+
+
+def _conditions(block: List[Dict[str, Any]]) -> Tuple[Condition, ...]:
+    return tuple(
+        (condition["left"], condition["operator"], condition["right"])
+        for condition in block
+    )
+
+
+def extract_intent_access(intent_data: Dict[str, Any]) -> IntentAccess:
+    """
+    Read/write sets of an intent definition.
+
+    Args:
+        intent_data: Intent dict from AethelParser (params, constraints,
+            post_conditions)
+
+    Returns:
+        IntentAccess (cached per definition)
+    """
+    return _analyze(
+        tuple(param["name"] for param in intent_data.get("params", [])),
+        _conditions(intent_data.get("constraints", [])),
+        _conditions(intent_data.get("post_conditions", []))
+    )
+
+
+@lru_cache(maxsize=1024)
+def _analyze(params: Tuple[str, ...],
+             guard: Tuple[Condition, ...],
+             verify: Tuple[Condition, ...]) -> IntentAccess:
+    inputs = set(params)
+
+    def state_names(expression: str) -> List[str]:
+        return [name for name in _NAME.findall(expression) if name not in inputs]
+
+    def account(name: str) -> str:
+        if name.startswith(OLD_PREFIX) and len(name) > len(OLD_PREFIX):
+            return name[len(OLD_PREFIX):]
+        return name
+
+    reads = {
+        account(name)
+        for left, _, right in guard + verify
+        for name in state_names(left) + state_names(right)
+    }
+
+    writes: Dict[str, str] = {}
+    for left, operator, right in verify:
+        expression = f"{left} {operator} {right}"
+        for side, other in ((left, right), (right, left)):
+            target = side.strip()
+            if not _NAME.fullmatch(target) or target in inputs or target.startswith(OLD_PREFIX):
+                continue
+            pre_state = OLD_PREFIX + target
+            if operator == "==":
+                if other.strip() != pre_state:
+                    writes.setdefault(target, expression)
+            elif pre_state in state_names(other):
+                writes.setdefault(target, expression)
+
+    return IntentAccess(
+        reads=frozenset(reads),
+        writes=tuple(StateWrite(account_id, writes[account_id]) for account_id in sorted(writes))
+    )
+
+
+def intent_access_cache_info():
+    """Hit/miss statistics of the per-definition cache"""
+    return _analyze.cache_info()
+
+
+# ============================================================================
+# MODULE INFO
+# ============================================================================
+
+__version__ = "1.8.0"
+__author__ = "Aethel Team"
+__all__ = [
+    "IntentAccess",
+    "StateWrite",
+    "extract_intent_access",
+    "intent_access_cache_info",
+    "OLD_PREFIX",
+]
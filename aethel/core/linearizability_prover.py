@@ -1,8 +1,10 @@
 """
 Aethel Linearizability Prover - Synchrony Protocol v1.8.0
 
-Uses Z3 SMT solver to prove that parallel transaction execution is equivalent
-to some valid serial execution order. Generates formal proofs or counterexamples.
+Proves that parallel transaction execution is equivalent to some valid serial
+execution order. The common case is decided on a precedence graph built from the
+trace and the dependency DAG; the Z3 SMT solver is only used for ambiguous traces.
+Generates formal proofs or counterexamples.
 
 Philosophy: "If parallel execution is linearizable, there exists a serial order
             that produces identical results."
@@ -13,6 +15,7 @@ Date: February 4, 2026
 """
 
 from typing import List, Dict, Set, Optional, Tuple, Any
+import heapq
 import time
 import z3
 
@@ -24,6 +27,13 @@ from aethel.core.synchrony import (
     EventType,
     LinearizabilityError
 )
+from aethel.core.execution_trace import CompactTrace, START, READ, WRITE, COMMIT, NO_ACCOUNT
+
+
+# Verdicts of the precedence-graph check
+GRAPH_LINEARIZABLE = "linearizable"
+GRAPH_VIOLATION = "violation"
+GRAPH_AMBIGUOUS = "ambiguous"
 
 
 class LinearizabilityProver:
@@ -37,7 +47,15 @@ class LinearizabilityProver:
     - Proof: Z3 model showing equivalent serial order exists
     - Counterexample: Z3 unsat core showing no serial order exists
     
-    Algorithm:
+    Algorithm (common case, O((n + events + edges) log n)):
+    1. Build a precedence graph: real-time order from the trace plus the
+       edges of the dependency DAG
+    2. If conflicting accesses never overlap in time, the graph is exact:
+       acyclic → serial order by topological sort (proof);
+       cyclic → counterexample
+    
+    Fallback (ambiguous traces: missing events or overlapping conflicting
+    accesses):
     1. Encode parallel execution as SMT constraints
     2. Encode all possible serial executions as SMT constraints
     3. Ask Z3: ∃ serial_order such that parallel_result = serial_result
@@ -57,6 +75,7 @@ class LinearizabilityProver:
         """
         self.timeout_seconds = timeout_seconds
         self.solver = z3.Solver()
+        self.last_method: Optional[str] = None  # "precedence_graph" or "z3"
         
         # Configure Z3 for QF_LIA (quantifier-free linear integer arithmetic)
         self.solver.set("timeout", timeout_seconds * 1000)  # Z3 uses milliseconds
@@ -149,7 +168,7 @@ class LinearizabilityProver:
                     tx1_after = tx_vars[tx1.id].get(f"state_after_{account_id}")
                     tx2_before = tx_vars[tx2.id].get(f"state_before_{account_id}")
                     
-                    if tx1_after and tx2_before:
+                    if tx1_after is not None and tx2_before is not None:
                         # Conditional constraint: if T1 → T2, then states match
                         constraints.append(
                             z3.Implies(
@@ -177,6 +196,201 @@ class LinearizabilityProver:
         
         return constraints
     
+    def check_precedence_graph(self,
+                               execution_result: ExecutionResult,
+                               transactions: List[Transaction],
+                               dependency_graph: Optional[Any] = None) -> Tuple[str, Any]:
+        """
+        Decide linearizability on a precedence graph, without Z3.
+        
+        Real-time order (T1 commits before T2 starts) is an interval order,
+        so instead of one edge per ordered pair it is encoded through a
+        chain of time points, one per START/COMMIT event in timestamp order:
+        point(start T) → T → point(commit T). A path T1 ⇝ T2 through the
+        chain exists exactly when T1 committed before T2 started. Edges of
+        the dependency DAG are added on top.
+        
+        Conflicting accesses (two transactions touching an account that one
+        of them writes) that do not overlap in time are already ordered by
+        the real-time edges. If they overlap, the trace does not say which
+        serial order they took and the check reports it as ambiguous.
+        
+        A CompactTrace is read column by column without building event
+        objects. A sampled or disabled CompactTrace says nothing about the
+        transactions it skipped, so with a dependency graph the order is
+        decided on the DAG alone - the executor only releases a transaction
+        after its dependencies - and without one the trace is ambiguous.
+        
+        Args:
+            execution_result: Result from parallel execution
+            transactions: Original transactions
+            dependency_graph: Optional DependencyGraph whose edges the serial
+                order must respect
+        
+        Returns:
+            (GRAPH_LINEARIZABLE, serial_order),
+            (GRAPH_VIOLATION, unordered transaction IDs) or
+            (GRAPH_AMBIGUOUS, reason)
+        """
+        tx_ids = [tx.id for tx in transactions]
+        position = {tx_id: i for i, tx_id in enumerate(tx_ids)}
+        trace = execution_result.execution_trace
+        
+        if isinstance(trace, CompactTrace):
+            if not trace.complete:
+                if dependency_graph is None:
+                    return GRAPH_AMBIGUOUS, f"{trace.mode} trace without dependency graph"
+                return self._order_dependency_graph(tx_ids, position, dependency_graph)
+            boundaries, accesses = self._scan_compact_trace(trace, position)
+        else:
+            boundaries, accesses = self._scan_event_trace(trace, position)
+        
+        start_point: Dict[str, int] = {}
+        commit_point: Dict[str, int] = {}
+        for point, (tx_id, is_start) in enumerate(boundaries):
+            if is_start:
+                start_point.setdefault(tx_id, point)
+            else:
+                commit_point[tx_id] = point
+        
+        for tx_id in tx_ids:
+            if tx_id not in start_point or tx_id not in commit_point:
+                return GRAPH_AMBIGUOUS, f"missing START or COMMIT for {tx_id}"
+            if commit_point[tx_id] < start_point[tx_id]:
+                return GRAPH_AMBIGUOUS, f"COMMIT before START for {tx_id}"
+        
+        # Overlapping conflicting accesses make the order ambiguous
+        for account_id, accessors in accesses.items():
+            if len(accessors) < 2 or not any(accessors.values()):
+                continue
+            latest_commit = -1
+            latest_writer_commit = -1
+            for tx_id in sorted(accessors, key=start_point.__getitem__):
+                start = start_point[tx_id]
+                overlaps = latest_commit > start if accessors[tx_id] else latest_writer_commit > start
+                if overlaps:
+                    return GRAPH_AMBIGUOUS, f"overlapping conflicting accesses to {account_id}"
+                latest_commit = max(latest_commit, commit_point[tx_id])
+                if accessors[tx_id]:
+                    latest_writer_commit = max(latest_writer_commit, commit_point[tx_id])
+        
+        # Precedence graph: transactions are 0..n-1, time points follow
+        n = len(tx_ids)
+        node_count = n + len(boundaries)
+        successors: List[List[int]] = [[] for _ in range(node_count)]
+        for point in range(len(boundaries) - 1):
+            successors[n + point].append(n + point + 1)
+        for tx_id, i in position.items():
+            successors[n + start_point[tx_id]].append(i)
+            successors[i].append(n + commit_point[tx_id])
+        if dependency_graph is not None:
+            for from_id, to_id in dependency_graph.edges:
+                if from_id in position and to_id in position:
+                    successors[position[from_id]].append(position[to_id])
+        
+        # Kahn's algorithm; among ready transactions prefer earlier starts
+        in_degree = [0] * node_count
+        for targets in successors:
+            for target in targets:
+                in_degree[target] += 1
+        ready = [
+            (start_point[tx_ids[node]] if node < n else node - n, node)
+            for node in range(node_count) if in_degree[node] == 0
+        ]
+        heapq.heapify(ready)
+        serial_order: List[str] = []
+        visited = 0
+        while ready:
+            _, node = heapq.heappop(ready)
+            visited += 1
+            if node < n:
+                serial_order.append(tx_ids[node])
+            for target in successors[node]:
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    key = start_point[tx_ids[target]] if target < n else target - n
+                    heapq.heappush(ready, (key, target))
+        
+        if visited < node_count:
+            unordered = sorted(set(tx_ids) - set(serial_order), key=position.__getitem__)
+            return GRAPH_VIOLATION, unordered
+        return GRAPH_LINEARIZABLE, serial_order
+    
+    def _scan_event_trace(self,
+                          trace: List[ExecutionEvent],
+                          position: Dict[str, int]) -> Tuple[List[Tuple[str, bool]], Dict[str, Dict[str, bool]]]:
+        """
+        Boundaries and accesses of a list of ExecutionEvent objects.
+        
+        Returns:
+            ([(tx_id, is_start)] in time order (trace position breaks ties),
+             account_id -> {tx_id: wrote})
+        """
+        boundaries = []
+        accesses: Dict[str, Dict[str, bool]] = {}
+        for index, event in enumerate(trace):
+            if event.transaction_id not in position:
+                continue
+            if event.event_type in (EventType.START, EventType.COMMIT):
+                boundaries.append((event.timestamp, index, event.transaction_id, event.event_type == EventType.START))
+            elif event.event_type in (EventType.READ, EventType.WRITE) and event.account_id is not None:
+                writers = accesses.setdefault(event.account_id, {})
+                is_write = event.event_type == EventType.WRITE
+                writers[event.transaction_id] = writers.get(event.transaction_id, False) or is_write
+        boundaries.sort(key=lambda item: (item[0], item[1]))
+        return [(tx_id, is_start) for _, _, tx_id, is_start in boundaries], accesses
+    
+    def _scan_compact_trace(self,
+                            trace: CompactTrace,
+                            position: Dict[str, int]) -> Tuple[List[Tuple[str, bool]], Dict[str, Dict[str, bool]]]:
+        """
+        Boundaries and accesses of a CompactTrace, read from its columns.
+        
+        The columns are already in real order, so no sort is needed.
+        """
+        tx_names = [tx_id if tx_id in position else None for tx_id in trace.transaction_ids]
+        account_names = trace.account_ids
+        boundaries: List[Tuple[str, bool]] = []
+        by_account: Dict[int, Dict[str, bool]] = {}
+        for code, tx_index, account in zip(trace.event_code, trace.tx_index, trace.account_index):
+            tx_id = tx_names[tx_index]
+            if tx_id is None:
+                continue
+            if code == START or code == COMMIT:
+                boundaries.append((tx_id, code == START))
+            elif (code == READ or code == WRITE) and account != NO_ACCOUNT:
+                writers = by_account.setdefault(account, {})
+                writers[tx_id] = writers.get(tx_id, False) or code == WRITE
+        accesses = {account_names[account]: writers for account, writers in by_account.items()}
+        return boundaries, accesses
+    
+    def _order_dependency_graph(self,
+                                tx_ids: List[str],
+                                position: Dict[str, int],
+                                dependency_graph: Any) -> Tuple[str, Any]:
+        """Topologically order the transactions on the dependency DAG alone"""
+        n = len(tx_ids)
+        successors: List[List[int]] = [[] for _ in range(n)]
+        in_degree = [0] * n
+        for from_id, to_id in dependency_graph.edges:
+            if from_id in position and to_id in position:
+                successors[position[from_id]].append(position[to_id])
+                in_degree[position[to_id]] += 1
+        ready = [node for node in range(n) if in_degree[node] == 0]
+        heapq.heapify(ready)
+        serial_order: List[str] = []
+        while ready:
+            node = heapq.heappop(ready)
+            serial_order.append(tx_ids[node])
+            for target in successors[node]:
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    heapq.heappush(ready, target)
+        if len(serial_order) < n:
+            unordered = sorted(set(tx_ids) - set(serial_order), key=position.__getitem__)
+            return GRAPH_VIOLATION, unordered
+        return GRAPH_LINEARIZABLE, serial_order
+    
     def find_serial_order(self,
                          transactions: List[Transaction],
                          execution_result: ExecutionResult) -> Optional[List[str]]:
@@ -241,17 +455,22 @@ class LinearizabilityProver:
     
     def prove_linearizability(self,
                              execution_result: ExecutionResult,
-                             transactions: List[Transaction]) -> ProofResult:
+                             transactions: List[Transaction],
+                             dependency_graph: Optional[Any] = None) -> ProofResult:
         """
         Prove that parallel execution is linearizable.
         
+        Tries the precedence-graph check first and only encodes the
+        execution for Z3 when the trace is ambiguous.
+        
         Generates either:
-        - A proof (serial order + Z3 model) if linearizable
-        - A counterexample (Z3 unsat core) if not linearizable
+        - A proof (serial order) if linearizable
+        - A counterexample if not linearizable
         
         Args:
             execution_result: Result from parallel execution
             transactions: Original transactions
+            dependency_graph: Optional dependency DAG the order must respect
             
         Returns:
             ProofResult containing proof or counterexample
@@ -265,8 +484,39 @@ class LinearizabilityProver:
         start_time = time.time()
         
         try:
-            # Find equivalent serial order
-            serial_order = self.find_serial_order(transactions, execution_result)
+            verdict, detail = self.check_precedence_graph(
+                execution_result,
+                transactions,
+                dependency_graph
+            )
+            
+            if verdict == GRAPH_VIOLATION:
+                self.last_method = "precedence_graph"
+                counterexample = self._generate_counterexample(
+                    execution_result,
+                    transactions
+                )
+                counterexample["violation_type"] = "precedence_cycle"
+                counterexample["unordered_transactions"] = detail
+                counterexample["hint"] = (
+                    "Trace order contradicts the dependency DAG; "
+                    "system will fall back to serial execution"
+                )
+                return ProofResult(
+                    is_linearizable=False,
+                    serial_order=None,
+                    proof=None,
+                    counterexample=counterexample,
+                    proof_time=time.time() - start_time
+                )
+            
+            if verdict == GRAPH_LINEARIZABLE:
+                self.last_method = "precedence_graph"
+                serial_order = detail
+            else:
+                # Ambiguous trace - find equivalent serial order with Z3
+                self.last_method = "z3"
+                serial_order = self.find_serial_order(transactions, execution_result)
             
             if serial_order is not None:
                 # Linearizability proven!
@@ -343,8 +593,9 @@ class LinearizabilityProver:
             ""
         ]
         
+        tx_map = {t.id: t for t in transactions}
         for i, tx_id in enumerate(serial_order, 1):
-            tx = next((t for t in transactions if t.id == tx_id), None)
+            tx = tx_map.get(tx_id)
             if tx:
                 proof_lines.append(f"{i}. {tx_id} ({tx.intent_name})")
         
@@ -355,6 +606,7 @@ class LinearizabilityProver:
             f"- Parallel groups: {len(execution_result.parallel_groups)}",
             f"- Execution time: {execution_result.execution_time:.3f}s",
             f"- Thread count: {execution_result.thread_count}",
+            f"- Method: {self.last_method or 'z3'}",
             "",
             "All dependency constraints satisfied ✓",
             "All state consistency constraints satisfied ✓",
@@ -489,4 +741,7 @@ __version__ = "1.8.0"
 __author__ = "Aethel Team"
 __all__ = [
     "LinearizabilityProver",
+    "GRAPH_LINEARIZABLE",
+    "GRAPH_VIOLATION",
+    "GRAPH_AMBIGUOUS",
 ]
@@ -32,6 +32,7 @@ from pathlib import Path
 from enum import Enum
 
 from aethel.core.persistence import AethelPersistenceLayer
+from aethel.core.sqlite_store import get_sqlite_store
 
 
 class MemoryType(Enum):
@@ -146,12 +147,16 @@ class CognitiveMemorySystem:
         # Persistence layer for Merkle sealing
         self.persistence = persistence_layer or AethelPersistenceLayer()
         
-        # Initialize database
+        # Initialize database (shared WAL-mode connections)
+        self._db = get_sqlite_store(self.db_path)
         self._init_database()
     
     def _init_database(self) -> None:
         """Initialize SQLite database schema for cognitive memory"""
-        conn = sqlite3.connect(str(self.db_path))
+        self._db.ensure_schema("cognitive_memory", self._create_tables)
+    
+    def _create_tables(self, conn: sqlite3.Connection) -> None:
+        """Create memory tables and indexes"""
         cursor = conn.cursor()
         
         # Main memories table
@@ -200,9 +205,6 @@ class CognitiveMemorySystem:
             CREATE INDEX IF NOT EXISTS idx_tag 
             ON memory_tags(tag)
         """)
-        
-        conn.commit()
-        conn.close()
     
     def store_memory(self, memory_type: MemoryType, content: Dict[str, Any],
                     tags: List[str] = None, source: str = "ai",
@@ -260,35 +262,31 @@ class CognitiveMemorySystem:
                 print(f"[MEMORY] Warning: Failed to seal memory with Merkle root: {e}")
         
         # Store in database
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT OR REPLACE INTO cognitive_memories 
-            (memory_id, timestamp, memory_type, content, tags, merkle_root, 
-             confidence, source, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            memory.memory_id,
-            memory.timestamp,
-            memory.memory_type.value,
-            json.dumps(memory.content),
-            json.dumps(memory.tags),
-            memory.merkle_root,
-            memory.confidence,
-            memory.source,
-            json.dumps(memory.metadata)
-        ))
-        
-        # Store tags in separate table for efficient search
-        for tag in memory.tags:
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            
             cursor.execute("""
+                INSERT OR REPLACE INTO cognitive_memories 
+                (memory_id, timestamp, memory_type, content, tags, merkle_root, 
+                 confidence, source, metadata)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                memory.memory_id,
+                memory.timestamp,
+                memory.memory_type.value,
+                json.dumps(memory.content),
+                json.dumps(memory.tags),
+                memory.merkle_root,
+                memory.confidence,
+                memory.source,
+                json.dumps(memory.metadata)
+            ))
+            
+            # Store tags in separate table for efficient search
+            cursor.executemany("""
                 INSERT OR IGNORE INTO memory_tags (memory_id, tag)
                 VALUES (?, ?)
-            """, (memory.memory_id, tag))
-        
-        conn.commit()
-        conn.close()
+            """, [(memory.memory_id, tag) for tag in memory.tags])
         
         print(f"[MEMORY] Stored {memory_type.value} memory: {memory_id[:16]}...")
         
@@ -314,7 +312,7 @@ class CognitiveMemorySystem:
         Returns:
             List of CognitiveMemory objects matching the filters
         """
-        conn = sqlite3.connect(str(self.db_path))
+        conn = self._db.connection()
         cursor = conn.cursor()
         
         # Build query dynamically based on filters
@@ -353,7 +351,6 @@ class CognitiveMemorySystem:
         
         cursor.execute(query, params)
         rows = cursor.fetchall()
-        conn.close()
         
         # Convert rows to CognitiveMemory objects
         memories = []
@@ -481,7 +478,7 @@ class CognitiveMemorySystem:
         Returns:
             Dictionary with memory counts by type, source, etc.
         """
-        conn = sqlite3.connect(str(self.db_path))
+        conn = self._db.connection()
         cursor = conn.cursor()
         
         # Total memories
@@ -514,8 +511,6 @@ class CognitiveMemorySystem:
         """)
         top_tags = dict(cursor.fetchall())
         
-        conn.close()
-        
         return {
             'total_memories': total_memories,
             'by_type': by_type,
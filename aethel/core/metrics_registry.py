@@ -0,0 +1,378 @@
+"""
+Metrics Registry - In-Process Prometheus Metrics
+v2.1.0
+
+Counters, gauges and fixed-bucket histograms kept in memory and rendered
+in the Prometheus text exposition format. Components update metrics on
+the hot path; a scrape only walks the registered metrics, so rendering is
+O(metrics) and never touches a database or a history list.
+
+Design:
+1. Striped updates: every counter and histogram child keeps one cell per
+   stripe and each thread writes to its own stripe, so concurrent
+   observers rarely contend on the same lock. Reads sum the stripes.
+2. Fixed buckets: histograms count observations per bucket and keep a
+   running sum; quantile() estimates p50/p95/p99 from the buckets the
+   same way Prometheus' histogram_quantile() does.
+3. Labels: metrics declare label names up front; labels(...) returns a
+   cached child per label-value tuple.
+
+Components take an optional registry argument. Passing the same registry
+to several components (or using get_registry()) exposes them all on one
+endpoint.
+"""
+
+import bisect
+import itertools
+import math
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Seconds; covers sub-millisecond cache hits up to multi-second rounds
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+STRIPES = 8
+
+_stripe_counter = itertools.count()
+_thread_stripe = threading.local()
+
+
+def _stripe() -> int:
+    """Stripe index owned by the calling thread."""
+    try:
+        return _thread_stripe.index
+    except AttributeError:
+        _thread_stripe.index = next(_stripe_counter) % STRIPES
+        return _thread_stripe.index
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _CounterChild:
+    """One label combination of a counter."""
+    
+    def __init__(self):
+        self._values = [0.0] * STRIPES
+        self._locks = [threading.Lock() for _ in range(STRIPES)]
+    
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("counters can only increase")
+        stripe = _stripe()
+        with self._locks[stripe]:
+            self._values[stripe] += amount
+    
+    def get(self) -> float:
+        return sum(self._values)
+
+
+class _GaugeChild:
+    """One label combination of a gauge."""
+    
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+    
+    def set(self, value: float) -> None:
+        self._value = float(value)
+    
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+    
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+    
+    def get(self) -> float:
+        return self._value
+
+
+class _HistogramChild:
+    """One label combination of a histogram."""
+    
+    def __init__(self, bounds: Tuple[float, ...]):
+        self._bounds = bounds
+        # Per stripe: bucket counts (last slot is +Inf) and the running sum
+        self._counts = [[0] * (len(bounds) + 1) for _ in range(STRIPES)]
+        self._sums = [0.0] * STRIPES
+        self._locks = [threading.Lock() for _ in range(STRIPES)]
+    
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self._bounds, value)
+        stripe = _stripe()
+        with self._locks[stripe]:
+            self._counts[stripe][index] += 1
+            self._sums[stripe] += value
+    
+    def snapshot(self) -> Tuple[List[int], float]:
+        """Per-bucket (non-cumulative) counts and the sum across stripes."""
+        counts = [sum(column) for column in zip(*self._counts)]
+        return counts, sum(self._sums)
+    
+    def count(self) -> int:
+        return sum(sum(counts) for counts in self._counts)
+    
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the q-quantile (0 < q < 1) from bucket counts.
+        
+        Interpolates linearly inside the bucket holding the target rank.
+        Ranks in the +Inf bucket report the largest finite bound.
+        """
+        counts, _ = self.snapshot()
+        total = sum(counts)
+        if total == 0:
+            return 0.0
+        
+        rank = q * total
+        cumulative = 0
+        for index, count in enumerate(counts):
+            if cumulative + count >= rank and count > 0:
+                if index == len(self._bounds):
+                    return self._bounds[-1]
+                lower = self._bounds[index - 1] if index > 0 else 0.0
+                upper = self._bounds[index]
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self._bounds[-1]
+
+
+class _Metric:
+    """Base class: name, help text, label names and children."""
+    
+    kind = ""
+    
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._children[()] = self._new_child()
+    
+    def _new_child(self):
+        raise NotImplementedError
+    
+    def labels(self, *values: str, **kwargs: str):
+        """Child for one combination of label values."""
+        if kwargs:
+            values = tuple(str(kwargs[name]) for name in self.labelnames)
+        else:
+            values = tuple(str(value) for value in values)
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+    
+    def _unlabelled(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} has labels {self.labelnames}; use labels()")
+        return self._children[()]
+    
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+    
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(self._samples())
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+    
+    kind = "counter"
+    
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+    
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabelled().inc(amount)
+    
+    def get(self) -> float:
+        return self._unlabelled().get()
+    
+    def _samples(self) -> List[str]:
+        return [
+            f"{self.name}{_label_text(self.labelnames, values)} {_format_value(child.get())}"
+            for values, child in list(self._children.items())
+        ]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+    
+    kind = "gauge"
+    
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+    
+    def set(self, value: float) -> None:
+        self._unlabelled().set(value)
+    
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabelled().inc(amount)
+    
+    def dec(self, amount: float = 1.0) -> None:
+        self._unlabelled().dec(amount)
+    
+    def get(self) -> float:
+        return self._unlabelled().get()
+    
+    def _samples(self) -> List[str]:
+        return [
+            f"{self.name}{_label_text(self.labelnames, values)} {_format_value(child.get())}"
+            for values, child in list(self._children.items())
+        ]
+
+
+class Histogram(_Metric):
+    """Distribution over fixed buckets with sum and count."""
+    
+    kind = "histogram"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        bounds = tuple(sorted(float(b) for b in buckets if b != math.inf))
+        if not bounds:
+            raise ValueError("histogram needs at least one finite bucket")
+        self.buckets = bounds
+        super().__init__(name, documentation, labelnames)
+    
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+    
+    def observe(self, value: float) -> None:
+        self._unlabelled().observe(value)
+    
+    def quantile(self, q: float) -> float:
+        return self._unlabelled().quantile(q)
+    
+    def count(self) -> int:
+        return self._unlabelled().count()
+    
+    def _samples(self) -> List[str]:
+        lines = []
+        bounds = [_format_value(bound) for bound in self.buckets] + ["+Inf"]
+        for values, child in list(self._children.items()):
+            counts, total = child.snapshot()
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                labels = _label_text(self.labelnames, values, f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _label_text(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Named collection of metrics rendered together.
+    
+    counter(), gauge() and histogram() return the existing metric when the
+    name is already registered, so components sharing a registry share
+    their metrics.
+    """
+    
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+    
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames, **kwargs) -> _Metric:
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = cls(name, documentation, labelnames, **kwargs)
+                    self._metrics[name] = metric
+        if not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+            raise ValueError(f"metric {name} already registered with a different type or labels")
+        return metric
+    
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._get_or_create(Counter, name, documentation, tuple(labelnames))
+    
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._get_or_create(Gauge, name, documentation, tuple(labelnames))
+    
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._get_or_create(Histogram, name, documentation, tuple(labelnames), buckets=buckets)
+    
+    def get(self, name: str) -> Optional[_Metric]:
+        """Registered metric by name."""
+        return self._metrics.get(name)
+    
+    def render(self) -> str:
+        """Prometheus text exposition of every registered metric."""
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+# Process-wide registry
+_default_registry: Optional[MetricsRegistry] = None
+_default_registry_lock = threading.Lock()
+
+
+def get_registry() -> MetricsRegistry:
+    """
+    Get the process-wide registry.
+    
+    Returns:
+        Shared MetricsRegistry instance
+    """
+    global _default_registry
+    if _default_registry is None:
+        with _default_registry_lock:
+            if _default_registry is None:
+                _default_registry = MetricsRegistry()
+    return _default_registry
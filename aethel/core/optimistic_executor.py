@@ -0,0 +1,411 @@
+"""
+Aethel Optimistic Executor - Synchrony Protocol v1.8.0
+
+Block-STM style optimistic execution for atomic batches. No dependency
+analysis is done up front: every transaction runs speculatively in parallel
+against a multi-version account store, records the version of every account
+it read, and publishes its writes as versions tagged with its batch position.
+
+Validation then walks the batch in order. A transaction whose reads still
+see the same versions is committed as-is; otherwise only that transaction is
+re-executed, against the now-final writes of every transaction before it,
+which makes the new incarnation valid by construction. The committed result
+is identical to executing the batch serially in submission order, without a
+global serial fallback, even when read/write sets are unknown or
+over-approximated.
+
+Author: Aethel Team
+Version: 1.8.0
+Date: February 4, 2026
+"""
+
+from typing import List, Dict, Set, Optional, Tuple, Any, Callable
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+import bisect
+import copy
+import threading
+import time
+
+from aethel.core.synchrony import (
+    Transaction,
+    ExecutionEvent,
+    ExecutionResult,
+    EventType,
+    TimeoutError
+)
+from aethel.core.parallel_executor import _apply_effect, _credit_totals
+
+
+# (writer batch position, incarnation); None means the initial state
+Version = Optional[Tuple[int, int]]
+
+
+class MultiVersionStore:
+    """
+    Account versions written by the transactions of one batch.
+    
+    Each account keeps the positions of the transactions that wrote it,
+    sorted, so a read by transaction j finds the highest writer below j
+    with one bisect. Reads below every writer fall through to the initial
+    states.
+    """
+    
+    def __init__(self, initial_states: Dict[str, Any]):
+        """
+        Create a store.
+        
+        Args:
+            initial_states: Account states before the batch (read-only)
+        """
+        self.initial_states = initial_states
+        self._writers: Dict[str, List[int]] = {}
+        self._versions: Dict[Tuple[str, int], Tuple[int, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def read(self, account_id: str, txn_index: int) -> Tuple[Version, Any]:
+        """
+        Latest value of an account visible to a transaction.
+        
+        Args:
+            account_id: Account to read
+            txn_index: Batch position of the reading transaction
+        
+        Returns:
+            (version, value); value is None if the account does not exist
+        """
+        with self._lock:
+            writers = self._writers.get(account_id)
+            if writers:
+                slot = bisect.bisect_left(writers, txn_index)
+                if slot > 0:
+                    writer = writers[slot - 1]
+                    incarnation, value = self._versions[(account_id, writer)]
+                    return (writer, incarnation), value
+        return None, self.initial_states.get(account_id)
+    
+    def publish(self,
+                txn_index: int,
+                incarnation: int,
+                writes: Dict[str, Any],
+                previous: Set[str]) -> None:
+        """
+        Replace a transaction's versions with those of a new incarnation.
+        
+        Args:
+            txn_index: Batch position of the writer
+            incarnation: Execution attempt that produced the writes
+            writes: account_id -> new state
+            previous: Accounts written by the previous incarnation
+        """
+        with self._lock:
+            for account_id in previous - writes.keys():
+                self._versions.pop((account_id, txn_index), None)
+                writers = self._writers[account_id]
+                del writers[bisect.bisect_left(writers, txn_index)]
+            for account_id, value in writes.items():
+                if (account_id, txn_index) not in self._versions:
+                    bisect.insort(self._writers.setdefault(account_id, []), txn_index)
+                self._versions[(account_id, txn_index)] = (incarnation, value)
+
+
+class VersionedView:
+    """
+    One transaction's window onto the multi-version store.
+    
+    Same read()/write() interface as AccountView, but any account can be
+    accessed: reads record the version they saw for validation, and writes
+    go to a private copy until the incarnation is published.
+    """
+    
+    def __init__(self, store: MultiVersionStore, txn_index: int):
+        self._store = store
+        self._txn_index = txn_index
+        self.read_versions: Dict[str, Version] = {}
+        self.read_values: Dict[str, Any] = {}
+        self.writes: Dict[str, Any] = {}
+    
+    def _load(self, account_id: str) -> Any:
+        if account_id not in self.read_versions:
+            version, value = self._store.read(account_id, self._txn_index)
+            self.read_versions[account_id] = version
+            self.read_values[account_id] = value
+        return self.read_values[account_id]
+    
+    def read(self, account_id: str, default: Any = None) -> Any:
+        """Current state of an account (do not mutate the result)"""
+        if account_id in self.writes:
+            return self.writes[account_id]
+        value = self._load(account_id)
+        return default if value is None else value
+    
+    def write(self, account_id: str, default: Any = None) -> Any:
+        """Private, mutable copy of an account, made on first write"""
+        if account_id not in self.writes:
+            value = self._load(account_id)
+            self.writes[account_id] = copy.deepcopy(default if value is None else value)
+        return self.writes[account_id]
+
+
+def simulate_transaction(transaction: Transaction, view: Any) -> None:
+    """
+    Default transaction body: the same simulated effect as ParallelExecutor.
+    
+    Args:
+        transaction: Transaction to execute
+        view: AccountView or VersionedView
+    """
+    credits = _credit_totals(transaction)
+    for account_id in transaction.accounts.keys():
+        current = view.read(account_id)
+        old_value = current.get("balance", 0) if current is not None else 0
+        view.write(account_id, default={"balance": 0})["balance"] = (
+            _apply_effect(old_value) + credits.get(account_id, 0)
+        )
+
+
+@dataclass
+class _Incarnation:
+    """Outcome of one execution attempt of a transaction"""
+    number: int
+    view: Optional[VersionedView] = None
+    error: Optional[BaseException] = None
+    thread_id: int = 0
+    written: Set[str] = field(default_factory=set)
+
+
+class OptimisticExecutor:
+    """
+    Executes a batch speculatively and repairs conflicts in order.
+    
+    Algorithm:
+    1. Run every transaction in parallel against a MultiVersionStore,
+       publishing its writes as soon as it finishes
+    2. For i = 0..n-1: re-read transaction i's read set; if any version
+       changed (or the speculative run raised), re-execute i alone - all
+       transactions before it are final, so the new incarnation is valid
+    3. Commit: final states are the last version of every account
+    
+    The execution trace records each transaction's committed incarnation
+    at commit time, in batch order, so it describes the serial history the
+    batch is equivalent to. Discarded incarnations appear as ROLLBACK
+    events.
+    """
+    
+    def __init__(self,
+                 thread_count: int = 8,
+                 timeout_seconds: float = 30.0,
+                 execute_fn: Optional[Callable[[Transaction, Any], None]] = None):
+        """
+        Initialize optimistic executor.
+        
+        Args:
+            thread_count: Number of threads for speculative execution
+            timeout_seconds: Timeout for batch execution (default 30s)
+            execute_fn: Transaction body called as execute_fn(transaction,
+                view); defaults to simulate_transaction
+        """
+        self.thread_count = thread_count
+        self.timeout_seconds = timeout_seconds
+        self.execute_fn = execute_fn or simulate_transaction
+        self.executor = ThreadPoolExecutor(max_workers=thread_count)
+        self.stats: Dict[str, Any] = {}
+        self.next_thread_id = 0
+        self.thread_id_lock = threading.Lock()
+    
+    def _get_thread_id(self) -> int:
+        with self.thread_id_lock:
+            thread_id = self.next_thread_id
+            self.next_thread_id += 1
+            return thread_id
+    
+    def _run(self,
+             store: MultiVersionStore,
+             transaction: Transaction,
+             txn_index: int,
+             number: int,
+             previous: Set[str]) -> _Incarnation:
+        """Execute one incarnation and publish its writes"""
+        incarnation = _Incarnation(number=number, thread_id=self._get_thread_id())
+        view = VersionedView(store, txn_index)
+        try:
+            self.execute_fn(transaction, view)
+        except Exception as error:
+            # Possibly caused by an inconsistent speculative read
+            incarnation.error = error
+        incarnation.view = view
+        incarnation.written = set(view.writes) if incarnation.error is None else set()
+        store.publish(
+            txn_index,
+            number,
+            view.writes if incarnation.error is None else {},
+            previous
+        )
+        return incarnation
+    
+    def _is_valid(self, store: MultiVersionStore, txn_index: int, incarnation: _Incarnation) -> bool:
+        if incarnation.error is not None:
+            return False
+        for account_id, version in incarnation.view.read_versions.items():
+            if store.read(account_id, txn_index)[0] != version:
+                return False
+        return True
+    
+    def execute_optimistic(self,
+                           transactions: List[Transaction],
+                           initial_states: Dict[str, Any]) -> ExecutionResult:
+        """
+        Execute a batch optimistically.
+        
+        Args:
+            transactions: Transactions in submission (serial) order
+            initial_states: Initial account states (not mutated)
+        
+        Returns:
+            ExecutionResult equivalent to serial execution in batch order
+        
+        Raises:
+            TimeoutError: If execution exceeds timeout
+            Exception: If a transaction fails on its in-order execution
+        """
+        start_time = time.time()
+        deadline = start_time + self.timeout_seconds
+        self.next_thread_id = 0
+        store = MultiVersionStore(initial_states)
+        
+        # Phase 1: speculative parallel execution
+        futures = [
+            self.executor.submit(self._run, store, transaction, index, 0, set())
+            for index, transaction in enumerate(transactions)
+        ]
+        incarnations: List[_Incarnation] = []
+        for future in futures:
+            remaining = deadline - time.time()
+            try:
+                incarnations.append(future.result(timeout=max(0.0, remaining)))
+            except Exception:
+                for pending in futures:
+                    pending.cancel()
+                if time.time() < deadline:
+                    raise
+                raise TimeoutError(
+                    timeout_seconds=self.timeout_seconds,
+                    completed=len(incarnations),
+                    pending=len(transactions) - len(incarnations)
+                )
+        
+        # Phase 2: validate in order, re-executing only invalid transactions
+        trace: List[ExecutionEvent] = []
+        speculative_group: Set[str] = set()
+        re_executed: List[str] = []
+        final_states = dict(initial_states)
+        
+        for index, transaction in enumerate(transactions):
+            if time.time() > deadline:
+                raise TimeoutError(
+                    timeout_seconds=self.timeout_seconds,
+                    completed=index,
+                    pending=len(transactions) - index
+                )
+            incarnation = incarnations[index]
+            if self._is_valid(store, index, incarnation):
+                speculative_group.add(transaction.id)
+            else:
+                trace.append(ExecutionEvent(
+                    timestamp=time.time(),
+                    transaction_id=transaction.id,
+                    event_type=EventType.ROLLBACK,
+                    thread_id=incarnation.thread_id
+                ))
+                incarnation = self._run(
+                    store, transaction, index, incarnation.number + 1, incarnation.written
+                )
+                if incarnation.error is not None:
+                    # Every predecessor is final: this is a genuine failure
+                    raise incarnation.error
+                re_executed.append(transaction.id)
+            
+            self._record_commit(trace, transaction, incarnation)
+            final_states.update(incarnation.view.writes)
+        
+        self.stats = {
+            "transactions": len(transactions),
+            "speculative_commits": len(speculative_group),
+            "re_executions": len(re_executed),
+            "re_executed": re_executed,
+        }
+        
+        parallel_groups: List[Set[str]] = [speculative_group] if speculative_group else []
+        parallel_groups.extend({tx_id} for tx_id in re_executed)
+        
+        return ExecutionResult(
+            final_states=final_states,
+            execution_trace=trace,
+            parallel_groups=parallel_groups,
+            execution_time=time.time() - start_time,
+            thread_count=self.thread_count
+        )
+    
+    def _record_commit(self,
+                       trace: List[ExecutionEvent],
+                       transaction: Transaction,
+                       incarnation: _Incarnation) -> None:
+        """Append the committed incarnation's events to the trace"""
+        view = incarnation.view
+        thread_id = incarnation.thread_id
+        
+        def balance(state: Any) -> Any:
+            return state.get("balance", 0) if isinstance(state, dict) else 0
+        
+        trace.append(ExecutionEvent(time.time(), transaction.id, EventType.START, thread_id=thread_id))
+        for account_id, value in view.read_values.items():
+            trace.append(ExecutionEvent(
+                timestamp=time.time(),
+                transaction_id=transaction.id,
+                event_type=EventType.READ,
+                account_id=account_id,
+                old_value=balance(value),
+                thread_id=thread_id
+            ))
+        for account_id, value in view.writes.items():
+            trace.append(ExecutionEvent(
+                timestamp=time.time(),
+                transaction_id=transaction.id,
+                event_type=EventType.WRITE,
+                account_id=account_id,
+                old_value=balance(view.read_values.get(account_id)),
+                new_value=balance(value),
+                thread_id=thread_id
+            ))
+        trace.append(ExecutionEvent(time.time(), transaction.id, EventType.COMMIT, thread_id=thread_id))
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Statistics from the last batch"""
+        return dict(self.stats)
+    
+    def shutdown(self):
+        """Shutdown the thread pool"""
+        self.executor.shutdown(wait=True)
+    
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.shutdown()
+        return False
+
+
+# ============================================================================
+# MODULE INFO
+# ============================================================================
+
+__version__ = "1.8.0"
+__author__ = "Aethel Team"
+__all__ = [
+    "OptimisticExecutor",
+    "MultiVersionStore",
+    "VersionedView",
+    "simulate_transaction",
+]
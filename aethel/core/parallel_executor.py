@@ -2,8 +2,13 @@
 Aethel Parallel Executor - Synchrony Protocol v1.8.0
 
 Executes independent transactions concurrently using thread pools while respecting
-dependency order. Implements copy-on-write for account states, timeout mechanisms,
-and comprehensive execution tracing.
+dependency order. Transactions are dispatched by a work-stealing wavefront scheduler
+as soon as their dependencies complete, each on a copy-on-write view of only the
+accounts it touches. Implements timeout mechanisms and comprehensive execution tracing.
+
+Credits to split hot accounts (see DependencyAnalyzer) bypass the shared
+state: each worker sums them into its own sub-accumulator, and the partial
+sums are merged into the final states after the batch.
 
 Philosophy: "If one transaction is correct, a thousand parallel transactions are correct."
 
@@ -12,15 +17,23 @@ Version: 1.8.0
 Date: February 4, 2026
 """
 
-from typing import List, Dict, Set, Optional, Tuple, Any
+from typing import List, Dict, Set, Optional, Tuple, Any, Iterable
 from dataclasses import dataclass, field
-from concurrent.futures import ThreadPoolExecutor, Future, TimeoutError as FutureTimeoutError
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    ProcessPoolExecutor,
+    Future,
+    TimeoutError as FutureTimeoutError,
+    wait,
+)
+import os
 import threading
 import time
 import copy
 
 from aethel.core.synchrony import (
     Transaction,
+    Credit,
     ExecutionEvent,
     ExecutionResult,
     EventType,
@@ -28,6 +41,8 @@ from aethel.core.synchrony import (
     ConservationViolationError
 )
 from aethel.core.dependency_graph import DependencyGraph
+from aethel.core.dag_scheduler import WorkStealingScheduler
+from aethel.core.execution_trace import TraceBuffer, CompactTrace, TRACE_FULL
 
 
 @dataclass
@@ -47,23 +62,141 @@ class ExecutionContext:
         }
 
 
+# Execution backends
+BACKEND_THREAD = "thread"
+BACKEND_PROCESS = "process"
+
+# Compact wire forms for the process backend:
+#   slice:  (tx_id, (account_id, ...), (balance_or_None, ...), (credit_or_None, ...))
+#           credit is None for accounts the transaction only reads
+#   result: (tx_id, ((account_id, new_balance), ...), (event, ...))
+#   event:  (timestamp, event_type_value, account_id, old_value, new_value)
+AccountSlice = Tuple[str, Tuple[str, ...], Tuple[Any, ...], Tuple[Any, ...]]
+SliceResult = Tuple[str, Tuple[Tuple[str, Any], ...], Tuple[Tuple[Any, ...], ...]]
+
+
+def _apply_effect(old_value: Any) -> Any:
+    """
+    New balance of one account touched by a transaction.
+    
+    Simulate transaction effect (for testing). In real implementation,
+    this would execute the intent. Shared by both backends so they agree.
+    """
+    return old_value  # Placeholder
+
+
+def _credit_totals(transaction: Transaction) -> Dict[str, Any]:
+    """Sum of the Credit operations of a transaction, per account"""
+    totals: Dict[str, Any] = {}
+    for op in transaction.operations:
+        if isinstance(op, Credit):
+            totals[op.account_id] = totals.get(op.account_id, 0) + op.amount
+    return totals
+
+
+def _execute_slices(slices: Tuple[AccountSlice, ...]) -> List[SliceResult]:
+    """
+    Process-pool entry point: execute a chunk of independent transactions.
+    
+    Each slice carries only the balances of the accounts one transaction
+    touches (None for accounts not in the state yet) and what it credits to
+    each account it writes. Only balances that changed come back, as deltas
+    for the parent to merge.
+    
+    Args:
+        slices: Compact account slices
+    
+    Returns:
+        Compact result per slice, in the same order
+    """
+    results = []
+    for tx_id, account_ids, balances, credits in slices:
+        events = [(time.time(), EventType.START.value, None, None, None)]
+        deltas = []
+        for account_id, balance, credit in zip(account_ids, balances, credits):
+            old_value = 0 if balance is None else balance
+            events.append((time.time(), EventType.READ.value, account_id, old_value, None))
+            if credit is None:
+                continue
+            new_value = _apply_effect(old_value) + credit
+            events.append((time.time(), EventType.WRITE.value, account_id, old_value, new_value))
+            if balance is None or new_value != balance:
+                deltas.append((account_id, new_value))
+        events.append((time.time(), EventType.COMMIT.value, None, None, None))
+        results.append((tx_id, tuple(deltas), tuple(events)))
+    return results
+
+
+class AccountView:
+    """
+    Copy-on-write view of the accounts one transaction touches.
+    
+    Reads go straight to the shared state; the first write to an account
+    copies just that account into the view. Accounts outside the
+    transaction are not reachable, and the shared state is never mutated.
+    """
+    
+    def __init__(self, base: Dict[str, Any], accounts: Iterable[str]):
+        """
+        Create a view.
+        
+        Args:
+            base: Shared account states (read-only through the view)
+            accounts: Account IDs the transaction may access
+        """
+        self._base = base
+        self._accounts = frozenset(accounts)
+        self._writes: Dict[str, Any] = {}
+    
+    def _check(self, account_id: str) -> None:
+        if account_id not in self._accounts:
+            raise KeyError(f"account {account_id} is not accessed by this transaction")
+    
+    def __contains__(self, account_id: str) -> bool:
+        return account_id in self._accounts and (
+            account_id in self._writes or account_id in self._base
+        )
+    
+    def read(self, account_id: str, default: Any = None) -> Any:
+        """Current state of an account (do not mutate the result)"""
+        self._check(account_id)
+        if account_id in self._writes:
+            return self._writes[account_id]
+        return self._base.get(account_id, default)
+    
+    def write(self, account_id: str, default: Any = None) -> Any:
+        """Private, mutable copy of an account, made on first write"""
+        self._check(account_id)
+        if account_id not in self._writes:
+            if account_id in self._base:
+                self._writes[account_id] = copy.deepcopy(self._base[account_id])
+            else:
+                self._writes[account_id] = copy.deepcopy(default)
+        return self._writes[account_id]
+    
+    def changes(self) -> Dict[str, Any]:
+        """Accounts written through this view"""
+        return dict(self._writes)
+
+
 class ParallelExecutor:
     """
     Executes transactions in parallel while respecting dependencies.
     
     Key Features:
     - Thread pool for concurrent execution
-    - Copy-on-write for account states (isolation)
+    - Optional process pool for large independent sets (backend="process")
+    - Wavefront dispatch with per-worker deques and work stealing
+    - Copy-on-write views of touched accounts (isolation)
     - Timeout mechanism to prevent deadlocks
-    - Execution trace with timestamps and thread IDs
+    - Compact per-thread execution trace (full, sampled or off)
     - Respects dependency order from conflict resolution
     
     Algorithm:
-    1. Get independent sets from dependency graph
-    2. For each independent set:
-       a. Execute all transactions in parallel (thread pool)
-       b. Wait for all to complete
-       c. Merge results
+    1. Seed the scheduler with transactions whose in-degree is zero
+    2. Each worker runs a ready transaction on an AccountView, publishes
+       the accounts it wrote, and releases dependents whose in-degree
+       drops to zero; idle workers steal ready transactions
     3. Record execution trace with timestamps
     4. Return final states and trace
     
@@ -71,21 +204,44 @@ class ParallelExecutor:
         Requirements 2.1, 2.2, 2.3, 10.3, 10.4, 10.5
     """
     
-    def __init__(self, thread_count: int = 8, timeout_seconds: float = 30.0):
+    def __init__(self,
+                 thread_count: int = 8,
+                 timeout_seconds: float = 30.0,
+                 backend: str = BACKEND_THREAD,
+                 process_count: Optional[int] = None,
+                 process_threshold: int = 64,
+                 trace_mode: str = TRACE_FULL,
+                 trace_sample_rate: float = 0.01):
         """
         Initialize parallel executor.
         
         Args:
             thread_count: Number of threads in pool (default 8)
             timeout_seconds: Timeout for batch execution (default 30s)
+            backend: "thread" (default) or "process"; the process backend
+                ships independent sets to a process pool so pure-Python
+                evaluation is not serialized by the GIL
+            process_count: Worker processes (default: CPU count)
+            process_threshold: Independent sets smaller than this run on
+                the thread pool, where IPC would cost more than it saves
+            trace_mode: "full" (default), "sampled" or "off"
+            trace_sample_rate: Fraction of transactions traced when sampled
         """
+        if backend not in (BACKEND_THREAD, BACKEND_PROCESS):
+            raise ValueError(f"Unknown execution backend: {backend}")
         self.thread_count = thread_count
         self.timeout_seconds = timeout_seconds
+        self.backend = backend
+        self.process_count = process_count or os.cpu_count() or 1
+        self.process_threshold = max(1, process_threshold)
         self.executor = ThreadPoolExecutor(max_workers=thread_count)
+        self.scheduler = WorkStealingScheduler(worker_count=thread_count)
+        self.process_pool: Optional[ProcessPoolExecutor] = None
         
         # Execution state
-        self.execution_trace: List[ExecutionEvent] = []
-        self.trace_lock = threading.Lock()
+        self.trace_buffer = TraceBuffer(mode=trace_mode, sample_rate=trace_sample_rate)
+        self.split_accounts: Set[str] = set()
+        self.accumulators: List[Dict[str, Any]] = []
         self.next_thread_id = 0
         self.thread_id_lock = threading.Lock()
     
@@ -96,89 +252,81 @@ class ParallelExecutor:
             self.next_thread_id += 1
             return thread_id
     
+    @property
+    def execution_trace(self) -> CompactTrace:
+        """Events recorded so far, merged across threads in real order"""
+        return self.trace_buffer.merge()
+    
     def _record_event(self, event: ExecutionEvent):
         """Thread-safe event recording"""
-        with self.trace_lock:
-            self.execution_trace.append(event)
+        self.trace_buffer.record_event(event)
     
     def _execute_transaction(self, 
                             transaction: Transaction,
                             account_states: Dict[str, Any],
-                            thread_id: int) -> Dict[str, Any]:
+                            thread_id: int,
+                            accumulator: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Execute a single transaction with copy-on-write semantics.
         
         Args:
             transaction: Transaction to execute
-            account_states: Current account states (will be copied)
+            account_states: Current account states (never mutated)
             thread_id: Thread ID for tracing
+            accumulator: The calling worker's sub-accumulator; credits to
+                split accounts are added here instead of being written
             
         Returns:
-            Updated account states after transaction
+            Updated states of the accounts the transaction wrote
             
         Raises:
             Exception: If transaction execution fails
         """
-        start_time = time.time()
+        # Sampling is decided once per transaction
+        trace = self.trace_buffer if self.trace_buffer.traces(transaction.id) else None
         
         # Record START event
-        self._record_event(ExecutionEvent(
-            timestamp=start_time,
-            transaction_id=transaction.id,
-            event_type=EventType.START,
-            thread_id=thread_id
-        ))
+        if trace is not None:
+            trace.record(EventType.START, transaction.id, thread_id=thread_id)
         
-        # Copy-on-write: Create isolated copy of account states
-        local_states = copy.deepcopy(account_states)
+        # Copy-on-write: view of only the accounts this transaction touches
+        view = AccountView(account_states, transaction.accounts.keys())
         
         # Execute transaction operations
         # For now, we simulate execution by modifying account balances
         # In real implementation, this would call the Aethel runtime
         
+        write_set = transaction.get_write_set()
+        credits = _credit_totals(transaction)
         for account_id, account in transaction.accounts.items():
-            if account_id in local_states:
-                old_value = local_states[account_id].get("balance", 0)
-            else:
-                old_value = 0
-                local_states[account_id] = {"balance": 0}
+            if accumulator is not None and account_id in self.split_accounts:
+                # Commutative: no read, merged after the batch
+                accumulator[account_id] = accumulator.get(account_id, 0) + credits.get(account_id, 0)
+                continue
+            
+            current = view.read(account_id)
+            old_value = current.get("balance", 0) if current is not None else 0
             
             # Record READ event
-            self._record_event(ExecutionEvent(
-                timestamp=time.time(),
-                transaction_id=transaction.id,
-                event_type=EventType.READ,
-                account_id=account_id,
-                old_value=old_value,
-                thread_id=thread_id
-            ))
+            if trace is not None:
+                trace.record(EventType.READ, transaction.id, account_id, old_value, thread_id=thread_id)
             
-            # Simulate transaction effect (for testing)
-            # In real implementation, this would execute the intent
-            new_value = old_value  # Placeholder
+            if account_id not in write_set:
+                continue
+            
+            new_value = _apply_effect(old_value) + credits.get(account_id, 0)
             
             # Record WRITE event
-            self._record_event(ExecutionEvent(
-                timestamp=time.time(),
-                transaction_id=transaction.id,
-                event_type=EventType.WRITE,
-                account_id=account_id,
-                old_value=old_value,
-                new_value=new_value,
-                thread_id=thread_id
-            ))
+            if trace is not None:
+                trace.record(EventType.WRITE, transaction.id, account_id, old_value, new_value, thread_id)
             
-            local_states[account_id]["balance"] = new_value
+            view.write(account_id, default={"balance": 0})["balance"] = new_value
         
         # Record COMMIT event
-        self._record_event(ExecutionEvent(
-            timestamp=time.time(),
-            transaction_id=transaction.id,
-            event_type=EventType.COMMIT,
-            thread_id=thread_id
-        ))
-        
-        return local_states
+        if trace is not None:
+            trace.record(EventType.COMMIT, transaction.id, thread_id=thread_id)
+        
+        return view.changes()
     
     def execute_independent_set(self,
                                transactions: List[Transaction],
@@ -244,14 +392,182 @@ class ParallelExecutor:
         
         # Merge results from all transactions
         # Since transactions are independent, we can merge their state changes
-        final_states = copy.deepcopy(initial_states)
+        final_states = dict(initial_states)
         
         for tx_states in completed_states.values():
-            for account_id, account_state in tx_states.items():
-                final_states[account_id] = account_state
+            final_states.update(tx_states)
         
         return final_states, self.execution_trace.copy()
     
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Create the process pool on first use"""
+        if self.process_pool is None:
+            self.process_pool = ProcessPoolExecutor(max_workers=self.process_count)
+        return self.process_pool
+    
+    def execute_independent_set_in_processes(self,
+                                            transactions: List[Transaction],
+                                            current_states: Dict[str, Any],
+                                            deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Execute a set of independent transactions on the process pool.
+        
+        Each transaction is encoded as a compact slice holding only the
+        balances of its accounts; slices are shipped in chunks (about four
+        per worker) and the returned balance deltas are merged with
+        copy-on-write into current_states.
+        
+        Args:
+            transactions: List of independent transactions
+            current_states: Account states; updated in place with the deltas
+            deadline: Absolute time.time() deadline (None = no limit)
+        
+        Returns:
+            current_states after merging
+        
+        Raises:
+            TimeoutError: If the set does not finish before the deadline
+        """
+        slices = []
+        # Split-account credits are summed here instead of in the workers
+        accumulator: Dict[str, Any] = {}
+        self.accumulators.append(accumulator)
+        for transaction in transactions:
+            credit_totals = _credit_totals(transaction)
+            account_ids = []
+            for account_id in transaction.accounts:
+                if account_id in self.split_accounts:
+                    accumulator[account_id] = accumulator.get(account_id, 0) + credit_totals.get(account_id, 0)
+                else:
+                    account_ids.append(account_id)
+            balances = tuple(
+                current_states[account_id].get("balance", 0)
+                if account_id in current_states else None
+                for account_id in account_ids
+            )
+            write_set = transaction.get_write_set()
+            credits = tuple(
+                credit_totals.get(account_id, 0) if account_id in write_set else None
+                for account_id in account_ids
+            )
+            slices.append((transaction.id, tuple(account_ids), balances, credits))
+        
+        chunk_size = max(1, -(-len(slices) // (self.process_count * 4)))
+        pool = self._get_process_pool()
+        futures = [
+            pool.submit(_execute_slices, tuple(slices[i:i + chunk_size]))
+            for i in range(0, len(slices), chunk_size)
+        ]
+        
+        timeout = None if deadline is None else max(0.0, deadline - time.time())
+        done, pending = wait(futures, timeout=timeout)
+        if pending:
+            for future in pending:
+                future.cancel()
+            completed = sum(
+                len(slices[i:i + chunk_size])
+                for i, future in zip(range(0, len(slices), chunk_size), futures)
+                if future in done
+            )
+            raise TimeoutError(
+                timeout_seconds=self.timeout_seconds,
+                completed=completed,
+                pending=len(slices) - completed
+            )
+        
+        for future in futures:
+            for tx_id, deltas, events in future.result():
+                thread_id = self._get_thread_id()
+                if self.trace_buffer.traces(tx_id):
+                    for timestamp, event_type, account_id, old_value, new_value in events:
+                        self.trace_buffer.record(
+                            EventType(event_type),
+                            tx_id,
+                            account_id,
+                            old_value,
+                            new_value,
+                            thread_id,
+                            int(timestamp * 1e9)
+                        )
+                for account_id, new_value in deltas:
+                    state = dict(current_states.get(account_id) or {})
+                    state["balance"] = new_value
+                    current_states[account_id] = state
+        
+        return current_states
+    
+    def _execute_parallel_processes(self,
+                                    transactions: List[Transaction],
+                                    dependency_graph: DependencyGraph,
+                                    current_states: Dict[str, Any],
+                                    included: Set[str]) -> List[Set[str]]:
+        """
+        Process backend: run the graph one independent set at a time.
+        
+        Sets of at least process_threshold transactions go to the process
+        pool; smaller sets run on the thread pool.
+        
+        Returns:
+            The independent sets that were executed
+        """
+        deadline = time.time() + self.timeout_seconds
+        tx_map = {tx.id: tx for tx in transactions}
+        parallel_groups: List[Set[str]] = []
+        
+        for level in dependency_graph.get_independent_sets():
+            group = level & included
+            if not group:
+                continue
+            set_transactions = [tx_map[tx_id] for tx_id in sorted(group)]
+            
+            if len(set_transactions) >= self.process_threshold:
+                self.execute_independent_set_in_processes(set_transactions, current_states, deadline)
+            else:
+                futures = []
+                for tx in set_transactions:
+                    accumulator: Dict[str, Any] = {}
+                    self.accumulators.append(accumulator)
+                    futures.append(self.executor.submit(
+                        self._execute_transaction,
+                        tx,
+                        current_states,
+                        self._get_thread_id(),
+                        accumulator
+                    ))
+                done, pending = wait(futures, timeout=max(0.0, deadline - time.time()))
+                if pending:
+                    for future in pending:
+                        future.cancel()
+                    raise TimeoutError(
+                        timeout_seconds=self.timeout_seconds,
+                        completed=len(done),
+                        pending=len(pending)
+                    )
+                for future in futures:
+                    current_states.update(future.result())
+            
+            parallel_groups.append(group)
+        
+        return parallel_groups
+    
+    def _merge_accumulators(self, current_states: Dict[str, Any]) -> Dict[str, List[Any]]:
+        """
+        Add the sub-accumulators of every split account to its balance.
+        
+        Split accounts are never written during the batch, so their entry
+        in current_states is still the initial state.
+        
+        Returns:
+            Split account -> partial sums, one per sub-accumulator
+        """
+        partials: Dict[str, List[Any]] = {}
+        for account_id in sorted(self.split_accounts):
+            partials[account_id] = [accumulator.get(account_id, 0) for accumulator in self.accumulators]
+            state = dict(current_states.get(account_id) or {})
+            state["balance"] = state.get("balance", 0) + sum(partials[account_id])
+            current_states[account_id] = state
+        return partials
+    
     def execute_parallel(self,
                         transactions: List[Transaction],
                         dependency_graph: DependencyGraph,
@@ -260,12 +576,25 @@ class ParallelExecutor:
         Execute transactions in parallel respecting dependency order.
         
         Algorithm:
-        1. Get independent sets from dependency graph (topological levels)
-        2. For each independent set:
-           a. Execute all transactions in parallel
-           b. Wait for completion
-           c. Merge results
-        3. Return final states and execution trace
+        1. Hand the dependency graph to the work-stealing scheduler
+        2. A transaction is dispatched as soon as all of its dependencies
+           have completed - there is no barrier between topological levels
+        3. Each transaction reads the shared states through an AccountView
+           and its written accounts are published before its dependents
+           are released, so dependents always observe them
+        4. Return final states and execution trace
+        
+        parallel_groups still reports the topological levels: the sets of
+        transactions that are mutually independent.
+        
+        With backend="process", batches of at least process_threshold
+        transactions run one independent set at a time instead, shipping
+        large sets to the process pool. Any other batch of one transaction
+        runs on the calling thread.
+        
+        Credits to the graph's split accounts go to per-worker
+        sub-accumulators; the partial sums are merged into final_states and
+        returned as ExecutionResult.accumulators for the conservation stage.
         
         Args:
             transactions: List of transactions to execute
@@ -284,35 +613,97 @@ class ParallelExecutor:
         """
         start_time = time.time()
         
-        # Reset execution state
-        self.execution_trace = []
-        self.next_thread_id = 0
+        # Only transactions present in both the batch and the graph run
+        tx_map = {tx.id: tx for tx in transactions}
+        dependencies = {
+            tx.id: dependency_graph.nodes[tx.id].dependencies
+            for tx in transactions
+            if tx.id in dependency_graph.nodes
+        }
         
-        # Get independent sets (transactions that can execute in parallel)
-        independent_sets = dependency_graph.get_independent_sets()
+        # Reset execution state; preallocate about one thread's share of events
+        # (a lone transaction records everything on the calling thread)
+        expected_events = sum(2 * len(tx.accounts) + 2 for tx in transactions)
+        threads = 1 if len(dependencies) == 1 else self.thread_count
+        self.trace_buffer.reset(capacity_hint=expected_events // threads + 1)
+        self.next_thread_id = 0
         
-        # Execute each independent set in parallel
+        # One copy protects the caller; transactions share it read-only
         current_states = copy.deepcopy(initial_states)
-        parallel_groups: List[Set[str]] = []
         
-        for independent_set in independent_sets:
-            # Get transactions for this set
-            set_transactions = [
-                tx for tx in transactions
-                if tx.id in independent_set
-            ]
-            
-            if not set_transactions:
-                continue
-            
-            # Execute this independent set in parallel
-            current_states, _ = self.execute_independent_set(
-                set_transactions,
-                current_states
+        self.split_accounts = set(getattr(dependency_graph, "split_accounts", None) or ())
+        self.accumulators = []
+        
+        if self.backend == BACKEND_PROCESS and len(dependencies) >= self.process_threshold:
+            parallel_groups = self._execute_parallel_processes(
+                transactions,
+                dependency_graph,
+                current_states,
+                set(dependencies)
             )
-            
-            # Record which transactions executed in parallel
-            parallel_groups.append(independent_set)
+            return ExecutionResult(
+                final_states=current_states,
+                execution_trace=self.execution_trace,
+                parallel_groups=parallel_groups,
+                execution_time=time.time() - start_time,
+                thread_count=self.process_count,
+                accumulators=self._merge_accumulators(current_states)
+            )
+        
+        if len(dependencies) == 1:
+            # Nothing to overlap with: run it here instead of waking workers
+            tx_id = next(iter(dependencies))
+            self.accumulators = [{}] if self.split_accounts else []
+            current_states.update(
+                self._execute_transaction(
+                    tx_map[tx_id],
+                    current_states,
+                    self._get_thread_id(),
+                    self.accumulators[0] if self.accumulators else None
+                )
+            )
+            return ExecutionResult(
+                final_states=current_states,
+                execution_trace=self.execution_trace,
+                parallel_groups=[{tx_id}],
+                execution_time=time.time() - start_time,
+                thread_count=self.thread_count,
+                accumulators=self._merge_accumulators(current_states)
+            )
+        
+        # One sub-accumulator per worker loop, so adding to it needs no lock
+        if self.split_accounts:
+            self.accumulators = [{} for _ in range(self.thread_count)]
+        worker_accumulators = self.accumulators
+        
+        state_lock = threading.Lock()
+        
+        def run_transaction(tx_id: str, worker_index: int) -> None:
+            changes = self._execute_transaction(
+                tx_map[tx_id],
+                current_states,
+                self._get_thread_id(),
+                worker_accumulators[worker_index] if worker_accumulators else None
+            )
+            # Publish before the scheduler releases dependents
+            with state_lock:
+                current_states.update(changes)
+        
+        self.scheduler.run(
+            dependencies,
+            run_transaction,
+            self.executor,
+            timeout_seconds=self.timeout_seconds
+        )
+        
+        # Record which transactions could execute in parallel
+        parallel_groups: List[Set[str]] = [
+            level & dependencies.keys()
+            for level in dependency_graph.get_independent_sets()
+        ]
+        parallel_groups = [group for group in parallel_groups if group]
+        
+        accumulators = self._merge_accumulators(current_states)
         
         end_time = time.time()
         execution_time = end_time - start_time
@@ -320,17 +711,21 @@ class ParallelExecutor:
         # Build execution result
         result = ExecutionResult(
             final_states=current_states,
-            execution_trace=self.execution_trace.copy(),
+            execution_trace=self.execution_trace,
             parallel_groups=parallel_groups,
             execution_time=execution_time,
-            thread_count=self.thread_count
+            thread_count=self.thread_count,
+            accumulators=accumulators
         )
         
         return result
     
     def shutdown(self):
-        """Shutdown the thread pool"""
+        """Shutdown the thread pool and the process pool, if started"""
         self.executor.shutdown(wait=True)
+        if self.process_pool is not None:
+            self.process_pool.shutdown(wait=True)
+            self.process_pool = None
     
     def __enter__(self):
         """Context manager entry"""
@@ -351,4 +746,7 @@ __author__ = "Aethel Team"
 __all__ = [
     "ParallelExecutor",
     "ExecutionContext",
+    "AccountView",
+    "BACKEND_THREAD",
+    "BACKEND_PROCESS",
 ]
@@ -1,6 +1,7 @@
 from lark import Lark
 from aethel.core.grammar import aethel_grammar
 from aethel.core.synchrony import Transaction
+from aethel.core.intent_access import extract_intent_access
 from typing import List, Dict, Any
 
 
@@ -16,23 +17,29 @@ class AtomicBatchNode:
         """
         Convert intents to executable transactions.
         
+        Accounts and write operations come from static analysis of each
+        intent's guard and verify conditions (see intent_access), so the
+        DependencyAnalyzer sees precise read/write sets.
+        
         Returns:
             List of Transaction objects
         """
         transactions = []
         
         for intent_name, intent_data in self.intents.items():
-            # Create transaction from intent
-            # Note: This is a simplified conversion
-            # In production, would need full intent execution logic
+            access = extract_intent_access(intent_data)
             tx = Transaction(
                 id=f"{self.name}_{intent_name}",
                 intent_name=intent_name,
-                accounts={},  # Would be populated from intent params
-                operations=[],  # Would be populated from intent logic
+                accounts={account_id: {} for account_id in access.accounts},
+                operations=list(access.writes),
                 verify_conditions=intent_data.get("post_conditions", []),
                 oracle_proofs=[]
             )
+            tx._read_set = set(access.reads)
+            tx._write_set = set(access.write_set)
+            # Exact even when empty: a read-only intent writes nothing
+            tx._static_write_set = set(access.write_set)
             transactions.append(tx)
         
         return transactions
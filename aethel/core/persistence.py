@@ -20,9 +20,11 @@ import time
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from dataclasses import dataclass, asdict
 
+from aethel.core.vault_store import PackedBundleStore, RecordView
+
 
 @dataclass
 class ExecutionRecord:
@@ -357,6 +359,31 @@ class MerkleStateDB:
         self.state[key] = value
         self.merkle_root = self._calculate_merkle_root()
     
+    def put_many(self, items: Dict[str, Any]) -> str:
+        """
+        Store several key-value pairs and update the Merkle root once.
+        
+        Returns:
+            New Merkle root
+        """
+        self.state.update(items)
+        self.merkle_root = self._calculate_merkle_root()
+        return self.merkle_root
+    
+    def bulk_load(self, state: Dict[str, Any]) -> str:
+        """
+        Replace the whole state and compute the Merkle root once.
+        
+        Used by crash recovery, where replaying entries one by one through
+        put() would recompute the root after every entry.
+        
+        Returns:
+            New Merkle root
+        """
+        self.state = state
+        self.merkle_root = self._calculate_merkle_root()
+        return self.merkle_root
+    
     def get(self, key: str) -> Optional[Any]:
         """Retrieve value by key"""
         return self.state.get(key)
@@ -424,6 +451,10 @@ class ContentAddressableVault:
     
     This guarantees that the code you're running today is EXACTLY
     the same code that was proved last year.
+    
+    New bundles are appended to compressed packfiles (see vault_store);
+    bundles written by earlier versions as one JSON file each stay
+    readable through the legacy index.json.
     """
     
     def __init__(self, vault_path: str = ".aethel_vault"):
@@ -435,8 +466,12 @@ class ContentAddressableVault:
         
         self.index_path = self.vault_path / "index.json"
         
-        # Load index
+        # Packed storage for bundle bodies
+        self.packs = PackedBundleStore(str(self.vault_path / "packs"))
+        
+        # Load index (legacy entries + packed summaries)
         self.index = self._load_index()
+        self.index.update(self.packs.summaries)
         
         print(f"[VAULT DB] Initialized at: {self.vault_path.absolute()}")
         print(f"   Bundles: {len(self.index)}")
@@ -460,9 +495,6 @@ class ContentAddressableVault:
             print(f"[VAULT DB] Bundle already exists: {content_hash[:16]}...")
             return content_hash
         
-        # Store bundle
-        bundle_path = self.bundles_path / f"{content_hash[:16]}.ae_bundle"
-        
         bundle = {
             'code': code,
             'metadata': metadata,
@@ -470,16 +502,13 @@ class ContentAddressableVault:
             'timestamp': time.time()
         }
         
-        with open(bundle_path, 'w') as f:
-            json.dump(bundle, f, indent=2)
-        
-        # Update index
-        self.index[content_hash] = {
+        # Store bundle (appends body + index line; no index rewrite)
+        summary = {
             'intent_name': metadata.get('intent_name', 'unknown'),
-            'bundle_path': str(bundle_path),
             'timestamp': bundle['timestamp']
         }
-        self._save_index()
+        self.packs.put(content_hash, bundle, summary)
+        self.index[content_hash] = summary
         
         print(f"[VAULT DB] Bundle stored: {content_hash[:16]}...")
         
@@ -490,6 +519,10 @@ class ContentAddressableVault:
         if content_hash not in self.index:
             return None
         
+        if content_hash in self.packs:
+            return self.packs.get(content_hash)
+        
+        # Legacy one-file-per-bundle entry
         bundle_path = Path(self.index[content_hash]['bundle_path'])
         
         if not bundle_path.exists():
@@ -498,13 +531,28 @@ class ContentAddressableVault:
         with open(bundle_path, 'r') as f:
             return json.load(f)
     
+    def open_bundle(self, content_hash: str) -> Optional[Mapping]:
+        """
+        Open a bundle without deserializing it.
+        
+        Packed bundles come back as a RecordView over the memory-mapped
+        pack (fields decoded on access); legacy bundles as a parsed dict.
+        """
+        if content_hash in self.packs:
+            return self.packs.view(content_hash)
+        return self.fetch_bundle(content_hash)
+    
     def verify_bundle(self, content_hash: str) -> bool:
         """Verify bundle integrity by recalculating hash"""
-        bundle = self.fetch_bundle(content_hash)
+        bundle = self.open_bundle(content_hash)
         
         if not bundle:
             return False
         
+        if isinstance(bundle, RecordView):
+            # Hash the stored code bytes in place
+            return bundle.sha256('code') == content_hash
+        
         # Recalculate hash
         calculated_hash = hashlib.sha256(bundle['code'].encode()).hexdigest()
         
@@ -520,13 +568,8 @@ class ContentAddressableVault:
             for hash_val, info in self.index.items()
         ]
     
-    def _save_index(self):
-        """Save index to disk"""
-        with open(self.index_path, 'w') as f:
-            json.dump(self.index, f, indent=2)
-    
     def _load_index(self) -> Dict[str, Any]:
-        """Load index from disk"""
+        """Load legacy index from disk"""
         if not self.index_path.exists():
             return {}
         
@@ -638,6 +681,7 @@ class AethelPersistenceLayer:
     def close(self):
         """Close all database connections"""
         self.auditor.close()
+        self.vault_db.packs.close()
         print("\n[PERSISTENCE] All databases closed")
 
 
@@ -18,6 +18,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from aethel.core.vault_store import RecordView, is_record_file, open_record
+
 
 class ExecutionEnvelope:
     """
@@ -136,19 +138,27 @@ class AethelRuntime:
         raise SecurityError(f"RUNTIME PANIC: {reason}")
     
     def _load_bundle(self, bundle_path: str) -> Dict[str, Any]:
-        """Load bundle from file"""
+        """
+        Load bundle from file.
+        
+        Packed bundles are memory-mapped and returned as a RecordView:
+        fields are only decoded when execution touches them.
+        """
         self._log('INFO', f"Loading bundle: {bundle_path}")
         
         try:
-            with open(bundle_path, 'r') as f:
-                bundle = json.load(f)
+            if is_record_file(bundle_path):
+                bundle = open_record(bundle_path)
+            else:
+                with open(bundle_path, 'r') as f:
+                    bundle = json.load(f)
             
             self._log('SUCCESS', f"Bundle loaded: {bundle['intent_name']}")
             return bundle
         
         except FileNotFoundError:
             self._panic(f"Bundle not found: {bundle_path}")
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, ValueError):
             self._panic(f"Bundle corrupted: Invalid JSON")
         except Exception as e:
             self._panic(f"Bundle load failed: {e}")
@@ -203,13 +213,16 @@ class AethelRuntime:
             return True  # Allow bundles without signature for now
         
         # Recalculate bundle signature
-        bundle_data = {
-            'function_hash': bundle['function_hash'],
-            'ast': bundle['ast'],
-            'certificate': bundle.get('certificate')
-        }
-        bundle_string = json.dumps(bundle_data, sort_keys=True, separators=(',', ':'))
-        calculated_sig = hashlib.sha256(bundle_string.encode()).hexdigest()
+        if isinstance(bundle, RecordView):
+            calculated_sig = self._packed_bundle_signature(bundle)
+        else:
+            bundle_data = {
+                'function_hash': bundle['function_hash'],
+                'ast': bundle['ast'],
+                'certificate': bundle.get('certificate')
+            }
+            bundle_string = json.dumps(bundle_data, sort_keys=True, separators=(',', ':'))
+            calculated_sig = hashlib.sha256(bundle_string.encode()).hexdigest()
         
         if calculated_sig != bundle_sig:
             self._panic("Bundle signature mismatch - bundle may be corrupted")
@@ -217,6 +230,23 @@ class AethelRuntime:
         self._log('SUCCESS', "Bundle signature verified")
         return True
     
+    def _packed_bundle_signature(self, bundle: RecordView) -> str:
+        """
+        Bundle signature computed on the mapped bytes.
+        
+        Packed fields are stored in the same canonical JSON the signature
+        is defined over, so the signed document can be hashed piecewise
+        (keys in sorted order) without decoding the AST or certificate.
+        """
+        digest = hashlib.sha256(b'{"ast":')
+        digest.update(bundle.raw('ast'))
+        digest.update(b',"certificate":')
+        digest.update(bundle.raw('certificate') if 'certificate' in bundle else b'null')
+        digest.update(b',"function_hash":')
+        digest.update(json.dumps(bundle['function_hash']).encode())
+        digest.update(b'}')
+        return digest.hexdigest()
+    
     def _verify_merkle_root(self, bundle: Dict[str, Any]) -> bool:
         """Verify bundle is in vault's Merkle tree"""
         if not self.vault:
@@ -40,6 +40,7 @@ from aethel.core.persistence import (
     ContentAddressableVault,
     AethelAuditor
 )
+from aethel.core.vault_store import RecordView, encode_record, is_record_file, open_record
 
 
 @dataclass
@@ -53,6 +54,23 @@ class StateSnapshot:
     metadata: Dict[str, Any]
 
 
+@dataclass
+class RecoveryReport:
+    """Phase-by-phase breakdown of a crash recovery"""
+    success: bool
+    snapshot_id: Optional[str]
+    state_keys: int
+    wal_entries_replayed: int
+    expected_root: Optional[str]  # None when the WAL tail ends in an unfinished write
+    merkle_root: str
+    snapshot_load_ms: float
+    wal_read_ms: float
+    wal_apply_ms: float
+    root_compute_ms: float
+    total_ms: float
+    error: Optional[str] = None
+
+
 @dataclass
 class WALEntry:
     """Write-Ahead Log entry for crash recovery"""
@@ -207,6 +225,11 @@ class SnapshotManager:
     3. Verify Merkle Root (<10ms)
     
     Total: <500ms guaranteed
+    
+    Snapshots are written as field records (see vault_store) and read
+    through a memory map, so header fields such as the Merkle root or
+    WAL sequence can be inspected without parsing the state. Snapshots
+    written as JSON by earlier versions still load.
     """
     
     def __init__(self, snapshot_dir: str):
@@ -270,9 +293,9 @@ class SnapshotManager:
         )
         
         # Save snapshot to disk
-        snapshot_path = self.snapshot_dir / f"snapshot_{snapshot_id}.json"
-        with open(snapshot_path, 'w') as f:
-            json.dump(asdict(snapshot), f, indent=2)
+        snapshot_path = self.snapshot_dir / f"snapshot_{snapshot_id}.snap"
+        with open(snapshot_path, 'wb') as f:
+            f.write(encode_record(asdict(snapshot)))
         
         # Update index
         self.snapshots_index[snapshot_id] = {
@@ -323,15 +346,37 @@ class SnapshotManager:
         if snapshot_id not in self.snapshots_index:
             return None
         
+        view = self.open_snapshot(snapshot_id)
+        if view is None:
+            return None
+        
+        snapshot_dict = view.to_dict() if isinstance(view, RecordView) else view
+        return StateSnapshot(**snapshot_dict)
+    
+    def open_snapshot(self, snapshot_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Open a snapshot without decoding its state.
+        
+        Args:
+            snapshot_id: Snapshot ID
+        
+        Returns:
+            RecordView over the memory-mapped snapshot (legacy JSON
+            snapshots are parsed into a dict), or None if not found
+        """
+        if snapshot_id not in self.snapshots_index:
+            return None
+        
         snapshot_path = Path(self.snapshots_index[snapshot_id]['path'])
         
         if not snapshot_path.exists():
             return None
         
-        with open(snapshot_path, 'r') as f:
-            snapshot_dict = json.load(f)
+        if is_record_file(str(snapshot_path)):
+            return open_record(str(snapshot_path))
         
-        return StateSnapshot(**snapshot_dict)
+        with open(snapshot_path, 'r') as f:
+            return json.load(f)
     
     def cleanup_old_snapshots(self, keep_count: int = 10):
         """
@@ -409,6 +454,7 @@ class SovereignPersistence(AethelPersistenceLayer):
         
         # Recovery metrics
         self.last_recovery_time_ms = 0
+        self.last_recovery_report: Optional[RecoveryReport] = None
         self.recovery_count = 0
         
         # Auto-snapshot configuration
@@ -553,100 +599,152 @@ class SovereignPersistence(AethelPersistenceLayer):
         
         return snapshot
     
-    def recover_from_crash(self) -> Tuple[bool, float]:
+    def fast_recover(self) -> RecoveryReport:
         """
-        Recover state after crash.
+        Rebuild state from the latest snapshot plus the WAL tail.
         
         Process:
-        1. Load latest snapshot (<100ms)
-        2. Replay WAL from snapshot (<400ms)
-        3. Verify Merkle Root (<10ms)
+        1. Bulk-load the latest snapshot (no per-key work)
+        2. Read the WAL tail written after the snapshot
+        3. Apply the tail to the in-memory dict in one pass
+        4. Compute the Merkle root once and check it against the last
+           root recorded in the WAL (or the snapshot root if the tail is empty)
         
-        Returns:
-            (success, recovery_time_ms)
+        Replaying through put_state() recomputes the root after every
+        entry, which makes recovery O(entries * keys). This path is
+        O(entries + keys log keys).
         
-        Performance: <500ms guaranteed
+        Returns:
+            RecoveryReport with per-phase timings
         
-        Validates: Property 75 (Recovery time <500ms)
+        Validates: Property 75 (Recovery time <500ms), Property 78 (Tamper detection)
         """
         start_time = time.time()
-        
-        print("\n" + "="*70)
-        print("CRASH RECOVERY - RESTORING IMMORTAL MEMORY")
-        print("="*70 + "\n")
+        snapshot_id = None
+        snapshot_ms = wal_read_ms = wal_apply_ms = root_ms = 0.0
+        wal_entries: List[WALEntry] = []
         
         try:
-            # Step 1: Load latest snapshot
-            print("[RECOVERY] Step 1: Loading latest snapshot...")
-            snapshot_start = time.time()
-            
+            # Phase 1: Bulk-load snapshot
+            phase_start = time.time()
             snapshot = self.snapshot_manager.load_latest_snapshot()
             
             if snapshot:
-                # Restore state from snapshot
-                self.merkle_db.state = snapshot.state_data.copy()
-                self.merkle_db.merkle_root = snapshot.merkle_root
-                
-                snapshot_time = (time.time() - snapshot_start) * 1000
-                print(f"   Snapshot loaded: {snapshot.snapshot_id}")
-                print(f"   Merkle Root: {snapshot.merkle_root[:32]}...")
-                print(f"   Time: {snapshot_time:.2f}ms")
-                
+                # The snapshot dict was freshly parsed, so it can be adopted without a copy
+                state = snapshot.state_data
+                snapshot_id = snapshot.snapshot_id
+                expected_root = snapshot.merkle_root
                 wal_from_sequence = snapshot.metadata.get('wal_sequence', 0)
             else:
-                print("   No snapshot found, starting from empty state")
-                snapshot_time = 0
+                state = {}
+                expected_root = None
                 wal_from_sequence = 0
+            snapshot_ms = (time.time() - phase_start) * 1000
             
-            # Step 2: Replay WAL
-            print("\n[RECOVERY] Step 2: Replaying Write-Ahead Log...")
-            wal_start = time.time()
-            
+            # Phase 2: Read WAL tail
+            phase_start = time.time()
             wal_entries = self.wal.replay(from_sequence=wal_from_sequence)
+            wal_read_ms = (time.time() - phase_start) * 1000
             
+            # Phase 3: Apply tail in one batch (plain dict operations, no hashing)
+            phase_start = time.time()
             for entry in wal_entries:
                 if entry.operation == 'PUT':
-                    self.merkle_db.put(entry.key, entry.value)
+                    state[entry.key] = entry.value
                 elif entry.operation == 'DELETE':
-                    self.merkle_db.delete(entry.key)
+                    state.pop(entry.key, None)
             
-            wal_time = (time.time() - wal_start) * 1000
-            print(f"   WAL entries replayed: {len(wal_entries)}")
-            print(f"   Time: {wal_time:.2f}ms")
+            if wal_entries:
+                # A trailing 'pending' entry means we crashed between the WAL
+                # write and the state update, so no root was ever recorded for it
+                last_root = wal_entries[-1].merkle_root_after
+                expected_root = None if last_root == "pending" else last_root
+            wal_apply_ms = (time.time() - phase_start) * 1000
             
-            # Step 3: Verify Merkle Root
-            print("\n[RECOVERY] Step 3: Verifying Merkle Root...")
-            verify_start = time.time()
-            
-            is_valid = self.merkle_db.verify_integrity()
-            
-            verify_time = (time.time() - verify_start) * 1000
-            print(f"   Integrity check: {'PASSED' if is_valid else 'FAILED'}")
-            print(f"   Time: {verify_time:.2f}ms")
-            
-            # Calculate total recovery time
-            recovery_time_ms = (time.time() - start_time) * 1000
-            
-            print("\n" + "="*70)
-            print(f"RECOVERY COMPLETE: {recovery_time_ms:.2f}ms")
-            print(f"   Snapshot: {snapshot_time:.2f}ms")
-            print(f"   WAL Replay: {wal_time:.2f}ms")
-            print(f"   Verification: {verify_time:.2f}ms")
-            print(f"   Target: <500ms")
-            print(f"   Status: {'✅ MET' if recovery_time_ms < 500 else '❌ MISSED'}")
-            print("="*70 + "\n")
-            
-            # Update metrics
-            self.last_recovery_time_ms = recovery_time_ms
-            self.recovery_count += 1
-            
-            return (is_valid, recovery_time_ms)
+            # Phase 4: Compute root once and verify
+            phase_start = time.time()
+            merkle_root = self.merkle_db.bulk_load(state)
+            root_ms = (time.time() - phase_start) * 1000
             
+            success = expected_root is None or merkle_root == expected_root
+            error = None if success else (
+                f"Merkle root mismatch: expected {expected_root[:16]}..., "
+                f"got {merkle_root[:16]}..."
+            )
         except Exception as e:
-            recovery_time_ms = (time.time() - start_time) * 1000
-            print(f"\n[RECOVERY] FAILED: {e}")
-            print(f"   Time: {recovery_time_ms:.2f}ms\n")
-            return (False, recovery_time_ms)
+            success = False
+            merkle_root = self.merkle_db.get_root() or ""
+            expected_root = None
+            error = str(e)
+        
+        report = RecoveryReport(
+            success=success,
+            snapshot_id=snapshot_id,
+            state_keys=len(self.merkle_db.state),
+            wal_entries_replayed=len(wal_entries),
+            expected_root=expected_root,
+            merkle_root=merkle_root,
+            snapshot_load_ms=snapshot_ms,
+            wal_read_ms=wal_read_ms,
+            wal_apply_ms=wal_apply_ms,
+            root_compute_ms=root_ms,
+            total_ms=(time.time() - start_time) * 1000,
+            error=error
+        )
+        
+        # Update metrics
+        self.last_recovery_time_ms = report.total_ms
+        self.last_recovery_report = report
+        self.recovery_count += 1
+        
+        return report
+    
+    def recover_from_crash(self) -> Tuple[bool, float]:
+        """
+        Recover state after crash.
+        
+        Process:
+        1. Load latest snapshot (<100ms)
+        2. Replay WAL from snapshot (<400ms)
+        3. Verify Merkle Root (<10ms)
+        
+        Returns:
+            (success, recovery_time_ms)
+        
+        Performance: <500ms guaranteed
+        
+        Validates: Property 75 (Recovery time <500ms)
+        """
+        print("\n" + "="*70)
+        print("CRASH RECOVERY - RESTORING IMMORTAL MEMORY")
+        print("="*70 + "\n")
+        
+        report = self.fast_recover()
+        
+        if report.snapshot_id:
+            print(f"[RECOVERY] Snapshot loaded: {report.snapshot_id}")
+        else:
+            print("[RECOVERY] No snapshot found, starting from empty state")
+        print(f"   WAL entries replayed: {report.wal_entries_replayed}")
+        print(f"   Merkle Root: {report.merkle_root[:32]}...")
+        if report.expected_root is None:
+            print("   Integrity check: SKIPPED (no recorded root to compare)")
+        else:
+            print(f"   Integrity check: {'PASSED' if report.success else 'FAILED'}")
+        if report.error:
+            print(f"   Error: {report.error}")
+        
+        print("\n" + "="*70)
+        print(f"RECOVERY COMPLETE: {report.total_ms:.2f}ms")
+        print(f"   Snapshot: {report.snapshot_load_ms:.2f}ms")
+        print(f"   WAL Read: {report.wal_read_ms:.2f}ms")
+        print(f"   WAL Apply: {report.wal_apply_ms:.2f}ms")
+        print(f"   Root Computation: {report.root_compute_ms:.2f}ms")
+        print(f"   Target: <500ms")
+        print(f"   Status: {'✅ MET' if report.total_ms < 500 else '❌ MISSED'}")
+        print("="*70 + "\n")
+        
+        return (report.success, report.total_ms)
     
     def get_merkle_root(self) -> str:
         """Get current Merkle root"""
@@ -662,7 +760,8 @@ class SovereignPersistence(AethelPersistenceLayer):
             'last_recovery_time_ms': self.last_recovery_time_ms,
             'recovery_count': self.recovery_count,
             'target_recovery_time_ms': 500,
-            'meets_target': self.last_recovery_time_ms < 500 if self.last_recovery_time_ms > 0 else None
+            'meets_target': self.last_recovery_time_ms < 500 if self.last_recovery_time_ms > 0 else None,
+            'last_recovery_phases': asdict(self.last_recovery_report) if self.last_recovery_report else None
         }
 
 
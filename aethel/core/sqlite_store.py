@@ -0,0 +1,256 @@
+"""
+SQLite Store - Shared Access Layer for SQLite-Backed Components
+v2.1.0
+
+Every SQLite-backed component (cognitive memory, MOE telemetry, training,
+A/B testing, Gauntlet Report, lattice sync, cognitive persistence) goes
+through this layer instead of calling sqlite3.connect() per method.
+
+What it provides:
+1. Per-thread cached connections (no connect() on the hot path)
+2. journal_mode=WAL with tuned synchronous (readers never block the writer)
+3. Prepared-statement reuse (sqlite3 caches compiled statements per
+   connection, which only helps when the connection outlives the call)
+4. One-time schema initialization per database file
+5. executemany batching helpers
+6. A bounded pool of read-only connections for dashboards and exporters
+
+Stores are shared per database file: two components opened on the same
+path reuse the same connections.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+
+class SQLiteStore:
+    """
+    Connection manager for a single SQLite database file.
+    
+    Writers use one long-lived connection per thread. Readers that only
+    serve dashboards can borrow a read-only connection from a bounded pool,
+    which in WAL mode never blocks (and is never blocked by) the writer.
+    """
+    
+    def __init__(
+        self,
+        db_path: str,
+        synchronous: str = "NORMAL",
+        read_pool_size: int = 4,
+        busy_timeout_s: float = 5.0,
+        cached_statements: int = 256
+    ):
+        """
+        Open (or create) a SQLite database in WAL mode.
+        
+        Args:
+            db_path: Path to SQLite database file
+            synchronous: PRAGMA synchronous level (NORMAL is durable across
+                application crashes in WAL mode; FULL also survives power loss)
+            read_pool_size: Maximum number of read-only connections
+            busy_timeout_s: How long a writer waits on a locked database
+            cached_statements: Prepared statements kept per connection
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self.synchronous = synchronous
+        self.busy_timeout_s = busy_timeout_s
+        self.cached_statements = cached_statements
+        
+        self._local = threading.local()
+        self._lock = threading.RLock()
+        self._connections = []
+        self._schemas = set()
+        
+        self._read_pool_size = max(1, read_pool_size)
+        self._read_pool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._read_connections_created = 0
+        
+        # Open the first writer eagerly so the file exists and is in WAL mode
+        # before any read-only connection is attempted
+        self.connection()
+        self._file_id = self._stat_file_id()
+    
+    def _stat_file_id(self) -> Optional[Tuple[int, int]]:
+        """Identity of the database file on disk (device, inode)"""
+        try:
+            st = os.stat(self.db_path)
+        except OSError:
+            return None
+        return (st.st_dev, st.st_ino)
+    
+    def is_stale(self) -> bool:
+        """True if the database file was deleted or replaced since it was opened"""
+        return self._stat_file_id() != self._file_id
+    
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        if read_only:
+            uri = self.db_path.resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(
+                uri,
+                uri=True,
+                timeout=self.busy_timeout_s,
+                check_same_thread=False,
+                cached_statements=self.cached_statements
+            )
+            conn.execute("PRAGMA query_only=ON")
+            return conn
+        
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=self.busy_timeout_s,
+            check_same_thread=False,
+            cached_statements=self.cached_statements
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        return conn
+    
+    def connection(self) -> sqlite3.Connection:
+        """
+        Get this thread's cached read/write connection.
+        
+        Callers must not close it. Use transaction() for writes so they are
+        committed (or rolled back) as a unit.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+    
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a block of writes on this thread's connection and commit once"""
+        conn = self.connection()
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+    
+    @contextmanager
+    def read_connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a read-only connection from the pool.
+        
+        Intended for dashboards and exporters: queries see the latest
+        committed data without contending with the writer.
+        """
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_create = self._read_connections_created < self._read_pool_size
+                if can_create:
+                    self._read_connections_created += 1
+            conn = self._connect(read_only=True) if can_create else self._read_pool.get()
+        
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+    
+    def ensure_schema(self, name: str, init: Callable[[sqlite3.Connection], None]) -> None:
+        """
+        Run a schema initializer once per database file.
+        
+        Args:
+            name: Identifies the initializer (usually the component name)
+            init: Function that creates tables and indexes on a connection
+        """
+        if name in self._schemas:
+            return
+        
+        with self._lock:
+            if name in self._schemas:
+                return
+            with self.transaction() as conn:
+                init(conn)
+            self._schemas.add(name)
+    
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> sqlite3.Cursor:
+        """Execute a single statement on this thread's connection (no commit)"""
+        return self.connection().execute(sql, params)
+    
+    def executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> int:
+        """
+        Execute a statement for many parameter rows in one transaction.
+        
+        Returns:
+            Number of rows affected
+        """
+        with self.transaction() as conn:
+            cursor = conn.executemany(sql, rows)
+            return cursor.rowcount
+    
+    def close(self) -> None:
+        """Close every connection opened by this store"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                pass
+        
+        while True:
+            try:
+                self._read_pool.get_nowait().close()
+            except queue.Empty:
+                break
+        
+        self._read_connections_created = 0
+        self._local = threading.local()
+        self._schemas.clear()
+
+
+# Shared stores, one per database file
+_stores: Dict[str, SQLiteStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_sqlite_store(db_path: str) -> SQLiteStore:
+    """
+    Get the shared SQLiteStore for a database file.
+    
+    A store whose file was deleted or replaced on disk is closed and
+    reopened, so a new component never writes into an unlinked file.
+    
+    Args:
+        db_path: Path to SQLite database file
+    
+    Returns:
+        SQLiteStore instance
+    """
+    key = os.path.abspath(str(db_path))
+    
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is not None and store.is_stale():
+            store.close()
+            store = None
+        if store is None:
+            store = SQLiteStore(key)
+            _stores[key] = store
+        return store
+
+
+def close_all_stores() -> None:
+    """Close every shared store (used at shutdown and in tests)"""
+    with _stores_lock:
+        stores = list(_stores.values())
+        _stores.clear()
+    
+    for store in stores:
+        store.close()
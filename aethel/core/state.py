@@ -14,11 +14,35 @@ Philosophy: "State is not stored. State is proved."
 
 import hashlib
 import json
+from array import array
+from collections.abc import Mapping
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
 
+class AccountsView(Mapping):
+    """Read-only address -> account dict view over a MerkleStateTree"""
+    
+    def __init__(self, tree: "MerkleStateTree"):
+        self._tree = tree
+    
+    def __getitem__(self, address: str) -> Dict[str, Any]:
+        account = self._tree.get_account(address)
+        if account is None:
+            raise KeyError(address)
+        return account
+    
+    def __iter__(self):
+        return iter(self._tree._addresses)
+    
+    def __len__(self) -> int:
+        return len(self._tree._addresses)
+    
+    def __contains__(self, address) -> bool:
+        return address in self._tree._index
+
+
 class MerkleStateTree:
     """
     Authenticated State Tree using Merkle Tree structure.
@@ -29,34 +53,117 @@ class MerkleStateTree:
     - hash: SHA-256(balance + nonce)
     
     The root hash represents the entire global state.
+    
+    Accounts live in a columnar table rather than one dict each:
+    - address -> row index map
+    - balances and nonces in int64 arrays (balances fall back to Python
+      ints if a value ever exceeds int64)
+    - leaf and interior hashes packed 32 bytes per node in one bytearray
+    
+    Leaves are ordered by row (account creation order, which is part of
+    the replicated state), so updating an account rehashes one path:
+    O(log n) per update instead of rehashing every account. The total
+    supply is a running counter updated on every balance change.
     """
     
+    EMPTY_ROOT = hashlib.sha256(b"empty").hexdigest()
+    NODE_SIZE = 32
+    _EMPTY_NODE = bytes(NODE_SIZE)
+    
     def __init__(self):
-        self.accounts = {}  # address -> {balance, nonce, hash}
+        self._index: Dict[str, int] = {}  # address -> row
+        self._addresses: List[str] = []
+        self._balances = array('q')
+        self._nonces = array('q')
+        self._public_keys: List[str] = []
+        self._total_supply = 0
+        
+        # Binary tree over rows: node k at [k*32, (k+1)*32), leaves at capacity + row
+        self._capacity = 0
+        self._tree = bytearray()
+        
         self.root_hash = None
         self.history = []  # List of (root_hash, timestamp, operation)
     
+    @property
+    def accounts(self) -> AccountsView:
+        """Address -> account dict view (accounts are materialized on access)"""
+        return AccountsView(self)
+    
     def _hash_account(self, balance: int, nonce: int, public_key: str = "") -> str:
         """Generate hash for account state (v2.2.0: includes public_key)"""
         data = f"{balance}:{nonce}:{public_key}"
         return hashlib.sha256(data.encode()).hexdigest()
     
+    def _node(self, k: int) -> bytes:
+        return bytes(self._tree[k * self.NODE_SIZE:(k + 1) * self.NODE_SIZE])
+    
+    def _set_node(self, k: int, digest: bytes):
+        self._tree[k * self.NODE_SIZE:(k + 1) * self.NODE_SIZE] = digest
+    
+    def _current_root(self) -> str:
+        if not self._addresses:
+            return self.EMPTY_ROOT
+        return self._node(1).hex()
+    
     def _calculate_root(self) -> str:
-        """Calculate Merkle root from all accounts"""
-        if not self.accounts:
-            return hashlib.sha256(b"empty").hexdigest()
+        """Rebuild the whole tree from the leaves (O(n)) and return the root"""
+        count = len(self._addresses)
+        capacity = 1
+        while capacity < count:
+            capacity *= 2
+        
+        self._capacity = capacity
+        self._tree = bytearray(2 * capacity * self.NODE_SIZE)
         
-        # Sort accounts by address for deterministic ordering
-        sorted_accounts = sorted(self.accounts.items())
+        for row in range(count):
+            self._set_node(capacity + row, self._leaf_digest(row))
         
-        # Combine all account hashes
-        combined = ""
-        for address, account in sorted_accounts:
-            combined += account['hash']
+        for k in range(capacity - 1, 0, -1):
+            self._set_node(k, hashlib.sha256(self._node(2 * k) + self._node(2 * k + 1)).digest())
         
-        # Generate root hash
-        root = hashlib.sha256(combined.encode()).hexdigest()
-        return root
+        return self._current_root()
+    
+    def _leaf_digest(self, row: int) -> bytes:
+        data = f"{self._balances[row]}:{self._nonces[row]}:{self._public_keys[row]}"
+        return hashlib.sha256(data.encode()).digest()
+    
+    def _update_path(self, row: int):
+        """Rehash one leaf and its ancestors: O(log n)"""
+        k = self._capacity + row
+        self._set_node(k, self._leaf_digest(row))
+        k //= 2
+        while k >= 1:
+            self._set_node(k, hashlib.sha256(self._node(2 * k) + self._node(2 * k + 1)).digest())
+            k //= 2
+    
+    def _set_balance(self, row: int, balance: int):
+        try:
+            self._balances[row] = balance
+        except OverflowError:
+            self._balances = list(self._balances)
+            self._balances[row] = balance
+    
+    def _append_row(self, address: str, balance: int, nonce: int, public_key: str) -> int:
+        row = len(self._addresses)
+        self._index[address] = row
+        self._addresses.append(address)
+        try:
+            self._balances.append(balance)
+        except OverflowError:
+            self._balances = list(self._balances)
+            self._balances.append(balance)
+        self._nonces.append(nonce)
+        self._public_keys.append(public_key)
+        self._total_supply += balance
+        return row
+    
+    def _set_row(self, row: int, balance: int, nonce: int):
+        """Overwrite a row, keeping the supply counter and tree in sync"""
+        self._total_supply += balance - self._balances[row]
+        self._set_balance(row, balance)
+        self._nonces[row] = nonce
+        self._update_path(row)
     
     def create_account(self, address: str, initial_balance: int = 0, public_key: str = "") -> str:
         """
@@ -70,21 +177,18 @@ class MerkleStateTree:
         Returns:
             Account hash
         """
-        if address in self.accounts:
+        if address in self._index:
             raise ValueError(f"Account {address} already exists")
         
-        account_hash = self._hash_account(initial_balance, 0, public_key)
-        
-        self.accounts[address] = {
-            'balance': initial_balance,
-            'nonce': 0,
-            'public_key': public_key,  # v2.2.0: Store public key
-            'hash': account_hash
-        }
+        row = self._append_row(address, initial_balance, 0, public_key)
         
-        # Update root
+        # Update root (grow the tree when the new row does not fit)
         old_root = self.root_hash
-        self.root_hash = self._calculate_root()
+        if row >= self._capacity:
+            self.root_hash = self._calculate_root()
+        else:
+            self._update_path(row)
+            self.root_hash = self._current_root()
         
         # Record history
         self.history.append({
@@ -96,11 +200,25 @@ class MerkleStateTree:
             'timestamp': datetime.now().isoformat()
         })
         
-        return account_hash
+        return self._node(self._capacity + row).hex()
     
     def get_account(self, address: str) -> Optional[Dict[str, Any]]:
         """Get account state"""
-        return self.accounts.get(address)
+        row = self._index.get(address)
+        if row is None:
+            return None
+        
+        return {
+            'balance': self._balances[row],
+            'nonce': self._nonces[row],
+            'public_key': self._public_keys[row],
+            'hash': self._node(self._capacity + row).hex()
+        }
+    
+    def get_balance(self, address: str) -> Optional[int]:
+        """Get account balance without materializing the account"""
+        row = self._index.get(address)
+        return self._balances[row] if row is not None else None
     
     def update_account(self, address: str, new_balance: int) -> str:
         """
@@ -109,28 +227,20 @@ class MerkleStateTree:
         Returns:
             New account hash
         """
-        if address not in self.accounts:
+        row = self._index.get(address)
+        if row is None:
             raise ValueError(f"Account {address} does not exist")
         
-        account = self.accounts[address]
-        old_balance = account['balance']
-        old_nonce = account['nonce']
-        public_key = account.get('public_key', '')  # v2.2.0: Preserve public key
+        old_balance = self._balances[row]
+        old_nonce = self._nonces[row]
         
         # Update account
         new_nonce = old_nonce + 1
-        new_hash = self._hash_account(new_balance, new_nonce, public_key)
-        
-        self.accounts[address] = {
-            'balance': new_balance,
-            'nonce': new_nonce,
-            'public_key': public_key,  # v2.2.0: Preserve public key
-            'hash': new_hash
-        }
+        self._set_row(row, new_balance, new_nonce)
         
         # Update root
         old_root = self.root_hash
-        self.root_hash = self._calculate_root()
+        self.root_hash = self._current_root()
         
         # Record history
         self.history.append({
@@ -145,29 +255,41 @@ class MerkleStateTree:
             'timestamp': datetime.now().isoformat()
         })
         
-        return new_hash
+        return self._node(self._capacity + row).hex()
+    
+    def revert_account(self, address: str, balance: int, nonce: int):
+        """Restore an account's previous balance and nonce (transfer rollback)"""
+        self._set_row(self._index[address], balance, nonce)
+        self.root_hash = self._current_root()
     
     def get_total_supply(self) -> int:
-        """Calculate total supply (sum of all balances)"""
-        return sum(account['balance'] for account in self.accounts.values())
+        """Total supply (sum of all balances), maintained incrementally"""
+        return self._total_supply
     
     def get_merkle_proof(self, address: str) -> Dict[str, Any]:
         """
         Generate Merkle proof for account inclusion.
         
-        Returns proof that account exists in state tree.
+        Returns proof that account exists in state tree, including the
+        sibling hashes from the account's leaf up to the root.
         """
-        if address not in self.accounts:
+        row = self._index.get(address)
+        if row is None:
             raise ValueError(f"Account {address} does not exist")
         
-        account = self.accounts[address]
+        siblings = []
+        k = self._capacity + row
+        while k > 1:
+            siblings.append(self._node(k ^ 1).hex())
+            k //= 2
         
-        # Simplified proof (in production, would include sibling hashes)
         proof = {
             'address': address,
-            'balance': account['balance'],
-            'nonce': account['nonce'],
-            'account_hash': account['hash'],
+            'balance': self._balances[row],
+            'nonce': self._nonces[row],
+            'account_hash': self._node(self._capacity + row).hex(),
+            'leaf_index': row,
+            'siblings': siblings,
             'root_hash': self.root_hash,
             'timestamp': datetime.now().isoformat()
         }
@@ -178,11 +300,9 @@ class MerkleStateTree:
         """Verify Merkle proof is valid"""
         address = proof['address']
         
-        if address not in self.accounts:
+        if address not in self._index:
             return False
         
-        account = self.accounts[address]
-        
         # Verify account hash
         expected_hash = self._hash_account(proof['balance'], proof['nonce'])
         if expected_hash != proof['account_hash']:
@@ -192,21 +312,43 @@ class MerkleStateTree:
         if self.root_hash != proof['root_hash']:
             return False
         
+        # Verify inclusion path
+        if 'siblings' in proof:
+            digest = bytes.fromhex(proof['account_hash'])
+            k = proof['leaf_index'] + (1 << len(proof['siblings']))
+            for sibling in proof['siblings']:
+                pair = (digest + bytes.fromhex(sibling)) if k % 2 == 0 else (bytes.fromhex(sibling) + digest)
+                digest = hashlib.sha256(pair).digest()
+                k //= 2
+            if digest.hex() != proof['root_hash']:
+                return False
+        
         return True
     
     def snapshot(self) -> Dict[str, Any]:
         """Create snapshot of current state"""
         return {
             'root_hash': self.root_hash,
-            'accounts': self.accounts.copy(),
+            'accounts': {address: self.get_account(address) for address in self._addresses},
             'total_supply': self.get_total_supply(),
             'timestamp': datetime.now().isoformat()
         }
     
     def restore(self, snapshot: Dict[str, Any]):
-        """Restore state from snapshot"""
-        self.root_hash = snapshot['root_hash']
-        self.accounts = snapshot['accounts'].copy()
+        """Restore state from snapshot (rows keep the snapshot's account order)"""
+        history = self.history
+        self.__init__()
+        self.history = history
+        
+        for address, account in snapshot['accounts'].items():
+            self._append_row(
+                address,
+                account['balance'],
+                account.get('nonce', 0),
+                account.get('public_key', '')
+            )
+        
+        self.root_hash = self._calculate_root() if self._addresses else snapshot['root_hash']
 
 
 class StateTransitionEngine:
@@ -247,6 +389,10 @@ class StateTransitionEngine:
         """
         Apply transfer with conservation proof.
         
+        O(log n): two account updates each rehash one tree path, the
+        supply check reads the running counter, and rollback restores the
+        two touched rows instead of copying the whole state.
+        
         Returns:
             (success, old_root, new_root)
         """
@@ -277,8 +423,11 @@ class StateTransitionEngine:
             self._log('ERROR', f"Invalid amount: {amount}")
             return False, old_root, old_root
         
-        # Create snapshot for rollback
-        snapshot = self.state_tree.snapshot()
+        # Previous rows for rollback (reverted in reverse order)
+        undo = [
+            (sender, sender_account['balance'], sender_account['nonce']),
+            (receiver, receiver_account['balance'], receiver_account['nonce'])
+        ]
         
         try:
             # Apply transfer
@@ -294,7 +443,7 @@ class StateTransitionEngine:
             if new_supply != old_supply:
                 self._log('ERROR', f"Conservation violated: {old_supply} != {new_supply}")
                 # Rollback
-                self.state_tree.restore(snapshot)
+                self._rollback(undo)
                 return False, old_root, old_root
             
             self._log('CONSERVATION', f"Total supply conserved: {old_supply} == {new_supply}")
@@ -309,9 +458,14 @@ class StateTransitionEngine:
         except Exception as e:
             self._log('ERROR', f"Transfer failed: {e}")
             # Rollback
-            self.state_tree.restore(snapshot)
+            self._rollback(undo)
             return False, old_root, old_root
     
+    def _rollback(self, undo: List[Tuple[str, int, int]]):
+        """Restore rows touched by a failed transfer"""
+        for address, balance, nonce in reversed(undo):
+            self.state_tree.revert_account(address, balance, nonce)
+    
     def verify_conservation(self, expected_supply: int) -> bool:
         """Verify total supply matches expected value"""
         actual_supply = self.state_tree.get_total_supply()
@@ -397,8 +551,7 @@ class AethelStateManager:
     
     def get_account_balance(self, address: str) -> Optional[int]:
         """Get account balance"""
-        account = self.state_tree.get_account(address)
-        return account['balance'] if account else None
+        return self.state_tree.get_balance(address)
     
     def get_total_supply(self) -> int:
         """Get total supply"""
@@ -0,0 +1,433 @@
+"""
+Aethel Stream Processor - Synchrony Protocol v1.8.0
+
+Streaming front end for the BatchProcessor. Transactions are submitted one
+at a time and grouped into micro-batches that close when they reach a size
+limit or when their oldest transaction has waited for the latency bound,
+so clients get bounded latency without assembling large batches.
+
+The pipeline runs in two stages on two threads:
+- Ingest: forms micro-batch k+1 and runs dependency analysis and conflict
+  detection on it
+- Commit: executes, proves and commits micro-batch k
+
+Micro-batches commit strictly in order. Account states committed by one
+micro-batch are carried into the next, overriding the snapshot a client
+submitted for the same account. A committed state is kept only while a
+submitted transaction still refers to its account, or while it belongs to
+the latest micro-batch, so a long-running stream does not accumulate
+every account it has ever seen. In analyzed mode a transaction that
+conflicts with the micro-batch being formed (it writes an account the
+batch reads or writes, or reads one the batch writes) closes that batch
+and opens the next one, so conflicting transactions are ordered by the
+pipeline instead of being rejected as a circular dependency. Shared reads
+and shared credit-only accounts that the DependencyAnalyzer will split do
+not close a batch.
+
+Author: Aethel Team
+Version: 1.8.0
+Date: February 4, 2026
+"""
+
+from typing import List, Dict, Set, Optional, Any, Tuple
+from collections import deque
+from concurrent.futures import Future
+import queue
+import threading
+import time
+
+from aethel.core.synchrony import Transaction, BatchResult
+from aethel.core.batch_processor import BatchProcessor
+
+
+# Queue marker that shuts a pipeline stage down
+_STOP = object()
+
+
+class _MicroBatch:
+    """A closed micro-batch travelling through the pipeline"""
+    
+    def __init__(self, transactions: List[Transaction], futures: List[Future]):
+        self.transactions = transactions
+        self.futures = futures
+        self.start_time = time.time()
+        self.dependency_graph: Any = None
+        self.conflicts: List[Any] = []
+        self.error: Optional[Exception] = None
+
+
+class StreamingBatchProcessor:
+    """
+    Continuous micro-batching over a BatchProcessor.
+    
+    submit() returns a Future that resolves to the BatchResult of the
+    micro-batch the transaction was committed in.
+    
+    Example:
+        with StreamingBatchProcessor(max_batch_size=128) as stream:
+            futures = [stream.submit(tx) for tx in incoming]
+            results = [f.result() for f in futures]
+    """
+    
+    def __init__(self,
+                 processor: Optional[BatchProcessor] = None,
+                 max_batch_size: int = 256,
+                 max_latency_seconds: float = 0.005):
+        """
+        Initialize stream processor.
+        
+        Args:
+            processor: BatchProcessor running the stages (default: new one)
+            max_batch_size: Largest micro-batch (default 256)
+            max_latency_seconds: Longest a transaction waits for its
+                micro-batch to fill (default 5ms)
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.processor = processor or BatchProcessor()
+        self.max_batch_size = max_batch_size
+        self.max_latency_seconds = max_latency_seconds
+        
+        self._incoming: "queue.Queue[Any]" = queue.Queue()
+        # One analyzed batch may wait while the previous one commits
+        self._analyzed: "queue.Queue[Any]" = queue.Queue(maxsize=1)
+        self._committed_states: Dict[str, Any] = {}
+        # account -> submitted transactions touching it that have not committed
+        self._in_flight_accounts: Dict[str, int] = {}
+        self._latest_accounts: Set[str] = set()
+        self._outstanding: Set[Future] = set()
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._accepting = False
+        self.stats: Dict[str, Any] = {
+            "transactions": 0,
+            "batches": 0,
+            "failed_batches": 0,
+            "conflict_cuts": 0,
+            "max_batch_size": 0,
+        }
+    
+    def start(self) -> "StreamingBatchProcessor":
+        """Start the pipeline threads (idempotent)"""
+        with self._lock:
+            if self._threads:
+                return self
+            self._threads = [
+                threading.Thread(target=self._ingest_loop, name="aethel-stream-ingest", daemon=True),
+                threading.Thread(target=self._commit_loop, name="aethel-stream-commit", daemon=True),
+            ]
+            self._accepting = True
+        for thread in self._threads:
+            thread.start()
+        return self
+    
+    def submit(self, transaction: Transaction) -> Future:
+        """
+        Queue a transaction for the next micro-batch.
+        
+        Args:
+            transaction: Transaction to execute
+        
+        Returns:
+            Future resolving to the BatchResult of its micro-batch
+        
+        Raises:
+            RuntimeError: If the stream has been stopped
+        """
+        if not self._threads:
+            self.start()
+        future: Future = Future()
+        with self._lock:
+            if not self._accepting:
+                raise RuntimeError("StreamingBatchProcessor is stopped")
+            self._outstanding.add(future)
+            for account_id in transaction.accounts:
+                self._in_flight_accounts[account_id] = self._in_flight_accounts.get(account_id, 0) + 1
+        future.add_done_callback(self._forget)
+        self._incoming.put((transaction, future))
+        return future
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every transaction submitted so far has been committed.
+        
+        Args:
+            timeout: Seconds to wait (None = no limit)
+        
+        Returns:
+            True if everything finished before the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            pending = list(self._outstanding)
+        for future in pending:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                future.exception(timeout=remaining)
+            except Exception:
+                return False
+        return True
+    
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop accepting transactions, drain the pipeline and join its threads"""
+        with self._lock:
+            if not self._accepting:
+                return
+            self._accepting = False
+        self._incoming.put(_STOP)
+        for thread in self._threads:
+            thread.join(timeout)
+    
+    def get_account_state(self, account_id: str) -> Any:
+        """
+        Last committed state of an account (None if never committed).
+        
+        Only accounts of the latest micro-batch or of transactions still in
+        flight are remembered.
+        """
+        with self._lock:
+            return self._committed_states.get(account_id)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Micro-batching statistics"""
+        with self._lock:
+            stats = dict(self.stats)
+        stats["avg_batch_size"] = stats["transactions"] / stats["batches"] if stats["batches"] else 0.0
+        return stats
+    
+    def _forget(self, future: Future) -> None:
+        with self._lock:
+            self._outstanding.discard(future)
+    
+    # ------------------------------------------------------------------
+    # Ingest stage
+    # ------------------------------------------------------------------
+    
+    def _ingest_loop(self) -> None:
+        """Form micro-batches and analyze them"""
+        analyzed = not self.processor.optimistic
+        carried: "deque[Any]" = deque()
+        while True:
+            item = carried.popleft() if carried else self._incoming.get()
+            if item is _STOP:
+                break
+            
+            items: List[Tuple[Transaction, Future]] = []
+            credited_sets: List[Set[str]] = []
+            reads: Set[str] = set()
+            writes: Set[str] = set()
+            credited: Set[str] = set()
+            deadline = time.monotonic() + self.max_latency_seconds
+            while True:
+                if analyzed:
+                    tx_reads, tx_writes, tx_credited = self._access(item[0])
+                    if items and (
+                        tx_writes & (reads | writes)
+                        or tx_reads & writes
+                        or (tx_reads | tx_writes) & credited
+                        or tx_credited & (reads | writes)
+                    ):
+                        # Order the conflict across micro-batches instead
+                        carried.appendleft(item)
+                        with self._lock:
+                            self.stats["conflict_cuts"] += 1
+                        break
+                    reads |= tx_reads
+                    writes |= tx_writes
+                    credited |= tx_credited
+                    credited_sets.append(tx_credited)
+                items.append(item)
+                if len(items) >= self.max_batch_size:
+                    break
+                if carried:
+                    item = carried.popleft()
+                else:
+                    remaining = deadline - time.monotonic()
+                    try:
+                        item = self._incoming.get(timeout=remaining) if remaining > 0 else self._incoming.get_nowait()
+                    except queue.Empty:
+                        break
+                if item is _STOP:
+                    carried.appendleft(item)
+                    break
+            
+            if analyzed:
+                released = self._release_unsplit_credits(items, credited_sets)
+                if released:
+                    carried.extendleft(reversed(released))
+                    with self._lock:
+                        self.stats["conflict_cuts"] += 1
+            
+            transactions = [transaction for transaction, _ in items]
+            futures = [future for _, future in items]
+            self._analyzed.put(self._analyze(_MicroBatch(transactions, futures)))
+        
+        self._analyzed.put(_STOP)
+    
+    def _access(self, transaction: Transaction) -> Tuple[Set[str], Set[str], Set[str]]:
+        """
+        Read set, write set and credit-only accounts of a transaction.
+        
+        Accounts the transaction only credits are returned separately:
+        credits commute, so the analyzer may split them instead of
+        ordering the transactions that share them.
+        """
+        analyzer = self.processor.dependency_analyzer
+        reads, writes = analyzer.extract_read_write_sets(transaction)
+        if analyzer.hot_account_threshold is None:
+            return reads, writes, set()
+        credited = {account_id for account_id in writes if analyzer.is_credit_only(transaction, account_id)}
+        return reads - credited, writes - credited, credited
+    
+    def _release_unsplit_credits(
+        self,
+        items: List[Tuple[Transaction, Future]],
+        credited_sets: List[Set[str]]
+    ) -> List[Tuple[Transaction, Future]]:
+        """
+        Drop transactions from a closed batch until every credit-only
+        account it shares is hot enough for the analyzer to split.
+        
+        A shared credit-only account below the hot-account threshold is an
+        ordinary write conflict to the analyzer, so only its first toucher
+        stays. Batch members do not otherwise conflict, so the dropped
+        transactions can run in the next micro-batch.
+        
+        Returns:
+            Dropped items in submission order (items is updated in place)
+        """
+        threshold = self.processor.dependency_analyzer.hot_account_threshold
+        if threshold is None:
+            return []
+        
+        kept = list(range(len(items)))
+        while True:
+            counts: Dict[str, int] = {}
+            for index in kept:
+                for account_id in credited_sets[index]:
+                    counts[account_id] = counts.get(account_id, 0) + 1
+            cold = {account_id for account_id, count in counts.items() if 1 < count < threshold}
+            if not cold:
+                break
+            claimed: Set[str] = set()
+            still_kept = []
+            for index in kept:
+                shared = credited_sets[index] & cold
+                if not shared & claimed:
+                    claimed |= shared
+                    still_kept.append(index)
+            kept = still_kept
+        
+        if len(kept) == len(items):
+            return []
+        kept_set = set(kept)
+        released = [item for index, item in enumerate(items) if index not in kept_set]
+        items[:] = [items[index] for index in kept]
+        return released
+    
+    def _analyze(self, batch: _MicroBatch) -> _MicroBatch:
+        """Run stages 1-2 for a micro-batch (no-op in optimistic mode)"""
+        if not self.processor.optimistic:
+            try:
+                batch.dependency_graph, batch.conflicts = self.processor._analyze(batch.transactions)
+            except Exception as error:
+                batch.error = error
+        return batch
+    
+    # ------------------------------------------------------------------
+    # Commit stage
+    # ------------------------------------------------------------------
+    
+    def _commit_loop(self) -> None:
+        """Execute, prove and commit analyzed micro-batches in order"""
+        while True:
+            batch = self._analyzed.get()
+            if batch is _STOP:
+                break
+            result = self._commit(batch)
+            with self._lock:
+                self.stats["batches"] += 1
+                self.stats["transactions"] += len(batch.transactions)
+                self.stats["max_batch_size"] = max(self.stats["max_batch_size"], len(batch.transactions))
+                if not result.success:
+                    self.stats["failed_batches"] += 1
+                self._retire(batch)
+            for future in batch.futures:
+                future.set_result(result)
+    
+    def _retire(self, batch: _MicroBatch) -> None:
+        """Forget committed states nothing in flight refers to (caller holds the lock)"""
+        for transaction in batch.transactions:
+            for account_id in transaction.accounts:
+                remaining = self._in_flight_accounts[account_id] - 1
+                if remaining:
+                    self._in_flight_accounts[account_id] = remaining
+                else:
+                    del self._in_flight_accounts[account_id]
+        
+        stale = [
+            account_id for account_id in self._committed_states
+            if account_id not in self._in_flight_accounts and account_id not in self._latest_accounts
+        ]
+        for account_id in stale:
+            del self._committed_states[account_id]
+    
+    def _commit(self, batch: _MicroBatch) -> BatchResult:
+        """Run stages 3-6 for a micro-batch, carrying committed states forward"""
+        processor = self.processor
+        initial_states = processor._capture_initial_states(batch.transactions)
+        with self._lock:
+            for account_id in initial_states:
+                if account_id in self._committed_states:
+                    initial_states[account_id] = self._committed_states[account_id]
+        
+        try:
+            if batch.error is not None:
+                raise batch.error
+            if processor.optimistic:
+                result, final_states = processor._execute_optimistic(
+                    batch.transactions,
+                    initial_states,
+                    batch.start_time
+                )
+            else:
+                result, final_states = processor._execute_analyzed(
+                    batch.transactions,
+                    initial_states,
+                    batch.dependency_graph,
+                    batch.conflicts,
+                    batch.start_time
+                )
+        except Exception as error:
+            return processor._create_error_result(
+                transactions=batch.transactions,
+                error=error,
+                start_time=batch.start_time,
+                initial_states=initial_states
+            )
+        
+        if result.success:
+            with self._lock:
+                self._committed_states.update(final_states)
+                self._latest_accounts = set(final_states)
+        return result
+    
+    def __enter__(self):
+        """Context manager entry"""
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.stop()
+        return False
+
+
+# ============================================================================
+# MODULE INFO
+# ============================================================================
+
+__version__ = "1.8.0"
+__author__ = "Aethel Team"
+__all__ = [
+    "StreamingBatchProcessor",
+]
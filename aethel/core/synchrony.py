@@ -158,6 +158,18 @@ class OracleValidationError(Exception):
 # DATA MODELS
 # ============================================================================
 
+@dataclass(frozen=True)
+class Credit:
+    """
+    Commutative balance update: add amount to an account (negative debits).
+    
+    Credits to the same account commute, so transactions that only credit
+    a hot account do not have to be ordered against each other.
+    """
+    account_id: str
+    amount: Any
+
+
 @dataclass
 class Transaction:
     """Represents a single transaction in a batch"""
@@ -171,6 +183,8 @@ class Transaction:
     # Cached read/write sets for performance
     _read_set: Optional[Set[str]] = field(default=None, init=False, repr=False)
     _write_set: Optional[Set[str]] = field(default=None, init=False, repr=False)
+    # Exact write set from static analysis (may be empty); None = derive from operations
+    _static_write_set: Optional[Set[str]] = field(default=None, init=False, repr=False)
     
     def get_read_set(self) -> Set[str]:
         """Return set of account IDs read by this transaction"""
@@ -255,6 +269,8 @@ class ExecutionResult:
     parallel_groups: List[Set[str]]  # Groups executed in parallel
     execution_time: float  # Total execution time in seconds
     thread_count: int  # Number of threads used
+    # Split hot account -> per-worker partial credit sums merged into final_states
+    accumulators: Dict[str, List[Any]] = field(default_factory=dict)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -263,7 +279,8 @@ class ExecutionResult:
             "execution_trace": [e.to_dict() for e in self.execution_trace],
             "parallel_groups": [list(g) for g in self.parallel_groups],
             "execution_time": self.execution_time,
-            "thread_count": self.thread_count
+            "thread_count": self.thread_count,
+            "accumulators": self.accumulators
         }
 
 
@@ -355,6 +372,7 @@ __all__ = [
     "ConflictResolutionError",
     "OracleValidationError",
     # Data Models
+    "Credit",
     "Transaction",
     "Conflict",
     "ExecutionEvent",
@@ -4,6 +4,8 @@ import os
 from datetime import datetime
 from pathlib import Path
 
+from aethel.core.vault_store import PackedBundleStore, IncrementalMerkleRoot, RecordView
+
 
 class AethelVault:
     """
@@ -11,14 +13,24 @@ class AethelVault:
     
     Funções são identificadas por seu conteúdo lógico (AST), não por nome.
     Uma vez provada, uma função é imutável e eterna.
+    
+    Entradas novas vão para packfiles comprimidos (vault_store); entradas
+    antigas (um JSON por função + index.json) continuam legíveis.
     """
     
     def __init__(self, vault_path=".aethel_vault"):
         self.vault_path = Path(vault_path)
         self.vault_path.mkdir(exist_ok=True)
         
+        # Armazenamento empacotado (corpo das entradas carregado sob demanda)
+        self.packs = PackedBundleStore(str(self.vault_path / "packs"))
+        
         # Índice em memória para acesso rápido
         self.index = self._load_index()
+        self.index.update(self.packs.summaries)
+        
+        # Raiz de Merkle mantida incrementalmente
+        self.merkle = IncrementalMerkleRoot(self.index.keys())
         
         print(f"Vault inicializado em: {self.vault_path.absolute()}")
         print(f"Funcoes no cofre: {len(self.index)}")
@@ -91,17 +103,13 @@ class AethelVault:
             'created_at': datetime.now().isoformat()
         }
         
-        # Salvar no disco
-        self._save_entry(full_hash, entry)
-        
-        # Atualizar índice
-        self.index[full_hash] = {
+        # Salvar no disco e atualizar índice
+        self._save_entry(full_hash, entry, {
             'intent_name': intent_name,
             'logic_hash': logic_hash,
             'created_at': entry['created_at'],
             'status': 'MATHEMATICALLY_PROVED'
-        }
-        self._save_index()
+        })
         
         print(f"\nFuncao imortalizada no Cofre:")
         print(f"   Intent: {intent_name}")
@@ -121,6 +129,17 @@ class AethelVault:
         entry = self._load_entry(function_hash)
         return entry
     
+    def open_entry(self, function_hash):
+        """
+        Abre uma função sem desserializá-la por inteiro.
+        
+        Entradas empacotadas retornam um RecordView (campos decodificados
+        sob demanda); entradas antigas retornam o dict completo.
+        """
+        if function_hash in self.packs:
+            return self.packs.view(function_hash)
+        return self.fetch(function_hash)
+    
     def find_by_logic(self, intent_data):
         """
         Busca funções com lógica idêntica, independente do nome.
@@ -142,10 +161,14 @@ class AethelVault:
         
         Recalcula o hash e compara com o armazenado.
         """
-        entry = self.fetch(function_hash)
+        entry = self.open_entry(function_hash)
         if not entry:
             return False
         
+        if isinstance(entry, RecordView):
+            # AST armazenado em JSON canônico: hash direto sobre os bytes
+            return entry.sha256('ast') == function_hash
+        
         # Recalcular hash
         calculated_hash = self.get_function_hash(entry['ast'])
         
@@ -196,14 +219,18 @@ class AethelVault:
         
         print(f"📤 Função exportada para: {output_path}")
     
-    def _save_entry(self, function_hash, entry):
-        """Salva entrada no disco"""
-        entry_path = self.vault_path / f"{function_hash}.json"
-        with open(entry_path, 'w') as f:
-            json.dump(entry, f, indent=2)
+    def _save_entry(self, function_hash, entry, index_entry):
+        """Salva entrada no pack e registra no índice (sem reescrever o índice)"""
+        self.packs.put(function_hash, entry, index_entry)
+        self.index[function_hash] = index_entry
+        self.merkle.add(function_hash)
     
     def _load_entry(self, function_hash):
         """Carrega entrada do disco"""
+        if function_hash in self.packs:
+            return self.packs.get(function_hash)
+        
+        # Entrada antiga: um arquivo JSON por função
         entry_path = self.vault_path / f"{function_hash}.json"
         if not entry_path.exists():
             return None
@@ -211,14 +238,8 @@ class AethelVault:
         with open(entry_path, 'r') as f:
             return json.load(f)
     
-    def _save_index(self):
-        """Salva índice no disco"""
-        index_path = self.vault_path / "index.json"
-        with open(index_path, 'w') as f:
-            json.dump(self.index, f, indent=2)
-    
     def _load_index(self):
-        """Carrega índice do disco"""
+        """Carrega índice antigo do disco"""
         index_path = self.vault_path / "index.json"
         if not index_path.exists():
             return {}
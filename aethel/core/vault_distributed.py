@@ -11,6 +11,7 @@ import hashlib
 from datetime import datetime
 from pathlib import Path
 from aethel.core.vault import AethelVault
+from aethel.core.vault_store import encode_record, is_record_file, open_record
 
 
 class AethelDistributedVault(AethelVault):
@@ -21,7 +22,7 @@ class AethelDistributedVault(AethelVault):
     - Proof certificates (digital stamps of verification)
     - Export bundles (.ae_bundle files)
     - Import with integrity verification
-    - Merkle tree organization (future)
+    - Merkle tree organization
     """
     
     def __init__(self, vault_path=".aethel_vault"):
@@ -102,7 +103,7 @@ class AethelDistributedVault(AethelVault):
         except Exception as e:
             return False, f"Verification error: {e}"
     
-    def export_bundle(self, function_hash, output_path=None):
+    def export_bundle(self, function_hash, output_path=None, packed=False):
         """
         Generates a .ae_bundle file containing:
         - AST (the logic)
@@ -111,6 +112,10 @@ class AethelDistributedVault(AethelVault):
         - Metadata
         
         This bundle can be shared globally and imported by anyone.
+        
+        With packed=True the bundle is written as a field record instead of
+        JSON. The runtime memory-maps packed bundles and verifies them
+        without deserializing the code or metadata.
         """
         # Fetch function from vault
         entry = self.fetch(function_hash)
@@ -151,8 +156,12 @@ class AethelDistributedVault(AethelVault):
         if output_path is None:
             output_path = self.bundles_path / f"{entry['intent_name']}_{function_hash[:8]}.ae_bundle"
         
-        with open(output_path, 'w') as f:
-            json.dump(bundle, f, indent=2)
+        if packed:
+            with open(output_path, 'wb') as f:
+                f.write(encode_record(bundle))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(bundle, f, indent=2)
         
         print(f"Bundle exported: {output_path}")
         print(f"  Intent: {entry['intent_name']}")
@@ -177,9 +186,12 @@ class AethelDistributedVault(AethelVault):
         """
         print(f"Importing bundle: {bundle_path}")
         
-        # Load bundle
-        with open(bundle_path, 'r') as f:
-            bundle = json.load(f)
+        # Load bundle (packed or JSON)
+        if is_record_file(bundle_path):
+            bundle = open_record(bundle_path).to_dict()
+        else:
+            with open(bundle_path, 'r') as f:
+                bundle = json.load(f)
         
         function_hash = bundle['function_hash']
         intent_name = bundle['intent_name']
@@ -234,18 +246,14 @@ class AethelDistributedVault(AethelVault):
             'imported_from': str(bundle_path)
         }
         
-        # Save entry
-        self._save_entry(function_hash, entry)
-        
-        # Update index
-        self.index[function_hash] = {
+        # Save entry and update index
+        self._save_entry(function_hash, entry, {
             'intent_name': intent_name,
             'logic_hash': entry['logic_hash'],
             'created_at': entry['created_at'],
             'status': 'MATHEMATICALLY_PROVED',
             'imported': True
-        }
-        self._save_index()
+        })
         
         # Save certificate if present
         if bundle.get('certificate'):
@@ -271,19 +279,12 @@ class AethelDistributedVault(AethelVault):
         This allows efficient verification that a vault contains
         a specific set of functions without checking each one.
         
+        Maintained incrementally: each stored function rehashes one
+        logarithmic path (see IncrementalMerkleRoot).
+        
         Future: This will be used for P2P synchronization.
         """
-        if not self.index:
-            return None
-        
-        # Get all function hashes
-        hashes = sorted(self.index.keys())
-        
-        # Build Merkle tree (simplified - just hash of all hashes)
-        combined = ''.join(hashes)
-        merkle_root = hashlib.sha256(combined.encode()).hexdigest()
-        
-        return merkle_root
+        return self.merkle.root()
     
     def sync_status(self):
         """
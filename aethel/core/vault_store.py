@@ -0,0 +1,556 @@
+"""
+Vault Store - Packed Bundle Storage for the Truth DB
+v2.1.0
+
+Backend shared by ContentAddressableVault and AethelVault.
+
+Layout:
+    <root>/pack-00000.pack   Append-only compressed bundle bodies
+    <root>/pack-00001.pack   (a new pack is started past pack_size_limit)
+    <root>/index.log         Append-only offset index, one line per bundle
+
+Each index line is:
+    <hash> TAB <pack> TAB <offset> TAB <length> TAB <codec> TAB <summary JSON>
+
+Storing a bundle appends one body and one index line, so the cost of a
+store no longer grows with the size of the vault. Only the index (hash ->
+location + small summary) is held in memory; bundle bodies are read from
+their memory-mapped pack on fetch.
+
+Bodies are field records (see encode_record): an offset table followed by
+the raw field payloads. RecordView decodes single fields on demand and
+hashes fields directly on the stored bytes, so callers that only need the
+certificate or a content hash never deserialize the whole bundle.
+
+The vault Merkle root is maintained incrementally by IncrementalMerkleRoot.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+from pathlib import Path
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+CODEC_NONE = "none"
+CODEC_ZLIB = "zlib"
+CODEC_ZSTD = "zstd"
+
+DEFAULT_PACK_SIZE_LIMIT = 64 * 1024 * 1024
+
+
+def default_codec() -> str:
+    """Best codec available in this environment"""
+    return CODEC_ZSTD if ZSTD_AVAILABLE else CODEC_ZLIB
+
+
+def compress(data: bytes, codec: str) -> bytes:
+    if codec == CODEC_ZSTD:
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    if codec == CODEC_ZLIB:
+        return zlib.compress(data, 6)
+    if codec == CODEC_NONE:
+        return data
+    raise ValueError(f"Unknown vault codec: {codec}")
+
+
+def decompress(data: bytes, codec: str) -> bytes:
+    if codec == CODEC_ZSTD:
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("Bundle is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(data)
+    if codec == CODEC_NONE:
+        return data
+    raise ValueError(f"Unknown vault codec: {codec}")
+
+
+# Field record layout:
+#   b"AEF1" | u32 field count
+#   per field: u16 name length | name | u8 kind | u32 offset | u32 length
+#   field payloads
+# Strings are stored as raw UTF-8, everything else as canonical JSON
+# (sorted keys, compact separators) - the same bytes the vault hashes.
+
+RECORD_MAGIC = b"AEF1"
+KIND_TEXT = 0
+KIND_JSON = 1
+
+_RECORD_HEADER = struct.Struct("<4sI")
+_FIELD_NAME = struct.Struct("<H")
+_FIELD_ENTRY = struct.Struct("<BII")
+
+
+def canonical_json(value: Any) -> bytes:
+    """JSON encoding used for hashing throughout the vault"""
+    return json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def encode_record(fields: Dict[str, Any]) -> bytes:
+    """Encode a flat dict as a field record"""
+    encoded = []
+    for name, value in fields.items():
+        if isinstance(value, str):
+            encoded.append((name.encode("utf-8"), KIND_TEXT, value.encode("utf-8")))
+        else:
+            encoded.append((name.encode("utf-8"), KIND_JSON, canonical_json(value)))
+    
+    offset = _RECORD_HEADER.size + sum(
+        _FIELD_NAME.size + len(name) + _FIELD_ENTRY.size for name, _, _ in encoded
+    )
+    
+    parts = [_RECORD_HEADER.pack(RECORD_MAGIC, len(encoded))]
+    for name, kind, data in encoded:
+        parts.append(_FIELD_NAME.pack(len(name)))
+        parts.append(name)
+        parts.append(_FIELD_ENTRY.pack(kind, offset, len(data)))
+        offset += len(data)
+    parts.extend(data for _, _, data in encoded)
+    
+    return b"".join(parts)
+
+
+def is_record_file(path: str) -> bool:
+    """True if the file starts with the field record magic"""
+    with open(path, "rb") as f:
+        return f.read(len(RECORD_MAGIC)) == RECORD_MAGIC
+
+
+def open_record(path: str) -> "RecordView":
+    """Memory-map a field record file and return a lazy view over it"""
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return RecordView(mapped)
+
+
+class RecordView(Mapping):
+    """
+    Read-only mapping over an encoded field record.
+    
+    Only the offset table is parsed up front. Fields are decoded on first
+    access and cached; raw() and sha256() work on the stored bytes. Over a
+    memory map nothing is copied until a field is decoded.
+    """
+    
+    def __init__(self, buffer):
+        self._buffer = memoryview(buffer)
+        magic, count = _RECORD_HEADER.unpack_from(self._buffer, 0)
+        if magic != RECORD_MAGIC:
+            raise ValueError("Not a field record")
+        
+        # name -> (kind, offset, length)
+        self._fields: Dict[str, Tuple[int, int, int]] = {}
+        position = _RECORD_HEADER.size
+        for _ in range(count):
+            (name_length,) = _FIELD_NAME.unpack_from(self._buffer, position)
+            position += _FIELD_NAME.size
+            name = str(self._buffer[position:position + name_length], "utf-8")
+            position += name_length
+            kind, offset, length = _FIELD_ENTRY.unpack_from(self._buffer, position)
+            position += _FIELD_ENTRY.size
+            if offset + length > len(self._buffer):
+                raise ValueError(f"Field record truncated at '{name}'")
+            self._fields[name] = (kind, offset, length)
+        
+        self._decoded: Dict[str, Any] = {}
+    
+    def __getitem__(self, name: str) -> Any:
+        if name in self._decoded:
+            return self._decoded[name]
+        
+        kind = self._fields[name][0]
+        raw = self.raw(name)
+        value = str(raw, "utf-8") if kind == KIND_TEXT else json.loads(bytes(raw))
+        self._decoded[name] = value
+        return value
+    
+    def __iter__(self):
+        return iter(self._fields)
+    
+    def __len__(self) -> int:
+        return len(self._fields)
+    
+    def __contains__(self, name) -> bool:
+        return name in self._fields
+    
+    def raw(self, name: str) -> memoryview:
+        """Stored bytes of a field (UTF-8 text or canonical JSON), no copy"""
+        _, offset, length = self._fields[name]
+        return self._buffer[offset:offset + length]
+    
+    def sha256(self, name: str) -> str:
+        """SHA-256 of a field's stored bytes, without decoding it"""
+        return hashlib.sha256(self.raw(name)).hexdigest()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Decode every field"""
+        return {name: self[name] for name in self._fields}
+
+
+class PackedBundleStore:
+    """
+    Append-only packfile store addressed by content hash.
+    
+    Thread-safe: appends are serialized, reads go through read-only
+    memory maps of the packs (remapped when a pack has grown).
+    """
+    
+    INDEX_FILE = "index.log"
+    
+    def __init__(
+        self,
+        root: str,
+        codec: Optional[str] = None,
+        pack_size_limit: int = DEFAULT_PACK_SIZE_LIMIT
+    ):
+        """
+        Open (or create) a packed store.
+        
+        Args:
+            root: Directory holding packs and the offset index
+            codec: Compression for new bundles (zstd if available, else zlib)
+            pack_size_limit: Start a new pack once the current one reaches this size
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        
+        self.codec = codec or default_codec()
+        compress(b"", self.codec)  # Fail fast on an unusable codec
+        self.pack_size_limit = pack_size_limit
+        
+        self._lock = threading.Lock()
+        self._maps: Dict[int, mmap.mmap] = {}
+        
+        # hash -> (pack, offset, length, codec)
+        self._locations: Dict[str, Tuple[int, int, int, str]] = {}
+        self.summaries: Dict[str, Dict[str, Any]] = {}
+        self._load_index()
+        
+        packs = sorted(int(p.stem.split("-")[1]) for p in self.root.glob("pack-*.pack"))
+        self._pack_id = packs[-1] if packs else 0
+        self._pack_file = None
+        self._index_file = None
+    
+    def _pack_path(self, pack_id: int) -> Path:
+        return self.root / f"pack-{pack_id:05d}.pack"
+    
+    def _load_index(self) -> None:
+        index_path = self.root / self.INDEX_FILE
+        if not index_path.exists():
+            return
+        
+        with open(index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                parts = line.rstrip("\n").split("\t", 5)
+                if len(parts) != 6:
+                    continue  # Torn write at the tail after a crash
+                try:
+                    content_hash, pack, offset, length, codec, summary = parts
+                    location = (int(pack), int(offset), int(length), codec)
+                    summary = json.loads(summary)
+                except ValueError:
+                    continue
+                self._locations[content_hash] = location
+                self.summaries[content_hash] = summary
+    
+    def _index_ends_with_newline(self) -> bool:
+        with open(self.root / self.INDEX_FILE, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+    
+    def __contains__(self, content_hash: str) -> bool:
+        return content_hash in self._locations
+    
+    def __len__(self) -> int:
+        return len(self._locations)
+    
+    def keys(self) -> Iterable[str]:
+        return self._locations.keys()
+    
+    def put(self, content_hash: str, body: Dict[str, Any], summary: Dict[str, Any]) -> bool:
+        """
+        Append a bundle body and its index entry.
+        
+        Args:
+            content_hash: Content address of the bundle
+            body: Full bundle (JSON-serializable)
+            summary: Small metadata kept in memory for listing
+        
+        Returns:
+            False if the hash was already stored, True otherwise
+        """
+        payload = compress(encode_record(body), self.codec)
+        summary_json = json.dumps(summary, separators=(",", ":"))
+        
+        with self._lock:
+            if content_hash in self._locations:
+                return False
+            
+            if self._pack_file is None:
+                self._pack_file = open(self._pack_path(self._pack_id), "ab")
+                self._index_file = open(self.root / self.INDEX_FILE, "a", encoding="utf-8")
+                if self._index_file.tell() > 0 and not self._index_ends_with_newline():
+                    self._index_file.write("\n")  # Seal a torn line from a crash
+            elif self._pack_file.tell() >= self.pack_size_limit:
+                self._pack_file.close()
+                self._pack_id += 1
+                self._pack_file = open(self._pack_path(self._pack_id), "ab")
+            
+            offset = self._pack_file.tell()
+            self._pack_file.write(payload)
+            self._pack_file.flush()
+            
+            # Body is on disk before the index points at it
+            self._index_file.write(
+                f"{content_hash}\t{self._pack_id}\t{offset}\t{len(payload)}\t"
+                f"{self.codec}\t{summary_json}\n"
+            )
+            self._index_file.flush()
+            
+            self._locations[content_hash] = (self._pack_id, offset, len(payload), self.codec)
+            self.summaries[content_hash] = summary
+        
+        return True
+    
+    def view(self, content_hash: str) -> Optional[RecordView]:
+        """
+        Lazy view of a bundle body, or None if not stored.
+        
+        Uncompressed bodies are viewed directly in the pack mapping;
+        compressed bodies are decompressed once into the view's buffer.
+        """
+        location = self._locations.get(content_hash)
+        if location is None:
+            return None
+        
+        pack, offset, length, codec = location
+        mapped = self._map(pack, offset + length)
+        if mapped is None:
+            return None
+        
+        payload = memoryview(mapped)[offset:offset + length]
+        if codec != CODEC_NONE:
+            payload = decompress(payload, codec)
+        
+        return RecordView(payload)
+    
+    def get(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """Read and fully decode a bundle body, or None if not stored"""
+        view = self.view(content_hash)
+        return view.to_dict() if view is not None else None
+    
+    def _map(self, pack: int, end: int) -> Optional[mmap.mmap]:
+        mapped = self._maps.get(pack)
+        if mapped is not None and len(mapped) >= end:
+            return mapped
+        
+        with self._lock:
+            if self._pack_file is not None and self._pack_id == pack:
+                self._pack_file.flush()
+            with open(self._pack_path(pack), "rb") as f:
+                if os.fstat(f.fileno()).st_size < end:
+                    return None
+                # A pack only grows, so a stale mapping is simply replaced;
+                # views still holding it keep it alive
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[pack] = mapped
+            return mapped
+    
+    def close(self) -> None:
+        """Close pack and index handles"""
+        with self._lock:
+            for handle in (self._pack_file, self._index_file):
+                if handle is not None:
+                    handle.close()
+            self._pack_file = None
+            self._index_file = None
+            
+            for mapped in self._maps.values():
+                try:
+                    mapped.close()
+                except BufferError:
+                    pass  # Still exported to a live RecordView
+            self._maps.clear()
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+_EMPTY_DIGEST = b"\x00" * 32
+
+
+class _MerkleNode:
+    """Treap node over one content hash, caching the digest of its subtree"""
+    
+    __slots__ = ("key", "priority", "left", "right", "digest")
+    
+    def __init__(self, key: str):
+        self.key = key
+        # Derived from the key, so a set of keys has exactly one tree shape
+        self.priority = hashlib.sha256(key.encode()).digest()
+        self.left: Optional["_MerkleNode"] = None
+        self.right: Optional["_MerkleNode"] = None
+        self.digest = b""
+    
+    def rehash(self) -> None:
+        left = self.left.digest if self.left is not None else _EMPTY_DIGEST
+        right = self.right.digest if self.right is not None else _EMPTY_DIGEST
+        self.digest = hashlib.sha256(left + self.key.encode() + right).digest()
+
+
+class IncrementalMerkleRoot:
+    """
+    Merkle root over a set of hex content hashes, updated incrementally.
+    
+    Hashes are bucketed by their first byte into 256 leaves of a fixed
+    binary tree. Each bucket is a treap ordered by hash whose priorities
+    are derived from the hashes themselves, so its shape (and every cached
+    subtree digest) depends only on the bucket's contents. Adding a hash
+    rehashes the O(log n) nodes on its path; computing the root rehashes
+    the 8 fixed-tree nodes above each dirty bucket. The root depends only
+    on the set of hashes, not on insertion order, so two vaults with the
+    same contents agree on it.
+    """
+    
+    BUCKETS = 256
+    
+    def __init__(self, hashes: Iterable[str] = ()):
+        grouped: List[List[str]] = [[] for _ in range(self.BUCKETS)]
+        for content_hash in hashes:
+            grouped[self._bucket(content_hash)].append(content_hash)
+        
+        self._trees: List[Optional[_MerkleNode]] = []
+        self._count = 0
+        for bucket in grouped:
+            keys = sorted(set(bucket))
+            self._trees.append(self._build(keys))
+            self._count += len(keys)
+        
+        # Fixed tree above the buckets: levels[0] holds the bucket digests
+        level = [tree.digest if tree is not None else b"" for tree in self._trees]
+        self._levels: List[List[bytes]] = [level]
+        while len(level) > 1:
+            level = [
+                hashlib.sha256(level[i] + level[i + 1]).digest()
+                for i in range(0, len(level), 2)
+            ]
+            self._levels.append(level)
+        self._dirty: Set[int] = set()
+    
+    @staticmethod
+    def _build(keys: List[str]) -> Optional[_MerkleNode]:
+        """Build a bucket's treap from sorted, distinct keys in linear time"""
+        stack: List[_MerkleNode] = []
+        for key in keys:
+            node = _MerkleNode(key)
+            last = None
+            while stack and stack[-1].priority < node.priority:
+                last = stack.pop()
+            node.left = last
+            if stack:
+                stack[-1].right = node
+            stack.append(node)
+        if not stack:
+            return None
+        
+        # Post-order, so children are hashed before their parents
+        order: List[_MerkleNode] = []
+        pending = [stack[0]]
+        while pending:
+            node = pending.pop()
+            order.append(node)
+            pending.extend(child for child in (node.left, node.right) if child is not None)
+        for node in reversed(order):
+            node.rehash()
+        return stack[0]
+    
+    @classmethod
+    def _insert(cls, node: Optional[_MerkleNode], key: str) -> Tuple[_MerkleNode, bool]:
+        """Insert key below node; returns the new subtree root and whether key was added"""
+        if node is None:
+            leaf = _MerkleNode(key)
+            leaf.rehash()
+            return leaf, True
+        if key == node.key:
+            return node, False
+        
+        if key < node.key:
+            child, added = cls._insert(node.left, key)
+            if not added:
+                return node, False
+            if child.priority > node.priority:
+                node.left = child.right
+                node.rehash()
+                child.right = node
+                child.rehash()
+                return child, True
+            node.left = child
+        else:
+            child, added = cls._insert(node.right, key)
+            if not added:
+                return node, False
+            if child.priority > node.priority:
+                node.right = child.left
+                node.rehash()
+                child.left = node
+                child.rehash()
+                return child, True
+            node.right = child
+        
+        node.rehash()
+        return node, True
+    
+    def _bucket(self, content_hash: str) -> int:
+        try:
+            return int(content_hash[:2], 16)
+        except ValueError:
+            return hashlib.sha256(content_hash.encode()).digest()[0]
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def add(self, content_hash: str) -> bool:
+        """Add a hash; returns False if it was already present"""
+        index = self._bucket(content_hash)
+        tree, added = self._insert(self._trees[index], content_hash)
+        if not added:
+            return False
+        
+        self._trees[index] = tree
+        self._dirty.add(index)
+        self._count += 1
+        return True
+    
+    def root(self) -> Optional[str]:
+        """Current Merkle root (hex), or None for an empty set"""
+        if self._count == 0:
+            return None
+        
+        if self._dirty:
+            dirty = self._dirty
+            for index in dirty:
+                self._levels[0][index] = self._trees[index].digest
+            for depth in range(1, len(self._levels)):
+                below = self._levels[depth - 1]
+                level = self._levels[depth]
+                dirty = {index // 2 for index in dirty}
+                for index in dirty:
+                    level[index] = hashlib.sha256(below[2 * index] + below[2 * index + 1]).digest()
+            self._dirty = set()
+        
+        return self._levels[-1][0].hex()
@@ -37,6 +37,8 @@ from enum import Enum
 import sqlite3
 from pathlib import Path
 
+from aethel.core.sqlite_store import get_sqlite_store
+
 
 class SyncStatus(Enum):
     """Status of synchronization"""
@@ -218,7 +220,8 @@ class StateSynchronizer:
         self.blocks_rejected = 0
         self.last_sync_time = 0.0
         
-        # Initialize database
+        # Initialize database (shared WAL-mode connections)
+        self._db = get_sqlite_store(self.storage_path)
         self._init_database()
         
         # Load existing state
@@ -240,7 +243,10 @@ class StateSynchronizer:
     
     def _init_database(self) -> None:
         """Initialize SQLite database schema"""
-        conn = sqlite3.connect(str(self.storage_path))
+        self._db.ensure_schema("state_synchronizer", self._create_tables)
+    
+    def _create_tables(self, conn: sqlite3.Connection) -> None:
+        """Create state block and sync metadata tables"""
         cursor = conn.cursor()
         
         # State blocks table
@@ -274,14 +280,11 @@ class StateSynchronizer:
                 value TEXT
             )
         """)
-        
-        conn.commit()
-        conn.close()
     
     def _load_state_from_disk(self) -> None:
         """Load state tree from persistent storage"""
         try:
-            conn = sqlite3.connect(str(self.storage_path))
+            conn = self._db.connection()
             cursor = conn.cursor()
             
             # Load all blocks
@@ -310,8 +313,6 @@ class StateSynchronizer:
             if result:
                 self.root_hash = result[0]
             
-            conn.close()
-            
             print(f"[SYNC] Loaded {len(self.state_tree)} blocks from disk")
             
         except Exception as e:
@@ -320,26 +321,23 @@ class StateSynchronizer:
     def _persist_block(self, node: MerkleNode, status: BlockStatus) -> None:
         """Persist a block to disk"""
         try:
-            conn = sqlite3.connect(str(self.storage_path))
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO state_blocks 
-                (hash, parent_hash, children, data, proof, signature, timestamp, status)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                node.hash,
-                node.parent_hash,
-                json.dumps(node.children),
-                json.dumps(node.data),
-                node.proof,
-                node.signature,
-                node.timestamp,
-                status.value
-            ))
-            
-            conn.commit()
-            conn.close()
+            with self._db.transaction() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    INSERT OR REPLACE INTO state_blocks 
+                    (hash, parent_hash, children, data, proof, signature, timestamp, status)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    node.hash,
+                    node.parent_hash,
+                    json.dumps(node.children),
+                    json.dumps(node.data),
+                    node.proof,
+                    node.signature,
+                    node.timestamp,
+                    status.value
+                ))
             
         except Exception as e:
             print(f"[SYNC] Error persisting block {node.hash}: {e}")
@@ -347,16 +345,13 @@ class StateSynchronizer:
     def _persist_root_hash(self, root_hash: str) -> None:
         """Persist root hash to disk"""
         try:
-            conn = sqlite3.connect(str(self.storage_path))
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO sync_metadata (key, value)
-                VALUES ('root_hash', ?)
-            """, (root_hash,))
-            
-            conn.commit()
-            conn.close()
+            with self._db.transaction() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    INSERT OR REPLACE INTO sync_metadata (key, value)
+                    VALUES ('root_hash', ?)
+                """, (root_hash,))
             
         except Exception as e:
             print(f"[SYNC] Error persisting root hash: {e}")
@@ -7,6 +7,11 @@ Tracks expert performance metrics in SQLite database:
 - Confidence distribution
 - Verdict distribution
 
+Prometheus export is served from in-memory metrics (latency histograms,
+verification counters, running confidence and accuracy) updated on each
+record, so scrapes never query the database. Counters and gauges are
+seeded from the database once at start-up.
+
 Author: Kiro AI - Engenheiro-Chefe
 Date: February 13, 2026
 Version: v2.1.0
@@ -15,9 +20,15 @@ Version: v2.1.0
 import sqlite3
 import time
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from .data_models import ExpertVerdict, MOEResult
+from ..core.metrics_registry import MetricsRegistry
+from ..core.sqlite_store import get_sqlite_store
+
+
+# Milliseconds, matching ExpertVerdict.latency_ms
+EXPERT_LATENCY_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
 
 
 class ExpertTelemetry:
@@ -31,20 +42,73 @@ class ExpertTelemetry:
     - Anomaly detection
     """
     
-    def __init__(self, db_path: str = ".aethel_moe/telemetry.db"):
+    def __init__(self, db_path: str = ".aethel_moe/telemetry.db",
+                 registry: Optional[MetricsRegistry] = None):
         """
         Initialize telemetry system.
         
         Args:
             db_path: Path to SQLite database file
+            registry: MetricsRegistry for Prometheus metrics (creates new if None)
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = get_sqlite_store(self.db_path)
         self._init_database()
+        self._register_metrics(registry or MetricsRegistry())
+    
+    def _register_metrics(self, registry: MetricsRegistry) -> None:
+        """Create the Prometheus metrics mirrored from each record."""
+        self.registry = registry
+        self._latency = registry.histogram(
+            "moe_expert_latency_ms", "Expert latency in milliseconds",
+            ["expert"], buckets=EXPERT_LATENCY_BUCKETS_MS)
+        self._consensus_latency = registry.histogram(
+            "moe_consensus_latency_ms", "Total MOE consensus latency in milliseconds",
+            buckets=EXPERT_LATENCY_BUCKETS_MS)
+        self._accuracy = registry.gauge(
+            "moe_expert_accuracy", "Expert accuracy (0.0 to 1.0)", ["expert"])
+        self._confidence = registry.gauge(
+            "moe_expert_confidence_avg", "Average expert confidence", ["expert"])
+        self._verifications = registry.counter(
+            "moe_expert_verifications_total", "Total verifications per expert", ["expert"])
+        
+        # Running totals behind the gauges: expert -> (sum, count) and (correct, total)
+        self._confidence_totals: Dict[str, Tuple[float, int]] = {}
+        self._accuracy_totals: Dict[str, Tuple[int, int]] = {}
+        self._seed_metrics()
+    
+    def _seed_metrics(self) -> None:
+        """Start counters and gauges from the totals already in the database."""
+        with self._db.read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT expert_name, SUM(confidence), COUNT(*)
+                FROM expert_verdicts
+                GROUP BY expert_name
+            ''')
+            verdict_rows = cursor.fetchall()
+            cursor.execute('''
+                SELECT expert_name, SUM(was_correct), COUNT(*)
+                FROM ground_truth
+                GROUP BY expert_name
+            ''')
+            truth_rows = cursor.fetchall()
+        
+        for name, total, count in verdict_rows:
+            self._verifications.labels(name).inc(count)
+            self._confidence_totals[name] = (total, count)
+            self._confidence.labels(name).set(total / count)
+        for name, correct, total in truth_rows:
+            self._accuracy_totals[name] = (correct, total)
+            self._accuracy.labels(name).set(correct / total)
         
     def _init_database(self) -> None:
-        """Initialize SQLite database schema."""
-        conn = sqlite3.connect(self.db_path)
+        """Initialize SQLite database schema (once per database file)."""
+        self._db.ensure_schema("expert_telemetry", self._create_tables)
+    
+    def _create_tables(self, conn: sqlite3.Connection) -> None:
+        """Create telemetry tables and indexes."""
         cursor = conn.cursor()
         
         # Table for expert verdicts
@@ -107,9 +171,6 @@ class ExpertTelemetry:
             ON ground_truth(expert_name, timestamp)
         ''')
         
-        conn.commit()
-        conn.close()
-        
     def record(self, tx_id: str, verdicts: List[ExpertVerdict], 
               consensus: MOEResult) -> None:
         """
@@ -120,19 +181,19 @@ class ExpertTelemetry:
             verdicts: List of expert verdicts
             consensus: Aggregated consensus result
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
         timestamp = time.time()
         
-        try:
-            # Record individual expert verdicts
-            for verdict in verdicts:
-                cursor.execute('''
-                    INSERT INTO expert_verdicts 
-                    (timestamp, transaction_id, expert_name, verdict, 
-                     confidence, latency_ms, reason, proof_trace)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            
+            # Record individual expert verdicts in one batch
+            cursor.executemany('''
+                INSERT INTO expert_verdicts 
+                (timestamp, transaction_id, expert_name, verdict, 
+                 confidence, latency_ms, reason, proof_trace)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [
+                (
                     timestamp,
                     tx_id,
                     verdict.expert_name,
@@ -141,7 +202,9 @@ class ExpertTelemetry:
                     verdict.latency_ms,
                     verdict.reason,
                     str(verdict.proof_trace) if verdict.proof_trace else None
-                ))
+                )
+                for verdict in verdicts
+            ])
             
             # Record consensus result
             cursor.execute('''
@@ -157,10 +220,16 @@ class ExpertTelemetry:
                 consensus.total_latency_ms,
                 ','.join(consensus.activated_experts)
             ))
-            
-            conn.commit()
-        finally:
-            conn.close()
+        
+        for verdict in verdicts:
+            name = verdict.expert_name
+            self._latency.labels(name).observe(verdict.latency_ms)
+            self._verifications.labels(name).inc()
+            total, count = self._confidence_totals.get(name, (0.0, 0))
+            total, count = total + verdict.confidence, count + 1
+            self._confidence_totals[name] = (total, count)
+            self._confidence.labels(name).set(total / count)
+        self._consensus_latency.observe(consensus.total_latency_ms)
             
     def record_ground_truth(self, tx_id: str, expert_name: str, 
                            was_correct: bool) -> None:
@@ -172,11 +241,8 @@ class ExpertTelemetry:
             expert_name: Name of the expert
             was_correct: True if expert verdict matched ground truth
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute('''
+        with self._db.transaction() as conn:
+            conn.execute('''
                 INSERT INTO ground_truth 
                 (timestamp, transaction_id, expert_name, was_correct)
                 VALUES (?, ?, ?, ?)
@@ -186,9 +252,11 @@ class ExpertTelemetry:
                 expert_name,
                 1 if was_correct else 0
             ))
-            conn.commit()
-        finally:
-            conn.close()
+        
+        correct, total = self._accuracy_totals.get(expert_name, (0, 0))
+        correct, total = correct + (1 if was_correct else 0), total + 1
+        self._accuracy_totals[expert_name] = (correct, total)
+        self._accuracy.labels(expert_name).set(correct / total)
             
     def get_expert_stats(self, expert_name: str, 
                         time_window_seconds: int = 3600) -> Dict[str, Any]:
@@ -208,12 +276,11 @@ class ExpertTelemetry:
             - verdict_distribution: Count of approvals vs rejections
             - total_verifications: Total number of verifications
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         cutoff_time = time.time() - time_window_seconds
         
-        try:
+        with self._db.read_connection() as conn:
+            cursor = conn.cursor()
+            
             # Get latency and confidence stats
             cursor.execute('''
                 SELECT 
@@ -283,8 +350,6 @@ class ExpertTelemetry:
                     },
                     'total_verifications': 0
                 }
-        finally:
-            conn.close()
             
     def get_all_experts_stats(self, time_window_seconds: int = 3600) -> List[Dict[str, Any]]:
         """
@@ -296,12 +361,11 @@ class ExpertTelemetry:
         Returns:
             List of statistics dictionaries, one per expert
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         cutoff_time = time.time() - time_window_seconds
         
-        try:
+        with self._db.read_connection() as conn:
+            cursor = conn.cursor()
+            
             # Get list of all experts
             cursor.execute('''
                 SELECT DISTINCT expert_name
@@ -310,52 +374,42 @@ class ExpertTelemetry:
             ''', (cutoff_time,))
             
             expert_names = [row[0] for row in cursor.fetchall()]
-            
-            # Get stats for each expert
-            return [self.get_expert_stats(name, time_window_seconds) 
-                   for name in expert_names]
-        finally:
-            conn.close()
+        
+        # Get stats for each expert
+        return [self.get_expert_stats(name, time_window_seconds) 
+               for name in expert_names]
             
     def export_prometheus(self) -> str:
         """
         Export metrics in Prometheus format.
         
+        Rendered from in-memory metrics updated by record() and
+        record_ground_truth(); no database reads happen per scrape.
+        Verification counts, confidence and accuracy are seeded from the
+        database at start-up, so they carry over restarts; latency
+        histograms cover what this process recorded.
+        
         Returns:
             Prometheus-formatted metrics string
         """
-        stats = self.get_all_experts_stats(time_window_seconds=3600)
-        
-        lines = []
-        lines.append("# HELP moe_expert_latency_ms Average expert latency in milliseconds")
-        lines.append("# TYPE moe_expert_latency_ms gauge")
-        
-        for stat in stats:
-            lines.append(f'moe_expert_latency_ms{{expert="{stat["expert_name"]}"}} {stat["average_latency_ms"]}')
-        
-        lines.append("")
-        lines.append("# HELP moe_expert_accuracy Expert accuracy (0.0 to 1.0)")
-        lines.append("# TYPE moe_expert_accuracy gauge")
-        
-        for stat in stats:
-            if stat["accuracy"] is not None:
-                lines.append(f'moe_expert_accuracy{{expert="{stat["expert_name"]}"}} {stat["accuracy"]}')
-        
-        lines.append("")
-        lines.append("# HELP moe_expert_confidence_avg Average expert confidence")
-        lines.append("# TYPE moe_expert_confidence_avg gauge")
-        
-        for stat in stats:
-            lines.append(f'moe_expert_confidence_avg{{expert="{stat["expert_name"]}"}} {stat["confidence_avg"]}')
-        
-        lines.append("")
-        lines.append("# HELP moe_expert_verifications_total Total verifications per expert")
-        lines.append("# TYPE moe_expert_verifications_total counter")
+        return self.registry.render()
+    
+    def get_latency_percentiles(self, expert_name: str) -> Dict[str, float]:
+        """
+        Estimated p50/p95/p99 latency (ms) for an expert.
         
-        for stat in stats:
-            lines.append(f'moe_expert_verifications_total{{expert="{stat["expert_name"]}"}} {stat["total_verifications"]}')
+        Args:
+            expert_name: Name of the expert
         
-        return "\n".join(lines)
+        Returns:
+            Dictionary with p50, p95 and p99
+        """
+        histogram = self._latency.labels(expert_name)
+        return {
+            'p50': histogram.quantile(0.50),
+            'p95': histogram.quantile(0.95),
+            'p99': histogram.quantile(0.99),
+        }
     
     def cleanup_old_data(self, days_to_keep: int = 30) -> int:
         """
@@ -367,12 +421,11 @@ class ExpertTelemetry:
         Returns:
             Number of records deleted
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         cutoff_time = time.time() - (days_to_keep * 24 * 3600)
         
-        try:
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            
             # Delete old verdicts
             cursor.execute('''
                 DELETE FROM expert_verdicts WHERE timestamp < ?
@@ -390,13 +443,9 @@ class ExpertTelemetry:
                 DELETE FROM ground_truth WHERE timestamp < ?
             ''', (cutoff_time,))
             ground_truth_deleted = cursor.rowcount
-            
-            conn.commit()
-            
-            total_deleted = verdicts_deleted + consensus_deleted + ground_truth_deleted
-            return total_deleted
-        finally:
-            conn.close()
+        
+        total_deleted = verdicts_deleted + consensus_deleted + ground_truth_deleted
+        return total_deleted
 
 
 # Singleton instance
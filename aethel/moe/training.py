@@ -24,6 +24,7 @@ from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from collections import deque
 from .telemetry import ExpertTelemetry
+from ..core.sqlite_store import get_sqlite_store
 
 
 @dataclass
@@ -103,11 +104,15 @@ class ExpertTrainingSystem:
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = get_sqlite_store(self.db_path)
         self._init_database()
         
     def _init_database(self) -> None:
-        """Initialize SQLite database schema for training data."""
-        conn = sqlite3.connect(self.db_path)
+        """Initialize SQLite database schema for training data (once per database file)."""
+        self._db.ensure_schema("expert_training", self._create_tables)
+    
+    def _create_tables(self, conn: sqlite3.Connection) -> None:
+        """Create training tables and indexes."""
         cursor = conn.cursor()
         
         # Table for ground truth records
@@ -192,9 +197,6 @@ class ExpertTrainingSystem:
             ON expert_models(expert_name, is_active)
         ''')
         
-        conn.commit()
-        conn.close()
-        
     def record_ground_truth(
         self,
         transaction_id: str,
@@ -229,10 +231,9 @@ class ExpertTrainingSystem:
             timestamp=timestamp
         )
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            
             cursor.execute('''
                 INSERT INTO ground_truth 
                 (timestamp, transaction_id, expert_name, expert_verdict,
@@ -248,10 +249,6 @@ class ExpertTrainingSystem:
                 1 if was_correct else 0
             ))
             
-            conn.commit()
-        finally:
-            conn.close()
-            
         return record
     
     def record_batch_ground_truth(
@@ -271,41 +268,34 @@ class ExpertTrainingSystem:
         ground_truth_records = []
         timestamp = time.time()
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        for tx_id, expert_name, expert_verdict, expert_confidence, actual_outcome in records:
+            ground_truth_records.append(GroundTruthRecord(
+                transaction_id=tx_id,
+                expert_name=expert_name,
+                expert_verdict=expert_verdict,
+                expert_confidence=expert_confidence,
+                actual_outcome=actual_outcome,
+                was_correct=(expert_verdict == actual_outcome),
+                timestamp=timestamp
+            ))
         
-        try:
-            for tx_id, expert_name, expert_verdict, expert_confidence, actual_outcome in records:
-                was_correct = (expert_verdict == actual_outcome)
-                
-                cursor.execute('''
-                    INSERT INTO ground_truth 
-                    (timestamp, transaction_id, expert_name, expert_verdict,
-                     expert_confidence, actual_outcome, was_correct)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    timestamp,
-                    tx_id,
-                    expert_name,
-                    expert_verdict,
-                    expert_confidence,
-                    actual_outcome,
-                    1 if was_correct else 0
-                ))
-                
-                ground_truth_records.append(GroundTruthRecord(
-                    transaction_id=tx_id,
-                    expert_name=expert_name,
-                    expert_verdict=expert_verdict,
-                    expert_confidence=expert_confidence,
-                    actual_outcome=actual_outcome,
-                    was_correct=was_correct,
-                    timestamp=timestamp
-                ))
-            
-            conn.commit()
-        finally:
-            conn.close()
+        self._db.executemany('''
+            INSERT INTO ground_truth 
+            (timestamp, transaction_id, expert_name, expert_verdict,
+             expert_confidence, actual_outcome, was_correct)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', [
+            (
+                timestamp,
+                record.transaction_id,
+                record.expert_name,
+                record.expert_verdict,
+                record.expert_confidence,
+                record.actual_outcome,
+                1 if record.was_correct else 0
+            )
+            for record in ground_truth_records
+        ])
             
         return ground_truth_records
     
@@ -326,51 +316,48 @@ class ExpertTrainingSystem:
         Returns:
             List of GroundTruthRecord objects
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connection()
         cursor = conn.cursor()
         
-        try:
-            query = '''
-                SELECT transaction_id, expert_name, expert_verdict,
-                       expert_confidence, actual_outcome, was_correct, timestamp
-                FROM ground_truth
-            '''
-            
-            conditions = []
-            params = []
-            
-            if expert_name is not None:
-                conditions.append('expert_name = ?')
-                params.append(expert_name)
-            
-            if time_window_seconds is not None:
-                cutoff_time = time.time() - time_window_seconds
-                conditions.append('timestamp >= ?')
-                params.append(cutoff_time)
-            
-            if conditions:
-                query += ' WHERE ' + ' AND '.join(conditions)
-            
-            query += ' ORDER BY timestamp DESC LIMIT ?'
-            params.append(limit)
-            
-            cursor.execute(query, params)
-            
-            records = []
-            for row in cursor.fetchall():
-                records.append(GroundTruthRecord(
-                    transaction_id=row[0],
-                    expert_name=row[1],
-                    expert_verdict=row[2],
-                    expert_confidence=row[3],
-                    actual_outcome=row[4],
-                    was_correct=bool(row[5]),
-                    timestamp=row[6]
-                ))
-            
-            return records
-        finally:
-            conn.close()
+        query = '''
+            SELECT transaction_id, expert_name, expert_verdict,
+                   expert_confidence, actual_outcome, was_correct, timestamp
+            FROM ground_truth
+        '''
+        
+        conditions = []
+        params = []
+        
+        if expert_name is not None:
+            conditions.append('expert_name = ?')
+            params.append(expert_name)
+        
+        if time_window_seconds is not None:
+            cutoff_time = time.time() - time_window_seconds
+            conditions.append('timestamp >= ?')
+            params.append(cutoff_time)
+        
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        
+        query += ' ORDER BY timestamp DESC LIMIT ?'
+        params.append(limit)
+        
+        cursor.execute(query, params)
+        
+        records = []
+        for row in cursor.fetchall():
+            records.append(GroundTruthRecord(
+                transaction_id=row[0],
+                expert_name=row[1],
+                expert_verdict=row[2],
+                expert_confidence=row[3],
+                actual_outcome=row[4],
+                was_correct=bool(row[5]),
+                timestamp=row[6]
+            ))
+        
+        return records
     
     def get_ground_truth_count(
         self,
@@ -387,31 +374,28 @@ class ExpertTrainingSystem:
         Returns:
             Count of records
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connection()
         cursor = conn.cursor()
         
-        try:
-            query = 'SELECT COUNT(*) FROM ground_truth'
-            
-            conditions = []
-            params = []
-            
-            if expert_name is not None:
-                conditions.append('expert_name = ?')
-                params.append(expert_name)
-            
-            if time_window_seconds is not None:
-                cutoff_time = time.time() - time_window_seconds
-                conditions.append('timestamp >= ?')
-                params.append(cutoff_time)
-            
-            if conditions:
-                query += ' WHERE ' + ' AND '.join(conditions)
-            
-            cursor.execute(query, params)
-            return cursor.fetchone()[0]
-        finally:
-            conn.close()
+        query = 'SELECT COUNT(*) FROM ground_truth'
+        
+        conditions = []
+        params = []
+        
+        if expert_name is not None:
+            conditions.append('expert_name = ?')
+            params.append(expert_name)
+        
+        if time_window_seconds is not None:
+            cutoff_time = time.time() - time_window_seconds
+            conditions.append('timestamp >= ?')
+            params.append(cutoff_time)
+        
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        
+        cursor.execute(query, params)
+        return cursor.fetchone()[0]
     
     def cleanup_old_ground_truth(self, days_to_keep: int = 90) -> int:
         """
@@ -423,22 +407,18 @@ class ExpertTrainingSystem:
         Returns:
             Number of records deleted
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cutoff_time = time.time() - (days_to_keep * 24 * 3600)
-        
-        try:
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            
+            cutoff_time = time.time() - (days_to_keep * 24 * 3600)
+            
             cursor.execute('''
                 DELETE FROM ground_truth WHERE timestamp < ?
             ''', (cutoff_time,))
             
             deleted_count = cursor.rowcount
-            conn.commit()
             
             return deleted_count
-        finally:
-            conn.close()
 
 
 
@@ -558,10 +538,9 @@ class ExpertTrainingSystem:
         Args:
             metrics: AccuracyMetrics to store
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            
             cursor.execute('''
                 INSERT INTO model_performance 
                 (timestamp, expert_name, model_version, window_size, accuracy,
@@ -584,10 +563,6 @@ class ExpertTrainingSystem:
                 metrics.avg_confidence_correct,
                 metrics.avg_confidence_incorrect
             ))
-            
-            conn.commit()
-        finally:
-            conn.close()
     
     def adjust_confidence_threshold(
         self,
@@ -660,10 +635,9 @@ class ExpertTrainingSystem:
             new_threshold: New threshold
             reason: Reason for adjustment
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            
             cursor.execute('''
                 INSERT INTO confidence_thresholds 
                 (timestamp, expert_name, old_threshold, new_threshold, reason)
@@ -675,10 +649,6 @@ class ExpertTrainingSystem:
                 new_threshold,
                 reason
             ))
-            
-            conn.commit()
-        finally:
-            conn.close()
     
     def get_threshold_history(
         self,
@@ -695,30 +665,27 @@ class ExpertTrainingSystem:
         Returns:
             List of threshold adjustment records
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connection()
         cursor = conn.cursor()
         
-        try:
-            cursor.execute('''
-                SELECT timestamp, old_threshold, new_threshold, reason
-                FROM confidence_thresholds
-                WHERE expert_name = ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-            ''', (expert_name, limit))
-            
-            history = []
-            for row in cursor.fetchall():
-                history.append({
-                    'timestamp': row[0],
-                    'old_threshold': row[1],
-                    'new_threshold': row[2],
-                    'reason': row[3]
-                })
-            
-            return history
-        finally:
-            conn.close()
+        cursor.execute('''
+            SELECT timestamp, old_threshold, new_threshold, reason
+            FROM confidence_thresholds
+            WHERE expert_name = ?
+            ORDER BY timestamp DESC
+            LIMIT ?
+        ''', (expert_name, limit))
+        
+        history = []
+        for row in cursor.fetchall():
+            history.append({
+                'timestamp': row[0],
+                'old_threshold': row[1],
+                'new_threshold': row[2],
+                'reason': row[3]
+            })
+        
+        return history
 
 
 @dataclass
@@ -762,6 +729,7 @@ class ABTestingFramework:
         """
         self.training_system = training_system
         self.db_path = training_system.db_path
+        self._db = training_system._db
     
     def register_model_version(
         self,
@@ -782,12 +750,11 @@ class ABTestingFramework:
         Returns:
             ExpertModelVersion object
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        deployed_at = time.time()
-        
-        try:
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            
+            deployed_at = time.time()
+            
             cursor.execute('''
                 INSERT OR REPLACE INTO expert_models 
                 (expert_name, model_version, model_config, deployed_at, is_active, ab_test_group)
@@ -800,10 +767,6 @@ class ABTestingFramework:
                 0,  # Not active by default
                 ab_test_group
             ))
-            
-            conn.commit()
-        finally:
-            conn.close()
         
         return ExpertModelVersion(
             expert_name=expert_name,
@@ -826,10 +789,9 @@ class ABTestingFramework:
             expert_name: Name of the expert
             model_version: Version to activate
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            
             # Deactivate all versions for this expert
             cursor.execute('''
                 UPDATE expert_models 
@@ -843,10 +805,6 @@ class ABTestingFramework:
                 SET is_active = 1
                 WHERE expert_name = ? AND model_version = ?
             ''', (expert_name, model_version))
-            
-            conn.commit()
-        finally:
-            conn.close()
     
     def get_active_model_version(
         self,
@@ -861,30 +819,27 @@ class ABTestingFramework:
         Returns:
             ExpertModelVersion if found, None otherwise
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connection()
         cursor = conn.cursor()
         
-        try:
-            cursor.execute('''
-                SELECT model_version, model_config, deployed_at, ab_test_group
-                FROM expert_models
-                WHERE expert_name = ? AND is_active = 1
-            ''', (expert_name,))
-            
-            row = cursor.fetchone()
-            if row:
-                return ExpertModelVersion(
-                    expert_name=expert_name,
-                    model_version=row[0],
-                    model_config=json.loads(row[1]) if row[1] else {},
-                    deployed_at=row[2],
-                    is_active=True,
-                    ab_test_group=row[3]
-                )
-            
-            return None
-        finally:
-            conn.close()
+        cursor.execute('''
+            SELECT model_version, model_config, deployed_at, ab_test_group
+            FROM expert_models
+            WHERE expert_name = ? AND is_active = 1
+        ''', (expert_name,))
+        
+        row = cursor.fetchone()
+        if row:
+            return ExpertModelVersion(
+                expert_name=expert_name,
+                model_version=row[0],
+                model_config=json.loads(row[1]) if row[1] else {},
+                deployed_at=row[2],
+                is_active=True,
+                ab_test_group=row[3]
+            )
+        
+        return None
     
     def compare_model_versions(
         self,
@@ -988,31 +943,28 @@ class ABTestingFramework:
         Returns:
             List of ExpertModelVersion objects
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connection()
         cursor = conn.cursor()
         
-        try:
-            cursor.execute('''
-                SELECT model_version, model_config, deployed_at, is_active, ab_test_group
-                FROM expert_models
-                WHERE expert_name = ?
-                ORDER BY deployed_at DESC
-            ''', (expert_name,))
-            
-            versions = []
-            for row in cursor.fetchall():
-                versions.append(ExpertModelVersion(
-                    expert_name=expert_name,
-                    model_version=row[0],
-                    model_config=json.loads(row[1]) if row[1] else {},
-                    deployed_at=row[2],
-                    is_active=bool(row[3]),
-                    ab_test_group=row[4]
-                ))
-            
-            return versions
-        finally:
-            conn.close()
+        cursor.execute('''
+            SELECT model_version, model_config, deployed_at, is_active, ab_test_group
+            FROM expert_models
+            WHERE expert_name = ?
+            ORDER BY deployed_at DESC
+        ''', (expert_name,))
+        
+        versions = []
+        for row in cursor.fetchall():
+            versions.append(ExpertModelVersion(
+                expert_name=expert_name,
+                model_version=row[0],
+                model_config=json.loads(row[1]) if row[1] else {},
+                deployed_at=row[2],
+                is_active=bool(row[3]),
+                ab_test_group=row[4]
+            ))
+        
+        return versions
 
 
 # Singleton instances
@@ -0,0 +1,443 @@
+"""
+Aethel Synchrony Protocol - Workload Benchmark Suite
+
+End-to-end benchmarks of BatchProcessor.execute_batch on parameterized
+workloads, broken down per pipeline stage and compared across serial,
+thread-pool and process-pool execution.
+
+Workload parameters:
+- batch_size: Transactions per batch
+- account_count: Shared accounts the batch draws from
+- zipf_skew: Zipf exponent of shared-account popularity (0 = uniform)
+- read_ratio: Fraction of shared-account accesses that are read-only;
+  the rest credit the account
+- chain_depth: Dependent rounds; round k writes the accounts round k-1
+  wrote, so rounds run as consecutive batches
+
+Every transaction debits its own account by what it credits to shared
+accounts, so conservation holds. A shared account is either read-only or
+credit-only for the whole batch; the analyzer splits the credit-only ones
+into sub-accumulators (hot_account_threshold=2), so skew shows up as
+accumulator work instead of a circular dependency.
+
+Results are appended to a JSON history and compared with the previous
+run of the same scenario and mode, so regressions show up.
+
+Run with: python benchmark_synchrony_workloads.py [--quick]
+
+Author: Aethel Team
+Version: 1.8.0
+Date: February 4, 2026
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from aethel.core.batch_processor import BatchProcessor
+from aethel.core.dependency_analyzer import DependencyAnalyzer
+from aethel.core.synchrony import Credit, Transaction
+
+
+HISTORY_FILE = "benchmark_synchrony_workloads_history.json"
+
+STAGES = ["analysis", "conflicts", "execute", "prove", "conservation", "commit"]
+
+MODES = ["serial", "thread", "process"]
+
+# Slower than the previous run by more than this fraction is a regression
+REGRESSION_THRESHOLD = 0.20
+
+SCENARIOS = [
+    {"name": "uniform", "batch_size": 1000, "account_count": 1000, "zipf_skew": 0.0, "read_ratio": 0.5, "chain_depth": 1},
+    {"name": "skewed", "batch_size": 1000, "account_count": 1000, "zipf_skew": 1.2, "read_ratio": 0.5, "chain_depth": 1},
+    {"name": "read_heavy", "batch_size": 1000, "account_count": 1000, "zipf_skew": 1.2, "read_ratio": 0.9, "chain_depth": 1},
+    {"name": "write_heavy", "batch_size": 1000, "account_count": 1000, "zipf_skew": 1.2, "read_ratio": 0.1, "chain_depth": 1},
+    {"name": "few_accounts", "batch_size": 1000, "account_count": 16, "zipf_skew": 0.0, "read_ratio": 0.5, "chain_depth": 1},
+    {"name": "chained", "batch_size": 1000, "account_count": 1000, "zipf_skew": 1.2, "read_ratio": 0.5, "chain_depth": 4},
+    {"name": "small_batch", "batch_size": 100, "account_count": 1000, "zipf_skew": 1.2, "read_ratio": 0.5, "chain_depth": 1},
+]
+
+
+def print_header(title):
+    print("\n" + "="*80)
+    print(f"  {title}")
+    print("="*80 + "\n")
+
+
+def print_section(title):
+    print(f"\n{'-'*80}")
+    print(f"  {title}")
+    print(f"{'-'*80}\n")
+
+
+# ============================================================================
+# WORKLOAD GENERATORS
+# ============================================================================
+
+def zipf_weights(count: int, skew: float) -> List[float]:
+    """Popularity of each rank under a Zipf distribution (skew 0 = uniform)"""
+    return [1.0 / (rank + 1) ** skew for rank in range(count)]
+
+
+def assign_roles(weights: List[float], read_ratio: float) -> List[bool]:
+    """
+    Decide which shared accounts are read-only (True) and which are credited.
+    
+    Accounts are assigned in popularity order so that the read-only ones
+    receive about read_ratio of all accesses.
+    """
+    roles = []
+    read_weight = 0.0
+    seen_weight = 0.0
+    for weight in weights:
+        seen_weight += weight
+        is_read = read_weight + weight <= read_ratio * seen_weight + 1e-12
+        if is_read:
+            read_weight += weight
+        roles.append(is_read)
+    return roles
+
+
+def generate_workload(batch_size: int,
+                      account_count: int,
+                      zipf_skew: float = 0.0,
+                      read_ratio: float = 0.5,
+                      chain_depth: int = 1,
+                      accesses_per_tx: int = 3,
+                      seed: int = 0) -> List[List[Transaction]]:
+    """
+    Generate a workload as a list of dependent rounds.
+    
+    Args:
+        batch_size: Transactions per round
+        account_count: Shared accounts to draw from
+        zipf_skew: Zipf exponent of shared-account popularity
+        read_ratio: Fraction of shared accesses that are read-only
+        chain_depth: Number of rounds; each round rewrites the own
+            accounts of the previous one
+        accesses_per_tx: Shared accounts each transaction touches
+        seed: Random seed
+    
+    Returns:
+        chain_depth lists of batch_size transactions
+    """
+    rng = random.Random(seed)
+    weights = zipf_weights(account_count, zipf_skew)
+    read_only = assign_roles(weights, read_ratio)
+    cumulative = []
+    total = 0.0
+    for weight in weights:
+        total += weight
+        cumulative.append(total)
+    picks = min(accesses_per_tx, account_count)
+    
+    rounds = []
+    for depth in range(chain_depth):
+        transactions = []
+        for i in range(batch_size):
+            shared = set()
+            while len(shared) < picks:
+                shared.update(rng.choices(range(account_count), cum_weights=cumulative, k=picks - len(shared)))
+            
+            own = f"own_{i}"
+            accounts = {own: {"balance": 1000}}
+            credits = []
+            for rank in sorted(shared):
+                account_id = f"shared_{rank}"
+                accounts[account_id] = {"balance": 1000}
+                if not read_only[rank]:
+                    credits.append(Credit(account_id, 1))
+            
+            transactions.append(Transaction(
+                id=f"tx_{depth}_{i}",
+                intent_name="transfer",
+                accounts=accounts,
+                operations=[Credit(own, -len(credits))] + credits,
+                verify_conditions=[]
+            ))
+        rounds.append(transactions)
+    return rounds
+
+
+# ============================================================================
+# INSTRUMENTATION
+# ============================================================================
+
+def create_processor(mode: str) -> BatchProcessor:
+    """BatchProcessor configured for an execution mode"""
+    if mode == "serial":
+        processor = BatchProcessor(num_threads=1)
+    elif mode == "thread":
+        processor = BatchProcessor(num_threads=8)
+    elif mode == "process":
+        processor = BatchProcessor(num_threads=8, execution_backend="process", process_threshold=64)
+    else:
+        raise ValueError(f"Unknown mode: {mode}")
+    processor.dependency_analyzer = DependencyAnalyzer(hot_account_threshold=2)
+    return processor
+
+
+def instrument(processor: BatchProcessor) -> Dict[str, float]:
+    """
+    Wrap the pipeline components so each stage adds its time to a dict.
+    
+    Returns:
+        Stage name -> seconds; clear it between runs
+    """
+    timings: Dict[str, float] = {}
+    
+    def timed(stage: str, method: Callable) -> Callable:
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - start
+        return wrapper
+    
+    stage_methods = [
+        ("analysis", processor.dependency_analyzer, "analyze"),
+        ("conflicts", processor.conflict_detector, "detect_conflicts"),
+        ("conflicts", processor.conflict_detector, "resolve_conflicts"),
+        ("execute", processor.parallel_executor, "execute_parallel"),
+        ("prove", processor.linearizability_prover, "prove_linearizability"),
+        ("conservation", processor.conservation_validator, "validate_batch_conservation"),
+        ("conservation", processor.conservation_validator, "validate_accumulator_merge"),
+        ("commit", processor.commit_manager, "commit_batch"),
+    ]
+    for stage, component, name in stage_methods:
+        setattr(component, name, timed(stage, getattr(component, name)))
+    return timings
+
+
+def run_workload(processor: BatchProcessor, rounds: List[List[Transaction]]) -> Dict[str, Any]:
+    """Execute every round once and collect totals"""
+    start = time.perf_counter()
+    successes = 0
+    parallel = 0
+    errors = []
+    for transactions in rounds:
+        result = processor.execute_batch(transactions)
+        if result.success:
+            successes += 1
+            parallel += result.transactions_parallel
+        elif result.diagnostic_info:
+            errors.append(result.diagnostic_info.get("error_type", "unknown"))
+    return {
+        "total": time.perf_counter() - start,
+        "success": successes == len(rounds),
+        "transactions_parallel": parallel,
+        "errors": errors,
+    }
+
+
+def benchmark_scenario(scenario: Dict[str, Any], mode: str, repeat: int) -> Dict[str, Any]:
+    """
+    Time one scenario in one mode.
+    
+    Stage times are medians over repeat timed runs after a warm-up run.
+    Peak memory comes from a separate tracemalloc run, so tracing does not
+    distort the timings.
+    """
+    rounds = generate_workload(
+        scenario["batch_size"],
+        scenario["account_count"],
+        scenario["zipf_skew"],
+        scenario["read_ratio"],
+        scenario["chain_depth"]
+    )
+    transaction_count = scenario["batch_size"] * scenario["chain_depth"]
+    processor = create_processor(mode)
+    try:
+        run_workload(processor, rounds)  # Warm-up (starts worker processes)
+        
+        timings = instrument(processor)
+        runs = []
+        for _ in range(repeat):
+            timings.clear()
+            outcome = run_workload(processor, rounds)
+            outcome["stages"] = dict(timings)
+            runs.append(outcome)
+        
+        tracemalloc.start()
+        run_workload(processor, rounds)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        processor.shutdown()
+    
+    total = statistics.median(run["total"] for run in runs)
+    return {
+        "scenario": scenario["name"],
+        "mode": mode,
+        "params": {key: value for key, value in scenario.items() if key != "name"},
+        "success": all(run["success"] for run in runs),
+        "errors": sorted({error for run in runs for error in run["errors"]}),
+        "transactions_parallel": runs[-1]["transactions_parallel"],
+        "total_seconds": total,
+        "tps": transaction_count / total if total > 0 else 0.0,
+        "stages": {
+            stage: statistics.median(run["stages"].get(stage, 0.0) for run in runs)
+            for stage in STAGES
+        },
+        "peak_memory_mb": peak_bytes / (1024 * 1024),
+    }
+
+
+# ============================================================================
+# HISTORY
+# ============================================================================
+
+def load_history(path: str) -> List[Dict[str, Any]]:
+    """Previous runs, oldest first (empty if there is no history yet)"""
+    if not os.path.exists(path):
+        return []
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def compare_with_previous(results: List[Dict[str, Any]],
+                          history: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Compare each result with the latest earlier run of the same scenario,
+    mode and parameters.
+    
+    Returns:
+        One entry per result that has a baseline, with the relative change
+        in total time and whether it exceeds REGRESSION_THRESHOLD
+    """
+    baselines: Dict[Any, Dict[str, Any]] = {}
+    for run in history:
+        for result in run["results"]:
+            key = (result["scenario"], result["mode"], json.dumps(result["params"], sort_keys=True))
+            baselines[key] = result
+    
+    comparisons = []
+    for result in results:
+        key = (result["scenario"], result["mode"], json.dumps(result["params"], sort_keys=True))
+        baseline = baselines.get(key)
+        if baseline is None or baseline["total_seconds"] <= 0:
+            continue
+        change = result["total_seconds"] / baseline["total_seconds"] - 1.0
+        comparisons.append({
+            "scenario": result["scenario"],
+            "mode": result["mode"],
+            "previous_seconds": baseline["total_seconds"],
+            "change": change,
+            "regression": change > REGRESSION_THRESHOLD,
+        })
+    return comparisons
+
+
+def append_history(path: str,
+                   history: List[Dict[str, Any]],
+                   results: List[Dict[str, Any]]) -> None:
+    """Append this run, with machine information, to the history file"""
+    history.append({
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "results": results,
+    })
+    with open(path, "w") as f:
+        json.dump(history, f, indent=2)
+
+
+# ============================================================================
+# REPORT
+# ============================================================================
+
+def print_results(results: List[Dict[str, Any]]) -> None:
+    print(f"{'Scenario':<14} {'Mode':<9} {'TPS':>9} {'Peak MB':>8}  "
+          + " ".join(f"{stage[:8]:>8}" for stage in STAGES))
+    print("-" * 100)
+    for result in results:
+        stage_ms = " ".join(f"{result['stages'][stage] * 1000:>8.1f}" for stage in STAGES)
+        status = "" if result["success"] else f"  FAILED {','.join(result['errors'])}"
+        print(f"{result['scenario']:<14} {result['mode']:<9} {result['tps']:>9.1f} "
+              f"{result['peak_memory_mb']:>8.1f}  {stage_ms}{status}")
+    print("\nStage columns are milliseconds per workload (median).")
+
+
+def print_payoff(results: List[Dict[str, Any]]) -> None:
+    """Speedup of each parallel mode over serial, per scenario"""
+    print(f"{'Scenario':<14} {'Thread vs serial':>18} {'Process vs serial':>18}")
+    print("-" * 80)
+    by_key = {(result["scenario"], result["mode"]): result for result in results}
+    for scenario in dict.fromkeys(result["scenario"] for result in results):
+        serial = by_key.get((scenario, "serial"))
+        if serial is None or serial["total_seconds"] <= 0:
+            continue
+        speedups = []
+        for mode in ("thread", "process"):
+            result = by_key.get((scenario, mode))
+            speedups.append(
+                f"{serial['total_seconds'] / result['total_seconds']:.2f}x"
+                if result and result["total_seconds"] > 0 else "-"
+            )
+        print(f"{scenario:<14} {speedups[0]:>18} {speedups[1]:>18}")
+
+
+def print_comparisons(comparisons: List[Dict[str, Any]]) -> None:
+    if not comparisons:
+        print("No previous run to compare with.")
+        return
+    regressions = [c for c in comparisons if c["regression"]]
+    for comparison in comparisons:
+        marker = "REGRESSION" if comparison["regression"] else ""
+        print(f"{comparison['scenario']:<14} {comparison['mode']:<9} "
+              f"{comparison['change'] * 100:>+8.1f}%  {marker}")
+    print(f"\n{len(regressions)} regression(s) above {REGRESSION_THRESHOLD * 100:.0f}%")
+
+
+def main(argv: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    parser = argparse.ArgumentParser(description="Synchrony workload benchmarks")
+    parser.add_argument("--quick", action="store_true",
+                        help="Batches of 200 and one timed run per mode")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per mode (default 3)")
+    parser.add_argument("--history", default=HISTORY_FILE, help="JSON history file")
+    parser.add_argument("--modes", default=",".join(MODES), help="Comma-separated modes")
+    args = parser.parse_args(argv)
+    
+    scenarios = SCENARIOS
+    repeat = args.repeat
+    if args.quick:
+        scenarios = [dict(scenario, batch_size=min(scenario["batch_size"], 200)) for scenario in SCENARIOS]
+        repeat = 1
+    modes = [mode for mode in args.modes.split(",") if mode]
+    
+    print_header("AETHEL SYNCHRONY PROTOCOL - WORKLOAD BENCHMARKS")
+    print(f"CPU cores: {os.cpu_count()}   Modes: {', '.join(modes)}   Runs: {repeat}")
+    
+    results = []
+    for scenario in scenarios:
+        for mode in modes:
+            results.append(benchmark_scenario(scenario, mode, repeat))
+    
+    print_section("Per-Stage Breakdown")
+    print_results(results)
+    
+    print_section("Where Parallelism Pays Off")
+    print_payoff(results)
+    
+    print_section("Change vs Previous Run")
+    history = load_history(args.history)
+    print_comparisons(compare_with_previous(results, history))
+    
+    append_history(args.history, history, results)
+    print(f"\nResults appended to {args.history}")
+    print("\n" + "="*80 + "\n")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Tests for the inverted account index
+
+Covers index construction, conflicting-pair enumeration, equivalence with
+the pairwise conflict check, and sharing of one index between the
+DependencyAnalyzer and the ConflictDetector.
+"""
+
+import itertools
+
+import pytest
+from hypothesis import given, settings, strategies as st
+
+from aethel.core.account_index import AccountIndex
+from aethel.core.conflict_detector import ConflictDetector
+from aethel.core.dependency_analyzer import DependencyAnalyzer
+from aethel.core.synchrony import CircularDependencyError, ConflictType, Transaction
+
+
+def make_txn(txn_id, accounts):
+    return Transaction(
+        id=txn_id,
+        intent_name="transfer",
+        accounts={account: {"balance": 100} for account in accounts},
+        operations=[],
+        verify_conditions=[],
+    )
+
+
+class TestAccountIndex:
+    """Test index construction and pair enumeration"""
+    
+    def test_readers_and_writers_in_batch_order(self):
+        """Each account lists its transactions by position"""
+        rw_sets = [({"a", "b"}, {"a"}), ({"b"}, set()), ({"a"}, {"b"})]
+        index = AccountIndex([make_txn(f"t{i}", []) for i in range(3)], rw_sets)
+        
+        assert index.readers == {"a": [0, 2], "b": [0, 1]}
+        assert index.writers == {"a": [0], "b": [2]}
+        assert index.to_dict()["b"] == {"readers": ["t0", "t1"], "writers": ["t2"]}
+    
+    def test_shared_reads_do_not_conflict(self):
+        """Only accounts with a writer produce pairs"""
+        rw_sets = [({"a"}, set()), ({"a"}, set()), ({"a"}, {"a"})]
+        index = AccountIndex([make_txn(f"t{i}", []) for i in range(3)], rw_sets)
+        
+        assert index.conflicting_pairs() == [(0, 2), (1, 2)]
+    
+    def test_disjoint_batch_has_no_pairs(self):
+        """Disjoint transfers never get compared"""
+        transactions = [make_txn(f"t{i}", [f"from_{i}", f"to_{i}"]) for i in range(5000)]
+        
+        assert AccountIndex.build(transactions).conflicting_pairs() == []
+    
+    @settings(max_examples=50, deadline=None)
+    @given(st.lists(
+        st.tuples(st.sets(st.sampled_from("abcdef")), st.sets(st.sampled_from("abcdef"))),
+        max_size=12,
+    ))
+    def test_pairs_match_pairwise_check(self, rw_sets):
+        """The index finds exactly the pairs a nested loop would"""
+        index = AccountIndex([make_txn(f"t{i}", []) for i in range(len(rw_sets))], rw_sets)
+        expected = [
+            (i, j)
+            for i, j in itertools.combinations(range(len(rw_sets)), 2)
+            if (rw_sets[i][1] & (rw_sets[j][0] | rw_sets[j][1]))
+            or (rw_sets[j][1] & (rw_sets[i][0] | rw_sets[i][1]))
+        ]
+        
+        assert index.conflicting_pairs() == expected
+
+
+class TestSharedIndex:
+    """Test the analyzer and detector using one index"""
+    
+    def test_analyzer_attaches_index_and_detector_reuses_it(self, monkeypatch):
+        """detect_conflicts does not rebuild the analyzer's index"""
+        transactions = [make_txn("t1", ["alice"]), make_txn("t2", ["bob"])]
+        graph = DependencyAnalyzer().analyze(transactions)
+        
+        assert isinstance(graph.account_index, AccountIndex)
+        
+        def no_rebuild(*args, **kwargs):
+            raise AssertionError("index rebuilt")
+        
+        monkeypatch.setattr(AccountIndex, "build", no_rebuild)
+        assert ConflictDetector().detect_conflicts(transactions, graph) == []
+    
+    def test_detector_rebuilds_for_other_batch(self):
+        """An index over a different batch is not reused"""
+        graph = DependencyAnalyzer().analyze([make_txn("t1", ["alice"])])
+        transactions = [make_txn("t1", ["alice"]), make_txn("t2", ["alice"])]
+        
+        conflicts = ConflictDetector().detect_conflicts(transactions, graph)
+        
+        assert {c.type for c in conflicts} == {ConflictType.RAW, ConflictType.WAW, ConflictType.WAR}
+        assert all(c.resource == "alice" for c in conflicts)
+    
+    def test_conflicting_pair_still_rejected(self):
+        """Shared accounts keep producing the bidirectional cycle"""
+        with pytest.raises(CircularDependencyError):
+            DependencyAnalyzer().analyze([make_txn("t1", ["alice"]), make_txn("t2", ["alice"])])
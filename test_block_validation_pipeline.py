@@ -0,0 +1,179 @@
+"""
+Tests for the block validation pipeline
+
+Covers the proof result cache, speculative pre-verification from the
+mempool, in-order parallel block validation and replicas reusing results
+for proofs they have already seen.
+"""
+
+import threading
+import time
+
+from aethel.consensus.consensus_engine import ConsensusEngine
+from aethel.consensus.data_models import MessageType, PeerInfo, PrePrepareMessage, ProofBlock, SignedProof
+from aethel.consensus.mock_network import MockP2PNetwork
+from aethel.consensus.proof_mempool import ProofMempool
+from aethel.consensus.proof_verifier import ProofVerifier
+
+
+def _proof(tag, valid=True):
+    return {'constraints': [f'{tag} > 0'], 'post_conditions': [f'{tag} >= 0'], 'valid': valid}
+
+
+def _block(proofs):
+    return ProofBlock(
+        block_id="block_1",
+        timestamp=int(time.time()),
+        proofs=proofs,
+        previous_block_hash="0" * 64,
+        proposer_id="val_0",
+    )
+
+
+def _wait_for_speculation(verifier, timeout=5.0):
+    deadline = time.time() + timeout
+    while verifier.get_stats()['speculative_in_flight'] and time.time() < deadline:
+        time.sleep(0.01)
+
+
+class TestResultCache:
+    """Test caching of proof results"""
+    
+    def test_repeat_proof_not_reverified(self):
+        """A proof verified once is answered from the cache"""
+        verifier = ProofVerifier()
+        first = verifier.verify_proof(_proof("a"))
+        second = verifier.verify_proof(_proof("a"))
+        
+        assert second is first
+        stats = verifier.get_stats()
+        assert stats['verification_count'] == 1
+        assert stats['cache_hits'] == 1
+    
+    def test_intent_names_not_cached(self):
+        """Intent names depend on the judge and are never cached"""
+        verifier = ProofVerifier()
+        assert ProofVerifier.proof_cache_key("transfer") is None
+        
+        verifier.verify_proof("transfer")
+        assert not verifier.is_cached("transfer")
+    
+    def test_signed_intent_names_not_cached(self):
+        """A signed intent name is re-verified once a judge is attached"""
+        verifier = ProofVerifier(require_signatures=False)
+        signed = SignedProof(proof_data="transfer", public_key="pk", signature="sig", timestamp=0)
+        assert ProofVerifier.proof_cache_key(signed) is None
+        
+        assert verifier.verify_proof(signed).error == "No judge instance provided"
+        
+        class ProvingJudge:
+            def verify_logic(self, intent_name):
+                return {'status': 'PROVED'}
+        
+        verifier.judge = ProvingJudge()
+        assert verifier.verify_proof(signed).valid
+    
+    def test_cache_is_bounded(self):
+        """Least recently used results are evicted"""
+        verifier = ProofVerifier(verification_cache_size=2)
+        for tag in ("a", "b", "c"):
+            verifier.verify_proof(_proof(tag))
+        
+        assert not verifier.is_cached(_proof("a"))
+        assert verifier.is_cached(_proof("c"))
+
+
+class TestSpeculation:
+    """Test speculative pre-verification"""
+    
+    def test_mempool_preverifies_gossiped_proofs(self):
+        """Proofs added with a claimed difficulty are verified in the background"""
+        verifier = ProofVerifier()
+        mempool = ProofMempool(proof_verifier=verifier)
+        for i in range(4):
+            assert mempool.add_proof(_proof(f"g{i}"), difficulty=1000 + i)
+        
+        _wait_for_speculation(verifier)
+        assert verifier.get_stats()['verification_count'] == 4
+        
+        result = verifier.verify_proof_block(_block([_proof(f"g{i}") for i in range(4)]))
+        
+        assert result.valid
+        assert verifier.get_stats()['verification_count'] == 4
+    
+    def test_speculation_can_be_disabled(self):
+        """speculative_verification=False leaves gossiped proofs unverified"""
+        verifier = ProofVerifier()
+        mempool = ProofMempool(proof_verifier=verifier, speculative_verification=False)
+        mempool.add_proof(_proof("off"), difficulty=10)
+        
+        assert not verifier.is_cached(_proof("off"))
+
+
+class TestBlockValidation:
+    """Test block validation over the cache and worker pool"""
+    
+    def test_parallel_failure_reported_in_block_order(self):
+        """The first invalid proof in block order is the one reported"""
+        verifier = ProofVerifier(max_workers=4)
+        proofs = [_proof("p0"), _proof("p1", valid=False), _proof("p2"), _proof("p3", valid=False)]
+        
+        result = verifier.verify_proof_block(_block(proofs), parallel=True)
+        
+        assert not result.valid
+        assert result.failed_proof == proofs[1]
+        assert len(result.results) == 2
+    
+    def test_only_uncached_proofs_rechecked(self):
+        """A block mixing seen and unseen proofs verifies only the unseen ones"""
+        verifier = ProofVerifier()
+        verifier.verify_proof(_proof("seen"))
+        
+        result = verifier.verify_proof_block(_block([_proof("seen"), _proof("new_1"), _proof("new_2")]))
+        
+        assert result.valid
+        assert verifier.get_stats()['verification_count'] == 3
+    
+    def test_speculation_does_not_wait_for_block_workers(self):
+        """Speculative runs progress while every block worker is busy"""
+        verifier = ProofVerifier(max_workers=1)
+        release = threading.Event()
+        blocker = verifier._pool().submit(release.wait)
+        try:
+            verifier.speculate(_proof("s"))
+            _wait_for_speculation(verifier)
+            
+            assert verifier.get_stats()['verification_count'] == 1
+        finally:
+            release.set()
+            blocker.result()
+            verifier.shutdown()
+
+
+class TestReplicaFastPath:
+    """Test replicas voting on blocks of known proofs"""
+    
+    def test_replica_reuses_mempool_results(self):
+        """A replica that saw the proofs prepares without re-verifying them"""
+        network = MockP2PNetwork("val_1")
+        for peer in ("val_0", "val_2", "val_3"):
+            network.add_peer(PeerInfo(peer_id=peer, address=f"localhost:{peer}", stake=1000))
+        replica = ConsensusEngine("val_1", 1000, network)
+        assert replica.proof_verifier is replica.proof_mempool.proof_verifier
+        
+        proofs = [_proof(f"r{i}") for i in range(3)]
+        for proof in proofs:
+            replica.proof_mempool.add_proof(proof)
+        verified = replica.proof_verifier.get_stats()['verification_count']
+        
+        replica.handle_pre_prepare(PrePrepareMessage(
+            message_type=MessageType.PRE_PREPARE,
+            view=0,
+            sequence=1,
+            sender_id="val_0",
+            proof_block=_block(proofs),
+        ))
+        
+        state = replica.get_instance(1)
+        assert state.verification_result.valid
+        assert replica.proof_verifier.get_stats()['verification_count'] == verified
@@ -0,0 +1,192 @@
+"""
+Tests for pipelined PBFT in ConsensusEngine
+
+Covers several sequence numbers in flight inside the watermark window,
+buffering of votes that overtake their PRE-PREPARE, out-of-order commits
+executed in sequence order, and in-flight proof exclusion for proposals.
+"""
+
+from typing import Dict, List, Tuple
+
+from aethel.consensus.consensus_engine import ConsensusEngine
+from aethel.consensus.data_models import ConsensusMessage, MessageType, PeerInfo
+from aethel.consensus.mock_network import MockP2PNetwork
+from aethel.consensus.monitoring import MetricsCollector
+from aethel.consensus.proof_mempool import ProofMempool
+from aethel.consensus.state_store import StateStore
+
+
+class QueueNetwork(MockP2PNetwork):
+    """Mock network that queues broadcasts so tests choose delivery order."""
+    
+    def __init__(self, node_id: str, outbox: List[Tuple[str, ConsensusMessage]]):
+        super().__init__(node_id)
+        self.outbox = outbox
+    
+    def broadcast(self, topic: str, message: ConsensusMessage) -> None:
+        self.outbox.append((self.node_id, message))
+
+
+def _cluster(prefix: str, count: int = 4, watermark_window: int = 8):
+    outbox: List[Tuple[str, ConsensusMessage]] = []
+    ids = [f"{prefix}{i}" for i in range(count)]
+    engines: Dict[str, ConsensusEngine] = {}
+    
+    for node_id in ids:
+        network = QueueNetwork(node_id, outbox)
+        for other in ids:
+            if other != node_id:
+                network.add_peer(PeerInfo(peer_id=other, address=f"localhost:{other}", stake=1000))
+        
+        engine = ConsensusEngine(
+            node_id=node_id,
+            validator_stake=1000,
+            network=network,
+            state_store=StateStore(),
+            proof_mempool=ProofMempool(),
+            metrics_collector=MetricsCollector(),
+            watermark_window=watermark_window,
+        )
+        engine.pre_prepare_handler = engine.handle_pre_prepare
+        engine.prepare_handler = engine.handle_prepare
+        engine.commit_handler = engine.handle_commit
+        engine.executed = []
+        engine.finalization_handler = (
+            lambda result, engine=engine: engine.executed.append(result.finalized_state)
+        )
+        engines[node_id] = engine
+    
+    return engines, outbox, engines[ids[0]]
+
+
+def _pump(engines, outbox, keep=lambda message: True):
+    """Deliver queued messages until quiet; messages failing `keep` are held back."""
+    held = []
+    while outbox:
+        sender, message = outbox.pop(0)
+        if not keep(message):
+            held.append((sender, message))
+            continue
+        for node_id, engine in engines.items():
+            if node_id != sender:
+                engine._handle_consensus_message(message)
+    outbox.extend(held)
+
+
+def _propose(leader, tag: str, count: int = 1):
+    for i in range(count):
+        leader.proof_mempool.add_proof({
+            'constraints': [f'{tag}_{i} > 0'],
+            'post_conditions': [f'{tag}_{i} > 0'],
+            'valid': True,
+        })
+    block = leader.propose_block_from_mempool(block_size=count)
+    leader.start_consensus_round(block)
+    return block
+
+
+class TestPipelining:
+    """Test overlapping consensus instances"""
+    
+    def test_rounds_overlap_and_execute_in_order(self):
+        """Three rounds run concurrently and every node executes them in order"""
+        engines, outbox, leader = _cluster("pipe_a")
+        blocks = [_propose(leader, f"b{i}") for i in range(3)]
+        
+        assert leader.sequence == 3
+        assert leader.get_performance_stats()['in_flight'] == 3
+        
+        _pump(engines, outbox)
+        
+        digests = [block.hash() for block in blocks]
+        for engine in engines.values():
+            assert engine.executed == digests
+            assert engine.low_watermark == 3
+            assert not engine.instances
+        assert leader.proof_mempool.size() == 0
+    
+    def test_out_of_order_commit_waits_for_earlier_sequence(self):
+        """A later sequence that commits first is buffered until the gap fills"""
+        engines, outbox, leader = _cluster("pipe_b")
+        first = _propose(leader, "first")
+        second = _propose(leader, "second")
+        
+        _pump(engines, outbox, keep=lambda message: message.sequence == 2)
+        
+        follower = engines["pipe_b1"]
+        state = follower.get_instance(2)
+        assert state.committed and not state.executed
+        assert follower.executed == []
+        assert follower.low_watermark == 0
+        
+        _pump(engines, outbox)
+        
+        assert follower.executed == [first.hash(), second.hash()]
+        assert follower.low_watermark == 2
+    
+    def test_votes_before_pre_prepare_are_buffered(self):
+        """PREPAREs and COMMITs that overtake the PRE-PREPARE still count"""
+        engines, outbox, leader = _cluster("pipe_c")
+        block = _propose(leader, "late")
+        
+        pre_prepares = [m for m in outbox if m[1].message_type == MessageType.PRE_PREPARE]
+        outbox[:] = [m for m in outbox if m[1].message_type != MessageType.PRE_PREPARE]
+        
+        # Everyone except the late node sees the proposal; votes reach all
+        late_node = engines["pipe_c3"]
+        for _, message in pre_prepares:
+            for node_id in ("pipe_c1", "pipe_c2"):
+                engines[node_id]._handle_consensus_message(message)
+        _pump(engines, outbox)
+        
+        state = late_node.get_instance(1)
+        assert state.early_prepares and state.early_commits
+        assert late_node.executed == []
+        
+        late_node._handle_consensus_message(pre_prepares[0][1])
+        _pump(engines, outbox)
+        
+        assert late_node.executed == [block.hash()]
+
+
+class TestWatermarks:
+    """Test the watermark window"""
+    
+    def test_window_caps_in_flight_rounds(self):
+        """The leader cannot start more rounds than the window allows"""
+        engines, outbox, leader = _cluster("pipe_d", watermark_window=2)
+        _propose(leader, "w0")
+        _propose(leader, "w1")
+        
+        assert not leader.can_start_round()
+        result = leader.start_consensus_round(leader.get_instance(1).proof_block)
+        assert not result.consensus_reached
+        assert leader.sequence == 2
+        
+        _pump(engines, outbox)
+        assert leader.can_start_round()
+        assert leader.high_watermark == 4
+    
+    def test_messages_outside_window_ignored(self):
+        """Sequences beyond the high watermark are dropped"""
+        engines, outbox, leader = _cluster("pipe_e", watermark_window=2)
+        follower = engines["pipe_e1"]
+        _propose(leader, "far")
+        _, pre_prepare = outbox[0]
+        pre_prepare.sequence = 5
+        
+        follower._handle_consensus_message(pre_prepare)
+        
+        assert follower.get_instance(5) is None
+        assert follower.sequence == 0
+    
+    def test_proposals_skip_in_flight_proofs(self):
+        """Back-to-back proposals do not reuse proofs still in consensus"""
+        engines, outbox, leader = _cluster("pipe_f")
+        first = _propose(leader, "p", count=2)
+        for i in range(2):
+            leader.proof_mempool.add_proof({'constraints': [f'q_{i} > 0'], 'valid': True})
+        second = leader.propose_block_from_mempool(block_size=4)
+        
+        assert len(second.proofs) == 2
+        assert not any(proof in first.proofs for proof in second.proofs)
@@ -0,0 +1,176 @@
+"""
+Tests for the discrete-event consensus simulator
+
+Covers determinism for a fixed seed, latency and bandwidth effects on
+finality, partitions that stall and heal, Byzantine validators, and the
+report's message-complexity figures.
+"""
+
+import pytest
+
+from aethel.consensus.byzantine_node import ByzantineAttackStrategy
+from aethel.consensus.data_models import MessageType, PrepareMessage
+from aethel.consensus.simulator import (
+    ConsensusSimulator,
+    LinkProfile,
+    SimulationConfig,
+    percentile,
+    simulate,
+)
+from aethel.consensus.wire_codec import encode_message
+
+
+class TestSimulation:
+    """Test basic simulation runs"""
+    
+    def test_blocks_finalize(self):
+        """An honest cluster finalizes nearly every proposed block"""
+        report = simulate(4, duration_ms=1000, seed=1)
+        
+        assert report.blocks_finalized >= report.blocks_proposed - 2
+        assert report.rounds_per_sec == pytest.approx(report.blocks_finalized / 1.0)
+        assert report.view_changes == 0
+    
+    def test_same_seed_same_result(self):
+        """Runs are deterministic for a given seed"""
+        first = simulate(7, duration_ms=800, seed=5).to_dict()
+        second = simulate(7, duration_ms=800, seed=5).to_dict()
+        first.pop("wall_seconds")
+        second.pop("wall_seconds")
+        
+        assert first == second
+    
+    def test_max_blocks_limits_proposals(self):
+        """No more than max_blocks blocks are proposed"""
+        report = simulate(4, duration_ms=2000, max_blocks=3)
+        
+        assert report.blocks_proposed == 3
+        assert report.blocks_finalized == 3
+    
+    def test_percentile(self):
+        """Nearest-rank percentiles"""
+        samples = list(range(1, 101))
+        
+        assert percentile(samples, 0.5) == 50
+        assert percentile(samples, 0.99) == 99
+        assert percentile([], 0.5) == 0.0
+
+
+class TestNetworkModel:
+    """Test latency, bandwidth and partitions"""
+    
+    def test_latency_raises_finality(self):
+        """Finality takes at least three one-way hops"""
+        fast = simulate(4, duration_ms=1500, link=LinkProfile(latency_ms=5, jitter_ms=0))
+        slow = simulate(4, duration_ms=1500, link=LinkProfile(latency_ms=100, jitter_ms=0))
+        
+        assert fast.finality_latency_ms["p50"] >= 15
+        assert slow.finality_latency_ms["p50"] >= 300
+        assert slow.finality_latency_ms["p50"] > fast.finality_latency_ms["p50"]
+    
+    def test_bandwidth_delays_large_clusters(self):
+        """A thin uplink slows a leader that broadcasts to many peers"""
+        wide = simulate(10, duration_ms=1000, link=LinkProfile(jitter_ms=0, bandwidth_mbps=1000))
+        thin = simulate(10, duration_ms=1000, link=LinkProfile(jitter_ms=0, bandwidth_mbps=1))
+        
+        assert thin.finality_latency_ms["p50"] > wide.finality_latency_ms["p50"]
+    
+    def test_per_link_override(self):
+        """set_link overrides the default profile for one pair"""
+        sim = ConsensusSimulator(SimulationConfig(validator_count=4, duration_ms=500))
+        a, b = sim.node_ids[:2]
+        slow = LinkProfile(latency_ms=400)
+        sim.set_link(a, b, slow)
+        
+        assert sim._links[(a, b)] is slow
+        assert sim._links[(b, a)] is slow
+        sim.run()
+    
+    def test_partition_stalls_then_recovers(self):
+        """No quorum while split; a view change restores progress after healing"""
+        config = SimulationConfig(validator_count=8, duration_ms=4000, view_change_timeout_ms=300, seed=2)
+        sim = ConsensusSimulator(config)
+        sim.partition([set(sim.node_ids[:4]), set(sim.node_ids[4:])], 500, 1500)
+        report = sim.run()
+        
+        finalized = sorted(sim._finalized_at.values())
+        assert not [t for t in finalized if 600 < t < 1500]
+        assert [t for t in finalized if t > 1500]
+        assert report.view_changes >= 1
+    
+    def test_loss_drops_messages(self):
+        """Lost messages are sent but never delivered"""
+        report = simulate(4, duration_ms=500, link=LinkProfile(loss_rate=0.2))
+        
+        assert report.messages_delivered < report.messages_sent
+
+
+class TestByzantine:
+    """Test Byzantine validators in the simulation"""
+    
+    @pytest.mark.parametrize("strategy", [
+        ByzantineAttackStrategy.CONFLICTING_VOTES,
+        ByzantineAttackStrategy.DOUBLE_SIGNING,
+        ByzantineAttackStrategy.WRONG_VIEW,
+        ByzantineAttackStrategy.RANDOM_CORRUPTION,
+    ])
+    def test_f_faulty_nodes_tolerated(self, strategy):
+        """Consensus still finalizes with f Byzantine validators"""
+        report = simulate(7, byzantine_count=2, byzantine_strategy=strategy, duration_ms=1000, seed=3)
+        
+        assert report.byzantine == 2
+        assert report.blocks_finalized > 0
+    
+    def test_silent_leader_triggers_view_change(self):
+        """A silent Byzantine leader is replaced after the progress timeout"""
+        seed = 0
+        while True:
+            config = SimulationConfig(
+                validator_count=4,
+                byzantine_count=1,
+                byzantine_strategy=ByzantineAttackStrategy.SILENT,
+                view_change_timeout_ms=200,
+                duration_ms=1500,
+                seed=seed,
+            )
+            sim = ConsensusSimulator(config)
+            if sim.node_ids[0] in sim.byzantine_ids:
+                break
+            seed += 1
+        
+        report = sim.run()
+        
+        assert report.view_changes >= 1
+        assert report.blocks_finalized > 0
+
+
+class TestReport:
+    """Test message complexity reporting"""
+    
+    def test_message_counts(self):
+        """Per-type counts add up and PBFT votes are quadratic (every node votes)"""
+        report = simulate(7, duration_ms=1000, max_blocks=5)
+        
+        assert sum(report.messages_by_type.values()) == report.messages_sent
+        assert report.messages_by_type[MessageType.PRE_PREPARE.value] == 5 * 6
+        assert report.messages_by_type[MessageType.PREPARE.value] == 5 * 7 * 6
+        assert report.messages_per_round == pytest.approx(report.messages_sent / 5)
+        assert report.bytes_per_round > 0
+    
+    def test_to_dict(self):
+        """Report serializes to a plain dictionary"""
+        data = simulate(4, duration_ms=300).to_dict()
+        
+        assert set(data["finality_latency_ms"]) == {"p50", "p95", "p99", "max"}
+        assert data["validators"] == 4
+    
+    def test_message_size_not_reused_after_free(self):
+        """A new message at a freed message's address is sized afresh"""
+        simulator = ConsensusSimulator(SimulationConfig(validator_count=4))
+        small = PrepareMessage(message_type=MessageType.PREPARE, view=0, sequence=1, sender_id="n0")
+        simulator.message_size(small)
+        del small
+        
+        large = PrepareMessage(message_type=MessageType.PREPARE, view=0, sequence=1, sender_id="n0",
+                               block_digest="f" * 4096)
+        assert simulator.message_size(large) == len(encode_message(large))
@@ -0,0 +1,178 @@
+"""
+Tests for the wavefront work-stealing scheduler
+
+Covers dependency ordering, dispatch without level barriers, work
+stealing, error and timeout propagation, copy-on-write account views,
+and ParallelExecutor running on the scheduler.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from aethel.core.dag_scheduler import WorkStealingScheduler
+from aethel.core.dependency_graph import DependencyGraph
+from aethel.core.parallel_executor import AccountView, ParallelExecutor
+from aethel.core.synchrony import EventType, TimeoutError, Transaction
+
+
+def make_txn(txn_id, accounts):
+    return Transaction(
+        id=txn_id,
+        intent_name="transfer",
+        accounts={account: {} for account in accounts},
+        operations=[],
+        verify_conditions=[],
+    )
+
+
+def run_graph(dependencies, task, workers=4, timeout_seconds=5.0):
+    scheduler = WorkStealingScheduler(worker_count=workers)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return scheduler, scheduler.run(dependencies, task, pool, timeout_seconds)
+
+
+class TestWorkStealingScheduler:
+    """Test DAG dispatch"""
+    
+    def test_respects_dependencies(self):
+        """Every node runs after all of its dependencies"""
+        dependencies = {
+            "a": [], "b": ["a"], "c": ["a"], "d": ["b", "c"], "e": [], "f": ["e", "d"],
+        }
+        lock = threading.Lock()
+        finished = []
+        
+        def task(node_id, worker_index):
+            with lock:
+                assert all(dep in finished for dep in dependencies[node_id])
+            time.sleep(0.001)
+            with lock:
+                finished.append(node_id)
+        
+        _, order = run_graph(dependencies, task)
+        
+        assert sorted(order) == sorted(dependencies)
+        assert order == finished
+    
+    def test_no_barrier_between_levels(self):
+        """A chain behind a short node finishes before a slow independent node"""
+        dependencies = {"slow": [], "b": [], "c": ["b"], "d": ["c"]}
+        
+        def task(node_id, worker_index):
+            if node_id == "slow":
+                time.sleep(0.2)
+        
+        _, order = run_graph(dependencies, task, workers=2)
+        
+        assert order.index("d") < order.index("slow")
+    
+    def test_idle_workers_steal(self):
+        """Ready work queued on one worker is picked up by the others"""
+        # Everything becomes ready when "root" completes, on one deque
+        dependencies = {"root": []}
+        dependencies.update({f"n{i}": ["root"] for i in range(40)})
+        
+        def task(node_id, worker_index):
+            time.sleep(0.002)
+        
+        scheduler, order = run_graph(dependencies, task)
+        stats = scheduler.get_stats()
+        
+        assert len(order) == 41
+        assert stats["steals"] > 0
+        assert sum(1 for count in stats["executed_per_worker"] if count) > 1
+    
+    def test_task_error_propagates(self):
+        """The first task exception is re-raised and dependents do not run"""
+        ran = []
+        
+        def task(node_id, worker_index):
+            if node_id == "a":
+                raise ValueError("boom")
+            ran.append(node_id)
+        
+        with pytest.raises(ValueError):
+            run_graph({"a": [], "b": ["a"]}, task)
+        assert "b" not in ran
+    
+    def test_timeout(self):
+        """A graph that outlives the deadline raises TimeoutError"""
+        release = threading.Event()
+        
+        def task(node_id, worker_index):
+            release.wait(1.0)
+        
+        with pytest.raises(TimeoutError) as exc_info:
+            run_graph({"a": [], "b": ["a"]}, task, workers=1, timeout_seconds=0.05)
+        release.set()
+        
+        assert exc_info.value.pending == 2
+    
+    def test_cycle_left_out(self):
+        """Nodes on a cycle never become ready and the run still returns"""
+        _, order = run_graph({"a": [], "b": ["c"], "c": ["b"]}, lambda node_id, index: None)
+        
+        assert order == ["a"]
+
+
+class TestAccountView:
+    """Test copy-on-write views"""
+    
+    def test_copies_only_on_write(self):
+        """Reads share the base object; writes copy one account"""
+        base = {"alice": {"balance": 10}, "bob": {"balance": 5}}
+        view = AccountView(base, ["alice", "bob"])
+        
+        assert view.read("bob") is base["bob"]
+        view.write("alice")["balance"] = 7
+        
+        assert base["alice"]["balance"] == 10
+        assert view.read("alice")["balance"] == 7
+        assert view.changes() == {"alice": {"balance": 7}}
+    
+    def test_untouched_accounts_unreachable(self):
+        """Accounts outside the transaction cannot be read"""
+        view = AccountView({"alice": {}, "carol": {}}, ["alice"])
+        
+        with pytest.raises(KeyError):
+            view.read("carol")
+        assert "carol" not in view
+
+
+class TestExecutorOnScheduler:
+    """Test ParallelExecutor using the scheduler"""
+    
+    def test_executes_graph_and_returns_levels(self):
+        """All transactions run and parallel_groups lists the levels"""
+        transactions = [make_txn("t1", ["a"]), make_txn("t2", ["a"]), make_txn("t3", ["b"])]
+        graph = DependencyGraph()
+        for txn in transactions:
+            graph.add_node(txn)
+        graph.add_edge("t1", "t2")
+        initial_states = {"a": {"balance": 3}, "b": {"balance": 4}, "c": {"balance": 9}}
+        
+        with ParallelExecutor(thread_count=2) as executor:
+            result = executor.execute_parallel(transactions, graph, initial_states)
+        
+        commits = [e.transaction_id for e in result.execution_trace if e.event_type == EventType.COMMIT]
+        starts = {e.transaction_id: e.timestamp for e in result.execution_trace if e.event_type == EventType.START}
+        commit_times = {e.transaction_id: e.timestamp for e in result.execution_trace if e.event_type == EventType.COMMIT}
+        
+        assert sorted(commits) == ["t1", "t2", "t3"]
+        assert commit_times["t1"] <= starts["t2"]
+        assert result.parallel_groups == [{"t1", "t3"}, {"t2"}]
+        assert result.final_states == initial_states
+        assert result.final_states["c"] is not initial_states["c"]
+    
+    def test_transaction_returns_only_touched_accounts(self):
+        """A transaction's result holds just the accounts it wrote"""
+        states = {f"acct_{i}": {"balance": i} for i in range(1000)}
+        
+        with ParallelExecutor() as executor:
+            changes = executor._execute_transaction(make_txn("t1", ["acct_5"]), states, thread_id=0)
+        
+        assert changes == {"acct_5": {"balance": 5}}
+        assert changes["acct_5"] is not states["acct_5"]
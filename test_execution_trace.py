@@ -0,0 +1,147 @@
+"""
+Tests for the compact execution trace
+
+Covers per-thread recording and merging, growth past the preallocated
+capacity, sampled and disabled modes, and the linearizability prover
+reading the compact form directly.
+"""
+
+import threading
+
+import pytest
+
+from aethel.core.batch_processor import BatchProcessor
+from aethel.core.dependency_analyzer import DependencyAnalyzer
+from aethel.core.execution_trace import CompactTrace, TraceBuffer
+from aethel.core.linearizability_prover import LinearizabilityProver
+from aethel.core.parallel_executor import ParallelExecutor
+from aethel.core.synchrony import EventType, ExecutionEvent, Transaction
+
+
+def make_txn(txn_id, accounts):
+    return Transaction(
+        id=txn_id,
+        intent_name="transfer",
+        accounts={account: {"balance": 100} for account in accounts},
+        operations=[],
+        verify_conditions=[],
+    )
+
+
+class TestTraceBuffer:
+    """Test recording and merging"""
+    
+    def test_merge_preserves_real_order_across_threads(self):
+        """Events from several threads come back in the order they happened"""
+        buffer = TraceBuffer(capacity_hint=16)
+        order_lock = threading.Lock()
+        expected = []
+        
+        def worker(name):
+            for i in range(50):
+                with order_lock:
+                    buffer.record(EventType.WRITE, name, f"acct_{i % 3}", i, i + 1, thread_id=7)
+                    expected.append((name, f"acct_{i % 3}", i))
+        
+        threads = [threading.Thread(target=worker, args=(f"t{n}",)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        trace = buffer.merge()
+        
+        assert len(trace) == 200
+        assert [(e.transaction_id, e.account_id, e.old_value) for e in trace] == expected
+        assert all(e.event_type == EventType.WRITE and e.thread_id == 7 for e in trace)
+        assert buffer.merge() is trace
+    
+    def test_behaves_like_event_list(self):
+        """Indexing, slicing and equality match a list of ExecutionEvent"""
+        buffer = TraceBuffer()
+        events = [
+            ExecutionEvent(1.5, "t1", EventType.START, thread_id=3),
+            ExecutionEvent(2.5, "t1", EventType.READ, account_id="alice", old_value=100, thread_id=3),
+            ExecutionEvent(3.5, "t1", EventType.COMMIT, thread_id=3),
+        ]
+        for event in events:
+            buffer.record_event(event)
+        
+        trace = buffer.merge()
+        
+        assert trace == events
+        assert trace[-1] == events[-1]
+        assert trace[1:] == events[1:]
+        assert CompactTrace.empty() == []
+        with pytest.raises(IndexError):
+            trace[3]
+    
+    def test_records_after_merge_are_appended(self):
+        """A later merge keeps earlier events and adds the new ones"""
+        buffer = TraceBuffer()
+        buffer.record(EventType.START, "t1")
+        first = buffer.merge()
+        buffer.record(EventType.COMMIT, "t1")
+        
+        assert len(first) == 1
+        assert [e.event_type for e in buffer.merge()] == [EventType.START, EventType.COMMIT]
+    
+    def test_sampling_is_per_transaction(self):
+        """Sampled mode keeps all or none of a transaction's events"""
+        buffer = TraceBuffer(mode="sampled", sample_rate=0.25)
+        traced = [f"t{i}" for i in range(400) if buffer.traces(f"t{i}")]
+        
+        assert 40 < len(traced) < 160
+        assert traced == [f"t{i}" for i in range(400) if TraceBuffer("sampled", 0.25).traces(f"t{i}")]
+        assert not buffer.merge().complete
+    
+    def test_off_mode_records_nothing(self):
+        """Disabled tracing skips every transaction"""
+        with ParallelExecutor(thread_count=2, trace_mode="off") as executor:
+            transactions = [make_txn(f"t{i}", [f"a{i}"]) for i in range(10)]
+            result = executor.execute_parallel(
+                transactions,
+                DependencyAnalyzer().analyze(transactions),
+                {f"a{i}": {"balance": i} for i in range(10)}
+            )
+        
+        assert len(result.execution_trace) == 0
+        assert result.final_states["a3"] == {"balance": 3}
+
+
+class TestProverOnCompactTrace:
+    """Test the prover consuming the compact form"""
+    
+    def test_prover_reads_columns(self, monkeypatch):
+        """No ExecutionEvent objects are built to prove a full trace"""
+        transactions = [make_txn(f"t{i}", [f"from_{i}", f"to_{i}"]) for i in range(200)]
+        graph = DependencyAnalyzer().analyze(transactions)
+        with ParallelExecutor(thread_count=4) as executor:
+            result = executor.execute_parallel(transactions, graph, {})
+        
+        def no_events(self, i):
+            raise AssertionError("event materialized")
+        
+        monkeypatch.setattr(CompactTrace, "event", no_events)
+        prover = LinearizabilityProver()
+        proof = prover.prove_linearizability(result, transactions, graph)
+        
+        assert proof.is_linearizable
+        assert prover.last_method == "precedence_graph"
+        assert sorted(proof.serial_order) == sorted(tx.id for tx in transactions)
+    
+    @pytest.mark.parametrize("mode", ["sampled", "off"])
+    def test_incomplete_trace_proven_on_dag(self, mode):
+        """Sampled and disabled traces are proven from the dependency graph"""
+        transactions = [make_txn(f"t{i}", [f"a{i}", f"b{i}"]) for i in range(50)]
+        
+        processor = BatchProcessor(num_threads=2, trace_mode=mode, trace_sample_rate=0.1)
+        try:
+            result = processor.execute_batch(transactions)
+        finally:
+            processor.shutdown()
+        
+        assert result.success
+        assert result.linearizability_proof.is_linearizable
+        assert "precedence_graph" in result.linearizability_proof.proof
+        assert len(result.execution_trace) < 50 * 6
@@ -0,0 +1,157 @@
+"""
+Tests for hot-account partitioning
+
+Covers hot-account detection in the DependencyAnalyzer, splitting
+credit-only hot accounts out of the dependency graph, per-worker
+sub-accumulators in both executor backends, and the merge proof in the
+conservation stage.
+"""
+
+import pytest
+
+from aethel.core.batch_processor import BatchProcessor
+from aethel.core.conservation_validator import ConservationValidator
+from aethel.core.dependency_analyzer import DependencyAnalyzer
+from aethel.core.parallel_executor import ParallelExecutor
+from aethel.core.synchrony import (
+    CircularDependencyError,
+    Credit,
+    EventType,
+    ExecutionResult,
+    Transaction,
+)
+
+
+def pay_fee(txn_id, payer, fee=1, sink="fees"):
+    """Move a fee from a payer to a shared fee sink"""
+    return Transaction(
+        id=txn_id,
+        intent_name="pay_fee",
+        accounts={payer: {"balance": 100}, sink: {"balance": 0}},
+        operations=[Credit(payer, -fee), Credit(sink, fee)],
+        verify_conditions=[],
+    )
+
+
+class TestHotAccountDetection:
+    """Test detection and splitting in the analyzer"""
+    
+    def test_credit_only_hot_account_is_split(self):
+        """Fee payers become independent once the sink is split"""
+        transactions = [pay_fee(f"t{i}", f"user_{i}") for i in range(20)]
+        
+        graph = DependencyAnalyzer(hot_account_threshold=8).analyze(transactions)
+        
+        assert graph.hot_accounts == {"fees": 20}
+        assert graph.split_accounts == {"fees": [f"t{i}" for i in range(20)]}
+        assert graph.get_independent_sets() == [{f"t{i}" for i in range(20)}]
+        assert transactions[0].get_write_set() == {"user_0"}
+    
+    def test_non_commutative_access_is_not_split(self):
+        """One transaction that does more than credit keeps the account ordered"""
+        transactions = [pay_fee(f"t{i}", f"user_{i}") for i in range(10)]
+        transactions.append(Transaction(
+            id="sweep",
+            intent_name="sweep",
+            accounts={"fees": {"balance": 0}},
+            operations=[],
+            verify_conditions=[],
+        ))
+        analyzer = DependencyAnalyzer(hot_account_threshold=8)
+        
+        assert analyzer.detect_hot_accounts([
+            analyzer.extract_read_write_sets(txn) for txn in transactions
+        ]) == {"fees": 11}
+        with pytest.raises(CircularDependencyError):
+            analyzer.analyze(transactions)
+    
+    def test_below_threshold_and_disabled(self):
+        """Cold or unsplit shared sinks are still ordinary write conflicts"""
+        transactions = [pay_fee(f"t{i}", f"user_{i}") for i in range(4)]
+        
+        with pytest.raises(CircularDependencyError):
+            DependencyAnalyzer(hot_account_threshold=8).analyze(transactions)
+        with pytest.raises(CircularDependencyError):
+            DependencyAnalyzer(hot_account_threshold=None).analyze(
+                [pay_fee(f"t{i}", f"user_{i}") for i in range(40)]
+            )
+        
+        graph = DependencyAnalyzer(hot_account_threshold=8).analyze(
+            [pay_fee(f"t{i}", f"user_{i}", sink=f"fees_{i}") for i in range(8)]
+        )
+        assert graph.hot_accounts == {} and graph.split_accounts == {}
+
+
+class TestSubAccumulators:
+    """Test execution and merge of split accounts"""
+    
+    @pytest.mark.parametrize("backend", ["thread", "process"])
+    def test_credits_merge_into_sink(self, backend):
+        """Both backends sum credits per worker and merge them after the batch"""
+        transactions = [pay_fee(f"t{i}", f"user_{i}", fee=i) for i in range(16)]
+        graph = DependencyAnalyzer(hot_account_threshold=8).analyze(transactions)
+        initial_states = {f"user_{i}": {"balance": 100} for i in range(16)}
+        initial_states["fees"] = {"balance": 5, "owner": "exchange"}
+        
+        with ParallelExecutor(thread_count=4, backend=backend, process_count=2,
+                              process_threshold=8) as executor:
+            result = executor.execute_parallel(transactions, graph, initial_states)
+        
+        assert result.final_states["fees"] == {"balance": 5 + sum(range(16)), "owner": "exchange"}
+        assert result.final_states["user_3"] == {"balance": 97}
+        assert sum(sum(partials) for partials in result.accumulators.values()) == sum(range(16))
+        assert not any(event.account_id == "fees" for event in result.execution_trace)
+        assert initial_states["fees"]["balance"] == 5
+    
+    def test_merge_proof_rejects_lost_credit(self):
+        """The conservation stage catches a merge that drops a partial sum"""
+        transactions = [pay_fee(f"t{i}", f"user_{i}") for i in range(3)]
+        initial_states = {"fees": {"balance": 0}}
+        validator = ConservationValidator()
+        
+        def merged(partials, final):
+            return ExecutionResult(
+                final_states={"fees": {"balance": final}},
+                execution_trace=[],
+                parallel_groups=[],
+                execution_time=0.0,
+                thread_count=2,
+                accumulators={"fees": partials}
+            )
+        
+        assert validator.validate_accumulator_merge(merged([2, 1], 3), transactions, initial_states).is_valid
+        lost = validator.validate_accumulator_merge(merged([2, 0], 2), transactions, initial_states)
+        assert not lost.is_valid
+        assert lost.violation_amount == -1
+    
+    def test_batch_with_hot_fee_sink(self):
+        """A fee-paying batch runs in one parallel group and conserves value"""
+        processor = BatchProcessor(num_threads=4)
+        try:
+            result = processor.execute_batch([pay_fee(f"t{i}", f"user_{i}") for i in range(32)])
+        finally:
+            processor.shutdown()
+        
+        assert result.success
+        assert result.transactions_parallel == 32
+        assert result.diagnostic_info["split_accounts"] == ["fees"]
+        assert any(event.event_type == EventType.WRITE for event in result.execution_trace)
+    
+    def test_no_split_skips_accumulators_and_merge_proof(self, monkeypatch):
+        """Batches without a split account pay nothing for sub-accumulators"""
+        processor = BatchProcessor(num_threads=4)
+        
+        def unexpected(*args, **kwargs):
+            raise AssertionError("merge proof ran without a split account")
+        
+        monkeypatch.setattr(processor.conservation_validator, "validate_accumulator_merge", unexpected)
+        try:
+            single = processor.execute_batch([pay_fee("t0", "user_0")])
+            independent = processor.execute_batch(
+                [pay_fee(f"t{i}", f"user_{i}", sink=f"fees_{i}") for i in range(4)]
+            )
+        finally:
+            processor.shutdown()
+        
+        assert single.success and independent.success
+        assert processor.parallel_executor.accumulators == []
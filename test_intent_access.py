@@ -0,0 +1,157 @@
+"""
+Tests for static read/write-set extraction from intents
+
+Covers the old_x pre-state rules, frame conditions, the per-definition
+cache, and atomic_batch transactions carrying the extracted sets into the
+dependency analyzer and executor.
+"""
+
+import pytest
+
+from aethel.core.batch_processor import BatchProcessor
+from aethel.core.dependency_analyzer import DependencyAnalyzer
+from aethel.core.intent_access import extract_intent_access, intent_access_cache_info
+from aethel.core.parser import AethelParser
+from aethel.core.synchrony import EventType
+
+
+PAYROLL = """
+atomic_batch payroll {
+    intent pay_alice(amount: int) {
+        guard {
+            old_alice == alice;
+            old_treasury == treasury;
+            amount > 0;
+        }
+        solve {
+            priority: speed;
+        }
+        verify {
+            alice == old_alice + amount;
+            treasury < old_treasury;
+            rate == old_rate;
+        }
+    }
+    
+    intent pay_bob(amount: int) {
+        guard {
+            old_bob == bob;
+            amount > 0;
+        }
+        solve {
+            priority: speed;
+        }
+        verify {
+            bob == old_bob + amount;
+            rate == old_rate;
+        }
+    }
+}
+"""
+
+
+@pytest.fixture
+def batch():
+    return AethelParser().parse(PAYROLL)[0]
+
+
+class TestExtraction:
+    """Test the read/write rules"""
+    
+    def test_transfer_sets(self, batch):
+        """Defined and changed state is written, parameters are not accounts"""
+        access = extract_intent_access(batch.intents["pay_alice"])
+        
+        assert access.write_set == {"alice", "treasury"}
+        assert access.reads == {"alice", "treasury", "rate"}
+        assert access.accounts == ["alice", "rate", "treasury"]
+        assert "amount" not in access.accounts
+    
+    def test_frame_condition_is_read_only(self, batch):
+        """x == old_x keeps x out of the write set"""
+        access = extract_intent_access(batch.intents["pay_bob"])
+        
+        assert access.write_set == {"bob"}
+        assert "rate" in access.reads
+    
+    def test_conservation_check_does_not_write(self):
+        """A relation between pre-states and parameters defines nothing"""
+        intent = AethelParser().parse("""
+        intent audit(limit: int) {
+            guard { total > 0; }
+            solve { priority: security; }
+            verify { old_total <= limit; }
+        }
+        """)["audit"]
+        access = extract_intent_access(intent)
+        
+        assert access.writes == ()
+        assert access.reads == {"total"}
+    
+    def test_cached_per_definition(self):
+        """Re-parsing the same program reuses the analysis"""
+        first = AethelParser().parse(PAYROLL)[0]
+        extract_intent_access(first.intents["pay_bob"])
+        hits = intent_access_cache_info().hits
+        
+        second = AethelParser().parse(PAYROLL)[0]
+        
+        assert extract_intent_access(second.intents["pay_bob"]) is extract_intent_access(first.intents["pay_bob"])
+        assert intent_access_cache_info().hits >= hits + 2
+
+
+class TestAtomicBatchTransactions:
+    """Test the sets reaching the batch pipeline"""
+    
+    def test_transactions_carry_sets(self, batch):
+        """to_transactions fills accounts, write operations and cached sets"""
+        by_intent = {tx.intent_name: tx for tx in batch.to_transactions()}
+        
+        alice = by_intent["pay_alice"]
+        assert set(alice.accounts) == {"alice", "treasury", "rate"}
+        assert [op.account_id for op in alice.operations] == ["alice", "treasury"]
+        assert alice.get_write_set() == {"alice", "treasury"}
+    
+    def test_shared_read_only_account_is_independent(self, batch):
+        """Intents that only read a common account run in one parallel group"""
+        graph = DependencyAnalyzer().analyze(batch.to_transactions())
+        
+        assert graph.get_independent_sets() == [{"payroll_pay_alice", "payroll_pay_bob"}]
+    
+    def test_read_only_intents_are_independent(self):
+        """Intents that write nothing are not treated as writing every account"""
+        batch = AethelParser().parse("""
+        atomic_batch audits {
+            intent audit_a(limit: int) {
+                guard { old_rate == rate; }
+                solve { priority: security; }
+                verify { rate == old_rate; }
+            }
+            
+            intent audit_b(limit: int) {
+                guard { old_rate == rate; }
+                solve { priority: security; }
+                verify { rate == old_rate; }
+            }
+        }
+        """)[0]
+        transactions = batch.to_transactions()
+        
+        graph = DependencyAnalyzer().analyze(transactions)
+        
+        assert all(tx.operations == [] and tx.get_write_set() == set() for tx in transactions)
+        assert graph.get_independent_sets() == [{"audits_audit_a", "audits_audit_b"}]
+    
+    def test_execution_writes_only_write_set(self, batch):
+        """Read-only accounts are read but never written"""
+        processor = BatchProcessor(num_threads=2)
+        try:
+            result = processor.execute_atomic_batch(batch)
+        finally:
+            processor.shutdown()
+        
+        assert result.success
+        written = {e.account_id for e in result.execution_trace if e.event_type == EventType.WRITE}
+        read = {e.account_id for e in result.execution_trace if e.event_type == EventType.READ}
+        assert written == {"alice", "treasury", "bob"}
+        assert "rate" in read
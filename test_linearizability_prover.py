@@ -13,7 +13,13 @@ import pytest
 import time
 from typing import List, Dict, Set
 
-from aethel.core.linearizability_prover import LinearizabilityProver
+from aethel.core.linearizability_prover import (
+    LinearizabilityProver,
+    GRAPH_AMBIGUOUS,
+    GRAPH_LINEARIZABLE,
+    GRAPH_VIOLATION,
+)
+from aethel.core.dependency_graph import DependencyGraph
 from aethel.core.synchrony import (
     Transaction,
     ExecutionResult,
@@ -279,5 +285,133 @@ def test_prove_linearizability_success(prover, simple_transactions, simple_execu
     assert "serial order" in proof_result.proof.lower()
 
 
+# ============================================================================
+# UNIT TESTS - Precedence graph check
+# ============================================================================
+
+def _trace(*spans):
+    """Build a trace from (tx_id, start, commit, accounts, writes) spans"""
+    events = []
+    for tx_id, start, commit, accounts, writes in spans:
+        events.append(ExecutionEvent(start, tx_id, EventType.START))
+        for account_id in accounts:
+            events.append(ExecutionEvent(start, tx_id, EventType.READ, account_id=account_id))
+            if writes:
+                events.append(ExecutionEvent(start, tx_id, EventType.WRITE, account_id=account_id))
+        events.append(ExecutionEvent(commit, tx_id, EventType.COMMIT))
+    events.sort(key=lambda e: e.timestamp)
+    return ExecutionResult(
+        final_states={},
+        execution_trace=events,
+        parallel_groups=[],
+        execution_time=0.0,
+        thread_count=1
+    )
+
+
+def _txn(tx_id, accounts):
+    return Transaction(id=tx_id, intent_name="transfer", accounts={a: {} for a in accounts},
+                       operations=[], verify_conditions=[])
+
+
+def test_graph_check_orders_by_real_time(prover):
+    """
+    Test non-overlapping transactions are ordered by the trace.
+    
+    Validates: Requirements 4.1, 4.2
+    """
+    transactions = [_txn("T1", ["A"]), _txn("T2", ["A"]), _txn("T3", ["B"])]
+    execution_result = _trace(
+        ("T2", 1.0, 2.0, ["A"], True),
+        ("T3", 1.5, 4.0, ["B"], True),
+        ("T1", 3.0, 5.0, ["A"], True),
+    )
+    
+    verdict, serial_order = prover.check_precedence_graph(execution_result, transactions)
+    
+    assert verdict == GRAPH_LINEARIZABLE
+    assert serial_order.index("T2") < serial_order.index("T1")
+    assert set(serial_order) == {"T1", "T2", "T3"}
+    
+    proof_result = prover.prove_linearizability(execution_result, transactions)
+    assert proof_result.is_linearizable is True
+    assert prover.last_method == "precedence_graph"
+
+
+def test_graph_check_detects_dag_violation(prover):
+    """
+    Test a trace contradicting the dependency DAG is rejected without Z3.
+    
+    Validates: Requirements 4.3
+    """
+    transactions = [_txn("T1", ["A"]), _txn("T2", ["A"])]
+    graph = DependencyGraph()
+    for tx in transactions:
+        graph.add_node(tx)
+    graph.add_edge("T1", "T2")
+    # T2 ran entirely before T1
+    execution_result = _trace(("T2", 1.0, 2.0, ["A"], True), ("T1", 3.0, 4.0, ["A"], True))
+    
+    verdict, unordered = prover.check_precedence_graph(execution_result, transactions, graph)
+    assert verdict == GRAPH_VIOLATION
+    assert set(unordered) == {"T1", "T2"}
+    
+    proof_result = prover.prove_linearizability(execution_result, transactions, graph)
+    assert proof_result.is_linearizable is False
+    assert proof_result.counterexample["violation_type"] == "precedence_cycle"
+
+
+def test_overlapping_conflicts_fall_back_to_z3(prover):
+    """
+    Test overlapping writes to one account are ambiguous and go to Z3.
+    
+    Validates: Requirements 4.1
+    """
+    transactions = [_txn("T1", ["A"]), _txn("T2", ["A"])]
+    execution_result = _trace(("T1", 1.0, 3.0, ["A"], True), ("T2", 2.0, 4.0, ["A"], True))
+    
+    verdict, _ = prover.check_precedence_graph(execution_result, transactions)
+    assert verdict == GRAPH_AMBIGUOUS
+    
+    prover.prove_linearizability(execution_result, transactions)
+    assert prover.last_method == "z3"
+
+
+def test_overlapping_readers_are_not_ambiguous(prover):
+    """
+    Test concurrent reads of one account need no fallback.
+    
+    Validates: Requirements 4.1
+    """
+    transactions = [_txn("T1", ["A"]), _txn("T2", ["A"])]
+    execution_result = _trace(("T1", 1.0, 3.0, ["A"], False), ("T2", 2.0, 4.0, ["A"], False))
+    
+    verdict, serial_order = prover.check_precedence_graph(execution_result, transactions)
+    
+    assert verdict == GRAPH_LINEARIZABLE
+    assert serial_order == ["T1", "T2"]
+
+
+def test_graph_check_scales(prover):
+    """
+    Test thousands of transactions are proven in well under a second.
+    
+    Validates: Requirements 4.1, 4.2
+    """
+    count = 3000
+    transactions = [_txn(f"T{i}", [f"A{i}", f"B{i}"]) for i in range(count)]
+    execution_result = _trace(*[
+        (f"T{i}", i * 0.001, i * 0.001 + 0.005, [f"A{i}", f"B{i}"], True)
+        for i in range(count)
+    ])
+    
+    proof_result = prover.prove_linearizability(execution_result, transactions)
+    
+    assert proof_result.is_linearizable is True
+    assert len(proof_result.serial_order) == count
+    assert prover.last_method == "precedence_graph"
+    assert proof_result.proof_time < 1.0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
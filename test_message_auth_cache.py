@@ -0,0 +1,174 @@
+"""
+Tests for batched message authentication in consensus
+
+Covers the verified signature cache and thread-pool batch verification in
+ProofVerifier, batched Ghost Identity verification with its verified
+message cache, and up-front ghost checks in ConsensusEngine batches.
+"""
+
+import json
+
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+from aethel.core.crypto import AethelCrypt
+from aethel.consensus.consensus_engine import ConsensusEngine
+from aethel.consensus.data_models import MessageType, PrepareMessage, SignedProof
+from aethel.consensus.ghost_consensus import GhostConsensusConfig, GhostConsensusIntegration
+from aethel.consensus.mock_network import MockP2PNetwork
+from aethel.consensus.proof_verifier import ProofVerifier
+
+
+def _signed(tag: str, tamper: bool = False) -> SignedProof:
+    crypto = AethelCrypt()
+    keypair = crypto.generate_keypair()
+    proof_data = {'constraints': [f'{tag} > 0'], 'valid': True}
+    message = json.dumps(proof_data, sort_keys=True, separators=(',', ':'))
+    if tamper:
+        message += " "
+    return SignedProof(
+        proof_data=proof_data,
+        public_key=keypair.public_key_hex,
+        signature=crypto.sign_message(keypair.private_key, message),
+    )
+
+
+def _ghost(validators: int = 4, **config):
+    ghost = GhostConsensusIntegration(GhostConsensusConfig(**config))
+    keys = [Ed25519PrivateKey.generate() for _ in range(validators)]
+    for key in keys:
+        ghost.register_validator(key.public_key())
+    return ghost, keys
+
+
+def _ghost_prepare(ghost, keys, signer: int, digest: str) -> PrepareMessage:
+    message = PrepareMessage(
+        message_type=MessageType.PREPARE,
+        view=0,
+        sequence=1,
+        sender_id=f"node_{signer}",
+        block_digest=digest
+    )
+    return ghost.create_ghost_consensus_message(message, keys[signer], signer)
+
+
+class TestSignatureCache:
+    """Test ProofVerifier signature caching and batching"""
+    
+    def test_repeat_verification_hits_cache(self):
+        """A signature verified once is answered from the cache"""
+        verifier = ProofVerifier()
+        proof = _signed("a")
+        
+        assert verifier.verify_signature(proof)
+        assert verifier.verify_signature(proof)
+        
+        assert verifier.get_stats()['signature_cache_hits'] == 1
+    
+    def test_invalid_signatures_stay_invalid(self):
+        """Cached failures are still reported as failures"""
+        verifier = ProofVerifier()
+        proof = _signed("b", tamper=True)
+        
+        assert not verifier.verify_signature(proof)
+        assert not verifier.verify_signature(proof)
+        assert verifier.get_stats()['signature_failures'] == 2
+    
+    def test_batch_matches_individual(self):
+        """Batched verdicts agree with one-at-a-time verification"""
+        proofs = [_signed(f"c{i}", tamper=(i % 3 == 0)) for i in range(9)]
+        proofs.append(SignedProof(proof_data={'constraints': []}))
+        
+        batch = ProofVerifier().batch_verify_signatures(proofs + proofs[:3])
+        single = ProofVerifier()
+        
+        assert len(batch) == len(proofs)
+        for proof in proofs:
+            proof_hash = next(h for h in batch if batch[h] == single.verify_signature(proof))
+            assert proof_hash
+        assert sum(batch.values()) == 6
+    
+    def test_batch_duplicates_verified_once(self):
+        """Duplicates inside a batch and across batches are cache hits"""
+        verifier = ProofVerifier(max_workers=2)
+        proof = _signed("d")
+        
+        verifier.batch_verify_signatures([proof, proof])
+        verifier.batch_verify_signatures([proof])
+        
+        assert verifier.get_stats()['signature_cache_hits'] == 2
+    
+    def test_cache_is_bounded(self):
+        """The oldest verdicts are evicted past the cache size"""
+        verifier = ProofVerifier(signature_cache_size=2)
+        verifier.batch_verify_signatures([_signed(f"e{i}") for i in range(5)])
+        
+        assert len(verifier._signature_cache) == 2
+
+
+class TestGhostBatchVerification:
+    """Test batched Ghost Identity verification"""
+    
+    def test_batch_accepts_distinct_signers(self):
+        """Messages from different validators all verify in one batch"""
+        ghost, keys = _ghost()
+        messages = [_ghost_prepare(ghost, keys, i, "digest") for i in range(4)]
+        
+        assert ghost.verify_ghost_consensus_messages(messages) == [True] * 4
+    
+    def test_redelivery_is_cache_hit(self):
+        """The same message delivered twice is accepted without re-verifying"""
+        ghost, keys = _ghost()
+        message = _ghost_prepare(ghost, keys, 1, "digest")
+        
+        assert ghost.verify_ghost_consensus_message(message)
+        assert ghost.verify_ghost_consensus_messages([message, message]) == [True, True]
+        assert ghost._verify_cache_hits == 2
+    
+    def test_batch_rejects_double_signing(self):
+        """A second message under the same key image fails, as it would singly"""
+        ghost, keys = _ghost()
+        first = _ghost_prepare(ghost, keys, 2, "digest_1")
+        second = _ghost_prepare(ghost, keys, 2, "digest_2")
+        
+        assert ghost.verify_ghost_consensus_messages([first, second]) == [True, False]
+    
+    def test_tampered_message_rejected(self):
+        """Changing the payload after signing fails verification"""
+        ghost, keys = _ghost()
+        message = _ghost_prepare(ghost, keys, 0, "digest")
+        message.sequence = 99
+        
+        assert ghost.verify_ghost_consensus_messages([message]) == [False]
+    
+    def test_clear_resets_cache(self):
+        """Clearing key images also forgets verified messages"""
+        ghost, keys = _ghost()
+        message = _ghost_prepare(ghost, keys, 0, "digest")
+        ghost.verify_ghost_consensus_message(message)
+        
+        ghost.clear_used_key_images()
+        
+        assert not ghost._verified
+
+
+class TestEngineBatch:
+    """Test ghost pre-verification in ConsensusEngine.batch_process_messages"""
+    
+    def test_invalid_ghost_messages_dropped(self):
+        """Only messages that pass batch verification reach the handlers"""
+        engine = ConsensusEngine("auth_0", 1000, MockP2PNetwork("auth_0"))
+        ghost, keys = _ghost()
+        engine.ghost_consensus = ghost
+        
+        good = _ghost_prepare(ghost, keys, 1, "digest")
+        bad = _ghost_prepare(ghost, keys, 2, "digest")
+        bad.sequence = 99
+        
+        seen = []
+        engine.prepare_handler = lambda message: seen.append(
+            (message, ghost.verify_ghost_consensus_message(message))
+        )
+        engine.batch_process_messages([good, bad])
+        
+        assert seen == [(good, True)]
+        assert ghost._verify_cache_hits == 1
@@ -0,0 +1,249 @@
+"""
+Tests for the in-process metrics registry
+
+Covers counters, gauges and histograms, the Prometheus text exposition,
+concurrent striped updates, bucket-based quantiles, consensus phase
+latencies from MetricsCollector, and scrape-time behaviour of
+ExpertTelemetry.
+"""
+
+import threading
+
+import pytest
+
+from aethel.consensus.consensus_engine import ConsensusEngine
+from aethel.consensus.data_models import PeerInfo
+from aethel.consensus.mock_network import MockP2PNetwork
+from aethel.consensus.monitoring import CONSENSUS_PHASES, MetricsCollector
+from aethel.consensus.proof_mempool import ProofMempool
+from aethel.consensus.state_store import StateStore
+from aethel.core.metrics_registry import MetricsRegistry, get_registry
+from aethel.moe.data_models import ExpertVerdict, MOEResult
+from aethel.moe.telemetry import ExpertTelemetry
+
+
+class TestMetrics:
+    """Test metric types"""
+    
+    def test_counter_and_labels(self):
+        """Counters add up per label combination"""
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "Requests", ["route"])
+        requests.labels("a").inc()
+        requests.labels(route="a").inc(2)
+        requests.labels("b").inc()
+        
+        assert requests.labels("a").get() == 3
+        assert requests.labels("b").get() == 1
+        with pytest.raises(ValueError):
+            requests.labels("a").inc(-1)
+        with pytest.raises(ValueError):
+            requests.inc()
+    
+    def test_gauge(self):
+        """Gauges can be set, raised and lowered"""
+        gauge = MetricsRegistry().gauge("depth", "Depth")
+        gauge.set(5)
+        gauge.inc()
+        gauge.dec(3)
+        
+        assert gauge.get() == 3
+    
+    def test_histogram_quantiles(self):
+        """Quantiles interpolate within the bucket holding the rank"""
+        histogram = MetricsRegistry().histogram("latency", "Latency", buckets=[1, 2, 4, 8])
+        for value in [0.5] * 50 + [3] * 49 + [7]:
+            histogram.observe(value)
+        
+        assert histogram.count() == 100
+        assert histogram.quantile(0.5) == pytest.approx(1.0)
+        assert 2 < histogram.quantile(0.95) <= 4
+        assert 4 < histogram.quantile(0.999) <= 8
+    
+    def test_overflow_bucket_reports_largest_bound(self):
+        """Observations above every bucket report the top finite bound"""
+        histogram = MetricsRegistry().histogram("big", "Big", buckets=[1, 2])
+        histogram.observe(100)
+        
+        assert histogram.quantile(0.99) == 2
+    
+    def test_registry_reuses_metrics(self):
+        """The same name returns the same metric; a type clash is rejected"""
+        registry = MetricsRegistry()
+        first = registry.counter("shared_total", "Shared")
+        
+        assert registry.counter("shared_total", "Shared") is first
+        with pytest.raises(ValueError):
+            registry.gauge("shared_total", "Shared")
+    
+    def test_concurrent_updates(self):
+        """Striped updates from many threads lose no increments"""
+        registry = MetricsRegistry()
+        counter = registry.counter("hits_total", "Hits")
+        histogram = registry.histogram("work_seconds", "Work")
+        
+        def work():
+            for _ in range(2000):
+                counter.inc()
+                histogram.observe(0.003)
+        
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert counter.get() == 16000
+        assert histogram.count() == 16000
+    
+    def test_default_registry_is_shared(self):
+        """get_registry returns one process-wide instance"""
+        assert get_registry() is get_registry()
+
+
+class TestExposition:
+    """Test the Prometheus text format"""
+    
+    def test_render(self):
+        """HELP/TYPE headers, cumulative buckets, sum and count"""
+        registry = MetricsRegistry()
+        registry.counter("jobs_total", "Jobs done").inc(3)
+        histogram = registry.histogram("job_seconds", "Job time", ["kind"], buckets=[0.1, 1])
+        histogram.labels("fast").observe(0.05)
+        histogram.labels("fast").observe(0.5)
+        
+        text = registry.render()
+        
+        assert "# HELP jobs_total Jobs done\n# TYPE jobs_total counter\njobs_total 3\n" in text
+        assert "# TYPE job_seconds histogram" in text
+        assert 'job_seconds_bucket{kind="fast",le="0.1"} 1' in text
+        assert 'job_seconds_bucket{kind="fast",le="1"} 2' in text
+        assert 'job_seconds_bucket{kind="fast",le="+Inf"} 2' in text
+        assert 'job_seconds_sum{kind="fast"} 0.55' in text
+        assert 'job_seconds_count{kind="fast"} 2' in text
+    
+    def test_label_values_escaped(self):
+        """Quotes and backslashes in label values are escaped"""
+        registry = MetricsRegistry()
+        registry.counter("odd_total", "Odd", ["name"]).labels('a"b\\c').inc()
+        
+        assert 'odd_total{name="a\\"b\\\\c"} 1' in registry.render()
+
+
+class TestConsensusInstrumentation:
+    """Test histograms fed by the consensus engine"""
+    
+    def test_phase_latencies_recorded(self):
+        """Executed rounds report p99 per phase and verification times"""
+        registry = MetricsRegistry()
+        ids = [f"metrics_node_{i}" for i in range(4)]
+        engines = []
+        for node_id in ids:
+            network = MockP2PNetwork(node_id)
+            network.start()
+            for other in ids:
+                if other != node_id:
+                    network.add_peer(PeerInfo(peer_id=other, address=f"localhost:{other}", stake=1000))
+            engine = ConsensusEngine(
+                node_id=node_id,
+                validator_stake=1000,
+                network=network,
+                state_store=StateStore(),
+                proof_mempool=ProofMempool(),
+                metrics_collector=MetricsCollector(registry=registry),
+            )
+            engine.pre_prepare_handler = engine.handle_pre_prepare
+            engine.prepare_handler = engine.handle_prepare
+            engine.commit_handler = engine.handle_commit
+            engines.append(engine)
+        
+        leader = engines[0]
+        for round_number in range(3):
+            leader.proof_mempool.add_proof({'constraints': [f'm{round_number} > 0'], 'valid': True})
+            leader.start_consensus_round(leader.propose_block_from_mempool(block_size=1))
+        
+        metrics = leader.metrics
+        latencies = metrics.get_latency_percentiles()
+        
+        for phase in ("round",) + CONSENSUS_PHASES + ("block_verification", "proof_verification"):
+            assert phase in latencies
+            assert latencies[phase]["p99"] >= latencies[phase]["p50"] >= 0
+        assert metrics.get_summary_stats()["latency"] == latencies
+        
+        # Every executed instance, on any node sharing the registry, is counted once
+        rounds = int(registry.get("consensus_rounds_total").get())
+        text = metrics.export_prometheus_metrics()
+        assert rounds >= 3
+        assert f"consensus_rounds_total {rounds}" in text
+        assert f'consensus_phase_duration_seconds_count{{phase="commit"}} {rounds}' in text
+        assert "mempool_size" in text
+        
+        for network_id in ids:
+            MockP2PNetwork._global_registry.pop(network_id, None)
+    
+    def test_collectors_keep_separate_registries_by_default(self):
+        """Without a shared registry each collector exports only its own counts"""
+        first = MetricsCollector()
+        second = MetricsCollector()
+        first.record_consensus_round("r", 0.1, ["n"], 1, 1000, 0, 1)
+        
+        assert "consensus_rounds_total 1" in first.export_prometheus_metrics()
+        assert "consensus_rounds_total 0" in second.export_prometheus_metrics()
+
+
+class TestTelemetryExport:
+    """Test ExpertTelemetry scrapes"""
+    
+    def test_export_does_not_read_database(self, tmp_path):
+        """Scrapes are served from memory"""
+        telemetry = ExpertTelemetry(str(tmp_path / "telemetry.db"))
+        verdicts = [
+            ExpertVerdict("Z3_Expert", "APPROVE", 0.9, 20.0),
+            ExpertVerdict("Guard_Expert", "APPROVE", 0.7, 400.0),
+        ]
+        result = MOEResult(
+            transaction_id="tx_1",
+            consensus="APPROVED",
+            overall_confidence=0.8,
+            expert_verdicts=verdicts,
+            total_latency_ms=400.0,
+            activated_experts=["Z3_Expert", "Guard_Expert"],
+        )
+        telemetry.record("tx_1", verdicts, result)
+        telemetry.record_ground_truth("tx_1", "Z3_Expert", True)
+        telemetry.record_ground_truth("tx_2", "Z3_Expert", False)
+        
+        def no_reads():
+            raise AssertionError("scrape touched the database")
+        
+        telemetry._db.read_connection = no_reads
+        text = telemetry.export_prometheus()
+        
+        assert 'moe_expert_verifications_total{expert="Z3_Expert"} 1' in text
+        assert 'moe_expert_accuracy{expert="Z3_Expert"} 0.5' in text
+        assert 'moe_expert_confidence_avg{expert="Guard_Expert"} 0.7' in text
+        assert 'moe_expert_latency_ms_bucket{expert="Guard_Expert",le="500"} 1' in text
+        assert 250 < telemetry.get_latency_percentiles("Guard_Expert")["p99"] <= 500
+    
+    def test_totals_survive_restart(self, tmp_path):
+        """A new instance on the same database exports the same totals"""
+        path = str(tmp_path / "telemetry.db")
+        telemetry = ExpertTelemetry(path)
+        for i, confidence in enumerate((0.9, 0.5)):
+            verdicts = [ExpertVerdict("Z3_Expert", "APPROVE", confidence, 20.0)]
+            telemetry.record(f"tx_{i}", verdicts, MOEResult(
+                transaction_id=f"tx_{i}",
+                consensus="APPROVED",
+                overall_confidence=confidence,
+                expert_verdicts=verdicts,
+                total_latency_ms=20.0,
+                activated_experts=["Z3_Expert"],
+            ))
+        telemetry.record_ground_truth("tx_0", "Z3_Expert", True)
+        telemetry.record_ground_truth("tx_1", "Z3_Expert", False)
+        
+        restarted = ExpertTelemetry(path).export_prometheus()
+        
+        assert 'moe_expert_verifications_total{expert="Z3_Expert"} 2' in restarted
+        assert 'moe_expert_accuracy{expert="Z3_Expert"} 0.5' in restarted
+        assert 'moe_expert_confidence_avg{expert="Z3_Expert"} 0.7' in restarted
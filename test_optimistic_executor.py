@@ -0,0 +1,160 @@
+"""
+Tests for the optimistic (Block-STM style) executor
+
+Covers the multi-version store, serial equivalence on contended batches,
+selective re-execution, error and trace handling, and BatchProcessor in
+optimistic mode.
+"""
+
+import time
+
+import pytest
+
+from aethel.core.batch_processor import BatchProcessor
+from aethel.core.optimistic_executor import MultiVersionStore, OptimisticExecutor
+from aethel.core.synchrony import EventType, Transaction
+
+
+def make_txn(txn_id, accounts):
+    return Transaction(
+        id=txn_id,
+        intent_name="transfer",
+        accounts={account: {"balance": 100} for account in accounts},
+        operations=[],
+        verify_conditions=[],
+    )
+
+
+def slow_increment(transaction, view):
+    """Read-modify-write of every account, slow enough to overlap"""
+    for account_id in transaction.accounts:
+        balance = view.read(account_id, default={"balance": 0})["balance"]
+        time.sleep(0.005)
+        view.write(account_id, default={"balance": 0})["balance"] = balance + 1
+
+
+class TestMultiVersionStore:
+    """Test versioned reads"""
+    
+    def test_reads_latest_lower_writer(self):
+        """A reader sees the highest writer below it, else the initial state"""
+        store = MultiVersionStore({"a": {"balance": 1}})
+        store.publish(2, 0, {"a": {"balance": 3}}, set())
+        store.publish(5, 0, {"a": {"balance": 6}}, set())
+        
+        assert store.read("a", 0) == (None, {"balance": 1})
+        assert store.read("a", 2) == (None, {"balance": 1})
+        assert store.read("a", 4) == ((2, 0), {"balance": 3})
+        assert store.read("a", 9) == ((5, 0), {"balance": 6})
+    
+    def test_new_incarnation_replaces_writes(self):
+        """Accounts no longer written by a re-execution are removed"""
+        store = MultiVersionStore({})
+        store.publish(1, 0, {"a": 1, "b": 2}, set())
+        store.publish(1, 1, {"b": 3}, {"a", "b"})
+        
+        assert store.read("a", 4) == (None, None)
+        assert store.read("b", 4) == ((1, 1), 3)
+
+
+class TestOptimisticExecutor:
+    """Test speculative execution and validation"""
+    
+    def test_contended_batch_matches_serial(self):
+        """Every increment on a hot account survives"""
+        transactions = [make_txn(f"t{i}", ["hot", f"own_{i}"]) for i in range(20)]
+        initial_states = {"hot": {"balance": 0}}
+        
+        with OptimisticExecutor(thread_count=8, execute_fn=slow_increment) as executor:
+            result = executor.execute_optimistic(transactions, initial_states)
+            stats = executor.get_stats()
+        
+        assert result.final_states["hot"] == {"balance": 20}
+        assert all(result.final_states[f"own_{i}"] == {"balance": 1} for i in range(20))
+        assert initial_states == {"hot": {"balance": 0}}
+        assert stats["re_executions"] >= 1
+        assert stats["speculative_commits"] + stats["re_executions"] == 20
+    
+    def test_disjoint_batch_needs_no_re_execution(self):
+        """Independent transactions all commit from their first run"""
+        transactions = [make_txn(f"t{i}", [f"from_{i}", f"to_{i}"]) for i in range(50)]
+        
+        with OptimisticExecutor(execute_fn=slow_increment) as executor:
+            result = executor.execute_optimistic(transactions, {})
+        
+        assert executor.get_stats()["re_executions"] == 0
+        assert result.parallel_groups == [{txn.id for txn in transactions}]
+    
+    def test_trace_is_in_commit_order(self):
+        """Committed incarnations appear in batch order; aborts as ROLLBACK"""
+        transactions = [make_txn(f"t{i}", ["hot"]) for i in range(6)]
+        
+        with OptimisticExecutor(execute_fn=slow_increment) as executor:
+            result = executor.execute_optimistic(transactions, {"hot": {"balance": 0}})
+            re_executed = executor.get_stats()["re_executed"]
+        
+        commits = [e.transaction_id for e in result.execution_trace if e.event_type == EventType.COMMIT]
+        rollbacks = [e.transaction_id for e in result.execution_trace if e.event_type == EventType.ROLLBACK]
+        writes = [e.new_value for e in result.execution_trace if e.event_type == EventType.WRITE]
+        
+        assert commits == [txn.id for txn in transactions]
+        assert rollbacks == re_executed
+        assert writes == [1, 2, 3, 4, 5, 6]
+    
+    def test_speculative_error_is_retried(self):
+        """An error caused by a stale read disappears on re-execution"""
+        def needs_funds(transaction, view):
+            balance = view.read("a")["balance"]
+            if transaction.id == "t1" and balance < 10:
+                raise ValueError("insufficient funds")
+            time.sleep(0.01)
+            view.write("a")["balance"] = balance + 10
+        
+        transactions = [make_txn("t0", ["a"]), make_txn("t1", ["a"])]
+        
+        with OptimisticExecutor(execute_fn=needs_funds) as executor:
+            result = executor.execute_optimistic(transactions, {"a": {"balance": 0}})
+            
+            assert executor.get_stats()["re_executed"] == ["t1"]
+        assert result.final_states["a"] == {"balance": 20}
+    
+    def test_in_order_error_propagates(self):
+        """An error on a transaction's final execution is raised"""
+        def failing(transaction, view):
+            if transaction.id == "t1":
+                raise ValueError("boom")
+        
+        with OptimisticExecutor(execute_fn=failing) as executor:
+            with pytest.raises(ValueError):
+                executor.execute_optimistic([make_txn("t0", ["a"]), make_txn("t1", ["b"])], {})
+
+
+class TestBatchProcessorOptimistic:
+    """Test the optimistic mode of the pipeline"""
+    
+    def test_shared_accounts_commit(self):
+        """A batch static analysis rejects commits optimistically"""
+        transactions = [make_txn("t1", ["alice", "bob"]), make_txn("t2", ["bob", "carol"])]
+        
+        processor = BatchProcessor(num_threads=2, optimistic=True)
+        try:
+            result = processor.execute_batch(transactions)
+        finally:
+            processor.shutdown()
+        
+        assert result.success
+        assert result.transactions_executed == 2
+        assert result.diagnostic_info["mode"] == "optimistic"
+        assert set(result.diagnostic_info) >= {"speculative_commits", "re_executions"}
+    
+    def test_analyzed_mode_unchanged(self):
+        """The default mode still rejects shared accounts"""
+        transactions = [make_txn("t1", ["alice"]), make_txn("t2", ["alice"])]
+        
+        processor = BatchProcessor(num_threads=2)
+        try:
+            result = processor.execute_batch(transactions)
+        finally:
+            processor.shutdown()
+        
+        assert not result.success
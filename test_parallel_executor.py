@@ -7,6 +7,7 @@ Tests the ParallelExecutor class methods:
 - Timeout mechanisms
 - Thread safety
 - Execution tracing
+- Process pool backend
 
 Author: Aethel Team
 Version: 1.8.0
@@ -16,7 +17,7 @@ Date: February 4, 2026
 import pytest
 import time
 import copy
-from aethel.core.parallel_executor import ParallelExecutor, ExecutionContext
+from aethel.core.parallel_executor import ParallelExecutor, ExecutionContext, _execute_slices
 from aethel.core.synchrony import Transaction, EventType, TimeoutError
 from aethel.core.dependency_graph import DependencyGraph
 from aethel.core.dependency_analyzer import DependencyAnalyzer
@@ -356,6 +357,28 @@ class TestExecuteParallel:
         
         executor.shutdown()
     
+    def test_single_transaction_runs_on_calling_thread(self):
+        """A lone transaction starts no worker threads"""
+        executor = ParallelExecutor(thread_count=4)
+        
+        transaction = Transaction(
+            id="t1",
+            intent_name="transfer",
+            accounts={"alice": {"balance": 100}},
+            operations=[],
+            verify_conditions=[]
+        )
+        graph = DependencyAnalyzer().analyze([transaction])
+        
+        result = executor.execute_parallel([transaction], graph, {"alice": {"balance": 100}})
+        
+        assert result.parallel_groups == [{"t1"}]
+        assert [e.event_type for e in result.execution_trace][0] == EventType.START
+        assert result.execution_trace[-1].event_type == EventType.COMMIT
+        assert len(executor.executor._threads) == 0
+        
+        executor.shutdown()
+    
     def test_execute_parallel_independent_transactions(self):
         """Test executing independent transactions in parallel"""
         executor = ParallelExecutor(thread_count=4)
@@ -471,6 +494,80 @@ class TestExecuteParallel:
         executor.shutdown()
 
 
+class TestProcessBackend:
+    """Test the process pool execution backend"""
+    
+    def _independent_batch(self, count):
+        transactions = [
+            Transaction(
+                id=f"t{i}",
+                intent_name="transfer",
+                accounts={f"from_{i}": {}, f"to_{i}": {}},
+                operations=[],
+                verify_conditions=[]
+            )
+            for i in range(count)
+        ]
+        graph = DependencyGraph()
+        for transaction in transactions:
+            graph.add_node(transaction)
+        return transactions, graph
+    
+    def test_unknown_backend_rejected(self):
+        """Test only thread and process backends are accepted"""
+        with pytest.raises(ValueError):
+            ParallelExecutor(backend="gpu")
+    
+    def test_slices_return_deltas_only(self):
+        """Test worker returns changed balances and compact events"""
+        results = _execute_slices((("t1", ("alice", "bob"), (100, None), (0, 0)),))
+        
+        tx_id, deltas, events = results[0]
+        assert tx_id == "t1"
+        # Unchanged balance is not sent back; the missing account is
+        assert deltas == (("bob", 0),)
+        assert [event[1] for event in events] == ["START", "READ", "WRITE", "READ", "WRITE", "COMMIT"]
+    
+    def test_slices_skip_read_only_accounts(self):
+        """Test accounts outside the write set are read but not written"""
+        results = _execute_slices((("t1", ("alice", "rate"), (100, None), (0, None)),))
+        
+        _, deltas, events = results[0]
+        assert deltas == ()
+        assert [(event[1], event[2]) for event in events if event[2]] == [
+            ("READ", "alice"), ("WRITE", "alice"), ("READ", "rate")
+        ]
+    
+    def test_large_set_runs_in_processes(self):
+        """Test large independent sets produce the same result as threads"""
+        transactions, graph = self._independent_batch(20)
+        initial_states = {f"from_{i}": {"balance": 10, "owner": i} for i in range(20)}
+        
+        with ParallelExecutor(backend="process", process_count=2, process_threshold=8) as executor:
+            result = executor.execute_parallel(transactions, graph, initial_states)
+            assert executor.process_pool is not None
+        
+        with ParallelExecutor() as executor:
+            expected = executor.execute_parallel(transactions, graph, initial_states)
+        
+        assert result.final_states == expected.final_states
+        assert result.parallel_groups == [{tx.id for tx in transactions}]
+        commits = {e.transaction_id for e in result.execution_trace if e.event_type == EventType.COMMIT}
+        assert commits == {tx.id for tx in transactions}
+        for tx_id in commits:
+            assert len({e.thread_id for e in result.execution_trace if e.transaction_id == tx_id}) == 1
+    
+    def test_small_batch_stays_on_threads(self):
+        """Test batches below the threshold never start the process pool"""
+        transactions, graph = self._independent_batch(3)
+        
+        with ParallelExecutor(backend="process", process_threshold=8) as executor:
+            result = executor.execute_parallel(transactions, graph, {})
+            assert executor.process_pool is None
+        
+        assert len(result.execution_trace) == 3 * 6
+
+
 class TestExecutionContext:
     """Test ExecutionContext data class"""
     
@@ -488,5 +488,85 @@ class TestMempoolIntegration:
         assert len(block.proofs) == num_proofs
 
 
+def _proof_hash(proof):
+    import hashlib
+    import json
+    return hashlib.sha256(json.dumps(proof).encode()).hexdigest()
+
+
+class TestIndexedMempool:
+    """Tests for the indexed heap, TTL, quotas and memory cap."""
+    
+    @settings(max_examples=50)
+    @given(
+        difficulties=st.lists(st.integers(min_value=0, max_value=50), min_size=1, max_size=60),
+        removals=st.lists(st.integers(min_value=0, max_value=59), max_size=30),
+        block_size=st.integers(min_value=1, max_value=20)
+    )
+    def test_selection_matches_sorted_order(self, difficulties, removals, block_size):
+        """Top-k after arbitrary removals equals a full sort (FIFO on ties)."""
+        mempool = ProofMempool(max_size=100)
+        proofs = [{'intent': f'p{i}', 'valid': True} for i in range(len(difficulties))]
+        for proof, difficulty in zip(proofs, difficulties):
+            assert mempool.add_proof(proof, difficulty=difficulty)
+        
+        removed = {i for i in removals if i < len(proofs)}
+        mempool.remove_proofs([_proof_hash(proofs[i]) for i in removed])
+        
+        remaining = [i for i in range(len(proofs)) if i not in removed]
+        expected = sorted(remaining, key=lambda i: (-difficulties[i], i))[:block_size]
+        
+        block = mempool.get_next_block(block_size=block_size)
+        if not remaining:
+            assert block is None
+        else:
+            assert [p['intent'] for p in block.proofs] == [f'p{i}' for i in expected]
+        assert mempool.size() == len(remaining)
+    
+    def test_ttl_expiry(self):
+        """Proofs older than the TTL are dropped."""
+        mempool = ProofMempool(ttl_seconds=60)
+        mempool.add_proof({'intent': 'old', 'valid': True}, difficulty=10)
+        mempool.add_proof({'intent': 'new', 'valid': True}, difficulty=5)
+        mempool._by_arrival[_proof_hash({'intent': 'old', 'valid': True})].timestamp -= 120
+        
+        assert mempool.evict_expired() == 1
+        assert mempool.size() == 1
+        assert mempool.get_stats()['total_expired'] == 1
+        assert mempool.get_next_block(block_size=5).proofs[0]['intent'] == 'new'
+    
+    def test_sender_quota(self):
+        """Senders cannot hold more than their quota; removal frees a slot."""
+        mempool = ProofMempool(max_per_sender=2)
+        proofs = [{'intent': f'q{i}', 'valid': True} for i in range(3)]
+        
+        assert mempool.add_proof(proofs[0], difficulty=1, sender="node_a")
+        assert mempool.add_proof(proofs[1], difficulty=1, sender="node_a")
+        assert not mempool.add_proof(proofs[2], difficulty=1, sender="node_a")
+        assert mempool.add_proof(proofs[2], difficulty=1, sender="node_b")
+        
+        mempool.remove_proof(_proof_hash(proofs[0]))
+        assert mempool.add_proof({'intent': 'q3', 'valid': True}, difficulty=1, sender="node_a")
+    
+    def test_memory_cap_evicts_lowest_difficulty(self):
+        """A harder proof displaces the easiest ones; an easier one is rejected."""
+        import json
+        
+        proofs = [{'intent': f'm{i}', 'valid': True} for i in range(4)]
+        proof_size = len(json.dumps(proofs[0]).encode())
+        mempool = ProofMempool(max_bytes=proof_size * 3)
+        
+        for proof, difficulty in zip(proofs[:3], (30, 10, 20)):
+            assert mempool.add_proof(proof, difficulty=difficulty)
+        
+        assert not mempool.add_proof(proofs[3], difficulty=5)
+        assert mempool.add_proof(proofs[3], difficulty=40)
+        
+        assert not mempool.contains(_proof_hash(proofs[1]))
+        assert mempool.size() == 3
+        assert mempool.get_stats()['total_evicted'] == 1
+        assert mempool.get_stats()['bytes'] <= proof_size * 3
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,108 @@
+"""
+Tests for incremental quorum counting
+
+Covers validator bit positions, once-only threshold callbacks, duplicate
+votes and ConsensusEngine's use of the trackers for PREPARE, COMMIT and
+VIEW-CHANGE quorums.
+"""
+
+from aethel.consensus.consensus_engine import ConsensusEngine
+from aethel.consensus.data_models import MessageType, PeerInfo, ViewChangeMessage
+from aethel.consensus.mock_network import MockP2PNetwork
+from aethel.consensus.quorum_tracker import QuorumTracker, ValidatorIndex
+
+
+class TestValidatorIndex:
+    """Test validator bit positions"""
+    
+    def test_sorted_positions(self):
+        """Known validators are numbered in sorted order"""
+        index = ValidatorIndex(["node_c", "node_a", "node_b"])
+        
+        assert [index.position(v) for v in ("node_a", "node_b", "node_c")] == [0, 1, 2]
+    
+    def test_late_validators_appended(self):
+        """A validator seen later takes the next free position"""
+        index = ValidatorIndex(["node_b"])
+        
+        assert index.position("node_a") == 1
+        assert index.members(0b11) == ["node_b", "node_a"]
+
+
+class TestQuorumTracker:
+    """Test vote counting and threshold callbacks"""
+    
+    def test_callback_fires_once(self):
+        """The callback runs exactly once, on the vote reaching quorum"""
+        fired = []
+        tracker = QuorumTracker(ValidatorIndex(), lambda: 3, fired.append)
+        
+        results = [tracker.add_vote("block", f"node_{i}") for i in range(5)]
+        
+        assert results == [False, False, True, False, False]
+        assert fired == ["block"]
+        assert tracker.count("block") == 5
+    
+    def test_duplicate_votes_ignored(self):
+        """A validator voting twice counts once"""
+        tracker = QuorumTracker(ValidatorIndex(), lambda: 2)
+        tracker.add_vote("block", "node_0")
+        tracker.add_vote("block", "node_0")
+        
+        assert tracker.count("block") == 1
+        assert not tracker.has_quorum("block")
+    
+    def test_keys_counted_separately(self):
+        """Votes for different digests do not combine"""
+        tracker = QuorumTracker(ValidatorIndex(), lambda: 2)
+        tracker.add_vote((0, 1, "a"), "node_0")
+        tracker.add_vote((0, 1, "b"), "node_1")
+        
+        assert not tracker.has_quorum((0, 1, "a"))
+        assert tracker.voters((0, 1, "b")) == ["node_1"]
+    
+    def test_discard_where(self):
+        """Discarded keys start counting from zero again"""
+        tracker = QuorumTracker(ValidatorIndex(), lambda: 1)
+        tracker.add_vote((0, 1), "node_0")
+        tracker.add_vote((0, 2), "node_0")
+        
+        tracker.discard_where(lambda key: key[1] <= 1)
+        
+        assert tracker.count((0, 1)) == 0
+        assert tracker.has_quorum((0, 2))
+
+
+class TestEngineQuorums:
+    """Test ConsensusEngine vote tracking"""
+    
+    def _engine(self, node_id="quorum_0", peers=3):
+        network = MockP2PNetwork(node_id)
+        for i in range(1, peers + 1):
+            network.add_peer(PeerInfo(peer_id=f"quorum_{i}", address=f"localhost:{i}", stake=1000))
+        return ConsensusEngine(node_id, 1000, network)
+    
+    def test_quorum_size(self):
+        """Four validators tolerate one fault and need three votes"""
+        assert self._engine().quorum_size() == 3
+    
+    def test_view_change_quorum_transitions_once(self):
+        """The view changes on the 2f+1-th VIEW-CHANGE and only then"""
+        engine = self._engine()
+        transitions = []
+        original = engine._transition_to_new_view
+        engine._transition_to_new_view = lambda view, messages: (
+            transitions.append((view, len(messages))), original(view, messages)
+        )
+        
+        for i in range(1, 4):
+            engine.handle_view_change(ViewChangeMessage(
+                message_type=MessageType.VIEW_CHANGE,
+                view=0,
+                sequence=0,
+                sender_id=f"quorum_{i}",
+                new_view=1,
+            ))
+        
+        assert transitions == [(1, 3)]
+        assert engine.view == 1
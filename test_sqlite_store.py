@@ -0,0 +1,125 @@
+"""
+Tests for the shared SQLite access layer
+
+Covers per-thread connection caching, WAL mode, one-time schema
+initialization, executemany batching and the read-only connection pool.
+"""
+
+import os
+import sqlite3
+import threading
+
+import pytest
+
+from aethel.core.sqlite_store import SQLiteStore, get_sqlite_store, close_all_stores
+
+
+def _create_items(conn):
+    conn.execute("CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY, name TEXT)")
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteStore(str(tmp_path / "store.db"))
+    store.ensure_schema("items", _create_items)
+    yield store
+    store.close()
+
+
+class TestConnections:
+    """Test connection caching and pragmas"""
+    
+    def test_connection_cached_per_thread(self, store):
+        """Same thread gets the same connection, other threads get their own"""
+        main_conn = store.connection()
+        assert store.connection() is main_conn
+        
+        other = []
+        thread = threading.Thread(target=lambda: other.append(store.connection()))
+        thread.start()
+        thread.join()
+        
+        assert other[0] is not main_conn
+    
+    def test_wal_mode_enabled(self, store):
+        """Database runs in WAL mode"""
+        mode = store.connection().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode.lower() == "wal"
+    
+    def test_ensure_schema_runs_once(self, store):
+        """Schema initializer only runs the first time"""
+        calls = []
+        store.ensure_schema("counter", lambda conn: calls.append(conn))
+        store.ensure_schema("counter", lambda conn: calls.append(conn))
+        
+        assert len(calls) == 1
+
+
+class TestWrites:
+    """Test transactions and batching"""
+    
+    def test_executemany_commits_batch(self, store):
+        """executemany inserts every row in one transaction"""
+        count = store.executemany(
+            "INSERT INTO items (name) VALUES (?)",
+            [(f"item-{i}",) for i in range(50)]
+        )
+        
+        assert count == 50
+        with store.read_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 50
+    
+    def test_transaction_rolls_back_on_error(self, store):
+        """Failed transaction leaves no partial writes"""
+        with pytest.raises(RuntimeError):
+            with store.transaction() as conn:
+                conn.execute("INSERT INTO items (name) VALUES ('lost')")
+                raise RuntimeError("boom")
+        
+        count = store.connection().execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        assert count == 0
+
+
+class TestReadPool:
+    """Test read-only connection pool"""
+    
+    def test_read_connection_rejects_writes(self, store):
+        """Pooled connections are read-only"""
+        with store.read_connection() as conn:
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("INSERT INTO items (name) VALUES ('nope')")
+    
+    def test_read_connection_reused(self, store):
+        """Returned connections are handed out again"""
+        with store.read_connection() as first:
+            pass
+        with store.read_connection() as second:
+            pass
+        
+        assert first is second
+
+
+class TestSharedStores:
+    """Test module-level store registry"""
+    
+    def test_same_path_shares_store(self, tmp_path):
+        """Components on the same file share one store"""
+        path = str(tmp_path / "shared.db")
+        try:
+            assert get_sqlite_store(path) is get_sqlite_store(path)
+        finally:
+            close_all_stores()
+    
+    def test_deleted_file_reopens_store(self, tmp_path):
+        """A store whose file was deleted is replaced"""
+        path = str(tmp_path / "deleted.db")
+        try:
+            first = get_sqlite_store(path)
+            first.close()
+            os.unlink(path)
+            
+            second = get_sqlite_store(path)
+            assert second is not first
+            assert os.path.exists(path)
+        finally:
+            close_all_stores()
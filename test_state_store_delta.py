@@ -0,0 +1,184 @@
+"""
+Tests for delta-based conservation in StateStore
+
+Covers path rehashing in the consensus MerkleTree, change-set conservation
+validation, the running conservation checksum and checkpoint-batched
+persistence.
+"""
+
+import random
+import time
+from types import SimpleNamespace
+
+from aethel.consensus.merkle_tree import MerkleTree
+from aethel.consensus.state_store import StateStore
+from aethel.consensus.conservation_validator import ConservationValidator
+from aethel.consensus.data_models import StateTransition, StateChange
+from aethel.core.persistence import MerkleStateDB
+
+
+def _transfer(sender, receiver, sender_after, receiver_after):
+    return StateTransition(
+        changes=[
+            StateChange(key=f"balance:{sender}", value=sender_after),
+            StateChange(key=f"balance:{receiver}", value=receiver_after)
+        ],
+        timestamp=int(time.time())
+    )
+
+
+def _rebuilt_root(tree):
+    fresh = MerkleTree()
+    fresh.batch_update({key: tree.get(key) for key in tree.get_all_keys()})
+    return fresh.get_root_hash()
+
+
+class TestPathRehash:
+    """Test incremental root maintenance in MerkleTree"""
+    
+    def test_updates_match_full_rebuild(self):
+        """Rehashing paths gives the same root as rebuilding the tree"""
+        rng = random.Random(7)
+        for size in (1, 2, 3, 7, 16, 33):
+            tree = MerkleTree()
+            tree.batch_update({f"k{i}": i for i in range(size)})
+            tree.get_root_hash()
+            
+            for _ in range(20):
+                tree.update(f"k{rng.randrange(size)}", rng.randrange(1000))
+                tree.batch_update({f"k{rng.randrange(size)}": rng.randrange(1000) for _ in range(3)})
+                assert tree.get_root_hash() == _rebuilt_root(tree)
+    
+    def test_proofs_valid_after_path_update(self):
+        """Proofs generated after a path update verify"""
+        tree = MerkleTree()
+        tree.batch_update({f"k{i}": i for i in range(9)})
+        tree.get_root_hash()
+        
+        tree.update("k4", 400)
+        
+        for key in tree.get_all_keys():
+            assert tree.verify_proof(tree.generate_proof(key))
+    
+    def test_version_tracks_mutations(self):
+        """Every write and delete bumps the version"""
+        tree = MerkleTree()
+        tree.update("a", 1)
+        tree.batch_update({"a": 2, "b": 3})
+        tree.delete("b")
+        
+        assert tree.version == 3
+
+
+class TestDeltaValidation:
+    """Test change-set conservation checks"""
+    
+    def test_validate_changes_matches_full_validation(self):
+        """Delta validation agrees with the full-state check"""
+        validator = ConservationValidator()
+        state = {"balance:alice": 100, "balance:bob": 50, "stake:carol": 1000}
+        
+        for transition in (_transfer("alice", "bob", 70, 80), _transfer("alice", "bob", 70, 90)):
+            assert validator.validate_changes(transition, state.get) == validator.validate(transition, state)
+    
+    def test_last_change_to_key_wins(self):
+        """Repeated keys use their final value"""
+        validator = ConservationValidator()
+        state = {"balance:alice": 100, "balance:bob": 0}
+        transition = StateTransition(changes=[
+            StateChange(key="balance:alice", value=10),
+            StateChange(key="balance:alice", value=40),
+            StateChange(key="balance:bob", value=60)
+        ])
+        
+        assert validator.validate_changes(transition, state.get)
+    
+    def test_new_keys_count_as_zero(self):
+        """Creating value from nothing is rejected"""
+        validator = ConservationValidator()
+        transition = StateTransition(changes=[StateChange(key="balance:mallory", value=5)])
+        
+        assert not validator.validate_changes(transition, {}.get)
+
+
+class TestRunningChecksum:
+    """Test the StateStore running conservation checksum"""
+    
+    def test_checksum_follows_store_writes(self):
+        """Setters and transitions keep the running total exact"""
+        store = StateStore()
+        store.set_balance("alice", 100)
+        store.set_balance("bob", 200)
+        store.set_validator_stake("carol", 1000)
+        store.reduce_stake("carol", 300)
+        
+        assert store.apply_state_transition(_transfer("alice", "bob", 40, 260))
+        
+        expected = store.conservation_validator.calculate_total_value(store.merkle_tree)
+        assert store.get_conservation_checksum() == expected == 1000
+    
+    def test_direct_tree_writes_are_recounted(self):
+        """Writes that bypass the store are picked up"""
+        store = StateStore()
+        store.set_balance("alice", 100)
+        store.merkle_tree.update("balance:bob", 25)
+        
+        assert store.get_conservation_checksum() == 125
+    
+    def test_rejected_transition_leaves_checksum(self):
+        """A non-conserving transition changes nothing"""
+        store = StateStore()
+        store.set_balance("alice", 100)
+        store.set_balance("bob", 100)
+        root = store.get_root_hash()
+        
+        assert not store.apply_state_transition(_transfer("alice", "bob", 50, 200))
+        assert store.get_root_hash() == root
+        assert store.get_conservation_checksum() == 200
+    
+    def test_sync_from_peer_recounts(self):
+        """Adopting a peer tree resets the running total"""
+        peer = StateStore()
+        peer.set_balance("dave", 70)
+        
+        store = StateStore()
+        store.set_balance("alice", 100)
+        
+        assert store.sync_from_peer(peer.get_root_hash(), peer.get_state_snapshot())
+        assert store.get_conservation_checksum() == 70
+
+
+class TestBatchedPersistence:
+    """Test checkpoint-interval persistence"""
+    
+    def test_records_flushed_at_checkpoint(self, tmp_path):
+        """Transitions are buffered and written at the checkpoint"""
+        merkle_db = MerkleStateDB(str(tmp_path / "state"))
+        store = StateStore(SimpleNamespace(merkle_db=merkle_db))
+        store.set_balance("alice", 1000)
+        store.set_balance("bob", 0)
+        
+        for i in range(1, store._checkpoint_interval):
+            assert store.apply_state_transition(_transfer("alice", "bob", 1000 - i, i))
+        assert "checkpoint_10" not in merkle_db.state
+        assert store._pending_records
+        
+        assert store.apply_state_transition(_transfer("alice", "bob", 990, 10))
+        
+        assert merkle_db.get("checkpoint_10")['conservation_checksum'] == 1000
+        assert not store._pending_records
+        assert merkle_db.verify_integrity()
+    
+    def test_flush_writes_pending(self, tmp_path):
+        """flush() persists transitions before the next checkpoint"""
+        merkle_db = MerkleStateDB(str(tmp_path / "state"))
+        store = StateStore(SimpleNamespace(merkle_db=merkle_db))
+        store.set_balance("alice", 10)
+        store.set_balance("bob", 0)
+        
+        assert store.apply_state_transition(_transfer("alice", "bob", 5, 5))
+        store.flush()
+        
+        records = [key for key in merkle_db.state if key.startswith("state_transition_")]
+        assert len(records) == 1
+        assert merkle_db.get(records[0])['root_after'] == store.get_root_hash()
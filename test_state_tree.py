@@ -0,0 +1,155 @@
+"""
+Tests for the columnar MerkleStateTree
+
+Covers the running total supply, incremental root updates, transfer
+rollback, inclusion proofs and snapshot round-trips.
+"""
+
+import pytest
+
+from aethel.core.state import MerkleStateTree, StateTransitionEngine
+
+
+def _tree(count=10, balance=100):
+    tree = MerkleStateTree()
+    for i in range(count):
+        tree.create_account(f"acct_{i}", balance)
+    return tree
+
+
+class TestAccountTable:
+    """Test columnar account storage"""
+    
+    def test_get_account_shape(self):
+        """Accounts are still exposed as dicts"""
+        tree = MerkleStateTree()
+        account_hash = tree.create_account("alice", 50, public_key="ab" * 32)
+        
+        account = tree.get_account("alice")
+        assert account == {
+            'balance': 50,
+            'nonce': 0,
+            'public_key': "ab" * 32,
+            'hash': tree._hash_account(50, 0, "ab" * 32)
+        }
+        assert account_hash == account['hash']
+        assert tree.get_account("bob") is None
+        assert len(tree.accounts) == 1
+        assert "alice" in tree.accounts
+    
+    def test_duplicate_account_rejected(self):
+        """Creating an existing address fails"""
+        tree = _tree(1)
+        with pytest.raises(ValueError):
+            tree.create_account("acct_0", 1)
+    
+    def test_running_total_supply(self):
+        """Supply counter follows creates and updates"""
+        tree = _tree(10, 100)
+        assert tree.get_total_supply() == 1000
+        
+        tree.update_account("acct_3", 40)
+        assert tree.get_total_supply() == 940
+        assert tree.get_total_supply() == sum(a['balance'] for a in tree.accounts.values())
+    
+    def test_balance_beyond_int64(self):
+        """Balances larger than int64 are still stored exactly"""
+        tree = _tree(2, 1)
+        tree.update_account("acct_1", 2 ** 70)
+        
+        assert tree.get_balance("acct_1") == 2 ** 70
+        assert tree.get_total_supply() == 2 ** 70 + 1
+
+
+class TestIncrementalRoot:
+    """Test O(log n) root maintenance"""
+    
+    def test_incremental_root_matches_rebuild(self):
+        """Path updates produce the same root as a full rebuild"""
+        tree = _tree(37)
+        for i in range(0, 37, 5):
+            tree.update_account(f"acct_{i}", i * 3)
+        
+        incremental = tree.root_hash
+        assert tree._calculate_root() == incremental
+    
+    def test_root_changes_with_state(self):
+        """Any balance change moves the root"""
+        tree = _tree(4)
+        before = tree.root_hash
+        tree.update_account("acct_2", 99)
+        
+        assert tree.root_hash != before
+    
+    def test_empty_root(self):
+        """An empty tree keeps the legacy empty root"""
+        tree = MerkleStateTree()
+        assert tree._calculate_root() == MerkleStateTree.EMPTY_ROOT
+    
+    def test_inclusion_proof(self):
+        """Sibling paths verify against the root"""
+        tree = _tree(13)
+        proof = tree.get_merkle_proof("acct_6")
+        
+        assert tree.verify_merkle_proof(proof)
+        
+        proof['siblings'][0] = "00" * 32
+        assert not tree.verify_merkle_proof(proof)
+
+
+class TestTransfers:
+    """Test StateTransitionEngine on the columnar tree"""
+    
+    def test_transfer_conserves_supply(self):
+        """Transfers move value and keep supply"""
+        tree = _tree(5, 100)
+        engine = StateTransitionEngine(tree)
+        
+        success, old_root, new_root = engine.apply_transfer("acct_0", "acct_1", 30)
+        
+        assert success
+        assert new_root != old_root
+        assert tree.get_balance("acct_0") == 70
+        assert tree.get_balance("acct_1") == 130
+        assert tree.get_total_supply() == 500
+    
+    def test_self_transfer_rolled_back(self):
+        """A transfer that breaks conservation restores both rows"""
+        tree = _tree(3, 100)
+        engine = StateTransitionEngine(tree)
+        root = tree.root_hash
+        
+        success, _, new_root = engine.apply_transfer("acct_0", "acct_0", 10)
+        
+        assert not success
+        assert new_root == root
+        assert tree.root_hash == root
+        assert tree.get_account("acct_0")['nonce'] == 0
+        assert tree.get_total_supply() == 300
+    
+    def test_insufficient_balance(self):
+        """Guards reject overdrafts without touching state"""
+        tree = _tree(2, 10)
+        engine = StateTransitionEngine(tree)
+        
+        success, old_root, new_root = engine.apply_transfer("acct_0", "acct_1", 11)
+        
+        assert not success
+        assert old_root == new_root == tree.root_hash
+
+
+class TestSnapshots:
+    """Test snapshot and restore"""
+    
+    def test_snapshot_roundtrip(self):
+        """Restoring a snapshot reproduces root, balances and supply"""
+        tree = _tree(9)
+        tree.update_account("acct_4", 7)
+        snapshot = tree.snapshot()
+        
+        restored = MerkleStateTree()
+        restored.restore(snapshot)
+        
+        assert restored.root_hash == tree.root_hash
+        assert restored.get_account("acct_4") == tree.get_account("acct_4")
+        assert restored.get_total_supply() == tree.get_total_supply()
@@ -0,0 +1,175 @@
+"""
+Tests for the streaming micro-batching front end
+
+Covers micro-batch formation by size and latency, conflict cuts, carrying
+committed states across micro-batches, optimistic mode, and shutdown.
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from aethel.core.batch_processor import BatchProcessor
+from aethel.core.stream_processor import StreamingBatchProcessor
+from aethel.core.synchrony import Credit, Transaction
+
+
+def make_txn(txn_id, accounts, balance=100):
+    return Transaction(
+        id=txn_id,
+        intent_name="transfer",
+        accounts={account: {"balance": balance} for account in accounts},
+        operations=[],
+        verify_conditions=[],
+    )
+
+
+def move(txn_id, source, target, amount=1):
+    """Credit-based transfer"""
+    return Transaction(
+        id=txn_id,
+        intent_name="transfer",
+        accounts={source: {"balance": 100}, target: {"balance": 100}},
+        operations=[Credit(source, -amount), Credit(target, amount)],
+        verify_conditions=[],
+    )
+
+
+def transfer_one(transaction, view):
+    """Move one unit from the first declared account to the second"""
+    source, target = list(transaction.accounts)
+    view.write(source)["balance"] -= 1
+    view.write(target)["balance"] += 1
+
+
+class TestMicroBatching:
+    """Test micro-batch formation"""
+    
+    def test_size_bound(self):
+        """Batches close at max_batch_size"""
+        with StreamingBatchProcessor(BatchProcessor(num_threads=2), max_batch_size=5,
+                                     max_latency_seconds=1.0) as stream:
+            futures = [stream.submit(make_txn(f"t{i}", [f"a{i}", f"b{i}"])) for i in range(20)]
+            results = [future.result(timeout=10) for future in futures]
+            stats = stream.get_stats()
+        
+        assert all(result.success for result in results)
+        assert stats["transactions"] == 20
+        assert stats["max_batch_size"] == 5
+        assert stats["batches"] == 4
+    
+    def test_latency_bound(self):
+        """A lone transaction is not held for a full batch"""
+        with StreamingBatchProcessor(BatchProcessor(num_threads=2), max_batch_size=1000,
+                                     max_latency_seconds=0.01) as stream:
+            started = time.monotonic()
+            result = stream.submit(make_txn("t1", ["alice", "bob"])).result(timeout=10)
+        
+        assert result.success
+        assert result.transactions_executed == 1
+        assert time.monotonic() - started < 5.0
+    
+    def test_conflicts_cut_batches(self):
+        """Transactions sharing an account land in successive micro-batches"""
+        transactions = [make_txn(f"t{i}", ["hot", f"own_{i}"]) for i in range(4)]
+        
+        with StreamingBatchProcessor(BatchProcessor(num_threads=2), max_latency_seconds=0.5) as stream:
+            futures = [stream.submit(txn) for txn in transactions]
+            results = [future.result(timeout=10) for future in futures]
+            stats = stream.get_stats()
+        
+        assert all(result.success for result in results)
+        assert stats["conflict_cuts"] == 3
+        assert stats["batches"] == 4
+    
+    def test_shared_reads_coalesce(self):
+        """Transactions that only read a shared account share a micro-batch"""
+        transactions = [
+            Transaction(
+                id=f"t{i}",
+                intent_name="transfer",
+                accounts={f"own_{i}": {"balance": 100}, "rate": {"balance": 1}},
+                operations=[SimpleNamespace(target_account=f"own_{i}")],
+                verify_conditions=[],
+            )
+            for i in range(6)
+        ]
+        
+        with StreamingBatchProcessor(BatchProcessor(num_threads=2), max_latency_seconds=0.5) as stream:
+            results = [future.result(timeout=10) for future in [stream.submit(t) for t in transactions]]
+            stats = stream.get_stats()
+        
+        assert all(result.success for result in results)
+        assert stats["conflict_cuts"] == 0
+        assert stats["batches"] == 1
+    
+    def test_credit_only_sink_coalesces_when_hot(self):
+        """A shared credit-only sink cuts batches only while it is too cold to split"""
+        hot = [move(f"t{i}", f"user_{i}", "fees") for i in range(10)]
+        cold = [move(f"c{i}", f"payer_{i}", "tips") for i in range(3)]
+        
+        with StreamingBatchProcessor(BatchProcessor(num_threads=2), max_latency_seconds=0.5) as stream:
+            results = [future.result(timeout=10) for future in [stream.submit(t) for t in hot]]
+            hot_stats = stream.get_stats()
+            results += [future.result(timeout=10) for future in [stream.submit(t) for t in cold]]
+            stats = stream.get_stats()
+        
+        assert all(result.success for result in results)
+        assert hot_stats["batches"] == 1
+        assert hot_stats["conflict_cuts"] == 0
+        assert stats["batches"] == 4
+        assert stream.get_account_state("tips") == {"balance": 103}
+    
+    def test_flush_and_stop(self):
+        """flush waits for everything submitted; submit after stop fails"""
+        stream = StreamingBatchProcessor(BatchProcessor(num_threads=2), max_batch_size=3)
+        futures = [stream.submit(make_txn(f"t{i}", [f"a{i}"])) for i in range(7)]
+        
+        assert stream.flush(timeout=10)
+        assert all(future.done() for future in futures)
+        
+        stream.stop()
+        with pytest.raises(RuntimeError):
+            stream.submit(make_txn("late", ["x"]))
+
+
+class TestCarriedState:
+    """Test account state across micro-batches"""
+    
+    def test_committed_states_carry_over(self):
+        """Later micro-batches see earlier commits, not the client snapshot"""
+        processor = BatchProcessor(num_threads=2, optimistic=True)
+        processor.optimistic_executor.execute_fn = transfer_one
+        transactions = [
+            Transaction(
+                id=f"t{i}",
+                intent_name="transfer",
+                accounts={"alice": {"balance": 100}, "bob": {"balance": 0}},
+                operations=[],
+                verify_conditions=[],
+            )
+            for i in range(12)
+        ]
+        
+        with StreamingBatchProcessor(processor, max_batch_size=4, max_latency_seconds=0.5) as stream:
+            results = [future.result(timeout=10) for future in [stream.submit(t) for t in transactions]]
+            
+            assert stream.get_stats()["batches"] == 3
+            assert stream.get_account_state("alice") == {"balance": 88}
+            assert stream.get_account_state("bob") == {"balance": 12}
+        processor.shutdown()
+        
+        assert all(result.success for result in results)
+    
+    def test_committed_states_are_bounded(self):
+        """Accounts nothing in flight refers to are forgotten"""
+        with StreamingBatchProcessor(BatchProcessor(num_threads=2), max_batch_size=4,
+                                     max_latency_seconds=0.5) as stream:
+            futures = [stream.submit(make_txn(f"t{i}", [f"a{i}", f"b{i}"])) for i in range(40)]
+            assert all(future.result(timeout=10).success for future in futures)
+            
+            assert stream.get_account_state("a0") is None
+            assert stream.get_account_state("a39") == {"balance": 100}
+            assert len(stream._committed_states) <= 8
+            assert stream._in_flight_accounts == {}
@@ -0,0 +1,256 @@
+"""
+Tests for the persistent TCP transport
+
+Runs real connections on localhost: framing, connection reuse, batching
+of queued frames into single writes, bounded send queues, gossip delivery
+through P2PNetwork, and the thread-backed synchronous wrapper.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from aethel.consensus.data_models import MessageType, PeerInfo, PrepareMessage
+from aethel.consensus.p2p_network import P2PNetwork, P2PNetworkSync
+from aethel.consensus.transport import (
+    FRAME_DATA,
+    TCPTransport,
+    TransportError,
+    decode_data,
+    encode_data,
+    parse_address,
+)
+
+
+def _prepare(sequence: int = 1, sender: str = "a") -> PrepareMessage:
+    return PrepareMessage(
+        message_type=MessageType.PREPARE,
+        view=0,
+        sequence=sequence,
+        sender_id=sender,
+        block_digest="ab" * 32,
+    )
+
+
+async def _wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        await asyncio.sleep(0.01)
+
+
+class TestFraming:
+    """Test frame encoding helpers"""
+    
+    def test_data_round_trip(self):
+        """DATA frames carry topic, TTL and payload"""
+        frame = encode_data("consensus", b"\x00payload", ttl=7)
+        
+        assert frame[0] == FRAME_DATA
+        assert decode_data(frame[5:]) == ("consensus", 7, b"\x00payload")
+    
+    def test_truncated_body_rejected(self):
+        """Malformed bodies raise TransportError"""
+        with pytest.raises(TransportError):
+            decode_data(b"\x01")
+        with pytest.raises(TransportError):
+            decode_data(b"\x00\xff\x00abc")
+    
+    def test_parse_address(self):
+        """PeerInfo addresses split into host and port"""
+        assert parse_address("127.0.0.1:9000") == ("127.0.0.1", 9000)
+        with pytest.raises(TransportError):
+            parse_address("nowhere")
+
+
+class TestTCPTransport:
+    """Test transport connections on localhost"""
+    
+    def test_messages_share_one_connection(self):
+        """Many sends open a single connection and arrive in order"""
+        async def scenario():
+            received = []
+            a = TCPTransport("a")
+            b = TCPTransport("b", on_message=lambda *args: received.append(args))
+            await a.start()
+            await b.start()
+            
+            for i in range(50):
+                await a.send("b", b.address, "consensus", f"m{i}".encode())
+            await _wait_for(lambda: len(received) == 50)
+            
+            stats = a.get_stats()
+            await a.stop()
+            await b.stop()
+            return received, stats
+        
+        received, stats = asyncio.run(scenario())
+        
+        assert [payload for _, _, _, payload in received] == [f"m{i}".encode() for i in range(50)]
+        assert all(peer == "a" and topic == "consensus" for peer, topic, _, _ in received)
+        assert stats["connections_opened"] == 1
+        assert stats["frames_sent"] == 50
+    
+    def test_queued_frames_batched_into_few_writes(self):
+        """Frames queued while the writer is busy go out in one write"""
+        async def scenario():
+            received = []
+            a = TCPTransport("a")
+            b = TCPTransport("b", on_message=lambda *args: received.append(args))
+            await a.start()
+            await b.start()
+            
+            for i in range(200):
+                a.try_send("b", b.address, "t", b"x" * 10)
+            await _wait_for(lambda: len(received) == 200)
+            
+            stats = a.get_stats()
+            await a.stop()
+            await b.stop()
+            return stats
+        
+        stats = asyncio.run(scenario())
+        
+        assert stats["frames_sent"] == 200
+        assert stats["writes"] < 10
+    
+    def test_reply_reuses_inbound_connection(self):
+        """The receiver answers over the connection the sender opened"""
+        async def scenario():
+            replies = []
+            a = TCPTransport("a", on_message=lambda *args: replies.append(args))
+            b = TCPTransport("b")
+            b.on_message = lambda peer, topic, ttl, payload: b.try_send(peer, None, topic, payload + b"!")
+            await a.start()
+            await b.start()
+            
+            await a.send("b", b.address, "echo", b"ping")
+            await _wait_for(lambda: replies)
+            
+            stats = (a.get_stats(), b.get_stats())
+            await a.stop()
+            await b.stop()
+            return replies, stats
+        
+        replies, (a_stats, b_stats) = asyncio.run(scenario())
+        
+        assert replies[0][3] == b"ping!"
+        assert a_stats["connections_opened"] == 1
+        assert b_stats["connections_opened"] == 0
+    
+    def test_bounded_queue_applies_backpressure(self):
+        """try_send refuses frames once a peer's queue is full"""
+        async def scenario():
+            a = TCPTransport("a", send_queue_size=4, connect_retries=1)
+            await a.start()
+            
+            # Nothing runs between these calls, so the writer cannot drain
+            results = [a.try_send("ghost", "127.0.0.1:1", "t", b"x") for _ in range(6)]
+            queued = a.queued("ghost")
+            await a.stop()
+            return results, queued, a.stats["frames_dropped"]
+        
+        results, queued, dropped = asyncio.run(scenario())
+        
+        assert results == [True] * 4 + [False] * 2
+        assert queued == 4
+        assert dropped == 2
+    
+    def test_unreachable_peer_drops_frames(self):
+        """Frames for a peer that cannot be reached are counted as dropped"""
+        async def scenario():
+            a = TCPTransport("a", connect_retries=2, connect_backoff=0.01)
+            await a.start()
+            await a.send("ghost", "127.0.0.1:1", "t", b"x")
+            await _wait_for(lambda: a.stats["frames_dropped"] == 1)
+            await a.stop()
+        
+        asyncio.run(scenario())
+
+
+class TestP2PNetworkTransport:
+    """Test P2PNetwork over the TCP transport"""
+    
+    def test_broadcast_reaches_subscribers(self):
+        """Broadcast messages are decoded and delivered to handlers"""
+        async def scenario():
+            ids = ["n0", "n1", "n2"]
+            networks = {i: P2PNetwork(i, transport=TCPTransport(i)) for i in ids}
+            inbox = {i: [] for i in ids}
+            for node_id, network in networks.items():
+                network.subscribe("consensus", inbox[node_id].append)
+                await network.start()
+            for node_id, network in networks.items():
+                for other in ids:
+                    if other != node_id:
+                        network.add_peer(PeerInfo(other, networks[other].transport.address))
+            
+            await networks["n0"].broadcast("consensus", _prepare())
+            await _wait_for(lambda: inbox["n1"] and inbox["n2"])
+            metrics = networks["n1"].get_metrics()
+            
+            for network in networks.values():
+                await network.stop()
+            return inbox, metrics
+        
+        inbox, metrics = asyncio.run(scenario())
+        
+        assert inbox["n0"] == []
+        for node_id in ("n1", "n2"):
+            assert len(inbox[node_id]) == 1
+            assert inbox[node_id][0].sequence == 1
+            assert inbox[node_id][0].block_digest == "ab" * 32
+        assert metrics["messages_received"] == 1
+        assert metrics["transport_connections_accepted"] >= 1
+    
+    def test_send_to_peer_over_tcp(self):
+        """Direct messages use the requested topic"""
+        async def scenario():
+            a = P2PNetwork("a", transport=TCPTransport("a"))
+            b = P2PNetwork("b", transport=TCPTransport("b"))
+            received = []
+            b.subscribe("direct", received.append)
+            await a.start()
+            await b.start()
+            a.add_peer(PeerInfo("b", b.transport.address))
+            
+            sent = await a.send_to_peer("b", _prepare(sequence=4), topic="direct")
+            await _wait_for(lambda: received)
+            
+            await a.stop()
+            await b.stop()
+            return sent, received
+        
+        sent, received = asyncio.run(scenario())
+        
+        assert sent is True
+        assert received[0].sequence == 4
+
+
+class TestSyncWrapper:
+    """Test the thread-backed synchronous wrapper"""
+    
+    def test_sync_networks_exchange_messages(self):
+        """Inbound traffic is served between synchronous calls"""
+        a = P2PNetworkSync("sa", transport=TCPTransport("sa"))
+        b = P2PNetworkSync("sb", transport=TCPTransport("sb"))
+        received = []
+        b.subscribe("consensus", received.append)
+        a.start()
+        b.start()
+        a.add_peer(PeerInfo("sb", b.network.transport.address))
+        
+        for i in range(5):
+            a.send_to_peer("sb", _prepare(sequence=i + 1))
+        
+        deadline = time.monotonic() + 5
+        while len(received) < 5 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        
+        a.close()
+        b.close()
+        
+        assert [message.sequence for message in received] == [1, 2, 3, 4, 5]
+        assert not a.network.is_running
@@ -0,0 +1,337 @@
+"""
+Tests for packed vault storage
+
+Covers packfile append/fetch, reopening, torn index lines, pack rollover,
+the incremental Merkle root and the vault classes built on top of them.
+"""
+
+import hashlib
+import json
+
+import pytest
+
+from aethel.core.vault_store import (
+    PackedBundleStore,
+    IncrementalMerkleRoot,
+    _MerkleNode,
+    RecordView,
+    encode_record,
+    open_record,
+    CODEC_NONE,
+    CODEC_ZLIB
+)
+from aethel.core.persistence import ContentAddressableVault
+from aethel.core.vault_distributed import AethelDistributedVault
+from aethel.core.runtime import AethelRuntime, SecurityError
+from aethel.core.sovereign_persistence import SnapshotManager
+
+
+def _hash(i):
+    return hashlib.sha256(str(i).encode()).hexdigest()
+
+
+class TestRecordView:
+    """Test field records and lazy views"""
+    
+    def test_roundtrip(self):
+        """Every field decodes back to its original value"""
+        fields = {'code': 'fn x() {}', 'ast': {'b': [1, 2], 'a': None}, 'n': 3, 'none': None}
+        view = RecordView(encode_record(fields))
+        
+        assert view.to_dict() == fields
+        assert set(view) == set(fields)
+    
+    def test_fields_hashed_in_place(self):
+        """Text fields hash as UTF-8 and others as canonical JSON"""
+        ast = {'z': 1, 'a': [True, "x"]}
+        view = RecordView(encode_record({'code': 'código', 'ast': ast}))
+        
+        assert view.sha256('code') == hashlib.sha256('código'.encode()).hexdigest()
+        expected = hashlib.sha256(json.dumps(ast, sort_keys=True, separators=(',', ':')).encode())
+        assert view.sha256('ast') == expected.hexdigest()
+        assert 'ast' not in view._decoded
+    
+    def test_truncated_record_rejected(self):
+        """A record cut short fails when opened"""
+        data = encode_record({'code': 'x' * 100})
+        
+        with pytest.raises(ValueError):
+            RecordView(data[:-10])
+    
+    def test_open_record_maps_file(self, tmp_path):
+        """Record files are opened through a memory map"""
+        path = tmp_path / "record.bin"
+        path.write_bytes(encode_record({'a': 1, 'b': 'two'}))
+        
+        view = open_record(str(path))
+        assert view['b'] == 'two'
+        assert view['a'] == 1
+
+
+class TestPackedBundleStore:
+    """Test append-only packfile store"""
+    
+    def test_put_and_get(self, tmp_path):
+        """Stored bodies round-trip through compression"""
+        store = PackedBundleStore(str(tmp_path), codec=CODEC_ZLIB)
+        body = {'code': 'x' * 1000, 'n': 1}
+        
+        assert store.put(_hash(1), body, {'intent_name': 'a'})
+        assert store.get(_hash(1)) == body
+        assert store.summaries[_hash(1)] == {'intent_name': 'a'}
+        assert store.get(_hash(2)) is None
+        store.close()
+    
+    def test_view_uncompressed_is_lazy(self, tmp_path):
+        """Views over uncompressed packs decode nothing up front"""
+        store = PackedBundleStore(str(tmp_path), codec=CODEC_NONE)
+        store.put(_hash(1), {'code': 'abc', 'big': list(range(1000))}, {})
+        
+        view = store.view(_hash(1))
+        assert view.sha256('code') == hashlib.sha256(b'abc').hexdigest()
+        assert view._decoded == {}
+        assert view['big'][-1] == 999
+        store.close()
+    
+    def test_duplicate_put_ignored(self, tmp_path):
+        """Storing the same hash twice keeps the first body"""
+        store = PackedBundleStore(str(tmp_path))
+        
+        assert store.put(_hash(1), {'v': 1}, {})
+        assert not store.put(_hash(1), {'v': 2}, {})
+        assert store.get(_hash(1)) == {'v': 1}
+        store.close()
+    
+    def test_reopen_loads_index(self, tmp_path):
+        """A reopened store sees every bundle written before"""
+        store = PackedBundleStore(str(tmp_path))
+        for i in range(20):
+            store.put(_hash(i), {'i': i}, {'i': i})
+        store.close()
+        
+        reopened = PackedBundleStore(str(tmp_path))
+        assert len(reopened) == 20
+        assert reopened.get(_hash(7)) == {'i': 7}
+        reopened.close()
+    
+    def test_torn_index_line_skipped(self, tmp_path):
+        """A partial index line left by a crash is ignored and sealed"""
+        store = PackedBundleStore(str(tmp_path))
+        store.put(_hash(1), {'i': 1}, {})
+        store.close()
+        
+        with open(tmp_path / PackedBundleStore.INDEX_FILE, 'a') as f:
+            f.write(f"{_hash(2)}\t0\t12")
+        
+        reopened = PackedBundleStore(str(tmp_path))
+        assert len(reopened) == 1
+        reopened.put(_hash(3), {'i': 3}, {})
+        reopened.close()
+        
+        final = PackedBundleStore(str(tmp_path))
+        assert final.get(_hash(3)) == {'i': 3}
+        assert _hash(2) not in final
+        final.close()
+    
+    def test_pack_rollover(self, tmp_path):
+        """New packs are started once the size limit is reached"""
+        store = PackedBundleStore(str(tmp_path), codec=CODEC_NONE, pack_size_limit=100)
+        for i in range(10):
+            store.put(_hash(i), {'pad': 'y' * 50, 'i': i}, {})
+        
+        assert len(list(tmp_path.glob("pack-*.pack"))) > 1
+        assert all(store.get(_hash(i))['i'] == i for i in range(10))
+        store.close()
+    
+    def test_unknown_codec_rejected(self, tmp_path):
+        """Unknown codecs fail at open time"""
+        with pytest.raises(ValueError):
+            PackedBundleStore(str(tmp_path), codec="lz9")
+
+
+class TestIncrementalMerkleRoot:
+    """Test incrementally maintained Merkle root"""
+    
+    def test_empty_root_is_none(self):
+        """An empty set has no root"""
+        assert IncrementalMerkleRoot().root() is None
+    
+    def test_order_independent(self):
+        """Root depends only on the set of hashes"""
+        hashes = [_hash(i) for i in range(500)]
+        
+        bulk = IncrementalMerkleRoot(hashes)
+        incremental = IncrementalMerkleRoot()
+        for h in reversed(hashes):
+            incremental.add(h)
+        
+        assert bulk.root() == incremental.root()
+    
+    def test_root_changes_on_add(self):
+        """Adding a hash changes the root; re-adding does not"""
+        merkle = IncrementalMerkleRoot([_hash(i) for i in range(10)])
+        before = merkle.root()
+        
+        assert merkle.add(_hash(10))
+        after = merkle.root()
+        assert after != before
+        
+        assert not merkle.add(_hash(10))
+        assert merkle.root() == after
+    
+    def test_update_matches_full_recompute(self):
+        """Roots after updates equal a root rebuilt from scratch"""
+        hashes = [_hash(i) for i in range(2000)]
+        merkle = IncrementalMerkleRoot(hashes[:1000])
+        
+        for end in (1001, 1002, 1500, 2000):
+            for h in hashes[len(merkle):end]:
+                assert merkle.add(h)
+            assert merkle.root() == IncrementalMerkleRoot(hashes[:end]).root()
+    
+    def test_update_rehashes_one_path(self, monkeypatch):
+        """An add rehashes a logarithmic path, not its whole bucket"""
+        merkle = IncrementalMerkleRoot([_hash(i) for i in range(50000)])
+        merkle.root()
+        
+        rehashes = []
+        original = _MerkleNode.rehash
+        monkeypatch.setattr(_MerkleNode, "rehash", lambda node: rehashes.append(node) or original(node))
+        assert merkle.add(_hash(50000))
+        
+        assert 0 < len(rehashes) < 64
+
+
+class TestVaultIntegration:
+    """Test vaults backed by packed storage"""
+    
+    def test_content_addressable_vault_roundtrip(self, tmp_path):
+        """Bundles survive a restart without rewriting index.json"""
+        vault = ContentAddressableVault(str(tmp_path / "vault"))
+        content_hash = vault.store_bundle("fn main() {}", {'intent_name': 'main'})
+        vault.packs.close()
+        
+        reopened = ContentAddressableVault(str(tmp_path / "vault"))
+        assert reopened.verify_bundle(content_hash)
+        assert reopened.list_bundles()[0]['intent_name'] == 'main'
+        assert not (tmp_path / "vault" / "index.json").exists()
+        reopened.packs.close()
+    
+    def test_legacy_bundle_still_readable(self, tmp_path):
+        """Bundles stored one file per bundle by older versions still load"""
+        vault_path = tmp_path / "vault"
+        (vault_path / "bundles").mkdir(parents=True)
+        code = "legacy code"
+        content_hash = hashlib.sha256(code.encode()).hexdigest()
+        bundle_path = vault_path / "bundles" / f"{content_hash[:16]}.ae_bundle"
+        bundle_path.write_text(json.dumps({'code': code, 'content_hash': content_hash}))
+        (vault_path / "index.json").write_text(json.dumps({
+            content_hash: {'intent_name': 'old', 'bundle_path': str(bundle_path)}
+        }))
+        
+        vault = ContentAddressableVault(str(vault_path))
+        assert vault.verify_bundle(content_hash)
+        vault.packs.close()
+    
+    def test_distributed_vault_merkle_root(self, tmp_path):
+        """Merkle root tracks stored functions and matches a rebuilt vault"""
+        vault = AethelDistributedVault(str(tmp_path / "vault"))
+        assert vault.generate_merkle_root() is None
+        
+        verification = {'status': 'PROVED', 'message': 'ok'}
+        hashes = [
+            vault.store(f"intent_{i}", {'name': f"intent_{i}", 'constraints': [str(i)]}, "code", verification)
+            for i in range(5)
+        ]
+        root = vault.generate_merkle_root()
+        assert root is not None
+        assert vault.fetch(hashes[3])['intent_name'] == "intent_3"
+        vault.packs.close()
+        
+        reopened = AethelDistributedVault(str(tmp_path / "vault"))
+        assert reopened.generate_merkle_root() == root
+        assert all(reopened.verify_integrity(h) for h in hashes)
+        reopened.packs.close()
+
+
+def _certified_vault(path):
+    vault = AethelDistributedVault(str(path))
+    ast = {
+        'name': 'transfer',
+        'constraints': ['sender_balance >= amount'],
+        'post_conditions': ['sender_balance == old_sender_balance - amount']
+    }
+    verification = {'status': 'PROVED', 'message': 'ok'}
+    function_hash = vault.store('transfer', ast, "code", verification)
+    vault.generate_proof_certificate(function_hash, verification)
+    return vault, function_hash
+
+
+class TestPackedBundles:
+    """Test runtime and snapshot reads over packed files"""
+    
+    def test_runtime_executes_packed_bundle(self, tmp_path):
+        """Packed bundles verify and execute like JSON bundles"""
+        vault, function_hash = _certified_vault(tmp_path / "vault")
+        packed_path = vault.export_bundle(function_hash, str(tmp_path / "t.ae_bundle"), packed=True)
+        json_path = vault.export_bundle(function_hash, str(tmp_path / "t.json"))
+        
+        runtime = AethelRuntime(vault=vault)
+        inputs = {'sender_balance': 500, 'receiver_balance': 100, 'amount': 150}
+        packed = runtime.execute_safely(packed_path, inputs)
+        plain = runtime.execute_safely(json_path, inputs)
+        
+        assert packed.output_state == plain.output_state
+        assert packed.output_state['sender_balance'] == 350
+        assert runtime._packed_bundle_signature(open_record(packed_path)) == \
+            open_record(packed_path)['bundle_signature']
+        vault.packs.close()
+    
+    def test_runtime_rejects_tampered_packed_bundle(self, tmp_path):
+        """Changing the AST in a packed bundle breaks the signature"""
+        vault, function_hash = _certified_vault(tmp_path / "vault")
+        packed_path = vault.export_bundle(function_hash, str(tmp_path / "t.ae_bundle"), packed=True)
+        
+        data = open(packed_path, 'rb').read().replace(b'sender_balance >= amount', b'sender_balance >= amounX')
+        open(packed_path, 'wb').write(data)
+        
+        with pytest.raises(SecurityError):
+            AethelRuntime(vault=vault).execute_safely(packed_path, {'amount': 1, 'sender_balance': 5})
+        vault.packs.close()
+    
+    def test_packed_bundle_import(self, tmp_path):
+        """Packed bundles import into another vault"""
+        vault, function_hash = _certified_vault(tmp_path / "vault")
+        packed_path = vault.export_bundle(function_hash, str(tmp_path / "t.ae_bundle"), packed=True)
+        
+        other = AethelDistributedVault(str(tmp_path / "other"))
+        assert other.import_bundle(packed_path) == function_hash
+        assert other.verify_integrity(function_hash)
+        vault.packs.close()
+        other.packs.close()
+    
+    def test_snapshot_header_without_state_decode(self, tmp_path):
+        """Snapshot metadata is readable without decoding state"""
+        manager = SnapshotManager(str(tmp_path / "snapshots"))
+        state = {f"account:{i}": {'balance': i} for i in range(100)}
+        snapshot = manager.create_snapshot("root", state, metadata={'wal_sequence': 7})
+        
+        view = manager.open_snapshot(snapshot.snapshot_id)
+        assert view['metadata']['wal_sequence'] == 7
+        assert 'state_data' not in view._decoded
+        
+        loaded = manager.load_snapshot(snapshot.snapshot_id)
+        assert loaded.state_data == state
+        assert loaded.merkle_root == "root"
+    
+    def test_legacy_json_snapshot_loads(self, tmp_path):
+        """Snapshots written as JSON still load"""
+        manager = SnapshotManager(str(tmp_path / "snapshots"))
+        path = tmp_path / "snapshots" / "snapshot_old.json"
+        path.write_text(json.dumps({
+            'snapshot_id': 'old', 'merkle_root': 'r', 'state_data': {'k': 1},
+            'timestamp': 1.0, 'block_height': 0, 'metadata': {}
+        }))
+        manager.snapshots_index['old'] = {'timestamp': 1.0, 'path': str(path)}
+        
+        assert manager.load_snapshot('old').state_data == {'k': 1}
@@ -0,0 +1,277 @@
+"""
+Tests for the binary wire codec
+
+Covers round-trips for every consensus message type and proof blocks,
+ghost proofs surviving transport, compression of large blocks, zero-copy
+decoding, version checks, and fuzzing of corrupted frames.
+"""
+
+import json
+import time
+
+import pytest
+from hypothesis import given, settings, strategies as st
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+from aethel.consensus.data_models import (
+    BlockVerificationResult,
+    CommitMessage,
+    MessageType,
+    NewViewMessage,
+    PrePrepareMessage,
+    PrepareMessage,
+    ProofBlock,
+    SignedProof,
+    VerificationResult,
+    ViewChangeMessage,
+)
+from aethel.consensus.ghost_consensus import GhostConsensusIntegration
+from aethel.consensus.p2p_network import P2PNetwork
+from aethel.consensus.wire_codec import (
+    CODEC_NONE,
+    KIND_PROOF_BLOCK,
+    WIRE_VERSION,
+    WireError,
+    decode,
+    decode_block,
+    decode_message,
+    encode_block,
+    encode_message,
+    peek_header,
+)
+
+
+def _block(proof_count=3, block_id="block_1"):
+    proofs = [
+        {'constraints': [f'x_{i} > 0'], 'post_conditions': [f'x_{i} >= 0'], 'valid': True}
+        for i in range(proof_count)
+    ]
+    proofs.append("intent_transfer")
+    proofs.append(SignedProof(proof_data={'intent': 'pay'}, public_key="ab" * 32, signature="cd" * 64))
+    return ProofBlock(
+        block_id=block_id,
+        timestamp=int(time.time()),
+        proofs=proofs,
+        previous_block_hash="0" * 64,
+        proposer_id="node_0",
+        signature=b"\x01" * 64,
+        transactions=[{'sender': 'alice', 'amount': 5}],
+    )
+
+
+def _messages():
+    block = _block()
+    digest = block.hash()
+    view_change = ViewChangeMessage(
+        message_type=MessageType.VIEW_CHANGE, view=1, sequence=4, sender_id="node_2",
+        new_view=2, last_stable_checkpoint="f" * 64,
+    )
+    return [
+        PrePrepareMessage(
+            message_type=MessageType.PRE_PREPARE, view=1, sequence=5, sender_id="node_0",
+            signature=b"\x02" * 64, proof_block=block,
+        ),
+        PrepareMessage(
+            message_type=MessageType.PREPARE, view=1, sequence=5, sender_id="node_1",
+            block_digest=digest,
+            verification_result=BlockVerificationResult(
+                valid=False,
+                total_difficulty=1234,
+                results=[
+                    VerificationResult(True, 1000, 1.5, "a" * 64),
+                    VerificationResult(False, 0, 0.0, "", error="bad proof"),
+                ],
+                failed_proof={'valid': False},
+            ),
+        ),
+        CommitMessage(
+            message_type=MessageType.COMMIT, view=1, sequence=5, sender_id="node_2",
+            block_digest=digest,
+        ),
+        view_change,
+        NewViewMessage(
+            message_type=MessageType.NEW_VIEW, view=2, sequence=4, sender_id="node_2",
+            new_view=2, view_change_messages=[view_change, view_change], checkpoint="not-hex",
+        ),
+    ]
+
+
+class TestRoundTrip:
+    """Test encode/decode round-trips"""
+    
+    def test_every_message_type(self):
+        """Each message type decodes to an equal message"""
+        for message in _messages():
+            decoded = decode_message(encode_message(message))
+            assert type(decoded) is type(message)
+            assert decoded == message
+    
+    def test_block_hash_preserved(self):
+        """A decoded block hashes to the same digest"""
+        block = _block()
+        decoded = decode_block(encode_block(block))
+        
+        assert decoded == block
+        assert decoded.hash() == block.hash()
+        assert peek_header(encode_block(block)).kind == KIND_PROOF_BLOCK
+    
+    def test_ghost_proof_survives_transport(self):
+        """A ghost-signed message still verifies after a round-trip"""
+        sender = GhostConsensusIntegration()
+        keys = [Ed25519PrivateKey.generate() for _ in range(4)]
+        for key in keys:
+            sender.register_validator(key.public_key())
+        message = sender.create_ghost_consensus_message(
+            CommitMessage(message_type=MessageType.COMMIT, view=0, sequence=1,
+                          sender_id="node_1", block_digest="ab" * 32),
+            keys[1],
+            1
+        )
+        
+        decoded = decode_message(encode_message(message))
+        
+        receiver = GhostConsensusIntegration()
+        for key in keys:
+            receiver.register_validator(key.public_key())
+        assert receiver.verify_ghost_consensus_message(decoded)
+    
+    def test_signatures_sent_raw(self):
+        """Hex digests and signatures travel as raw bytes"""
+        message = _messages()[2]
+        frame = encode_message(message)
+        
+        assert bytes.fromhex(message.block_digest) in frame
+        assert message.block_digest.encode() not in frame
+
+
+class TestCompression:
+    """Test compression of large frames"""
+    
+    def test_large_block_compressed_and_smaller_than_json(self):
+        """Large blocks are compressed and far smaller than the JSON form"""
+        block = _block(proof_count=2000)
+        frame = encode_block(block)
+        
+        assert peek_header(frame).codec != CODEC_NONE
+        assert len(frame) < len(block.serialize()) / 4
+        assert decode_block(frame) == block
+    
+    def test_small_frames_uncompressed(self):
+        """Frames below the threshold are sent as-is"""
+        frame = encode_message(_messages()[2])
+        assert peek_header(frame).codec == CODEC_NONE
+    
+    def test_compression_disabled(self):
+        """compress_threshold=None never compresses"""
+        frame = encode_block(_block(proof_count=2000), compress_threshold=None)
+        assert peek_header(frame).codec == CODEC_NONE
+
+
+class TestZeroCopy:
+    """Test memoryview decoding"""
+    
+    def test_byte_fields_reference_buffer(self):
+        """With copy=False signatures are views into the frame"""
+        frame = bytearray(encode_message(_messages()[0]))
+        decoded = decode_message(frame, copy=False)
+        
+        assert isinstance(decoded.signature, memoryview)
+        assert decoded.signature == b"\x02" * 64
+        
+        start = bytes(frame).index(b"\x02" * 64)
+        frame[start] = 0x09
+        assert decoded.signature[0] == 0x09
+
+
+class TestMalformedFrames:
+    """Test rejection of bad input"""
+    
+    def test_unsupported_version(self):
+        """Frames from another codec version are rejected"""
+        frame = bytearray(encode_message(_messages()[2]))
+        frame[2] = WIRE_VERSION + 1
+        with pytest.raises(WireError):
+            decode(bytes(frame))
+    
+    def test_truncated_and_extended(self):
+        """Length mismatches are rejected"""
+        frame = encode_message(_messages()[1])
+        for bad in (frame[:-1], frame + b"\x00", frame[:3], b""):
+            with pytest.raises(WireError):
+                decode(bad)
+    
+    @settings(max_examples=300, deadline=None)
+    @given(
+        index=st.integers(min_value=0, max_value=4),
+        position=st.integers(min_value=0),
+        replacement=st.binary(min_size=1, max_size=8),
+    )
+    def test_fuzzed_frames_never_crash(self, index, position, replacement):
+        """Corrupted frames either decode or raise WireError"""
+        frame = bytearray(encode_message(_messages()[index]))
+        position %= len(frame)
+        frame[position:position + len(replacement)] = replacement
+        try:
+            decode(bytes(frame))
+        except WireError:
+            pass
+    
+    @settings(max_examples=200, deadline=None)
+    @given(st.binary(max_size=256))
+    def test_random_bytes_never_crash(self, data):
+        """Arbitrary bytes either decode or raise WireError"""
+        try:
+            decode(b"AW\x01\x02\x00" + len(data).to_bytes(4, "little") + data)
+        except WireError:
+            pass
+
+
+class TestPropertyRoundTrip:
+    """Property-based round-trips"""
+    
+    @settings(max_examples=100, deadline=None)
+    @given(
+        view=st.integers(min_value=-2**63, max_value=2**63 - 1),
+        sequence=st.integers(min_value=0, max_value=2**63 - 1),
+        sender=st.text(),
+        digest=st.one_of(st.text(), st.binary(max_size=64).map(bytes.hex)),
+        signature=st.binary(max_size=128),
+    )
+    def test_commit_roundtrip(self, view, sequence, sender, digest, signature):
+        """Arbitrary COMMIT fields survive a round-trip"""
+        message = CommitMessage(
+            message_type=MessageType.COMMIT, view=view, sequence=sequence,
+            sender_id=sender, signature=signature, block_digest=digest,
+        )
+        assert decode_message(encode_message(message)) == message
+    
+    @settings(max_examples=50, deadline=None)
+    @given(proofs=st.lists(st.one_of(
+        st.text(),
+        st.dictionaries(st.text(), st.one_of(st.integers(-2**53, 2**53), st.text(), st.booleans())),
+    ), min_size=1, max_size=20))
+    def test_block_roundtrip(self, proofs):
+        """Blocks of arbitrary text and JSON proofs keep their hash"""
+        block = ProofBlock(
+            block_id="b", timestamp=0, proofs=proofs, previous_block_hash="",
+            proposer_id="p",
+        )
+        decoded = decode_block(encode_block(block, compress_threshold=64))
+        assert decoded == block
+        assert decoded.hash() == block.hash()
+
+
+class TestNetworkIds:
+    """Test P2PNetwork message ids over wire frames"""
+    
+    def test_distinct_digests_get_distinct_ids(self):
+        """Messages differing only in digest are not deduplicated together"""
+        network = P2PNetwork("node_1")
+        first, second = (
+            CommitMessage(message_type=MessageType.COMMIT, view=0, sequence=1,
+                          sender_id="node_1", block_digest=digest)
+            for digest in ("aa" * 32, "bb" * 32)
+        )
+        ids = {network._generate_message_id(network._serialize_message(m)) for m in (first, second)}
+        
+        assert len(ids) == 2